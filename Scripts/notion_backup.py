@@ -6,13 +6,28 @@
 
 import json
 import os
+import sys
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Iterator, Sequence, Tuple, Union
 from pathlib import Path
 import zipfile
 import hashlib
 from supabase_mcp import SupabaseMCP
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.notion_automation.utils.supabase_stream import SupabaseKeysetStream
+from src.notion_automation.utils.backup_archive import (
+    StreamingBackupWriter, BackupArchiveReader, resolve_chain, manifest_digest,
+    DEFAULT_CHUNK_RECORDS
+)
+from src.notion_automation.optimization.restore_engine import (
+    RestoreEngine, SQLiteRestoreTarget, SupabaseRestoreTarget
+)
+from src.notion_automation.utils.reconciliation import (
+    RangeDigestSource, RangeReconciler, record_fingerprint, DEFAULT_COMPARE_FIELDS as COMPARE_FIELDS
+)
+
 class NotionBackupSystem:
     """📦 Notion 백업 및 복구 시스템"""
     
@@ -21,155 +36,238 @@ class NotionBackupSystem:
         self.backup_dir = Path("backups")
         self.backup_dir.mkdir(exist_ok=True)
         
-    def create_backup(self, backup_type: str = "daily") -> Dict:
-        """📋 전체 데이터 백업 생성"""
+    def create_backup(self, backup_type: str = "daily", delta: bool = False,
+                      chunk_records: int = DEFAULT_CHUNK_RECORDS) -> Dict:
+        """📋 데이터 백업 생성 (delta=True이면 직전 백업 이후 변경분만 저장)"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_name = f"notion_backup_{backup_type}_{timestamp}"
         backup_path = self.backup_dir / f"{backup_name}.zip"
-        
-        print(f"🔄 백업 시작: {backup_name}")
-        
-        # 1. Supabase 데이터 추출
-        supabase_data = self._extract_supabase_data()
-        
-        # 2. Notion 데이터 추출
-        notion_data = self._extract_notion_data()
-        
-        # 3. 메타데이터 생성
-        metadata = {
-            "backup_type": backup_type,
-            "timestamp": timestamp,
-            "supabase_count": len(supabase_data),
-            "notion_count": len(notion_data),
-            "checksum": self._calculate_checksum(supabase_data, notion_data)
-        }
-        
-        # 4. ZIP 파일로 압축
-        with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            zipf.writestr("supabase_data.json", json.dumps(supabase_data, indent=2, ensure_ascii=False))
-            zipf.writestr("notion_data.json", json.dumps(notion_data, indent=2, ensure_ascii=False))
-            zipf.writestr("metadata.json", json.dumps(metadata, indent=2, ensure_ascii=False))
-            
+
+        parent = self._latest_streaming_backup() if delta else None
+        if delta and parent is None:
+            print("⚠️ 부모 백업이 없어 전체 백업으로 진행합니다")
+        mode = "delta" if parent else "full"
+
+        print(f"🔄 백업 시작: {backup_name} ({mode})")
+
+        parent_datasets = parent.manifest["datasets"] if parent else {}
+        supabase_watermark = parent_datasets.get("supabase_data", {}).get("watermark")
+        notion_watermark = parent_datasets.get("notion_data", {}).get("watermark")
+
+        # 1. Supabase 데이터 (증분이면 updated_at 워터마크 이후 변경분만 조회)
+        #    수정 시 updated_at은 supabase-manual-setup.sql의 BEFORE UPDATE 트리거가 갱신
+        filters = [("gt", "updated_at", supabase_watermark)] if supabase_watermark else None
+        supabase_records = self._iter_supabase_data(filters=filters)
+
+        # 2. Notion 데이터 (last_edited_time 기준 변경분)
+        notion_records = (
+            record for record in self._extract_notion_data()
+            if not notion_watermark or str(record.get("last_edited_time", "")) > notion_watermark
+        )
+
+        # 3. 청크 단위 스트리밍 기록 후 매니페스트 작성
+        #    (.zip.part에 기록하고 성공하면 .zip으로 교체, 실패하면 임시 파일 삭제)
+        with StreamingBackupWriter(str(backup_path), chunk_records=chunk_records) as writer:
+            supabase_dataset = writer.write_dataset("supabase_data", supabase_records, watermark_field="updated_at")
+            notion_dataset = writer.write_dataset("notion_data", notion_records, watermark_field="last_edited_time")
+
+            # 변경분이 없으면 부모 워터마크 유지
+            supabase_dataset["watermark"] = supabase_dataset["watermark"] or supabase_watermark
+            notion_dataset["watermark"] = notion_dataset["watermark"] or notion_watermark
+
+            metadata = writer.write_manifest({
+                "backup_name": backup_name,
+                "backup_type": backup_type,
+                "mode": mode,
+                "timestamp": timestamp,
+                "parent": parent.manifest["backup_name"] if parent else None,
+                "parent_digest": manifest_digest(parent.manifest) if parent else None,
+                "supabase_count": supabase_dataset["records"],
+                "notion_count": notion_dataset["records"],
+                "checksum": hashlib.sha256((supabase_dataset["sha256"] + notion_dataset["sha256"]).encode()).hexdigest()
+            })
+
         backup_info = {
             "backup_name": backup_name,
             "backup_path": str(backup_path),
             "size_mb": round(backup_path.stat().st_size / 1024 / 1024, 2),
             "metadata": metadata
         }
-        
+
         print(f"✅ 백업 완료: {backup_info['size_mb']}MB")
         return backup_info
-        
-    def restore_backup(self, backup_name: str, restore_mode: str = "verify") -> Dict:
-        """🔄 백업에서 데이터 복구"""
-        backup_path = self.backup_dir / f"{backup_name}.zip"
-        
+
+    def restore_backup(self, backup_name: str, restore_mode: str = "verify",
+                       target: str = "sqlite", db_path: Optional[str] = None) -> Dict:
+        """🔄 백업에서 데이터 복구 (증분 백업은 전체 백업부터 체인을 재생)"""
+        backup_path = self._backup_path(backup_name)
+
         if not backup_path.exists():
             raise FileNotFoundError(f"백업 파일을 찾을 수 없습니다: {backup_path}")
-            
-        print(f"🔄 복구 시작: {backup_name} (모드: {restore_mode})")
-        
-        # 1. 백업 파일 추출
-        with zipfile.ZipFile(backup_path, 'r') as zipf:
-            supabase_data = json.loads(zipf.read("supabase_data.json"))
-            notion_data = json.loads(zipf.read("notion_data.json"))
-            metadata = json.loads(zipf.read("metadata.json"))
-            
-        # 2. 체크섬 검증
-        current_checksum = self._calculate_checksum(supabase_data, notion_data)
-        if current_checksum != metadata["checksum"]:
-            print("⚠️ 백업 무결성 검증 실패")
-            
-        # 3. 복구 실행
-        if restore_mode == "full":
-            restored_count = self._restore_full(supabase_data, notion_data)
-        elif restore_mode == "incremental":
-            restored_count = self._restore_incremental(supabase_data, notion_data)
-        else:  # verify only
-            restored_count = 0
-            print("🔍 검증만 실행 (실제 복구 안함)")
-            
+
+        print(f"🔄 복구 시작: {backup_name} (모드: {restore_mode}, 대상: {target})")
+
+        restore_target = self._restore_target(target, db_path) if restore_mode != "verify" else None
+        engine = RestoreEngine(restore_target, str(self.backup_dir / f"{backup_name}.restore.json"))
+
+        try:
+            # 1. 백업 파일 체크섬 검증
+            chain = resolve_chain(str(backup_path), lambda name: str(self._backup_path(name)))
+            legacy_data = None
+            if chain[-1].is_streaming_format:
+                metadata = chain[-1].manifest
+                metadata["chain"] = [reader.manifest["backup_name"] for reader in chain]
+                checksum_valid = not engine.verify(chain, ("supabase_data", "notion_data"))
+            else:
+                supabase_data, notion_data, metadata = self._load_legacy_backup(backup_path)
+                checksum_valid = self._calculate_checksum(supabase_data, notion_data) == metadata["checksum"]
+                legacy_data = supabase_data
+
+            # 2. 복구 실행 (손상된 백업은 기록하지 않음)
+            restore_stats = None
+            if not checksum_valid:
+                print("⚠️ 백업 무결성 검증 실패")
+            elif legacy_data is not None and restore_mode in ("full", "incremental"):
+                restore_stats = engine.restore_records(f"{backup_name}/supabase_data", legacy_data)
+            elif restore_mode == "full":
+                restore_stats = self._restore_full(engine, chain)
+            elif restore_mode == "incremental":
+                restore_stats = self._restore_incremental(engine, chain)
+
+            if restore_mode == "verify":
+                print("🔍 검증만 실행 (실제 복구 안함)")
+        finally:
+            if restore_target is not None:
+                restore_target.close()
+
+        restored_count = restore_stats["records_written"] if restore_stats else 0
         restore_info = {
             "backup_name": backup_name,
             "restore_mode": restore_mode,
             "restored_count": restored_count,
+            "restore_stats": restore_stats,
             "backup_metadata": metadata,
-            "checksum_valid": current_checksum == metadata["checksum"]
+            "checksum_valid": checksum_valid
         }
-        
+
+        if restore_stats and not restore_stats["completed"]:
+            print(f"⚠️ 복구 중단: {restore_stats.get('error')} (다시 실행하면 이어서 진행)")
         print(f"✅ 복구 완료: {restored_count}개 레코드")
         return restore_info
-        
+
     def cleanup_old_backups(self, keep_days: int = 30) -> Dict:
-        """🧹 오래된 백업 파일 정리"""
+        """🧹 오래된 백업 파일 정리 (보관 중인 증분 백업의 부모는 유지)"""
         cutoff_date = datetime.now() - timedelta(days=keep_days)
         deleted_count = 0
         deleted_size = 0
-        
+
+        expired, kept = [], []
         for backup_file in self.backup_dir.glob("notion_backup_*.zip"):
             # 파일명에서 날짜 추출
             try:
                 date_str = backup_file.stem.split("_")[-2]  # YYYYMMDD
                 file_date = datetime.strptime(date_str, "%Y%m%d")
-                
-                if file_date < cutoff_date:
-                    file_size = backup_file.stat().st_size
-                    backup_file.unlink()
-                    deleted_count += 1
-                    deleted_size += file_size
-                    print(f"🗑️ 삭제됨: {backup_file.name}")
-                    
+                (expired if file_date < cutoff_date else kept).append(backup_file)
             except (ValueError, IndexError):
                 print(f"⚠️ 날짜 파싱 실패: {backup_file.name}")
-                
+
+        required = set()
+        for backup_file in kept:
+            try:
+                required.update(Path(reader.path).name for reader in
+                                resolve_chain(str(backup_file), lambda name: str(self._backup_path(name))))
+            except (FileNotFoundError, ValueError) as e:
+                print(f"⚠️ 백업 체인 확인 실패: {backup_file.name} ({e})")
+
+        for backup_file in expired:
+            if backup_file.name in required:
+                print(f"🔗 증분 백업의 부모라 유지: {backup_file.name}")
+                continue
+            file_size = backup_file.stat().st_size
+            backup_file.unlink()
+            deleted_count += 1
+            deleted_size += file_size
+            print(f"🗑️ 삭제됨: {backup_file.name}")
+
         return {
             "deleted_count": deleted_count,
             "deleted_size_mb": round(deleted_size / 1024 / 1024, 2),
             "keep_days": keep_days
         }
+
+    def _backup_path(self, backup_name: str) -> Path:
+        return self.backup_dir / f"{backup_name}.zip"
+
+    def _latest_streaming_backup(self) -> Optional[BackupArchiveReader]:
+        """증분 백업의 부모가 될 가장 최근 스트리밍 형식 백업"""
+        backups = sorted(self.backup_dir.glob("notion_backup_*.zip"),
+                         key=lambda path: path.stem.split("_")[-2:], reverse=True)
+        for backup_file in backups:
+            reader = BackupArchiveReader(str(backup_file))
+            if reader.is_streaming_format:
+                return reader
+        return None
+
+    def _load_legacy_backup(self, backup_path: Path):
+        """이전 형식(전체 JSON) 백업 읽기"""
+        with zipfile.ZipFile(backup_path, 'r') as zipf:
+            supabase_data = json.loads(zipf.read("supabase_data.json"))
+            notion_data = json.loads(zipf.read("notion_data.json"))
+            metadata = json.loads(zipf.read("metadata.json"))
+        return supabase_data, notion_data, metadata
         
     def verify_data_integrity(self) -> Dict:
         """🔍 데이터 무결성 검증"""
         print("🔍 데이터 무결성 검증 시작...")
         
-        # 1. Supabase-Notion 데이터 일치성 확인
-        supabase_data = self._extract_supabase_data()
-        notion_data = self._extract_notion_data()
-        
-        # 2. ID 기반 매칭 검증
-        supabase_ids = {item['id'] for item in supabase_data}
-        notion_ids = {item.get('supabase_id') for item in notion_data if item.get('supabase_id')}
-        
-        missing_in_notion = supabase_ids - notion_ids
-        orphaned_in_notion = notion_ids - supabase_ids
-        
-        # 3. 데이터 일관성 검증
-        inconsistent_records = []
-        for sb_item in supabase_data:
-            notion_item = next((n for n in notion_data if n.get('supabase_id') == sb_item['id']), None)
-            if notion_item and not self._compare_records(sb_item, notion_item):
-                inconsistent_records.append(sb_item['id'])
-                
+        # 1. 양쪽 월/일 다이제스트 생성 (Supabase는 비교 컬럼만 스트리밍)
+        columns = ["id", *COMPARE_FIELDS]
+        try:
+            supabase_source = RangeDigestSource(
+                self._iter_supabase_data(columns),
+                key_field="id",
+                fetch_day=lambda day: self._iter_supabase_data(columns, filters=[("eq", "date", day)])
+            )
+            notion_source = RangeDigestSource(self._extract_notion_data(), key_field="supabase_id")
+
+            # 2. 다이제스트가 다른 범위만 supabase_id 해시 조인으로 비교
+            report = RangeReconciler(supabase_source, notion_source).reconcile()
+        except Exception as e:
+            print(f"❌ 데이터 대사 실패: {e}")
+            return {}
+
+        missing_in_notion = report["missing_in_target"]
+        orphaned_in_notion = report["orphaned_in_target"]
+        inconsistent_records = report["inconsistent"]
+
         integrity_report = {
-            "total_supabase": len(supabase_data),
-            "total_notion": len(notion_data),
+            "total_supabase": supabase_source.total,
+            "total_notion": notion_source.total + notion_source.skipped,
             "missing_in_notion": len(missing_in_notion),
             "orphaned_in_notion": len(orphaned_in_notion),
             "inconsistent_records": len(inconsistent_records),
-            "integrity_score": round((1 - (len(missing_in_notion) + len(orphaned_in_notion) + len(inconsistent_records)) / max(len(supabase_data), 1)) * 100, 2)
+            "mismatched_days": report["mismatched_days"],
+            "integrity_score": round((1 - (len(missing_in_notion) + len(orphaned_in_notion) + len(inconsistent_records)) / max(supabase_source.total, 1)) * 100, 2)
         }
         
         print(f"📊 무결성 점수: {integrity_report['integrity_score']}%")
         return integrity_report
         
-    def _extract_supabase_data(self) -> List[Dict]:
+    def _extract_supabase_data(self, columns: Union[str, Sequence[str]] = "*") -> List[Dict]:
         """Supabase에서 모든 데이터 추출"""
         try:
-            response = self.mcp.supabase.table('daily_reflections').select("*").execute()
-            return response.data
+            return list(self._iter_supabase_data(columns))
         except Exception as e:
             print(f"❌ Supabase 데이터 추출 실패: {e}")
             return []
+
+    def _iter_supabase_data(self, columns: Union[str, Sequence[str]] = "*", page_size: int = 500,
+                            filters: Optional[List[Tuple[str, str, str]]] = None) -> Iterator[Dict]:
+        """Supabase 데이터를 (created_at, id) 키셋 페이지 단위로 스트리밍"""
+        stream = SupabaseKeysetStream(self.mcp.client, 'daily_reflections', columns,
+                                      page_size=page_size, filters=filters)
+        yield from stream
+        print(f"📥 Supabase 추출: {stream.stats['rows']}행 ({stream.stats['rows_per_second']}행/초)")
             
     def _extract_notion_data(self) -> List[Dict]:
         """Notion에서 모든 데이터 추출"""
@@ -186,20 +284,23 @@ class NotionBackupSystem:
         combined_data = json.dumps([supabase_data, notion_data], sort_keys=True)
         return hashlib.sha256(combined_data.encode()).hexdigest()
         
-    def _restore_full(self, supabase_data: List, notion_data: List) -> int:
-        """전체 복구 실행"""
-        # 실제 복구 로직 구현 필요
-        return len(supabase_data)
+    def _restore_target(self, target: str, db_path: Optional[str] = None):
+        """복구 대상 생성 (sqlite: 로컬 미러, supabase: 원격 테이블)"""
+        if target == "supabase":
+            return SupabaseRestoreTarget(self.mcp.client)
+        return SQLiteRestoreTarget(db_path or str(self.backup_dir / "restore_mirror.db"))
+
+    def _restore_full(self, engine: RestoreEngine, chain: List) -> Dict:
+        """전체 복구 실행 (전체 백업부터 체인 전체 재생)"""
+        return engine.restore_chain(chain, verify_first=False)
         
-    def _restore_incremental(self, supabase_data: List, notion_data: List) -> int:
-        """증분 복구 실행"""
-        # 실제 증분 복구 로직 구현 필요
-        return 0
+    def _restore_incremental(self, engine: RestoreEngine, chain: List) -> Dict:
+        """증분 복구 실행 (지정한 백업의 변경분만 기록)"""
+        return engine.restore_chain(chain[-1:], verify_first=False)
         
     def _compare_records(self, supabase_record: Dict, notion_record: Dict) -> bool:
         """레코드 일치성 비교"""
-        # 실제 비교 로직 구현 필요
-        return True
+        return record_fingerprint(supabase_record) == record_fingerprint(notion_record)
 
 def main():
     """CLI 인터페이스"""
@@ -211,11 +312,14 @@ def main():
     # 백업 명령어
     backup_parser = subparsers.add_parser('backup', help='데이터 백업 생성')
     backup_parser.add_argument('--type', default='daily', choices=['daily', 'weekly', 'manual'], help='백업 유형')
+    backup_parser.add_argument('--delta', action='store_true', help='직전 백업 이후 변경분만 저장')
     
     # 복구 명령어
     restore_parser = subparsers.add_parser('restore', help='백업에서 복구')
     restore_parser.add_argument('backup_name', help='복구할 백업 이름')
     restore_parser.add_argument('--mode', default='verify', choices=['verify', 'incremental', 'full'], help='복구 모드')
+    restore_parser.add_argument('--target', default='sqlite', choices=['sqlite', 'supabase'], help='복구 대상')
+    restore_parser.add_argument('--db', help='SQLite 미러 DB 경로 (기본값: backups/restore_mirror.db)')
     
     # 정리 명령어
     cleanup_parser = subparsers.add_parser('cleanup', help='오래된 백업 정리')
@@ -228,11 +332,11 @@ def main():
     backup_system = NotionBackupSystem()
     
     if args.command == 'backup':
-        result = backup_system.create_backup(args.type)
+        result = backup_system.create_backup(args.type, delta=args.delta)
         print(f"📋 백업 완료: {json.dumps(result, indent=2, ensure_ascii=False)}")
         
     elif args.command == 'restore':
-        result = backup_system.restore_backup(args.backup_name, args.mode)
+        result = backup_system.restore_backup(args.backup_name, args.mode, target=args.target, db_path=args.db)
         print(f"🔄 복구 완료: {json.dumps(result, indent=2, ensure_ascii=False)}")
         
     elif args.command == 'cleanup':
@@ -4,7 +4,11 @@ Notion API 토큰 검증 스크립트
 """
 
 import os
-import requests
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.notion_automation.utils.http_transport import get_transport
 
 def test_notion_token():
     """Notion API 토큰 직접 테스트"""
@@ -27,7 +31,7 @@ def test_notion_token():
     
     try:
         print("\n🌐 API 호출 테스트...")
-        response = requests.get("https://api.notion.com/v1/users/me", headers=headers)
+        response = get_transport().get("https://api.notion.com/v1/users/me", headers=headers)
         
         print(f"Status Code: {response.status_code}")
         print(f"Response: {response.text}")
@@ -56,7 +60,7 @@ def check_page_access():
     
     try:
         print(f"\n📄 페이지 접근 테스트 (ID: {page_id})")
-        response = requests.get(f"https://api.notion.com/v1/pages/{page_id}", headers=headers)
+        response = get_transport().get(f"https://api.notion.com/v1/pages/{page_id}", headers=headers)
         
         print(f"Status Code: {response.status_code}")
         print(f"Response: {response.text[:200]}...")
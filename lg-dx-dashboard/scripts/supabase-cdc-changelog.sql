@@ -0,0 +1,48 @@
+-- 🔄 Supabase → Notion 변경 데이터 캡처(CDC)용 변경 로그
+-- daily_reflections 변경을 순번(seq)이 있는 로그 테이블에 쌓고 NOTIFY로 알림
+-- Python CDC 소비자(src/notion_automation/optimization/cdc_consumer.py)가 로그를 읽어
+-- 같은 리플렉션의 연속 수정을 합친 뒤 Notion에 마이크로 배치로 반영합니다.
+
+-- 1. 변경 로그 테이블
+CREATE TABLE IF NOT EXISTS reflection_changes (
+  seq BIGSERIAL PRIMARY KEY,
+  reflection_id UUID NOT NULL,
+  operation TEXT NOT NULL CHECK (operation IN ('INSERT', 'UPDATE', 'DELETE')),
+  record JSONB,
+  changed_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- 보존 기간 정리용
+CREATE INDEX IF NOT EXISTS idx_reflection_changes_changed_at ON reflection_changes(changed_at);
+
+-- 2. 변경 기록 + 알림 함수
+CREATE OR REPLACE FUNCTION log_reflection_change()
+RETURNS TRIGGER AS $$
+DECLARE
+  change_seq BIGINT;
+BEGIN
+  INSERT INTO reflection_changes (reflection_id, operation, record)
+  VALUES (
+    COALESCE(NEW.id, OLD.id),
+    TG_OP,
+    CASE WHEN TG_OP = 'DELETE' THEN row_to_json(OLD)::jsonb ELSE row_to_json(NEW)::jsonb END
+  )
+  RETURNING seq INTO change_seq;
+
+  -- 소비자는 알림을 깨우기 신호로만 사용하고 실제 데이터는 seq 순서로 다시 읽음
+  PERFORM pg_notify('reflection_changes', change_seq::text);
+
+  RETURN COALESCE(NEW, OLD);
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- 3. 행 단위 webhook 트리거를 변경 로그 트리거로 교체
+DROP TRIGGER IF EXISTS trigger_notion_sync ON daily_reflections;
+DROP TRIGGER IF EXISTS trigger_reflection_changes ON daily_reflections;
+CREATE TRIGGER trigger_reflection_changes
+  AFTER INSERT OR UPDATE OR DELETE ON daily_reflections
+  FOR EACH ROW
+  EXECUTE FUNCTION log_reflection_change();
+
+-- 4. 오래된 변경 로그 정리 (소비자가 처리한 뒤 7일 보존)
+-- DELETE FROM reflection_changes WHERE changed_at < now() - interval '7 days';
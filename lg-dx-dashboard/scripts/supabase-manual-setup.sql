@@ -121,7 +121,27 @@ CREATE INDEX IF NOT EXISTS idx_daily_reflections_date_timepart
 CREATE INDEX IF NOT EXISTS idx_daily_statistics_user_date 
     ON public.daily_statistics(user_id, date);
 
--- 9. 기본 과목 데이터 삽입
+-- 9. updated_at 자동 갱신 트리거
+-- 증분 백업(Scripts/notion_backup.py)이 updated_at 워터마크 이후 행만 가져가므로
+-- 어떤 경로로 수정하든 updated_at이 바뀌어야 수정된 행이 다음 증분 백업에 포함됨
+CREATE OR REPLACE FUNCTION update_updated_at_column()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS update_daily_reflections_updated_at ON public.daily_reflections;
+CREATE TRIGGER update_daily_reflections_updated_at
+    BEFORE UPDATE ON public.daily_reflections
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+CREATE INDEX IF NOT EXISTS idx_daily_reflections_updated_at
+    ON public.daily_reflections(updated_at);
+
+-- 10. 기본 과목 데이터 삽입
 INSERT INTO public.subjects (name, category, subcategory, description, color_code, icon, difficulty_level, estimated_hours) VALUES
 ('Python 기초', 'Foundation', 'Programming', 'Python 프로그래밍 기초 문법과 개념', '#3776AB', '🐍', 2, 40),
 ('데이터 구조와 알고리즘', 'Foundation', 'Computer Science', '기본적인 자료구조와 알고리즘 학습', '#FF6B6B', '🔧', 3, 60),
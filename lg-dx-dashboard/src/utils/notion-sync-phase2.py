@@ -20,6 +20,9 @@ from datetime import datetime, time
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+
+from src.notion_automation.utils.notion_property_mapper import get_mapper, REFLECTION_DB_SCHEMA
 
 logger = logging.getLogger(__name__)
 
@@ -264,162 +267,33 @@ class SupabaseToNotionMapper:
     """Supabase 데이터를 Notion 형식으로 변환하는 매퍼"""
     
     def __init__(self):
-        self.time_part_mapping = {
-            "morning": "🌅 오전수업",
-            "afternoon": "🌞 오후수업", 
-            "evening": "🌙 저녁자율학습"
-        }
-        
-        self.condition_mapping = {
-            "좋음": "😊 좋음",
-            "보통": "😐 보통",
-            "나쁨": "😞 나쁨"
-        }
-        
-        self.focus_level_mapping = {
-            1: "😴 매우낮음",
-            2: "😑 낮음", 
-            3: "😐 보통",
-            4: "🙂 좋음",
-            5: "😊 매우좋음"
-        }
+        # 선언적 스키마에서 한 번만 컴파일된 공용 매퍼
+        self.mapper = get_mapper(REFLECTION_DB_SCHEMA)
     
     def map_supabase_to_notion(self, supabase_data: SupabaseReflectionSchema) -> Dict[str, Any]:
         """
         Phase 2.2.1: transform_reflection_to_notion() 함수 완성
         Supabase 스키마를 Notion 속성으로 변환
         """
-        
-        # 제목 생성 (name은 title 속성)
-        time_emoji = self.time_part_mapping.get(supabase_data.time_part, "📝").split()[0]
-        title = f"{time_emoji} {supabase_data.subject or '일일 반성'} - {supabase_data.date}"
-        
-        notion_properties = {
-            "name": {
-                "title": [
-                    {
-                        "text": {
-                            "content": title
-                        }
-                    }
-                ]
-            },
-            "reflection_date": {
-                "date": {
-                    "start": supabase_data.date
-                }
-            },
-            "time_part": {
-                "select": {
-                    "name": self.time_part_mapping.get(supabase_data.time_part, supabase_data.time_part)
-                }
-            },
-            "understanding": {
-                "number": supabase_data.understanding_score
-            },
-            "difficulty": {
-                "number": supabase_data.difficulty_rating or supabase_data.concentration_score
-            },
-            "condition": {
-                "select": {
-                    "name": self.condition_mapping.get(supabase_data.condition, supabase_data.condition)
-                }
-            },
-            "focus_level": {
-                "select": {
-                    "name": self.focus_level_mapping.get(supabase_data.achievement_score, "😐 보통")
-                }
-            },
-            "github_commits": {
-                "number": supabase_data.github_commits
-            },
-            "github_issues": {
-                "number": supabase_data.github_issues
-            },
-            "github_prs": {
-                "number": supabase_data.github_prs
-            }
-        }
-        
-        # 선택적 필드 처리
-        if supabase_data.subject:
-            notion_properties["subject"] = {
-                "rich_text": [{"text": {"content": supabase_data.subject}}]
-            }
-            
-        if supabase_data.key_topics:
-            notion_properties["key_learning"] = {
-                "rich_text": [{"text": {"content": ", ".join(supabase_data.key_topics)}}]
-            }
-            
-        if supabase_data.challenges:
-            notion_properties["challenges"] = {
-                "rich_text": [{"text": {"content": ", ".join(supabase_data.challenges) if isinstance(supabase_data.challenges, list) else str(supabase_data.challenges)}}]
-            }
-            
-        if supabase_data.notes:
-            notion_properties["reflection"] = {
-                "rich_text": [{"text": {"content": supabase_data.notes}}]
-            }
-            
-        if supabase_data.start_time and supabase_data.end_time:
-            notion_properties["start_time"] = {
-                "rich_text": [{"text": {"content": str(supabase_data.start_time)}}]
-            }
-            notion_properties["end_time"] = {
-                "rich_text": [{"text": {"content": str(supabase_data.end_time)}}]
-            }
-            
-        if supabase_data.study_hours:
-            notion_properties["learning_hours"] = {
-                "number": supabase_data.study_hours
-            }
-            
-        # GitHub 활동 요약
-        if any([supabase_data.github_commits, supabase_data.github_issues, supabase_data.github_prs]):
-            github_summary = f"커밋: {supabase_data.github_commits}, 이슈: {supabase_data.github_issues}, PR: {supabase_data.github_prs}"
-            notion_properties["github_activities"] = {
-                "rich_text": [{"text": {"content": github_summary}}]
-            }
-            
-        # 최적 플래그 설정 (종합 점수 8점 이상)
-        total_score = supabase_data.understanding_score + supabase_data.concentration_score + supabase_data.achievement_score
-        notion_properties["optimal_flag"] = {
-            "checkbox": total_score >= 24  # 30점 만점에서 80% 이상
-        }
-        
-        return notion_properties
+        return self.mapper.map_row(vars(supabase_data))
+    
+    def map_batch(self, records: List[SupabaseReflectionSchema]) -> Dict[str, Any]:
+        """
+        여러 레코드를 한 번에 변환
+        results(변환 결과), errors(index/key/error)와 처리 통계 반환
+        """
+        return self.mapper.map_batch(vars(record) for record in records)
     
     def validate_data_types(self, notion_data: Dict[str, Any]) -> bool:
         """
         Phase 2.2.2: 데이터 타입 검증 로직 추가
         """
         try:
-            # 필수 필드 검증
-            required_fields = ["name", "reflection_date", "time_part"]
-            for field in required_fields:
-                if field not in notion_data:
-                    logger.error(f"❌ 필수 필드 누락: {field}")
-                    return False
-            
-            # 숫자 필드 검증
-            number_fields = ["understanding", "difficulty", "github_commits", "github_issues", "github_prs"]
-            for field in number_fields:
-                if field in notion_data:
-                    value = notion_data[field].get("number")
-                    if value is not None and not isinstance(value, (int, float)):
-                        logger.error(f"❌ 숫자 필드 타입 오류: {field} = {value}")
-                        return False
-            
-            # 날짜 필드 검증
-            if "reflection_date" in notion_data:
-                date_value = notion_data["reflection_date"].get("date", {}).get("start")
-                if date_value:
-                    try:
-                        datetime.fromisoformat(date_value)
-                    except ValueError:
-                        logger.error(f"❌ 날짜 형식 오류: {date_value}")
-                        return False
+            errors = self.mapper.validate(notion_data)
+            for error in errors:
+                logger.error(f"❌ {error}")
+            if errors:
+                return False
             
             logger.info("✅ 데이터 타입 검증 통과")
             return True
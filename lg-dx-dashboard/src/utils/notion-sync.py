@@ -17,6 +17,11 @@ from datetime import datetime, date
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 import asyncio
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+
+from src.notion_automation.utils.notion_property_mapper import get_mapper, REFLECTION_SYNC_SCHEMA
 
 # 로깅 설정
 logging.basicConfig(
@@ -62,6 +67,7 @@ class NotionSyncManager:
     def __init__(self, config: NotionConfig):
         self.config = config
         self.database_id = "2277307d-c90b-8110-ba55-e52757c4e4b5"  # 기존 DB ID
+        self.mapper = get_mapper(REFLECTION_SYNC_SCHEMA, self.database_id)
         
     def validate_connection(self) -> bool:
         """
@@ -85,141 +91,16 @@ class NotionSyncManager:
     def transform_reflection_to_notion(self, reflection: ReflectionData) -> Dict[str, Any]:
         """
         Phase 2.2.1: 데이터 변환 로직
-        Supabase 데이터를 Notion 형식으로 변환
+        Supabase 데이터를 Notion 형식으로 변환 (공용 컴파일 매퍼 사용)
         """
-        
-        # 시간대별 이모지 매핑
-        time_part_emoji = {
-            "morning": "🌅",
-            "afternoon": "🌞", 
-            "evening": "🌙"
-        }
-        
-        # 시간대별 한국어 매핑
-        time_part_korean = {
-            "morning": "오전수업",
-            "afternoon": "오후수업",
-            "evening": "저녁자율학습"
-        }
-        
-        # 컨디션 이모지 매핑
-        condition_emoji = {
-            "좋음": "😊",
-            "보통": "😐",
-            "나쁨": "😞"
-        }
-        
-        # 집중도 이모지 매핑
-        focus_mapping = {
-            1: "😴 매우낮음", 2: "😑 낮음", 3: "😐 보통", 
-            4: "🙂 좋음", 5: "😊 매우좋음"
-        }
-        
-        emoji = time_part_emoji.get(reflection.time_part, "📝")
-        korean_time = time_part_korean.get(reflection.time_part, reflection.time_part)
-        
-        # Notion 페이지 속성 구성
-        notion_properties = {
-            "name": {
-                "title": [
-                    {
-                        "text": {
-                            "content": f"{emoji} {reflection.subject} - {reflection.date}"
-                        }
-                    }
-                ]
-            },
-            "reflection_date": {
-                "date": {
-                    "start": reflection.date.isoformat()
-                }
-            },
-            "time_part": {
-                "select": {
-                    "name": f"{emoji} {korean_time}"
-                }
-            },
-            "subject": {
-                "rich_text": [
-                    {
-                        "text": {
-                            "content": reflection.subject
-                        }
-                    }
-                ]
-            },
-            "understanding": {
-                "number": reflection.understanding_score
-            },
-            "difficulty": {
-                "number": reflection.concentration_score  # 일단 집중도로 매핑
-            },
-            "condition": {
-                "select": {
-                    "name": f"{condition_emoji.get(reflection.condition, '😐')} {reflection.condition}"
-                }
-            },
-            "focus_level": {
-                "select": {
-                    "name": focus_mapping.get(reflection.achievement_score, "😐 보통")
-                }
-            },
-            "key_learning": {
-                "rich_text": [
-                    {
-                        "text": {
-                            "content": reflection.key_learning
-                        }
-                    }
-                ]
-            },
-            "challenges": {
-                "rich_text": [
-                    {
-                        "text": {
-                            "content": reflection.challenges
-                        }
-                    }
-                ]
-            },
-            "reflection": {
-                "rich_text": [
-                    {
-                        "text": {
-                            "content": reflection.reflection
-                        }
-                    }
-                ]
-            },
-            "github_commits": {
-                "number": reflection.github_commits
-            },
-            "github_issues": {
-                "number": reflection.github_issues
-            },
-            "github_prs": {
-                "number": reflection.github_prs
-            },
-            "memo": {
-                "rich_text": [
-                    {
-                        "text": {
-                            "content": reflection.memo
-                        }
-                    }
-                ]
-            }
-        }
-        
-        # 태그 처리
-        if reflection.tags:
-            notion_properties["tags"] = {
-                "multi_select": [
-                    {"name": tag} for tag in reflection.tags
-                ]
-            }
-        
-        return notion_properties
+        return self.mapper.map_row(vars(reflection))
+    
+    def transform_reflections_to_notion(self, reflections: List[ReflectionData]) -> Dict[str, Any]:
+        """
+        대량 동기화용 일괄 변환
+        실패한 행은 errors에 모이고 나머지는 results로 반환
+        """
+        return self.mapper.map_batch(vars(reflection) for reflection in reflections)
     
     def create_sync_report(self, results: List[Dict]) -> Dict[str, Any]:
         """
@@ -1,7 +1,8 @@
 import os
-import requests
 from dotenv import load_dotenv
 
+from src.notion_automation.utils.http_transport import get_transport
+
 # .env.local 파일 로드
 env_path = os.path.join(os.path.dirname(__file__), '.env.local')
 load_dotenv(dotenv_path=env_path)
@@ -16,7 +17,7 @@ headers = {
 
 url = f'https://api.github.com/users/{GITHUB_OWNER}/repos'
 
-response = requests.get(url, headers=headers)
+response = get_transport().get(url, headers=headers)
 
 if response.status_code == 200:
     repos = response.json()
@@ -19,13 +19,14 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
 
 # 로거 설정
 from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.time_part_calendar import get_time_part_calendar
 
 logger = ThreePartLogger("github_time_analyzer")
 
 class GitHubTimeAnalyzer:
     """GitHub 시간대별 활동 분석 시스템"""
     
-    def __init__(self, owner: str = None, repo: str = None, token: str = None):
+    def __init__(self, owner: str = None, repo: str = None, token: str = None, activity_store=None):
         """
         GitHub 시간대별 분석기 초기화
         
@@ -33,16 +34,18 @@ class GitHubTimeAnalyzer:
             owner: GitHub 저장소 소유자
             repo: GitHub 저장소 이름  
             token: GitHub 액세스 토큰
+            activity_store: webhook으로 받은 활동 저장소 (GitHubActivityStore, 지정하면 시뮬레이션 대신 사용)
         """
         self.owner = owner or os.getenv("GITHUB_OWNER", "user")
         self.repo = repo or os.getenv("GITHUB_REPO", "repository")
         self.token = token or os.getenv("GITHUB_TOKEN")
+        self.activity_store = activity_store
         
         # 3-Part 시간대 정의
+        self.calendar = get_time_part_calendar()
         self.time_ranges = {
-            "🌅 오전수업": {"start": 9, "end": 12, "type": "morning"},
-            "🌞 오후수업": {"start": 13, "end": 17, "type": "afternoon"},
-            "🌙 저녁자율학습": {"start": 19, "end": 22, "type": "evening"}
+            window.label: {"start": window.hours[0], "end": window.hours[1], "type": window.code}
+            for window in self.calendar.windows
         }
         
         # GitHub 활동 유형별 가중치
@@ -76,20 +79,28 @@ class GitHubTimeAnalyzer:
         end_hour = time_config["end"]
         
         try:
-            # 시간대별 활동 수집 (현재는 시뮬레이션)
             activities = {
                 "date": str(target_date),
                 "time_part": time_part,
                 "time_range": f"{start_hour:02d}:00-{end_hour:02d}:00",
                 "owner": self.owner,
                 "repo": self.repo,
-                "commits": self._get_commits_by_time_range(target_date, start_hour, end_hour),
-                "issues": self._get_issues_by_time_range(target_date, start_hour, end_hour),
-                "pull_requests": self._get_prs_by_time_range(target_date, start_hour, end_hour),
-                "code_reviews": self._get_reviews_by_time_range(target_date, start_hour, end_hour),
                 "productive_score": 0  # 나중에 계산
             }
             
+            if self.activity_store is not None:
+                # webhook 수신기가 도착 즉시 기록한 활동 사용 (API 호출 없음)
+                activities.update(self.activity_store.get_time_part_activities(target_date, time_part))
+                activities["data_source"] = "webhook_store"
+            else:
+                # 시간대별 활동 수집 (현재는 시뮬레이션)
+                activities.update({
+                    "commits": self._get_commits_by_time_range(target_date, start_hour, end_hour),
+                    "issues": self._get_issues_by_time_range(target_date, start_hour, end_hour),
+                    "pull_requests": self._get_prs_by_time_range(target_date, start_hour, end_hour),
+                    "code_reviews": self._get_reviews_by_time_range(target_date, start_hour, end_hour)
+                })
+            
             # 생산성 점수 계산
             activities["productive_score"] = self._calculate_time_part_productivity(activities)
             
@@ -0,0 +1,295 @@
+"""
+일별 GitHub 활동 요약 테이블 (SQLite)
+
+(날짜, 시간대, 출처)별 커밋/이슈/PR/코드리뷰 수를 한 행으로 유지합니다.
+반성 파일은 수정 시각/크기가 바뀐 파일만 다시 읽어 반영하고, webhook 활동은
+GitHubActivityStore가 기록할 때마다 해당 (날짜, 시간대) 건수를 갱신합니다.
+히트맵은 반성 파일을 날짜마다 열지 않고 이 테이블의 범위 조회 몇 번으로 1년치 격자를 만듭니다.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, date as date_type, timedelta
+from typing import Dict, Any, Optional, Union
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.dashboard.reflection_dataset import TIMEPART_FILES
+
+DateLike = Union[datetime, date_type, str]
+
+DEFAULT_SUMMARY_DB = "data/stats/activity_summary.db"
+ACTIVITY_COLUMNS = ("commits", "issues", "pull_requests", "code_reviews")
+HEATMAP_COLUMNS = ("commits", "issues", "pull_requests")  # 히트맵 활동량 = 커밋 + 이슈 + PR
+
+SOURCE_REFLECTION = "reflection"
+SOURCE_WEBHOOK = "webhook"
+
+# 같은 (날짜, 시간대)에 출처가 여럿이면 큰 쪽을 사용 (같은 활동을 두 번 세지 않도록)
+CELL_QUERY = f'''
+    SELECT date, weekday, time_part, MAX({' + '.join(HEATMAP_COLUMNS)}) AS activity
+    FROM daily_activity WHERE date BETWEEN ? AND ?
+    GROUP BY date, time_part
+'''
+
+
+def _to_date(value: DateLike) -> date_type:
+    if isinstance(value, str):
+        # "YYYY-MM-DD..." 또는 반성 데이터셋 키 "YYYYMMDD"
+        return datetime.strptime(value[:10].replace("-", "")[:8], "%Y%m%d").date()
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def github_counts(github_data: Dict[str, Any]) -> Dict[str, int]:
+    """반성 데이터의 github_data에서 활동 건수 추출 (입력 스크립트는 PR 수를 "prs"로 저장)"""
+    def count(*keys) -> int:
+        for key in keys:
+            value = github_data.get(key)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return int(value)
+        return 0
+
+    return {
+        "commits": count("commits"),
+        "issues": count("issues"),
+        "pull_requests": count("pull_requests", "prs"),
+        "code_reviews": count("code_reviews"),
+    }
+
+
+class DailyActivitySummary:
+    """날짜 × 시간대 GitHub 활동 요약 테이블"""
+
+    def __init__(self, db_path: str = DEFAULT_SUMMARY_DB, logger: Optional[ThreePartLogger] = None):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            logger: 로깅 시스템 (선택사항)
+        """
+        self.db_path = db_path
+        self.logger = logger or ThreePartLogger(name="activity_summary")
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._initialize_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _initialize_database(self):
+        """요약/원본 파일 상태 테이블 생성"""
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f'''
+                CREATE TABLE IF NOT EXISTS daily_activity (
+                    date TEXT NOT NULL,
+                    weekday INTEGER NOT NULL,
+                    time_part TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    {', '.join(f'{column} INTEGER NOT NULL DEFAULT 0' for column in ACTIVITY_COLUMNS)},
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (date, time_part, source)
+                )
+            ''')
+            # 반영한 반성 파일의 (수정 시각, 크기) - 바뀐 파일만 다시 읽기 위함
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS reflection_sources (
+                    path TEXT PRIMARY KEY,
+                    date TEXT NOT NULL,
+                    time_part TEXT NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL
+                )
+            ''')
+
+    # ------------------------------------------------------------------ 갱신
+
+    @staticmethod
+    def _upsert(conn: sqlite3.Connection, day: date_type, time_part: str, source: str,
+                counts: Dict[str, int]) -> bool:
+        values = tuple(int(counts.get(column, 0)) for column in ACTIVITY_COLUMNS)
+        existing = conn.execute(
+            f"SELECT {', '.join(ACTIVITY_COLUMNS)} FROM daily_activity WHERE date = ? AND time_part = ? AND source = ?",
+            (day.isoformat(), time_part, source)
+        ).fetchone()
+        if existing == values:
+            return False
+
+        conn.execute(f'''
+            INSERT OR REPLACE INTO daily_activity
+            (date, weekday, time_part, source, {', '.join(ACTIVITY_COLUMNS)}, updated_at)
+            VALUES (?, ?, ?, ?, {', '.join('?' * len(ACTIVITY_COLUMNS))}, ?)
+        ''', (day.isoformat(), day.weekday(), time_part, source) + values + (datetime.now().isoformat(),))
+        return True
+
+    def record_counts(self, date_value: DateLike, time_part: str, source: str, counts: Dict[str, int]) -> bool:
+        """
+        (날짜, 시간대, 출처)의 활동 건수를 덮어씀
+
+        Returns:
+            값이 바뀌었는지 여부
+        """
+        with self._lock, self._connect() as conn:
+            return self._upsert(conn, _to_date(date_value), time_part, source, counts)
+
+    def record_reflection(self, date_value: DateLike, time_part: str, reflection: Dict[str, Any]) -> bool:
+        """반성 데이터 하나의 github_data 반영"""
+        return self.record_counts(date_value, time_part, SOURCE_REFLECTION,
+                                  github_counts(reflection.get("github_data") or {}))
+
+    def record_dataset(self, dataset: Dict[str, Dict[str, Dict[str, Any]]]) -> int:
+        """
+        load_reflection_dataset 결과를 한 트랜잭션으로 반영 (바뀐 행만 기록)
+
+        Returns:
+            변경된 행 수
+        """
+        changed = 0
+        with self._lock, self._connect() as conn:
+            for date_key, entries in dataset.items():
+                day = _to_date(date_key)
+                for time_part, reflection in entries.items():
+                    changed += self._upsert(conn, day, time_part, SOURCE_REFLECTION,
+                                            github_counts(reflection.get("github_data") or {}))
+        return changed
+
+    def sync_reflection_files(self, data_dir: str) -> int:
+        """
+        반성 폴더를 훑어 새로 생기거나 바뀐 파일만 읽어 반영하고, 사라진 파일의 행은 삭제
+
+        파일 내용은 (수정 시각, 크기)가 기록과 다를 때만 읽으므로 변화가 없으면
+        폴더 목록 조회만으로 끝납니다.
+
+        Returns:
+            다시 읽은 파일 수
+        """
+        parsed = 0
+        with self._lock, self._connect() as conn:
+            known = {
+                path: (mtime_ns, size, day, time_part)
+                for path, day, time_part, mtime_ns, size in conn.execute(
+                    "SELECT path, date, time_part, mtime_ns, size FROM reflection_sources")
+            }
+            seen = set()
+
+            for time_part, (folder, prefix) in TIMEPART_FILES.items():
+                folder_path = os.path.join(data_dir, folder)
+                if not os.path.isdir(folder_path):
+                    continue
+
+                with os.scandir(folder_path) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if not (name.startswith(prefix + "_") and name.endswith(".json")):
+                            continue
+                        stem = name[len(prefix) + 1:-5]
+                        if len(stem) != 8 or not stem.isdigit():
+                            continue
+
+                        seen.add(entry.path)
+                        stat = entry.stat()
+                        if known.get(entry.path, (None, None))[:2] == (stat.st_mtime_ns, stat.st_size):
+                            continue
+
+                        try:
+                            day = date_type(int(stem[:4]), int(stem[4:6]), int(stem[6:]))
+                            with open(entry.path, 'r', encoding='utf-8') as f:
+                                reflection = json.load(f)
+                        except (OSError, ValueError) as e:
+                            self.logger.warning(f"반성 파일 읽기 실패, 건너뜀: {entry.path} ({str(e)})")
+                            continue
+
+                        self._upsert(conn, day, time_part, SOURCE_REFLECTION,
+                                     github_counts(reflection.get("github_data") or {}))
+                        conn.execute(
+                            "INSERT OR REPLACE INTO reflection_sources (path, date, time_part, mtime_ns, size) VALUES (?, ?, ?, ?, ?)",
+                            (entry.path, day.isoformat(), time_part, stat.st_mtime_ns, stat.st_size)
+                        )
+                        parsed += 1
+
+            for path, (_, _, day, time_part) in known.items():
+                if path not in seen and path.startswith(os.path.join(data_dir, "")):
+                    conn.execute("DELETE FROM reflection_sources WHERE path = ?", (path,))
+                    conn.execute("DELETE FROM daily_activity WHERE date = ? AND time_part = ? AND source = ?",
+                                 (day, time_part, SOURCE_REFLECTION))
+
+        if parsed:
+            self.logger.info(f"활동 요약 갱신: 반성 파일 {parsed}개 반영")
+        return parsed
+
+    # ------------------------------------------------------------------ 조회
+
+    def activity_grid(self, start: DateLike, end: DateLike) -> Dict[str, Dict[str, int]]:
+        """
+        기간 내 {날짜(YYYY-MM-DD): {시간대: 활동량}} (기록이 있는 칸만)
+
+        활동량은 커밋 + 이슈 + PR이며, 출처가 여럿이면 큰 값을 사용합니다.
+        """
+        grid: Dict[str, Dict[str, int]] = {}
+        with self._connect() as conn:
+            for day, _, time_part, activity in conn.execute(
+                    CELL_QUERY, (_to_date(start).isoformat(), _to_date(end).isoformat())):
+                grid.setdefault(day, {})[time_part] = activity
+        return grid
+
+    def timepart_stats(self, start: DateLike, end: DateLike) -> Dict[str, Dict[str, int]]:
+        """기간 내 시간대별 {total, max, active_days} (집계 쿼리 한 번)"""
+        with self._connect() as conn:
+            rows = conn.execute(f'''
+                SELECT time_part, SUM(activity), MAX(activity), SUM(activity > 0)
+                FROM ({CELL_QUERY}) GROUP BY time_part
+            ''', (_to_date(start).isoformat(), _to_date(end).isoformat())).fetchall()
+        return {
+            time_part: {"total": total or 0, "max": max_activity or 0, "active_days": active_days or 0}
+            for time_part, total, max_activity, active_days in rows
+        }
+
+    def weekday_totals(self, start: DateLike, end: DateLike) -> Dict[int, int]:
+        """기간 내 요일(0=월요일)별 활동량 합계"""
+        with self._connect() as conn:
+            rows = conn.execute(f'''
+                SELECT weekday, SUM(activity) FROM ({CELL_QUERY}) GROUP BY weekday
+            ''', (_to_date(start).isoformat(), _to_date(end).isoformat())).fetchall()
+        return {weekday: total for weekday, total in rows}
+
+
+def test_activity_summary():
+    """1년치 반성 파일 반영 후 격자 조회 속도 확인"""
+    import tempfile
+    import random
+    import time
+
+    print("🗂️ 일별 활동 요약 테스트 시작")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        today = datetime.now()
+        for offset in range(365):
+            day = today - timedelta(days=offset)
+            for time_part, (folder, prefix) in TIMEPART_FILES.items():
+                os.makedirs(os.path.join(temp_dir, folder), exist_ok=True)
+                with open(os.path.join(temp_dir, folder, f"{prefix}_{day.strftime('%Y%m%d')}.json"), 'w', encoding='utf-8') as f:
+                    json.dump({"github_data": {"commits": random.randint(0, 8), "prs": random.randint(0, 2)}}, f)
+
+        summary = DailyActivitySummary(os.path.join(temp_dir, "summary.db"))
+
+        started = time.perf_counter()
+        parsed = summary.sync_reflection_files(temp_dir)
+        print(f"✅ 최초 반영: 파일 {parsed}개 {time.perf_counter() - started:.2f}초")
+
+        started = time.perf_counter()
+        parsed = summary.sync_reflection_files(temp_dir)
+        print(f"✅ 변경 없는 재반영: 파일 {parsed}개 {(time.perf_counter() - started) * 1000:.1f}ms")
+
+        started = time.perf_counter()
+        grid = summary.activity_grid(today - timedelta(days=364), today)
+        print(f"✅ 365일 격자 조회: {len(grid)}일 {(time.perf_counter() - started) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    test_activity_summary()
@@ -3,10 +3,10 @@
 모든 시각화 요소를 통합한 종합 대시보드
 """
 
-import json
 import os
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
+from functools import partial
+from typing import Dict, List, Any, Optional, Tuple, Iterator
 import sys
 
 # 프로젝트 루트 경로 추가
@@ -14,17 +14,43 @@ project_root = os.path.join(os.path.dirname(__file__), '..', '..', '..')
 sys.path.append(project_root)
 
 from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.artifact_store import ArtifactStore
 from src.notion_automation.dashboard.time_part_visualizer import TimePartVisualizer
 from src.notion_automation.dashboard.github_heatmap import GitHubTimePartHeatmap
 from src.notion_automation.dashboard.efficiency_trend import EfficiencyTrendChart
 from src.notion_automation.dashboard.optimal_time_analyzer import OptimalTimeAnalyzer
+from src.notion_automation.dashboard.reflection_dataset import load_reflection_dataset, get_reflection
+from src.notion_automation.dashboard.reflection_ingest import get_reflection_ingestor
+from src.notion_automation.dashboard.notion_block_uploader import NotionBlockUploader
+from src.notion_automation.optimization.task_dag_executor import TaskDAGExecutor
+
+
+def run_optimal_analysis(data_dir: str, days: int, dataset: Optional[Dict[str, Dict]] = None) -> Dict[str, Any]:
+    """
+    프로세스 작업용 최적 시간대 분석
+
+    분석기 인스턴스는 로거/락을 가지고 있어 pickle할 수 없으므로 워커 안에서 새로 만듭니다.
+    """
+    return OptimalTimeAnalyzer(data_dir).identify_optimal_learning_times(days, dataset)
+
 
 class ThreePartDashboard:
     """3-Part 메인 대시보드 생성 클래스"""
     
-    def __init__(self):
+    def __init__(self, process_analytics: bool = False):
+        """
+        Args:
+            process_analytics: 최적 시간대 분석을 별도 프로세스에서 실행할지 여부
+                (데이터가 적을 때는 프로세스 기동 비용이 더 크므로 기본값은 스레드)
+        """
         self.logger = ThreePartLogger()
         self.data_dir = os.path.join(project_root, 'data')
+        self.artifact_store = ArtifactStore(os.path.join(self.data_dir, 'artifacts'), logger=self.logger)
+        # 반성 저장 시점에 갱신되는 통계 저장소 (처음 사용 시 기존 파일 backfill)
+        self.ingestor = get_reflection_ingestor(self.data_dir)
+        self.rolling_stats = self.ingestor.score_stats
+        self.process_analytics = process_analytics
+        self.last_build_timings = {}
         
         # 각 시각화 모듈 인스턴스
         self.visualizer = TimePartVisualizer()
@@ -55,21 +81,15 @@ class ThreePartDashboard:
         try:
             self.logger.info(f"3-Part 메인 대시보드 생성 시작 ({days}일간 데이터)")
             
-            # 1. 오늘의 3-Part 요약 생성
-            today_summary = self._create_today_3part_summary()
-            
-            # 2. 시간대별 성과 비교 차트 생성
-            radar_chart = self.visualizer.create_3part_performance_radar(days)
-            heatmap_data = self.heatmap.create_github_timepart_heatmap(days)
-            
-            # 3. 개인 최적화 분석 생성
-            optimal_analysis = self.analyzer.identify_optimal_learning_times(days * 2)  # 2배 기간으로 정확도 향상
+            # 1~5. 데이터를 한 번 로드한 뒤 독립적인 섹션들을 동시에 생성
+            sections = self._build_sections(days)
             
-            # 4. 트렌드 분석 생성
-            trend_data = self.trend_chart.create_efficiency_trend_chart(days)
-            
-            # 5. 주간 3-Part 통계 생성
-            weekly_stats = self._generate_weekly_stats(days)
+            today_summary = sections.get("today_summary") or {}
+            radar_chart = sections.get("radar_chart") or {}
+            heatmap_data = sections.get("github_heatmap") or {}
+            optimal_analysis = sections.get("optimal_analysis") or {}
+            trend_data = sections.get("efficiency_trend") or {}
+            weekly_stats = sections.get("weekly_stats") or {}
             
             # 6. 대시보드 구조 생성
             dashboard_structure = {
@@ -132,7 +152,8 @@ class ThreePartDashboard:
                     "total_data_points": self._count_total_data_points(days),
                     "analysis_accuracy": self._calculate_analysis_accuracy(days),
                     "last_updated": datetime.now().isoformat(),
-                    "next_update": (datetime.now() + timedelta(hours=1)).isoformat()
+                    "next_update": (datetime.now() + timedelta(hours=1)).isoformat(),
+                    "section_timings": self.last_build_timings
                 }
             }
             
@@ -140,25 +161,62 @@ class ThreePartDashboard:
             notion_blocks = self._convert_to_notion_blocks(dashboard_structure)
             dashboard_structure["notion_blocks"] = notion_blocks
             
-            # 8. 대시보드 저장
-            output_path = os.path.join(self.data_dir, f"3part_dashboard_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(dashboard_structure, f, ensure_ascii=False, indent=2)
+            # 8. 대시보드 저장 (내용이 같으면 새로 기록하지 않음)
+            content_hash = self.artifact_store.put("3part_dashboard", dashboard_structure, window=f"{days}d")
             
-            self.logger.info(f"3-Part 메인 대시보드 생성 완료: {output_path}")
+            self.logger.info(f"3-Part 메인 대시보드 생성 완료: {content_hash[:12]}")
             return dashboard_structure
             
         except Exception as e:
             self.logger.log_error(e, "3-Part 메인 대시보드 생성")
             return {}
     
-    def _create_today_3part_summary(self) -> Dict[str, Any]:
+    def _build_sections(self, days: int) -> Dict[str, Any]:
+        """
+        대시보드 섹션을 의존성 DAG로 구성하여 동시에 생성
+        
+        모든 섹션은 한 번 로드한 반성 데이터셋을 공유하며,
+        섹션별 소요 시간은 last_build_timings에 기록됩니다.
+        
+        Args:
+            days: 분석할 일수
+            
+        Returns:
+            섹션 이름별 결과 (실패한 섹션은 None)
+        """
+        # 반성 스크립트를 거치지 않은 파일 수정/삭제 반영 (바뀐 파일만 읽음)
+        self.ingestor.sync_reflection_files()
+        
+        executor = TaskDAGExecutor(max_threads=5, logger=self.logger)
+        if self.process_analytics:
+            optimal_analysis = partial(run_optimal_analysis, self.data_dir, days * 2)
+        else:
+            optimal_analysis = partial(self.analyzer.identify_optimal_learning_times, days * 2)
+        
+        # 최적 시간대 분석이 2배 기간을 사용하므로 가장 긴 기간으로 한 번만 로드
+        executor.add_task("dataset", partial(load_reflection_dataset, self.data_dir, days * 2))
+        executor.add_task("today_summary", self._create_today_3part_summary, ["dataset"])
+        executor.add_task("radar_chart", partial(self.visualizer.create_3part_performance_radar, days), ["dataset"])
+        executor.add_task("github_heatmap", partial(self.heatmap.create_github_timepart_heatmap, days), ["dataset"])
+        executor.add_task("optimal_analysis", optimal_analysis,  # 2배 기간으로 정확도 향상
+                          ["dataset"], kind="process" if self.process_analytics else "thread")
+        executor.add_task("efficiency_trend", partial(self.trend_chart.create_efficiency_trend_chart, days), ["dataset"])
+        executor.add_task("weekly_stats", partial(self._generate_weekly_stats, days), ["dataset"])
+        
+        results = executor.run()
+        self.last_build_timings = executor.get_timing_breakdown()
+        
+        self.logger.info(
+            f"대시보드 섹션 생성: 총 {self.last_build_timings['total_seconds']:.2f}초 "
+            f"(순차 합계 {self.last_build_timings['sequential_seconds']:.2f}초, "
+            f"최장 섹션 {self.last_build_timings['slowest_task']})"
+        )
+        return results
+    
+    def _create_today_3part_summary(self, dataset: Optional[Dict[str, Dict]] = None) -> Dict[str, Any]:
         """오늘의 3-Part 요약 생성"""
         try:
             today = datetime.now()
-            today_str = today.strftime("%Y%m%d")
             
             summary = {
                 "date": today.strftime("%Y-%m-%d"),
@@ -166,19 +224,11 @@ class ThreePartDashboard:
                 "timeparts": {}
             }
             
-            # 각 시간대별 오늘 데이터 수집
-            timepart_configs = {
-                "🌅 오전수업": ("morning_reflections", f"morning_reflection_{today_str}.json"),
-                "🌞 오후수업": ("afternoon_reflections", f"afternoon_reflection_{today_str}.json"),
-                "🌙 저녁자율학습": ("evening_reflections", f"evening_reflection_{today_str}.json")
-            }
-            
             total_score = 0
             completed_parts = 0
             
-            for timepart, (folder, filename) in timepart_configs.items():
-                file_path = os.path.join(self.data_dir, folder, filename)
-                
+            # 각 시간대별 오늘 데이터 수집
+            for timepart in ["🌅 오전수업", "🌞 오후수업", "🌙 저녁자율학습"]:
                 timepart_summary = {
                     "completed": False,
                     "score": 0,
@@ -186,25 +236,23 @@ class ThreePartDashboard:
                     "status": "미완료"
                 }
                 
-                if os.path.exists(file_path):
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        
-                        score = data.get('총점', 0)
-                        condition = data.get('컨디션', '보통')
-                        github_data = data.get('github_data', {})
-                        
-                        timepart_summary = {
-                            "completed": True,
-                            "score": score,
-                            "condition": condition,
-                            "github_commits": github_data.get('commits', 0),
-                            "highlights": self._extract_highlights(data, timepart),
-                            "status": self._get_performance_status(score)
-                        }
-                        
-                        total_score += score
-                        completed_parts += 1
+                data = get_reflection(self.data_dir, timepart, today, dataset)
+                if data is not None:
+                    score = data.get('총점', 0)
+                    condition = data.get('컨디션', '보통')
+                    github_data = data.get('github_data', {})
+                    
+                    timepart_summary = {
+                        "completed": True,
+                        "score": score,
+                        "condition": condition,
+                        "github_commits": github_data.get('commits', 0),
+                        "highlights": self._extract_highlights(data, timepart),
+                        "status": self._get_performance_status(score)
+                    }
+                    
+                    total_score += score
+                    completed_parts += 1
                 
                 summary["timeparts"][timepart] = timepart_summary
             
@@ -286,7 +334,7 @@ class ThreePartDashboard:
         else:  # 부분 완료
             return f"부분 완료 ({completed_parts}/3)"
     
-    def _generate_weekly_stats(self, days: int) -> Dict[str, Any]:
+    def _generate_weekly_stats(self, days: int, dataset: Optional[Dict[str, Dict]] = None) -> Dict[str, Any]:
         """주간 통계 생성"""
         try:
             weekly_stats = {
@@ -298,7 +346,7 @@ class ThreePartDashboard:
             
             # 각 시간대별 주간 통계
             for timepart in ["🌅 오전수업", "🌞 오후수업", "🌙 저녁자율학습"]:
-                stats = self._calculate_timepart_weekly_stats(timepart, days)
+                stats = self._calculate_timepart_weekly_stats(timepart, days, dataset)
                 weekly_stats["timepart_stats"][timepart] = stats
             
             # 전체 트렌드
@@ -313,46 +361,36 @@ class ThreePartDashboard:
             self.logger.log_error(e, "주간 통계 생성")
             return {}
     
-    def _calculate_timepart_weekly_stats(self, timepart: str, days: int) -> Dict[str, Any]:
+    def _calculate_timepart_weekly_stats(self, timepart: str, days: int, dataset: Optional[Dict[str, Dict]] = None) -> Dict[str, Any]:
         """시간대별 주간 통계 계산"""
         try:
-            folder_map = {
-                "🌅 오전수업": "morning_reflections",
-                "🌞 오후수업": "afternoon_reflections", 
-                "🌙 저녁자율학습": "evening_reflections"
-            }
-            
-            folder = folder_map[timepart]
             scores = []
             github_activities = []
             active_days = 0
             
             for day_offset in range(days):
                 date = datetime.now() - timedelta(days=day_offset)
-                filename = f"{folder[:-1]}_{date.strftime('%Y%m%d')}.json"
-                file_path = os.path.join(self.data_dir, folder, filename)
+                data = get_reflection(self.data_dir, timepart, date, dataset)
                 
-                if os.path.exists(file_path):
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        
-                        score = data.get('총점', 0)
-                        scores.append(score)
-                        
-                        github_data = data.get('github_data', {})
-                        github_activity = github_data.get('commits', 0) + github_data.get('issues', 0)
-                        github_activities.append(github_activity)
-                        
-                        active_days += 1
+                if data is not None:
+                    score = data.get('총점', 0)
+                    scores.append(score)
+                    
+                    github_data = data.get('github_data', {})
+                    github_activity = github_data.get('commits', 0) + github_data.get('issues', 0)
+                    github_activities.append(github_activity)
+                    
+                    active_days += 1
             
             if scores:
+                window = self.rolling_stats.window(timepart, "total_score", datetime.now(), days)
                 return {
                     "active_days": active_days,
                     "activity_rate": (active_days / days) * 100,
-                    "average_score": sum(scores) / len(scores),
+                    "average_score": window["mean"],
                     "best_score": max(scores),
                     "total_github_activity": sum(github_activities),
-                    "consistency": self._calculate_consistency_score(scores)
+                    "consistency": self._calculate_consistency_score(window)
                 }
             else:
                 return {
@@ -368,17 +406,13 @@ class ThreePartDashboard:
             self.logger.log_error(e, f"시간대별 주간 통계 계산 ({timepart})")
             return {}
     
-    def _calculate_consistency_score(self, values: List[float]) -> float:
-        """일관성 점수 계산"""
-        if len(values) <= 1:
+    def _calculate_consistency_score(self, window: Dict[str, Any]) -> float:
+        """일관성 점수 계산 (누적 통계 구간 조회 결과 사용)"""
+        if window["count"] <= 1:
             return 0
         
-        mean_val = sum(values) / len(values)
-        variance = sum([(v - mean_val) ** 2 for v in values]) / len(values)
-        std_dev = variance ** 0.5
-        
         # 표준편차가 낮을수록 일관성이 높음
-        consistency = max(0, 10 - std_dev / 10)
+        consistency = max(0, 10 - window["std_dev"] / 10)
         return round(consistency, 1)
     
     def _calculate_overall_trends(self, days: int) -> Dict[str, Any]:
@@ -573,60 +607,108 @@ class ThreePartDashboard:
     
     def _convert_to_notion_blocks(self, dashboard_structure: Dict) -> List[Dict[str, Any]]:
         """대시보드를 Notion 블록으로 변환"""
-        blocks = []
+        try:
+            return list(self._iter_notion_blocks(dashboard_structure))
+            
+        except Exception as e:
+            self.logger.log_error(e, "Notion 블록 변환")
+            return []
+    
+    def _iter_notion_blocks(self, dashboard_structure: Dict, collapsible_sections: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        대시보드 Notion 블록을 섹션 순서대로 생성하는 제너레이터
+        
+        Args:
+            dashboard_structure: 대시보드 구조
+            collapsible_sections: True이면 섹션 내용을 토글 제목의 하위 블록으로 묶음
+                (섹션별 하위 트리를 병렬 업로드할 수 있음)
+        """
+        # 제목 블록
+        yield {
+            "object": "block",
+            "type": "heading_1",
+            "heading_1": {
+                "rich_text": [{"type": "text", "text": {"content": dashboard_structure.get("title", "3-Part Dashboard")}}]
+            }
+        }
+        
+        # 부제목 블록
+        yield {
+            "object": "block", 
+            "type": "paragraph",
+            "paragraph": {
+                "rich_text": [{"type": "text", "text": {"content": dashboard_structure.get("subtitle", "")}}]
+            }
+        }
         
+        # 각 섹션별 블록 생성
+        sections = dashboard_structure.get("sections", [])
+        for section in sorted(sections, key=lambda x: x.get("priority", 999)):
+            
+            # 섹션 내용에 따른 블록 생성
+            section_type = section.get("type", "")
+            content = section.get("content", {})
+            
+            if section_type == "summary_cards":
+                section_blocks = self._create_summary_blocks(content)
+            elif section_type == "visualization":
+                section_blocks = self._create_visualization_blocks(content)
+            elif section_type == "analysis":
+                section_blocks = self._create_analysis_blocks(content)
+            elif section_type == "trend":
+                section_blocks = self._create_trend_blocks(content)
+            elif section_type == "insights":
+                section_blocks = self._create_insights_blocks(content)
+            else:
+                section_blocks = []
+            
+            # 섹션 제목
+            heading = {
+                "rich_text": [{"type": "text", "text": {"content": section.get("title", "")}}]
+            }
+            
+            if collapsible_sections:
+                heading["is_toggleable"] = True
+                heading["children"] = section_blocks
+                yield {"object": "block", "type": "heading_2", "heading_2": heading}
+            else:
+                yield {"object": "block", "type": "heading_2", "heading_2": heading}
+                yield from section_blocks
+    
+    def publish_to_notion(self, page_id: str, dashboard_structure: Dict, client: Any = None,
+                          collapsible_sections: bool = True) -> Dict[str, Any]:
+        """
+        대시보드를 Notion 페이지에 업로드
+        
+        블록을 스트림으로 생성하여 API 제한(요청당 100개, 텍스트 2000자)에 맞게
+        묶어 올리며, 토글 섹션은 하위 트리로 병렬 업로드합니다.
+        
+        Args:
+            page_id: 대상 Notion 페이지 ID
+            dashboard_structure: create_main_3part_dashboard 결과
+            client: Notion 클라이언트 (기본값: NOTION_API_TOKEN으로 생성한 notion_client.Client)
+            collapsible_sections: 섹션을 토글 제목으로 묶을지 여부
+            
+        Returns:
+            업로드 통계 (실패 시 빈 딕셔너리)
+        """
         try:
-            # 제목 블록
-            blocks.append({
-                "object": "block",
-                "type": "heading_1",
-                "heading_1": {
-                    "rich_text": [{"type": "text", "text": {"content": dashboard_structure.get("title", "3-Part Dashboard")}}]
-                }
-            })
+            if client is None:
+                from notion_client import Client
+                client = Client(auth=os.getenv("NOTION_API_TOKEN"))
             
-            # 부제목 블록
-            blocks.append({
-                "object": "block", 
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [{"type": "text", "text": {"content": dashboard_structure.get("subtitle", "")}}]
-                }
-            })
+            uploader = NotionBlockUploader(client, logger=self.logger)
+            stats = uploader.upload(page_id, self._iter_notion_blocks(dashboard_structure, collapsible_sections))
             
-            # 각 섹션별 블록 생성
-            sections = dashboard_structure.get("sections", [])
-            for section in sorted(sections, key=lambda x: x.get("priority", 999)):
-                
-                # 섹션 제목
-                blocks.append({
-                    "object": "block",
-                    "type": "heading_2",
-                    "heading_2": {
-                        "rich_text": [{"type": "text", "text": {"content": section.get("title", "")}}]
-                    }
-                })
-                
-                # 섹션 내용에 따른 블록 생성
-                section_type = section.get("type", "")
-                content = section.get("content", {})
-                
-                if section_type == "summary_cards":
-                    blocks.extend(self._create_summary_blocks(content))
-                elif section_type == "visualization":
-                    blocks.extend(self._create_visualization_blocks(content))
-                elif section_type == "analysis":
-                    blocks.extend(self._create_analysis_blocks(content))
-                elif section_type == "trend":
-                    blocks.extend(self._create_trend_blocks(content))
-                elif section_type == "insights":
-                    blocks.extend(self._create_insights_blocks(content))
-            
-            return blocks
+            self.logger.info(
+                f"대시보드 Notion 업로드 완료: 요청 {stats['requests']}회, "
+                f"블록 {stats['blocks_uploaded']}개, 실패 {stats['failed_requests']}회"
+            )
+            return stats
             
         except Exception as e:
-            self.logger.log_error(e, "Notion 블록 변환")
-            return []
+            self.logger.log_error(e, "대시보드 Notion 업로드")
+            return {}
     
     def _create_summary_blocks(self, content: Dict) -> List[Dict[str, Any]]:
         """요약 블록 생성"""
@@ -838,6 +920,11 @@ def test_three_part_dashboard():
         accuracy = metadata.get('analysis_accuracy', '0%')
         print(f"📈 데이터 포인트: {total_data}개 (정확도: {accuracy})")
         
+        # 섹션별 소요 시간 출력
+        timings = metadata.get('section_timings', {})
+        for section_name, timing in timings.get('tasks', {}).items():
+            print(f"  ⏱️ {section_name}: {timing['duration_seconds']:.3f}초 ({timing['kind']})")
+        
     else:
         print("❌ 메인 대시보드 생성 실패")
     
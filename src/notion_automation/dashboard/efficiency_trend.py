@@ -3,7 +3,6 @@
 날짜별 3개 시간대 효율성 변화 추이 분석
 """
 
-import json
 import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
@@ -14,6 +13,10 @@ project_root = os.path.join(os.path.dirname(__file__), '..', '..', '..')
 sys.path.append(project_root)
 
 from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.artifact_store import ArtifactStore
+from src.notion_automation.dashboard.reflection_dataset import get_reflection
+from src.notion_automation.dashboard.reflection_ingest import get_reflection_ingestor
+from src.notion_automation.dashboard.reflection_metrics import efficiency_score
 
 class EfficiencyTrendChart:
     """시간대별 학습 효율성 트렌드 차트 클래스"""
@@ -21,6 +24,11 @@ class EfficiencyTrendChart:
     def __init__(self):
         self.logger = ThreePartLogger()
         self.data_dir = os.path.join(project_root, 'data')
+        self.artifact_store = ArtifactStore(os.path.join(self.data_dir, 'artifacts'), logger=self.logger)
+        # 누적 통계/분위수 스케치는 반성 저장 시점에 갱신되며 차트는 읽기만 함
+        self.ingestor = get_reflection_ingestor(self.data_dir)
+        self.rolling_stats = self.ingestor.efficiency_stats
+        self.sketches = self.ingestor.efficiency_sketches
         
         # 시간대별 색상 정의
         self.timepart_colors = {
@@ -37,13 +45,17 @@ class EfficiencyTrendChart:
             (7, 8.5): "높음",
             (8.5, 10): "매우 높음"
         }
+        
+        # 이력이 충분하면 시간대별 효율성 분위수로 등급 구분 (하위 10% / 30% / 상위 30% / 10%)
+        self.grade_quantiles = (0.1, 0.3, 0.7, 0.9)
     
-    def load_efficiency_data(self, days: int = 7) -> Dict[str, Dict[str, float]]:
+    def load_efficiency_data(self, days: int = 7, dataset: Optional[Dict[str, Dict]] = None) -> Dict[str, Dict[str, float]]:
         """
         최근 N일간의 효율성 데이터 로드
         
         Args:
             days: 로드할 일수 (기본값: 7일)
+            dataset: 미리 로드된 공유 반성 데이터셋 (선택사항)
             
         Returns:
             날짜별, 시간대별 효율성 데이터
@@ -62,26 +74,19 @@ class EfficiencyTrendChart:
                     "🌙 저녁자율학습": 0.0
                 }
                 
-                # 각 시간대별 데이터 파일에서 효율성 추출
-                timepart_files = {
-                    "🌅 오전수업": ("morning_reflections", f"morning_reflection_{date.strftime('%Y%m%d')}.json"),
-                    "🌞 오후수업": ("afternoon_reflections", f"afternoon_reflection_{date.strftime('%Y%m%d')}.json"),
-                    "🌙 저녁자율학습": ("evening_reflections", f"evening_reflection_{date.strftime('%Y%m%d')}.json")
-                }
-                
-                for timepart, (folder, filename) in timepart_files.items():
-                    file_path = os.path.join(self.data_dir, folder, filename)
+                # 각 시간대별 반성 데이터에서 효율성 추출
+                for timepart in self.timepart_colors:
+                    data = get_reflection(self.data_dir, timepart, date, dataset)
                     
-                    if os.path.exists(file_path):
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            
-                            # 효율성 점수 계산
-                            efficiency = self._calculate_efficiency_score(data, timepart)
-                            day_data[timepart] = efficiency
+                    if data is not None:
+                        # 효율성 점수 계산
+                        efficiency = self._calculate_efficiency_score(data, timepart)
+                        day_data[timepart] = efficiency
                 
                 efficiency_data[date_str] = day_data
             
+            # 어제까지 끝난 날짜만 등급 스케치에 반영 (오늘 값은 아직 바뀔 수 있음)
+            self.ingestor.finalize_days()
             self.logger.info(f"효율성 데이터 로드 완료: {len(efficiency_data)}일 데이터")
             return efficiency_data
             
@@ -101,57 +106,25 @@ class EfficiencyTrendChart:
             효율성 점수 (0-10)
         """
         try:
-            # 기본 학습 지표들
-            understanding = data.get('학습이해도', data.get('이해도', 5))
-            concentration = data.get('집중도', data.get('계획달성도', 5))
-            condition = data.get('컨디션', '보통')
-            
-            # 컨디션을 숫자로 변환
-            condition_score = {"좋음": 8, "보통": 5, "나쁨": 2}.get(condition, 5)
-            
-            # GitHub 활동 점수
-            github_data = data.get('github_data', {})
-            github_score = github_data.get('productivity_score', 0)
-            
-            # 학습 시간
-            study_time = data.get('학습시간', data.get('실제학습시간', 3))
-            
-            # 시간대별 특화 가중치
-            if "오전" in timepart:
-                # 오전: 이해도와 컨디션 중요
-                efficiency = (understanding * 0.3 + concentration * 0.2 + 
-                            condition_score * 0.3 + min(github_score/2, 5) * 0.1 + 
-                            min(study_time/3, 3.33) * 0.1)
-            elif "오후" in timepart:
-                # 오후: 실습과 GitHub 활동 중요
-                efficiency = (understanding * 0.2 + concentration * 0.3 + 
-                            condition_score * 0.2 + min(github_score/2, 5) * 0.2 + 
-                            min(study_time/4, 2.5) * 0.1)
-            else:  # 저녁
-                # 저녁: 집중도와 자기주도성 중요
-                efficiency = (understanding * 0.2 + concentration * 0.4 + 
-                            condition_score * 0.2 + min(github_score/2, 5) * 0.15 + 
-                            min(study_time/3, 3.33) * 0.05)
-            
-            return round(min(efficiency, 10), 1)
-            
+            return efficiency_score(data, timepart)
         except Exception as e:
             self.logger.log_error(e, f"효율성 점수 계산 ({timepart})")
             return 5.0
     
-    def create_efficiency_trend_chart(self, days: int = 7) -> Dict[str, Any]:
+    def create_efficiency_trend_chart(self, days: int = 7, dataset: Optional[Dict[str, Dict]] = None) -> Dict[str, Any]:
         """
         시간대별 학습 효율성 트렌드 차트 생성
         
         Args:
             days: 분석할 일수 (기본값: 7일)
+            dataset: 미리 로드된 공유 반성 데이터셋 (선택사항)
             
         Returns:
             트렌드 차트 데이터 및 메타데이터
         """
         try:
             # 효율성 데이터 로드
-            efficiency_data = self.load_efficiency_data(days)
+            efficiency_data = self.load_efficiency_data(days, dataset)
             
             # 날짜순으로 정렬 (과거순)
             sorted_dates = sorted(efficiency_data.keys())
@@ -174,7 +147,7 @@ class EfficiencyTrendChart:
                     trend_data[timepart].append({
                         "date": date_str,
                         "efficiency": efficiency,
-                        "grade": self._get_efficiency_grade(efficiency)
+                        "grade": self._get_efficiency_grade(efficiency, timepart)
                     })
             
             # 트렌드 분석
@@ -193,47 +166,55 @@ class EfficiencyTrendChart:
                     "🌅 오전수업": {
                         "color": self.timepart_colors["🌅 오전수업"],
                         "data": trend_data["🌅 오전수업"],
-                        "average": sum([d["efficiency"] for d in trend_data["🌅 오전수업"]]) / len(trend_data["🌅 오전수업"]) if trend_data["🌅 오전수업"] else 0
+                        "average": trend_analysis.get("overall", {}).get("timepart_averages", {}).get("🌅 오전수업", 0)
                     },
                     "🌞 오후수업": {
                         "color": self.timepart_colors["🌞 오후수업"],
                         "data": trend_data["🌞 오후수업"],
-                        "average": sum([d["efficiency"] for d in trend_data["🌞 오후수업"]]) / len(trend_data["🌞 오후수업"]) if trend_data["🌞 오후수업"] else 0
+                        "average": trend_analysis.get("overall", {}).get("timepart_averages", {}).get("🌞 오후수업", 0)
                     },
                     "🌙 저녁자율학습": {
                         "color": self.timepart_colors["🌙 저녁자율학습"],
                         "data": trend_data["🌙 저녁자율학습"],
-                        "average": sum([d["efficiency"] for d in trend_data["🌙 저녁자율학습"]]) / len(trend_data["🌙 저녁자율학습"]) if trend_data["🌙 저녁자율학습"] else 0
+                        "average": trend_analysis.get("overall", {}).get("timepart_averages", {}).get("🌙 저녁자율학습", 0)
                     }
                 },
                 "trend_analysis": trend_analysis,
                 "improvement_analysis": improvement_analysis,
+                "long_term_trends": self.get_long_term_trends(),
                 "recommendations": self._generate_trend_recommendations(trend_analysis, improvement_analysis),
                 "created_at": datetime.now().isoformat(),
                 "data_period": f"{days}일간"
             }
             
-            # 트렌드 차트 데이터 저장
-            output_path = os.path.join(self.data_dir, f"efficiency_trend_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(chart_structure, f, ensure_ascii=False, indent=2)
+            # 트렌드 차트 데이터 저장 (내용이 같으면 새로 기록하지 않음)
+            content_hash = self.artifact_store.put("efficiency_trend", chart_structure, window=f"{days}d")
             
-            self.logger.info(f"효율성 트렌드 차트 생성 완료: {output_path}")
+            self.logger.info(f"효율성 트렌드 차트 생성 완료: {content_hash[:12]}")
             return chart_structure
             
         except Exception as e:
             self.logger.log_error(e, "효율성 트렌드 차트 생성")
             return {}
     
-    def _get_efficiency_grade(self, efficiency: float) -> str:
-        """효율성 점수를 등급으로 변환"""
+    def _get_efficiency_grade(self, efficiency: float, timepart: Optional[str] = None) -> str:
+        """효율성 점수를 등급으로 변환 (시간대 이력이 충분하면 분위수 구간, 아니면 고정 구간)"""
+        if timepart is not None:
+            band = self.sketches.band(timepart, "efficiency", efficiency, self.grade_quantiles, side="right")
+            if band is not None:
+                return list(self.efficiency_grades.values())[band]
+        
         for (min_val, max_val), grade in self.efficiency_grades.items():
             if min_val <= efficiency < max_val:
                 return grade
         return "보통"
     
+    def _window_stats(self, timepart: str, sorted_dates: List[str], days: Optional[int] = None) -> Dict[str, Any]:
+        """분석 구간 마지막 날짜 기준 누적 통계 조회"""
+        if not sorted_dates:
+            return self.rolling_stats.window(timepart, "efficiency", datetime.now(), 0)
+        return self.rolling_stats.window(timepart, "efficiency", sorted_dates[-1], days or len(sorted_dates))
+    
     def _analyze_efficiency_trends(self, trend_data: Dict[str, List], sorted_dates: List[str]) -> Dict[str, Any]:
         """효율성 트렌드 분석"""
         analysis = {}
@@ -260,6 +241,8 @@ class EfficiencyTrendChart:
                     max_point = max(data_points, key=lambda x: x["efficiency"])
                     min_point = min(data_points, key=lambda x: x["efficiency"])
                     
+                    window = self._window_stats(timepart, sorted_dates)
+                    
                     analysis[timepart] = {
                         "trend_direction": trend_direction,
                         "change_amount": round(change, 1),
@@ -272,14 +255,15 @@ class EfficiencyTrendChart:
                             "date": min_point["date"],
                             "efficiency": min_point["efficiency"]
                         },
-                        "volatility": round(max_point["efficiency"] - min_point["efficiency"], 1)
+                        "volatility": round(max_point["efficiency"] - min_point["efficiency"], 1),
+                        "daily_slope": round(window["slope"], 2),
+                        "ewma": round(window["ewma"], 1) if window["ewma"] is not None else None
                     }
             
-            # 전체적인 패턴 분석
+            # 전체적인 패턴 분석 (기록된 날짜 기준 누적 통계 사용)
             timepart_averages = {}
-            for timepart, data_points in trend_data.items():
-                avg = sum([d["efficiency"] for d in data_points]) / len(data_points) if data_points else 0
-                timepart_averages[timepart] = avg
+            for timepart in trend_data:
+                timepart_averages[timepart] = self._window_stats(timepart, sorted_dates)["mean"]
             
             best_timepart = max(timepart_averages.keys(), key=lambda x: timepart_averages[x]) if timepart_averages else None
             worst_timepart = min(timepart_averages.keys(), key=lambda x: timepart_averages[x]) if timepart_averages else None
@@ -302,19 +286,18 @@ class EfficiencyTrendChart:
         
         try:
             for timepart, data_points in trend_data.items():
-                if len(data_points) >= 3:
-                    # 초기 3일 평균 vs 최근 3일 평균
-                    initial_avg = sum([d["efficiency"] for d in data_points[:3]]) / 3
-                    recent_avg = sum([d["efficiency"] for d in data_points[-3:]]) / 3
+                sorted_dates = [d["date"] for d in data_points]
+                window = self._window_stats(timepart, sorted_dates)
+                
+                if len(data_points) >= 3 and window["count"] >= 1:
+                    # 초기 3일 평균 vs 최근 3일 평균 (누적합 구간 조회)
+                    initial_avg = self._window_stats(timepart, sorted_dates[:3], 3)["mean"]
+                    recent_avg = self._window_stats(timepart, sorted_dates, 3)["mean"]
                     
                     improvement_rate = ((recent_avg - initial_avg) / initial_avg * 100) if initial_avg > 0 else 0
                     
-                    # 일관성 점수 (표준편차의 역수)
-                    efficiencies = [d["efficiency"] for d in data_points]
-                    mean_eff = sum(efficiencies) / len(efficiencies)
-                    variance = sum([(e - mean_eff) ** 2 for e in efficiencies]) / len(efficiencies)
-                    std_dev = variance ** 0.5
-                    consistency_score = max(0, 10 - std_dev)  # 표준편차가 낮을수록 일관성 높음
+                    # 일관성 점수 (표준편차가 낮을수록 일관성 높음)
+                    consistency_score = max(0, 10 - window["std_dev"])
                     
                     improvement_rates[timepart] = {
                         "improvement_rate": round(improvement_rate, 1),
@@ -330,6 +313,33 @@ class EfficiencyTrendChart:
         
         return improvement_rates
     
+    def get_long_term_trends(self, windows: Tuple[int, ...] = (30, 90, 365)) -> Dict[str, Dict[str, Any]]:
+        """
+        장기 구간 효율성 통계 (반성 파일을 다시 읽지 않고 누적 상태에서 조회)
+        
+        Args:
+            windows: 조회할 구간 일수 목록
+            
+        Returns:
+            시간대별 {"30d": 통계, ...}
+        """
+        today = datetime.now()
+        long_term = {}
+        
+        for timepart in self.timepart_colors:
+            long_term[timepart] = {}
+            for days in windows:
+                window = self.rolling_stats.window(timepart, "efficiency", today, days)
+                long_term[timepart][f"{days}d"] = {
+                    "count": window["count"],
+                    "average": round(window["mean"], 2),
+                    "std_dev": round(window["std_dev"], 2),
+                    "daily_slope": round(window["slope"], 3),
+                    "ewma": round(window["ewma"], 2) if window["ewma"] is not None else None
+                }
+        
+        return long_term
+    
     def _generate_trend_recommendations(self, trend_analysis: Dict, improvement_analysis: Dict) -> List[str]:
         """트렌드 기반 추천사항 생성"""
         recommendations = []
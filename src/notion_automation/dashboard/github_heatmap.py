@@ -1,9 +1,8 @@
 """
 시간대별 GitHub 활동 분포 히트맵 시각화 시스템
-일주일 x 3시간대 GitHub 활동 패턴 분석
+N일(최대 1년) x 3시간대 GitHub 활동 패턴 분석 - 일별 활동 요약 테이블에서 생성
 """
 
-import json
 import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
@@ -14,6 +13,9 @@ project_root = os.path.join(os.path.dirname(__file__), '..', '..', '..')
 sys.path.append(project_root)
 
 from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.artifact_store import ArtifactStore
+from src.notion_automation.dashboard.quantile_sketch import MIN_SKETCH_SAMPLES
+from src.notion_automation.dashboard.reflection_ingest import get_reflection_ingestor
 
 class GitHubTimePartHeatmap:
     """시간대별 GitHub 활동 히트맵 클래스"""
@@ -21,6 +23,11 @@ class GitHubTimePartHeatmap:
     def __init__(self):
         self.logger = ThreePartLogger()
         self.data_dir = os.path.join(project_root, 'data')
+        self.artifact_store = ArtifactStore(os.path.join(self.data_dir, 'artifacts'), logger=self.logger)
+        # 활동 요약/분위수 스케치는 반성 저장 시점에 갱신되는 공유 저장소
+        self.ingestor = get_reflection_ingestor(self.data_dir)
+        self.activity_summary = self.ingestor.activity_summary
+        self.sketches = self.ingestor.activity_sketches
         
         # 요일 한국어 매핑
         self.weekdays = ["월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일"]
@@ -36,65 +43,51 @@ class GitHubTimePartHeatmap:
             3: "#26A641",      # 높은 활동 (밝은 녹색)
             4: "#39D353"       # 매우 높은 활동 (가장 밝은 녹색)
         }
+        
+        # 활동이 있는 칸의 강도 구간 (시간대별 활동량 사분위수)
+        self.intensity_quantiles = (0.25, 0.5, 0.75)
     
-    def load_github_activity_data(self, days: int = 7) -> Dict[str, Dict[str, int]]:
+    def load_github_activity_data(self, days: int = 7, dataset: Optional[Dict[str, Dict]] = None) -> Dict[str, Dict[str, int]]:
         """
         최근 N일간의 GitHub 활동 데이터 로드
         
+        반성 파일을 날짜마다 열지 않고, 요약 테이블을 바뀐 부분만 갱신한 뒤
+        기간 조회 한 번으로 읽습니다.
+        
         Args:
             days: 로드할 일수 (기본값: 7일)
+            dataset: 미리 로드된 공유 반성 데이터셋 (선택사항, 있으면 파일 대신 반영)
             
         Returns:
             날짜별, 시간대별 GitHub 활동 데이터
         """
         try:
+            if dataset is not None:
+                self.activity_summary.record_dataset(dataset)
+            else:
+                self.activity_summary.sync_reflection_files(self.data_dir)
+            
+            end_date = datetime.now()
+            grid = self.activity_summary.activity_grid(end_date - timedelta(days=max(days - 1, 0)), end_date)
             activity_data = {}
             
             for day_offset in range(days):
-                date = datetime.now() - timedelta(days=day_offset)
+                date = end_date - timedelta(days=day_offset)
                 date_str = date.strftime("%Y-%m-%d")
-                weekday = self.weekdays[date.weekday()]
+                cells = grid.get(date_str, {})
                 
                 day_data = {
                     "date": date_str,
-                    "weekday": weekday,
-                    "🌅 오전수업": 0,
-                    "🌞 오후수업": 0,
-                    "🌙 저녁자율학습": 0
+                    "weekday": self.weekdays[date.weekday()]
                 }
-                
-                # 각 시간대별 데이터 파일에서 GitHub 활동 추출
-                timepart_files = {
-                    "🌅 오전수업": f"morning_reflection_{date.strftime('%Y%m%d')}.json",
-                    "🌞 오후수업": f"afternoon_reflection_{date.strftime('%Y%m%d')}.json",
-                    "🌙 저녁자율학습": f"evening_reflection_{date.strftime('%Y%m%d')}.json"
-                }
-                
-                for timepart, filename in timepart_files.items():
-                    timepart_folder = {
-                        "🌅 오전수업": "morning_reflections",
-                        "🌞 오후수업": "afternoon_reflections", 
-                        "🌙 저녁자율학습": "evening_reflections"
-                    }[timepart]
-                    
-                    file_path = os.path.join(self.data_dir, timepart_folder, filename)
-                    
-                    if os.path.exists(file_path):
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            github_data = data.get('github_data', {})
-                            
-                            # GitHub 활동 점수 추출
-                            commits = github_data.get('commits', 0)
-                            issues = github_data.get('issues', 0)
-                            pull_requests = github_data.get('pull_requests', 0)
-                            
-                            # 총 활동량 계산
-                            total_activity = commits + issues + pull_requests
-                            day_data[timepart] = total_activity
+                for timepart in self.timeparts:
+                    day_data[timepart] = cells.get(timepart, 0)
                 
                 activity_data[date_str] = day_data
             
+            # 어제까지 끝난 날짜만 분위수 스케치에 반영 (오늘은 webhook으로 계속 늘어나므로 제외)
+            self.ingestor.finalize_days()
+            
             self.logger.info(f"GitHub 활동 데이터 로드 완료: {len(activity_data)}일 데이터")
             return activity_data
             
@@ -102,19 +95,29 @@ class GitHubTimePartHeatmap:
             self.logger.log_error(e, "GitHub 활동 데이터 로드")
             return {}
     
-    def calculate_intensity_level(self, activity_count: int) -> int:
+    def calculate_intensity_level(self, activity_count: int, timepart: Optional[str] = None) -> int:
         """
         GitHub 활동량을 히트맵 강도 레벨로 변환
         
+        시간대가 주어지고 관측값이 충분하면 그 시간대 활동량의 사분위수로 1-4를 나누고,
+        아니면 고정 임계값을 사용합니다.
+        
         Args:
             activity_count: GitHub 활동 수
+            timepart: 시간대 (선택사항)
             
         Returns:
             강도 레벨 (0-4)
         """
         if activity_count == 0:
             return 0
-        elif activity_count <= 2:
+        
+        if timepart is not None:
+            band = self.sketches.band(timepart, "github_activity", activity_count, self.intensity_quantiles)
+            if band is not None:
+                return band + 1
+        
+        if activity_count <= 2:
             return 1
         elif activity_count <= 5:
             return 2
@@ -123,19 +126,20 @@ class GitHubTimePartHeatmap:
         else:
             return 4
     
-    def create_github_timepart_heatmap(self, days: int = 7) -> Dict[str, Any]:
+    def create_github_timepart_heatmap(self, days: int = 7, dataset: Optional[Dict[str, Dict]] = None) -> Dict[str, Any]:
         """
         일주일 x 3시간대 GitHub 활동 히트맵 생성
         
         Args:
             days: 분석할 일수 (기본값: 7일)
+            dataset: 미리 로드된 공유 반성 데이터셋 (선택사항)
             
         Returns:
             히트맵 데이터 및 메타데이터
         """
         try:
             # GitHub 활동 데이터 로드
-            activity_data = self.load_github_activity_data(days)
+            activity_data = self.load_github_activity_data(days, dataset)
             
             # 히트맵 매트릭스 생성 (7일 x 3시간대)
             heatmap_matrix = []
@@ -158,7 +162,7 @@ class GitHubTimePartHeatmap:
                 
                 for timepart in self.timeparts:
                     activity = day_data.get(timepart, 0)
-                    intensity = self.calculate_intensity_level(activity)
+                    intensity = self.calculate_intensity_level(activity, timepart)
                     color = self.intensity_levels[intensity]
                     
                     timepart_cell = {
@@ -184,19 +188,16 @@ class GitHubTimePartHeatmap:
                 
                 heatmap_matrix.append(row)
             
-            # 시간대별 통계 계산
+            # 시간대별 통계 계산 (요약 테이블 집계 쿼리)
             timepart_stats = {}
+            summary_stats = self.activity_summary.timepart_stats(min(activity_data), max(activity_data)) if activity_data else {}
             for timepart in self.timeparts:
-                timepart_activities = []
-                for date_str in activity_data:
-                    activity = activity_data[date_str].get(timepart, 0)
-                    timepart_activities.append(activity)
-                
+                stats = summary_stats.get(timepart, {"total": 0, "max": 0, "active_days": 0})
                 timepart_stats[timepart] = {
-                    "total": sum(timepart_activities),
-                    "average": sum(timepart_activities) / len(timepart_activities) if timepart_activities else 0,
-                    "max": max(timepart_activities) if timepart_activities else 0,
-                    "active_days": len([a for a in timepart_activities if a > 0])
+                    "total": stats["total"],
+                    "average": stats["total"] / len(activity_data) if activity_data else 0,
+                    "max": stats["max"],
+                    "active_days": stats["active_days"]
                 }
             
             # 히트맵 구조 생성
@@ -208,6 +209,11 @@ class GitHubTimePartHeatmap:
                 "timeparts": self.timeparts,
                 "weekdays": [row["weekday"] for row in heatmap_matrix],
                 "intensity_legend": self.intensity_levels,
+                "intensity_thresholds": {
+                    timepart: self.sketches.quantiles(timepart, "github_activity", self.intensity_quantiles)
+                    if self.sketches.count(timepart, "github_activity") >= MIN_SKETCH_SAMPLES else "fixed"
+                    for timepart in self.timeparts
+                },
                 "statistics": {
                     "total_activity": total_activity,
                     "max_single_activity": max_activity,
@@ -221,14 +227,10 @@ class GitHubTimePartHeatmap:
                 "data_period": f"{days}일간"
             }
             
-            # 히트맵 데이터 저장
-            output_path = os.path.join(self.data_dir, f"github_heatmap_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            # 히트맵 데이터 저장 (내용이 같으면 새로 기록하지 않음)
+            content_hash = self.artifact_store.put("github_heatmap", heatmap_structure, window=f"{days}d")
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(heatmap_structure, f, ensure_ascii=False, indent=2)
-            
-            self.logger.info(f"GitHub 히트맵 생성 완료: {output_path}")
+            self.logger.info(f"GitHub 히트맵 생성 완료: {content_hash[:12]}")
             return heatmap_structure
             
         except Exception as e:
@@ -245,12 +247,11 @@ class GitHubTimePartHeatmap:
                                      key=lambda x: timepart_stats[x]["total"])
             analysis["가장_활발한_시간대"] = f"{most_active_timepart} (총 {timepart_stats[most_active_timepart]['total']}개 활동)"
             
-            # 가장 활발한 요일
-            weekday_totals = {}
-            for date_str, day_data in activity_data.items():
-                weekday = day_data["weekday"]
-                total = sum([day_data.get(tp, 0) for tp in self.timeparts])
-                weekday_totals[weekday] = weekday_totals.get(weekday, 0) + total
+            # 가장 활발한 요일 (기간 내 요일은 활동이 없어도 0으로 포함)
+            weekday_totals = {day_data["weekday"]: 0 for day_data in activity_data.values()}
+            if activity_data:
+                for weekday, total in self.activity_summary.weekday_totals(min(activity_data), max(activity_data)).items():
+                    weekday_totals[self.weekdays[weekday]] = total
             
             if weekday_totals:
                 most_active_day = max(weekday_totals.keys(), key=lambda x: weekday_totals[x])
@@ -259,10 +260,8 @@ class GitHubTimePartHeatmap:
             # 일관성 분석
             consistency_scores = {}
             for timepart in self.timeparts:
-                activities = [activity_data[date].get(timepart, 0) for date in activity_data]
-                active_days = len([a for a in activities if a > 0])
-                consistency = (active_days / len(activities)) * 100 if activities else 0
-                consistency_scores[timepart] = consistency
+                active_days = timepart_stats[timepart]["active_days"]
+                consistency_scores[timepart] = (active_days / len(activity_data)) * 100 if activity_data else 0
             
             most_consistent = max(consistency_scores.keys(), key=lambda x: consistency_scores[x])
             analysis["가장_일관된_시간대"] = f"{most_consistent} ({consistency_scores[most_consistent]:.1f}% 활동률)"
@@ -0,0 +1,382 @@
+"""
+3-Part 지표 집계 큐브 (SQLite)
+
+(날짜, 요일, 시간대, 지표)별 합계/개수/제곱합/최대/최소를 미리 집계해 두고
+주/월 단위 롤업을 함께 유지합니다. 분석기는 원본 반성 데이터를 다시 훑지 않고
+인덱스를 타는 집계 쿼리 몇 번으로 임의 기간의 시간대/요일 통계를 얻습니다.
+"""
+
+import calendar
+import os
+import sqlite3
+import threading
+from datetime import datetime, date as date_type, timedelta
+from typing import Dict, List, Any, Optional, Iterable, Tuple, Union
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+
+DateLike = Union[datetime, date_type, str]
+
+ROLLUP_LEVELS = ("week", "month")
+
+
+def _to_date(value: DateLike) -> date_type:
+    if isinstance(value, str):
+        return datetime.strptime(value[:10], "%Y-%m-%d").date()
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def _week_key(day: date_type) -> str:
+    iso_year, iso_week, _ = day.isocalendar()
+    return f"{iso_year}-W{iso_week:02d}"
+
+
+def _empty_summary() -> Dict[str, Any]:
+    return {"count": 0, "total": 0.0, "sum_sq": 0.0, "max": None, "min": None}
+
+
+def finalize_summary(summary: Dict[str, Any]) -> Dict[str, Any]:
+    """합계/개수/제곱합에서 평균, 분산, 표준편차 계산"""
+    count = summary["count"]
+    mean = summary["total"] / count if count else 0.0
+    variance = max(0.0, summary["sum_sq"] / count - mean ** 2) if count else 0.0
+    return {
+        "count": count,
+        "total": summary["total"],
+        "mean": mean,
+        "variance": variance,
+        "std_dev": variance ** 0.5,
+        "max": summary["max"] if summary["max"] is not None else 0,
+        "min": summary["min"] if summary["min"] is not None else 0
+    }
+
+
+class TimePartMetricCube:
+    """시간대 × 요일 × 날짜 × 지표 집계 큐브"""
+
+    def __init__(self, db_path: str, logger: Optional[ThreePartLogger] = None):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            logger: 로깅 시스템 (선택사항)
+        """
+        self.db_path = db_path
+        self.logger = logger or ThreePartLogger(name="metric_cube")
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._initialize_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _initialize_database(self):
+        """팩트/롤업 테이블 및 인덱스 생성"""
+        with self._connect() as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS cube_daily (
+                    date TEXT NOT NULL,
+                    weekday INTEGER NOT NULL,
+                    week TEXT NOT NULL,
+                    month TEXT NOT NULL,
+                    time_part TEXT NOT NULL,
+                    metric TEXT NOT NULL,
+                    value_sum REAL NOT NULL,
+                    value_count INTEGER NOT NULL,
+                    value_sumsq REAL NOT NULL,
+                    value_max REAL,
+                    value_min REAL,
+                    PRIMARY KEY (date, time_part, metric)
+                )
+            ''')
+            # 기간 조회: (지표, 날짜) 범위 스캔, 요일 집계: (지표, 요일, 시간대)
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_cube_daily_metric_date
+                ON cube_daily (metric, date, time_part, value_sum, value_count, value_sumsq)
+            ''')
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_cube_daily_metric_weekday
+                ON cube_daily (metric, weekday, time_part, date)
+            ''')
+
+            for level in ROLLUP_LEVELS:
+                conn.execute(f'''
+                    CREATE TABLE IF NOT EXISTS cube_{level} (
+                        period TEXT NOT NULL,
+                        time_part TEXT NOT NULL,
+                        metric TEXT NOT NULL,
+                        value_sum REAL NOT NULL,
+                        value_count INTEGER NOT NULL,
+                        value_sumsq REAL NOT NULL,
+                        value_max REAL,
+                        value_min REAL,
+                        PRIMARY KEY (metric, period, time_part)
+                    )
+                ''')
+
+    def record_many(self, rows: Iterable[Tuple[DateLike, str, str, float]]) -> int:
+        """
+        (날짜, 시간대, 지표, 값) 관측값을 일괄 반영
+
+        같은 (날짜, 시간대, 지표)는 덮어쓰므로 여러 번 반영해도 안전하며,
+        값이 바뀐 주/월의 롤업만 다시 계산합니다.
+
+        Returns:
+            변경된 팩트 행 수
+        """
+        changed = 0
+        touched_weeks, touched_months = set(), set()
+
+        with self._lock, self._connect() as conn:
+            for date_value, time_part, metric, value in rows:
+                day = _to_date(date_value)
+                date_str = day.isoformat()
+                value = float(value)
+
+                existing = conn.execute(
+                    "SELECT value_sum, value_count FROM cube_daily WHERE date = ? AND time_part = ? AND metric = ?",
+                    (date_str, time_part, metric)
+                ).fetchone()
+                if existing == (value, 1):
+                    continue
+
+                week, month = _week_key(day), day.strftime("%Y-%m")
+                conn.execute('''
+                    INSERT OR REPLACE INTO cube_daily
+                    (date, weekday, week, month, time_part, metric, value_sum, value_count, value_sumsq, value_max, value_min)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?, ?)
+                ''', (date_str, day.weekday(), week, month, time_part, metric, value, value * value, value, value))
+
+                touched_weeks.add((week, metric))
+                touched_months.add((month, metric))
+                changed += 1
+
+            self._reroll(conn, touched_weeks, touched_months)
+
+        return changed
+
+    @staticmethod
+    def _reroll(conn: sqlite3.Connection, touched_weeks: Iterable[Tuple[str, str]],
+                touched_months: Iterable[Tuple[str, str]]) -> None:
+        """값이 바뀐 (주/월, 지표) 롤업만 팩트 테이블에서 다시 계산"""
+        for level, touched in (("week", touched_weeks), ("month", touched_months)):
+            for period, metric in touched:
+                conn.execute(f"DELETE FROM cube_{level} WHERE metric = ? AND period = ?", (metric, period))
+                conn.execute(f'''
+                    INSERT INTO cube_{level}
+                    (period, time_part, metric, value_sum, value_count, value_sumsq, value_max, value_min)
+                    SELECT {level}, time_part, metric, SUM(value_sum), SUM(value_count), SUM(value_sumsq),
+                           MAX(value_max), MIN(value_min)
+                    FROM cube_daily WHERE metric = ? AND {level} = ?
+                    GROUP BY time_part
+                ''', (metric, period))
+
+    def record(self, date_value: DateLike, time_part: str, metrics: Dict[str, Any]) -> int:
+        """한 시간대의 지표 묶음 반영 (숫자 값만)"""
+        return self.record_many(
+            (date_value, time_part, metric, value)
+            for metric, value in metrics.items()
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+        )
+
+    def remove(self, date_value: DateLike, time_part: str) -> int:
+        """
+        한 날짜/시간대의 관측값을 모두 제거 (반성 파일이 삭제된 경우)
+
+        Returns:
+            제거된 팩트 행 수
+        """
+        day = _to_date(date_value)
+        date_str = day.isoformat()
+
+        with self._lock, self._connect() as conn:
+            metrics = [row[0] for row in conn.execute(
+                "SELECT metric FROM cube_daily WHERE date = ? AND time_part = ?", (date_str, time_part)
+            )]
+            if not metrics:
+                return 0
+
+            conn.execute("DELETE FROM cube_daily WHERE date = ? AND time_part = ?", (date_str, time_part))
+            week, month = _week_key(day), day.strftime("%Y-%m")
+            self._reroll(conn, [(week, metric) for metric in metrics], [(month, metric) for metric in metrics])
+
+        return len(metrics)
+
+    @staticmethod
+    def _merge(target: Dict[str, Any], row: Tuple) -> None:
+        value_sum, value_count, value_sumsq, value_max, value_min = row
+        if not value_count:
+            return
+        target["total"] += value_sum
+        target["count"] += value_count
+        target["sum_sq"] += value_sumsq
+        target["max"] = value_max if target["max"] is None else max(target["max"], value_max)
+        target["min"] = value_min if target["min"] is None else min(target["min"], value_min)
+
+    @staticmethod
+    def _split_range(start: date_type, end: date_type) -> Tuple[List[Tuple[date_type, date_type]], List[str]]:
+        """기간을 (앞뒤 일 단위 구간들, 완전히 포함된 월 목록)으로 분할"""
+        first_full = start if start.day == 1 else (start.replace(day=1) + timedelta(days=32)).replace(day=1)
+        last_day_of_end = end.replace(day=calendar.monthrange(end.year, end.month)[1])
+        last_full_end = end if end == last_day_of_end else end.replace(day=1) - timedelta(days=1)
+
+        if first_full > last_full_end:
+            return [(start, end)], []
+
+        months = []
+        cursor = first_full
+        while cursor <= last_full_end:
+            months.append(cursor.strftime("%Y-%m"))
+            cursor = (cursor + timedelta(days=32)).replace(day=1)
+
+        day_ranges = []
+        if start < first_full:
+            day_ranges.append((start, first_full - timedelta(days=1)))
+        if last_full_end < end:
+            day_ranges.append((last_full_end + timedelta(days=1), end))
+        return day_ranges, months
+
+    def summarize(self, start: DateLike, end: DateLike, time_part: Optional[str] = None,
+                  metrics: Optional[List[str]] = None) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        기간 내 시간대/지표별 통계
+
+        완전히 포함된 달은 월 롤업에서, 앞뒤 자투리 날짜는 일별 팩트에서 읽습니다.
+
+        Args:
+            start: 시작 날짜 (포함)
+            end: 종료 날짜 (포함)
+            time_part: 특정 시간대만 조회 (기본값: 전체)
+            metrics: 조회할 지표 목록 (기본값: 전체)
+
+        Returns:
+            {시간대: {지표: {count, total, mean, variance, std_dev, max, min}}}
+        """
+        start_day, end_day = _to_date(start), _to_date(end)
+        day_ranges, months = self._split_range(start_day, end_day)
+
+        filters, params = [], []
+        if time_part is not None:
+            filters.append("time_part = ?")
+            params.append(time_part)
+        if metrics:
+            filters.append(f"metric IN ({','.join('?' * len(metrics))})")
+            params.extend(metrics)
+        extra = "".join(f" AND {f}" for f in filters)
+
+        raw: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+        def collect(rows):
+            for row_time_part, metric, *values in rows:
+                target = raw.setdefault(row_time_part, {}).setdefault(metric, _empty_summary())
+                self._merge(target, tuple(values))
+
+        with self._connect() as conn:
+            for range_start, range_end in day_ranges:
+                collect(conn.execute(f'''
+                    SELECT time_part, metric, SUM(value_sum), SUM(value_count), SUM(value_sumsq), MAX(value_max), MIN(value_min)
+                    FROM cube_daily WHERE date BETWEEN ? AND ?{extra}
+                    GROUP BY time_part, metric
+                ''', [range_start.isoformat(), range_end.isoformat()] + params))
+
+            if months:
+                collect(conn.execute(f'''
+                    SELECT time_part, metric, SUM(value_sum), SUM(value_count), SUM(value_sumsq), MAX(value_max), MIN(value_min)
+                    FROM cube_month WHERE period BETWEEN ? AND ?{extra}
+                    GROUP BY time_part, metric
+                ''', [months[0], months[-1]] + params))
+
+        return {
+            row_time_part: {metric: finalize_summary(summary) for metric, summary in by_metric.items()}
+            for row_time_part, by_metric in raw.items()
+        }
+
+    def weekday_summary(self, metric: str, start: DateLike, end: DateLike) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        기간 내 요일 × 시간대 통계 (집계 쿼리 한 번)
+
+        Returns:
+            {요일 영문명: {시간대: {count, total, mean, ...}}}
+        """
+        with self._connect() as conn:
+            rows = conn.execute('''
+                SELECT weekday, time_part, SUM(value_sum), SUM(value_count), SUM(value_sumsq), MAX(value_max), MIN(value_min)
+                FROM cube_daily
+                WHERE metric = ? AND date BETWEEN ? AND ?
+                GROUP BY weekday, time_part
+            ''', (metric, _to_date(start).isoformat(), _to_date(end).isoformat())).fetchall()
+
+        result: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for weekday, time_part, *values in rows:
+            summary = _empty_summary()
+            self._merge(summary, tuple(values))
+            result.setdefault(calendar.day_name[weekday], {})[time_part] = finalize_summary(summary)
+        return result
+
+    def period_series(self, level: str, metric: str, start: DateLike, end: DateLike) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        주/월 롤업 시계열
+
+        Args:
+            level: "week" 또는 "month"
+            metric: 지표 이름
+            start, end: 조회 기간 (해당 날짜가 속한 주/월 포함)
+
+        Returns:
+            {기간: {시간대: 통계}}
+        """
+        if level not in ROLLUP_LEVELS:
+            raise ValueError(f"지원하지 않는 롤업 단위: {level} (week/month 중 선택)")
+
+        start_day, end_day = _to_date(start), _to_date(end)
+        if level == "week":
+            bounds = (_week_key(start_day), _week_key(end_day))
+        else:
+            bounds = (start_day.strftime("%Y-%m"), end_day.strftime("%Y-%m"))
+
+        with self._connect() as conn:
+            rows = conn.execute(f'''
+                SELECT period, time_part, value_sum, value_count, value_sumsq, value_max, value_min
+                FROM cube_{level} WHERE metric = ? AND period BETWEEN ? AND ?
+                ORDER BY period
+            ''', (metric,) + bounds).fetchall()
+
+        series: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for period, time_part, *values in rows:
+            summary = _empty_summary()
+            self._merge(summary, tuple(values))
+            series.setdefault(period, {})[time_part] = finalize_summary(summary)
+        return series
+
+
+def test_metric_cube():
+    """TimePartMetricCube 테스트 함수"""
+    import tempfile
+
+    print("🧊 지표 집계 큐브 테스트 시작")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cube = TimePartMetricCube(os.path.join(temp_dir, "cube.db"))
+        today = datetime.now()
+
+        for offset in range(60):
+            day = today - timedelta(days=offset)
+            cube.record(day, "🌅 오전수업", {"overall_score": 60 + offset % 20, "understanding": 7})
+            cube.record(day, "🌙 저녁자율학습", {"overall_score": 70 + offset % 10, "understanding": 8})
+
+        summary = cube.summarize(today - timedelta(days=59), today)
+        for time_part, metrics in summary.items():
+            score = metrics["overall_score"]
+            print(f"✅ {time_part}: 평균 {score['mean']:.1f}점 (표준편차 {score['std_dev']:.1f}, {score['count']}일)")
+
+        weekdays = cube.weekday_summary("overall_score", today - timedelta(days=59), today)
+        print(f"📅 요일별 집계: {len(weekdays)}개 요일")
+
+
+if __name__ == "__main__":
+    test_metric_cube()
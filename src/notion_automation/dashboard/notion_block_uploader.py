@@ -0,0 +1,343 @@
+"""
+Notion 블록 업로드 파이프라인
+
+대시보드 빌더가 만든 블록을 스트림으로 받아 Notion API 제한에 맞게
+긴 텍스트를 분할하고, 요청당 자식 블록 수에 맞춰 묶어서 업로드합니다.
+서로 독립적인 하위 트리(토글 섹션 등)는 스레드 풀에서 병렬로 업로드합니다.
+"""
+
+import copy
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.shared_rate_limiter import get_rate_limiter, penalize_on_rate_limit
+
+# Notion API 제한
+NOTION_MAX_CHILDREN = 100          # 요청당 / children 배열당 최대 블록 수
+NOTION_MAX_BLOCKS_PER_REQUEST = 1000  # 중첩 포함 요청당 최대 블록 수
+NOTION_MAX_TEXT_LENGTH = 2000      # rich_text 항목당 최대 글자 수
+NOTION_MAX_RICH_TEXT_ITEMS = 100   # 블록당 최대 rich_text 항목 수
+NOTION_REQUESTS_PER_SECOND = 3.0   # 통합(integration)당 평균 요청 한도
+
+
+def _text_length(text: str) -> int:
+    """Notion 글자 수 (UTF-16 코드 단위 기준, 이모지는 2자로 계산됨)"""
+    return len(text.encode("utf-16-le")) // 2
+
+
+def split_text(text: str, limit: int = NOTION_MAX_TEXT_LENGTH) -> List[str]:
+    """
+    긴 문자열을 limit 이하 조각으로 분할
+
+    가능하면 줄바꿈 위치에서 자르고, 없으면 글자 단위로 자릅니다.
+    """
+    if _text_length(text) <= limit:
+        return [text]
+
+    pieces = []
+    start = 0
+    while start < len(text):
+        end = start
+        length = 0
+        while end < len(text):
+            char_length = 2 if ord(text[end]) > 0xFFFF else 1
+            if length + char_length > limit:
+                break
+            length += char_length
+            end += 1
+
+        if end < len(text):
+            newline = text.rfind("\n", start, end)
+            if newline > start:
+                end = newline + 1
+
+        pieces.append(text[start:end])
+        start = end
+
+    return pieces
+
+
+def split_rich_text(rich_text: List[Dict[str, Any]], limit: int = NOTION_MAX_TEXT_LENGTH) -> List[Dict[str, Any]]:
+    """rich_text 배열의 긴 text 항목을 서식을 유지한 채 여러 항목으로 분할"""
+    result = []
+
+    for item in rich_text:
+        text = item.get("text")
+        if item.get("type", "text") != "text" or not text or _text_length(text.get("content", "")) <= limit:
+            result.append(item)
+            continue
+
+        for piece in split_text(text["content"], limit):
+            new_item = dict(item)
+            new_item["text"] = dict(text, content=piece)
+            if "plain_text" in new_item:
+                new_item["plain_text"] = piece
+            result.append(new_item)
+
+    return result
+
+
+def normalize_block(block: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    단일 블록을 API 제한에 맞게 정규화
+
+    긴 텍스트는 분할하고, rich_text 항목이 100개를 넘으면
+    같은 유형의 블록 여러 개로 나눕니다 (자식 블록은 마지막 블록에 연결).
+
+    Returns:
+        정규화된 블록 리스트
+    """
+    block_type = block.get("type")
+    body = block.get(block_type) if block_type else None
+    if not isinstance(body, dict) or "rich_text" not in body:
+        return [block]
+
+    rich_text = split_rich_text(body["rich_text"])
+    if len(rich_text) <= NOTION_MAX_RICH_TEXT_ITEMS:
+        normalized = dict(block)
+        normalized[block_type] = dict(body, rich_text=rich_text)
+        return [normalized]
+
+    blocks = []
+    for start in range(0, len(rich_text), NOTION_MAX_RICH_TEXT_ITEMS):
+        part_body = {key: value for key, value in body.items() if key != "children"}
+        part_body["rich_text"] = rich_text[start:start + NOTION_MAX_RICH_TEXT_ITEMS]
+        part = dict(block)
+        part[block_type] = part_body
+        blocks.append(part)
+
+    if "children" in body:
+        blocks[-1][block_type]["children"] = body["children"]
+
+    return blocks
+
+
+def iter_normalized_blocks(blocks: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """블록 스트림을 정규화된 블록 스트림으로 변환"""
+    for block in blocks:
+        yield from normalize_block(block)
+
+
+class RateLimiter:
+    """프로세스 안에서만 공유되는 간단한 요청 간격 제한기 (0이면 제한 없음)"""
+
+    def __init__(self, requests_per_second: float = NOTION_REQUESTS_PER_SECOND):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self.total_wait_seconds = 0.0
+
+    def acquire(self):
+        """다음 요청 슬롯까지 대기"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+            wait_seconds = slot - now
+            self.total_wait_seconds += wait_seconds
+
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+
+
+class NotionBlockUploader:
+    """청크 단위 병렬 Notion 블록 업로더"""
+
+    def __init__(self, client: Any, max_workers: int = 3,
+                 requests_per_second: Optional[float] = None,
+                 logger: Optional[ThreePartLogger] = None):
+        """
+        업로더 초기화
+
+        Args:
+            client: blocks.children.append(block_id=..., children=[...])를 제공하는
+                Notion 클라이언트 (notion_client.Client는 내부 HTTP 연결 풀을 재사용하므로
+                여러 스레드가 하나의 인스턴스를 공유)
+            max_workers: 하위 트리 병렬 업로드 스레드 수
+            requests_per_second: 초당 최대 요청 수 (None이면 다른 프로세스와 공유하는 Notion 기본 한도,
+                0이면 제한 없음)
+            logger: 로깅 시스템 (선택사항)
+        """
+        self.client = client
+        self.max_workers = max_workers
+        if requests_per_second is not None and requests_per_second <= 0:
+            self.rate_limiter = RateLimiter(0)
+        else:
+            self.rate_limiter = get_rate_limiter("notion", rate=requests_per_second)
+        self.logger = logger or ThreePartLogger(name="notion_uploader")
+        self._stats_lock = threading.Lock()
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self.stats = {
+            "requests": 0,
+            "blocks_uploaded": 0,
+            "failed_requests": 0,
+            "skipped_blocks": 0,
+            "errors": []
+        }
+
+    def _append(self, parent_id: str, children: List[Dict[str, Any]]) -> List[str]:
+        """children 한 묶음 업로드 후 생성된 최상위 블록 ID 반환"""
+        self.rate_limiter.acquire()
+        response = self.client.blocks.children.append(block_id=parent_id, children=children)
+
+        with self._stats_lock:
+            self.stats["requests"] += 1
+            self.stats["blocks_uploaded"] += sum(1 + len(self._children_of(block)) for block in children)
+
+        return [result.get("id") for result in (response or {}).get("results", [])]
+
+    @staticmethod
+    def _children_of(block: Dict[str, Any]) -> List[Dict[str, Any]]:
+        body = block.get(block.get("type"), {})
+        return body.get("children", []) if isinstance(body, dict) else []
+
+    def _prepare(self, block: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        요청에 포함할 블록과 나중에 업로드할 하위 블록 분리
+
+        자식이 100개 이하이고 손자 블록이 없으면 한 요청에 함께 보내고(2단계 중첩까지 허용),
+        그렇지 않으면 부모를 먼저 만든 뒤 하위 트리로 따로 업로드합니다.
+        """
+        children = self._children_of(block)
+        if not children:
+            return block, []
+
+        children = list(iter_normalized_blocks(children))
+        block_type = block["type"]
+        body = {key: value for key, value in block[block_type].items() if key != "children"}
+
+        inline = len(children) <= NOTION_MAX_CHILDREN and not any(self._children_of(child) for child in children)
+        if inline:
+            body["children"] = children
+            deferred = []
+        else:
+            deferred = children
+
+        prepared = dict(block)
+        prepared[block_type] = body
+        return prepared, deferred
+
+    def _upload_level(self, parent_id: str, blocks: Iterable[Dict[str, Any]]) -> List[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        한 부모 아래 블록을 순서대로 묶어 업로드
+
+        같은 부모의 블록은 순서를 지키기 위해 순차 업로드하고,
+        분리된 하위 트리는 (생성된 부모 ID, 자식 블록) 작업으로 반환합니다.
+        """
+        subtrees = []
+        batch: List[Dict[str, Any]] = []
+        batch_deferred: List[List[Dict[str, Any]]] = []
+        batch_size = 0
+
+        def flush():
+            nonlocal batch, batch_deferred, batch_size
+            if not batch:
+                return
+            try:
+                block_ids = self._append(parent_id, batch)
+                for block_id, deferred in zip(block_ids, batch_deferred):
+                    if deferred and block_id:
+                        subtrees.append((block_id, deferred))
+            except Exception as e:
+                penalize_on_rate_limit(self.rate_limiter, e)
+                with self._stats_lock:
+                    self.stats["failed_requests"] += 1
+                    self.stats["skipped_blocks"] += len(batch) + sum(len(d) for d in batch_deferred)
+                    self.stats["errors"].append(str(e))
+                self.logger.error(f"Notion 블록 업로드 실패 (부모 {parent_id}, {len(batch)}개): {str(e)}")
+            batch, batch_deferred, batch_size = [], [], 0
+
+        for block in iter_normalized_blocks(blocks):
+            prepared, deferred = self._prepare(block)
+            size = 1 + len(self._children_of(prepared))
+
+            if len(batch) >= NOTION_MAX_CHILDREN or batch_size + size > NOTION_MAX_BLOCKS_PER_REQUEST:
+                flush()
+
+            batch.append(prepared)
+            batch_deferred.append(deferred)
+            batch_size += size
+
+        flush()
+        return subtrees
+
+    def upload(self, parent_id: str, blocks: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        블록 스트림을 페이지(또는 블록) 아래에 업로드
+
+        Args:
+            parent_id: 대상 페이지/블록 ID
+            blocks: 업로드할 블록 (리스트 또는 제너레이터)
+
+        Returns:
+            업로드 통계 (요청 수, 업로드 블록 수, 실패 수, 소요 시간)
+        """
+        self._reset_stats()
+        start_time = time.perf_counter()
+
+        # 최상위 블록은 순서 보장을 위해 현재 스레드에서 업로드
+        pending_subtrees = self._upload_level(parent_id, blocks)
+
+        # 하위 트리는 서로 독립적이므로 병렬 업로드 (작업자는 새 하위 트리를 반환만 하고 기다리지 않음)
+        if pending_subtrees:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                running = {pool.submit(self._upload_level, sub_parent, sub_blocks) for sub_parent, sub_blocks in pending_subtrees}
+                while running:
+                    done, running = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        for sub_parent, sub_blocks in future.result():
+                            running.add(pool.submit(self._upload_level, sub_parent, sub_blocks))
+
+        duration = time.perf_counter() - start_time
+        self.stats["duration_seconds"] = round(duration, 4)
+        self.stats["rate_limit_wait_seconds"] = round(self.rate_limiter.total_wait_seconds, 4)
+        self.logger.log_performance(f"Notion 블록 업로드 ({self.stats['requests']}회 요청)", duration)
+
+        return copy.deepcopy(self.stats)
+
+
+def test_notion_block_uploader():
+    """NotionBlockUploader 테스트 함수 (실제 API 대신 호출 기록용 클라이언트 사용)"""
+    print("📤 Notion 블록 업로더 테스트 시작")
+
+    class _RecordingChildren:
+        def __init__(self):
+            self.calls = []
+
+        def append(self, block_id, children):
+            self.calls.append((block_id, children))
+            return {"results": [{"id": f"{block_id}-{len(self.calls)}-{i}"} for i in range(len(children))]}
+
+    class _RecordingClient:
+        def __init__(self):
+            self.blocks = type("Blocks", (), {})()
+            self.blocks.children = _RecordingChildren()
+
+    client = _RecordingClient()
+    uploader = NotionBlockUploader(client, requests_per_second=0)
+
+    blocks = [{
+        "object": "block",
+        "type": "paragraph",
+        "paragraph": {"rich_text": [{"type": "text", "text": {"content": "가" * 4500}}]}
+    }] + [{
+        "object": "block",
+        "type": "bulleted_list_item",
+        "bulleted_list_item": {"rich_text": [{"type": "text", "text": {"content": f"항목 {i}"}}]}
+    } for i in range(150)]
+
+    stats = uploader.upload("page-id", blocks)
+    print(f"✅ 요청 {stats['requests']}회, 블록 {stats['blocks_uploaded']}개, 소요 {stats['duration_seconds']:.3f}초")
+
+
+if __name__ == "__main__":
+    test_notion_block_uploader()
@@ -3,9 +3,8 @@
 3-Part 데이터를 분석하여 개인화된 학습 전략 제공
 """
 
-import json
 import os
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 import sys
 
@@ -14,13 +13,24 @@ project_root = os.path.join(os.path.dirname(__file__), '..', '..', '..')
 sys.path.append(project_root)
 
 from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.artifact_store import ArtifactStore
+from src.notion_automation.dashboard.reflection_dataset import get_reflection
+from src.notion_automation.dashboard.reflection_ingest import get_reflection_ingestor
+from src.notion_automation.dashboard.reflection_metrics import timepart_metrics
 
 class OptimalTimeAnalyzer:
     """개인별 최적 학습 시간대 분석 클래스"""
     
-    def __init__(self):
+    def __init__(self, data_dir: Optional[str] = None):
+        """
+        Args:
+            data_dir: 반성 데이터/통계 저장 디렉토리 (기본값: 프로젝트 data 폴더)
+        """
         self.logger = ThreePartLogger()
-        self.data_dir = os.path.join(project_root, 'data')
+        self.data_dir = data_dir or os.path.join(project_root, 'data')
+        self.artifact_store = ArtifactStore(os.path.join(self.data_dir, 'artifacts'), logger=self.logger)
+        # 지표 큐브는 반성 저장 시점에 채워지며 분석기는 집계 쿼리만 함
+        self.metric_cube = get_reflection_ingestor(self.data_dir).metric_cube
         
         # 분석 차원 정의
         self.analysis_dimensions = {
@@ -64,12 +74,13 @@ class OptimalTimeAnalyzer:
             }
         }
     
-    def load_comprehensive_data(self, days: int = 14) -> Dict[str, Dict[str, Any]]:
+    def load_comprehensive_data(self, days: int = 14, dataset: Optional[Dict[str, Dict]] = None) -> Dict[str, Dict[str, Any]]:
         """
         종합적인 3-Part 데이터 로드
         
         Args:
             days: 분석할 일수 (기본값: 14일)
+            dataset: 미리 로드된 공유 반성 데이터셋 (선택사항)
             
         Returns:
             날짜별, 시간대별 종합 데이터
@@ -89,15 +100,7 @@ class OptimalTimeAnalyzer:
                 }
                 
                 # 각 시간대별 데이터 수집
-                timepart_configs = {
-                    "🌅 오전수업": ("morning_reflections", f"morning_reflection_{date.strftime('%Y%m%d')}.json"),
-                    "🌞 오후수업": ("afternoon_reflections", f"afternoon_reflection_{date.strftime('%Y%m%d')}.json"),
-                    "🌙 저녁자율학습": ("evening_reflections", f"evening_reflection_{date.strftime('%Y%m%d')}.json")
-                }
-                
-                for timepart, (folder, filename) in timepart_configs.items():
-                    file_path = os.path.join(self.data_dir, folder, filename)
-                    
+                for timepart in ["🌅 오전수업", "🌞 오후수업", "🌙 저녁자율학습"]:
                     timepart_data = {
                         "understanding": 0,
                         "concentration": 0,
@@ -108,11 +111,10 @@ class OptimalTimeAnalyzer:
                         "has_data": False
                     }
                     
-                    if os.path.exists(file_path):
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            timepart_data = self._extract_timepart_metrics(data, timepart)
-                            timepart_data["has_data"] = True
+                    data = get_reflection(self.data_dir, timepart, date, dataset)
+                    if data is not None:
+                        timepart_data = self._extract_timepart_metrics(data, timepart)
+                        timepart_data["has_data"] = True
                     
                     day_data["timeparts"][timepart] = timepart_data
                 
@@ -128,38 +130,7 @@ class OptimalTimeAnalyzer:
     def _extract_timepart_metrics(self, data: Dict[str, Any], timepart: str) -> Dict[str, Any]:
         """시간대별 데이터에서 메트릭 추출"""
         try:
-            # 이해도
-            understanding = data.get('학습이해도', data.get('이해도', 0))
-            
-            # 집중도 
-            concentration = data.get('집중도', data.get('계획달성도', 0))
-            
-            # 컨디션 (숫자로 변환)
-            condition_text = data.get('컨디션', '보통')
-            condition = {"좋음": 8, "보통": 5, "나쁨": 2}.get(condition_text, 5)
-            
-            # GitHub 활동
-            github_data = data.get('github_data', {})
-            github_activity = (
-                github_data.get('commits', 0) * 2 +
-                github_data.get('issues', 0) * 1.5 +
-                github_data.get('pull_requests', 0) * 3
-            )
-            
-            # 학습 시간
-            learning_time = data.get('학습시간', data.get('실제학습시간', 0))
-            
-            # 종합 점수
-            overall_score = data.get('총점', 0)
-            
-            return {
-                "understanding": understanding,
-                "concentration": concentration,
-                "condition": condition,
-                "github_activity": min(github_activity, 20),  # 최대 20점으로 제한
-                "learning_time": learning_time,
-                "overall_score": overall_score
-            }
+            return timepart_metrics(data)
             
         except Exception as e:
             self.logger.log_error(e, f"메트릭 추출 ({timepart})")
@@ -172,25 +143,32 @@ class OptimalTimeAnalyzer:
                 "overall_score": 0
             }
     
-    def identify_optimal_learning_times(self, days: int = 14) -> Dict[str, Any]:
+    def _analysis_window(self, days: int) -> Tuple[date, date]:
+        """분석 구간 [오늘-days+1, 오늘]"""
+        today = datetime.now().date()
+        return today - timedelta(days=days - 1), today
+    
+    def identify_optimal_learning_times(self, days: int = 14, dataset: Optional[Dict[str, Dict]] = None) -> Dict[str, Any]:
         """
         개인의 3-Part 데이터를 분석하여 최적 학습 시간대 식별
         
+        반성 파일을 읽지 않고 분석 구간에 대한 지표 큐브 집계 조회만 합니다.
+        
         Args:
             days: 분석할 일수 (기본값: 14일)
+            dataset: 미리 로드된 공유 반성 데이터셋 (큐브 조회로 대체되어 사용하지 않음, 호출 호환용)
             
         Returns:
             최적 시간대 분석 결과
         """
         try:
-            # 종합 데이터 로드
-            comprehensive_data = self.load_comprehensive_data(days)
+            window = self._analysis_window(days)
             
             # 시간대별 성과 집계
             timepart_performance = {}
             for timepart in ["🌅 오전수업", "🌞 오후수업", "🌙 저녁자율학습"]:
                 timepart_performance[timepart] = self._aggregate_timepart_performance(
-                    comprehensive_data, timepart
+                    window, timepart
                 )
             
             # 다차원 분석
@@ -210,10 +188,10 @@ class OptimalTimeAnalyzer:
                 learning_type_optimal[learning_type] = optimal_timepart
             
             # 일관성 분석
-            consistency_analysis = self._analyze_consistency(comprehensive_data)
+            consistency_analysis = self._analyze_consistency(window)
             
             # 요일별 패턴 분석
-            weekday_patterns = self._analyze_weekday_patterns(comprehensive_data)
+            weekday_patterns = self._analyze_weekday_patterns(window)
             
             # 종합 추천
             overall_recommendation = self._generate_overall_recommendation(
@@ -237,57 +215,40 @@ class OptimalTimeAnalyzer:
                 "created_at": datetime.now().isoformat()
             }
             
-            # 분석 결과 저장
-            output_path = os.path.join(self.data_dir, f"optimal_time_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            # 분석 결과 저장 (내용이 같으면 새로 기록하지 않음)
+            content_hash = self.artifact_store.put("optimal_time_analysis", analysis_result, window=f"{days}d")
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(analysis_result, f, ensure_ascii=False, indent=2)
-            
-            self.logger.info(f"최적 시간대 분석 완료: {output_path}")
+            self.logger.info(f"최적 시간대 분석 완료: {content_hash[:12]}")
             return analysis_result
             
         except Exception as e:
             self.logger.log_error(e, "최적 시간대 분석")
             return {}
     
-    def _aggregate_timepart_performance(self, data: Dict[str, Dict], timepart: str) -> Dict[str, Any]:
-        """시간대별 성과 집계"""
+    def _aggregate_timepart_performance(self, window: Tuple[date, date], timepart: str) -> Dict[str, Any]:
+        """시간대별 성과 집계 (지표 큐브 조회)"""
         try:
-            metrics = {
-                "understanding": [],
-                "concentration": [],
-                "condition": [],
-                "github_activity": [],
-                "learning_time": [],
-                "overall_score": []
-            }
+            metrics = ["understanding", "concentration", "condition", "github_activity", "learning_time", "overall_score"]
+            summary = self._cube_summary(window, timepart).get(timepart, {})
             
-            valid_days = 0
-            
-            for date_str, day_data in data.items():
-                timepart_data = day_data["timeparts"].get(timepart, {})
-                
-                if timepart_data.get("has_data", False):
-                    valid_days += 1
-                    for metric in metrics.keys():
-                        value = timepart_data.get(metric, 0)
-                        metrics[metric].append(value)
+            valid_days = summary.get("overall_score", {}).get("count", 0)
+            window_days = (window[1] - window[0]).days + 1
             
             # 통계 계산
             aggregated = {
                 "valid_days": valid_days,
-                "activity_rate": (valid_days / len(data)) * 100 if data else 0
+                "activity_rate": (valid_days / window_days) * 100 if window_days > 0 else 0
             }
             
-            for metric, values in metrics.items():
-                if values:
+            for metric in metrics:
+                stats = summary.get(metric)
+                if stats and stats["count"]:
                     aggregated[metric] = {
-                        "average": sum(values) / len(values),
-                        "max": max(values),
-                        "min": min(values),
-                        "total": sum(values),
-                        "consistency": self._calculate_consistency_score(values)
+                        "average": stats["mean"],
+                        "max": stats["max"],
+                        "min": stats["min"],
+                        "total": stats["total"],
+                        "consistency": self._calculate_consistency_score(stats)
                     }
                 else:
                     aggregated[metric] = {
@@ -300,17 +261,21 @@ class OptimalTimeAnalyzer:
             self.logger.log_error(e, f"시간대별 성과 집계 ({timepart})")
             return {}
     
-    def _calculate_consistency_score(self, values: List[float]) -> float:
+    def _cube_summary(self, window: Tuple[date, date], timepart: Optional[str] = None,
+                      metrics: Optional[List[str]] = None) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """분석 구간에 해당하는 큐브 집계 조회"""
+        start, end = window
+        if start > end:
+            return {}
+        return self.metric_cube.summarize(start, end, timepart, metrics)
+    
+    def _calculate_consistency_score(self, stats: Dict[str, Any]) -> float:
         """일관성 점수 계산 (낮은 변동성 = 높은 일관성)"""
-        if len(values) <= 1:
+        if stats["count"] <= 1:
             return 0
         
-        mean_val = sum(values) / len(values)
-        variance = sum([(v - mean_val) ** 2 for v in values]) / len(values)
-        std_dev = variance ** 0.5
-        
         # 표준편차가 낮을수록 일관성이 높음 (0-10 스케일)
-        consistency = max(0, 10 - std_dev)
+        consistency = max(0, 10 - stats["std_dev"])
         return round(consistency, 1)
     
     def _find_best_timepart_for_dimension(self, timepart_performance: Dict, dimension: str) -> Dict[str, Any]:
@@ -370,28 +335,25 @@ class OptimalTimeAnalyzer:
             self.logger.log_error(e, "가중치 기반 최적 시간대 계산")
             return {"optimal_timepart": None, "weighted_score": 0, "all_weighted_scores": {}}
     
-    def _analyze_consistency(self, data: Dict[str, Dict]) -> Dict[str, Dict]:
+    def _analyze_consistency(self, window: Tuple[date, date]) -> Dict[str, Dict]:
         """일관성 분석"""
         consistency_analysis = {}
         
         try:
+            summary = self._cube_summary(window, metrics=["overall_score"])
+            
             for timepart in ["🌅 오전수업", "🌞 오후수업", "🌙 저녁자율학습"]:
-                daily_scores = []
+                # 기록이 있는 날짜의 종합 점수 집계
+                stats = summary.get(timepart, {}).get("overall_score")
                 
-                for date_str, day_data in data.items():
-                    timepart_data = day_data["timeparts"].get(timepart, {})
-                    if timepart_data.get("has_data", False):
-                        score = timepart_data.get("overall_score", 0)
-                        daily_scores.append(score)
-                
-                if daily_scores:
-                    consistency_score = self._calculate_consistency_score(daily_scores)
-                    avg_score = sum(daily_scores) / len(daily_scores)
+                if stats and stats["count"]:
+                    consistency_score = self._calculate_consistency_score(stats)
+                    avg_score = stats["mean"]
                     
                     consistency_analysis[timepart] = {
                         "consistency_score": consistency_score,
                         "average_performance": round(avg_score, 1),
-                        "data_points": len(daily_scores),
+                        "data_points": stats["count"],
                         "reliability": "높음" if consistency_score >= 7 else "보통" if consistency_score >= 4 else "낮음"
                     }
                 
@@ -400,40 +362,32 @@ class OptimalTimeAnalyzer:
         
         return consistency_analysis
     
-    def _analyze_weekday_patterns(self, data: Dict[str, Dict]) -> Dict[str, Any]:
-        """요일별 패턴 분석"""
+    def _analyze_weekday_patterns(self, window: Tuple[date, date]) -> Dict[str, Any]:
+        """요일별 패턴 분석 (요일 × 시간대 큐브 집계)"""
         weekday_patterns = {}
         
         try:
-            weekday_performance = {}
+            start, end = window
+            if start > end:
+                return weekday_patterns
             
-            for date_str, day_data in data.items():
-                weekday = day_data["weekday"]
-                
-                if weekday not in weekday_performance:
-                    weekday_performance[weekday] = {
-                        "🌅 오전수업": [],
-                        "🌞 오후수업": [],
-                        "🌙 저녁자율학습": []
-                    }
-                
-                for timepart in ["🌅 오전수업", "🌞 오후수업", "🌙 저녁자율학습"]:
-                    timepart_data = day_data["timeparts"].get(timepart, {})
-                    if timepart_data.get("has_data", False):
-                        score = timepart_data.get("overall_score", 0)
-                        weekday_performance[weekday][timepart].append(score)
+            weekday_summary = self.metric_cube.weekday_summary("overall_score", start, end)
+            
+            # 분석 구간에 포함된 요일 (데이터가 없는 요일도 표시)
+            for offset in range(min(7, (end - start).days + 1)):
+                weekday = (end - timedelta(days=offset)).strftime("%A")
+                weekday_patterns.setdefault(weekday, {"best_timepart": None, "best_score": 0})
             
             # 요일별 최고 시간대 찾기
-            for weekday, timepart_scores in weekday_performance.items():
+            for weekday, timepart_stats in weekday_summary.items():
                 best_timepart = None
                 best_avg = 0
                 
-                for timepart, scores in timepart_scores.items():
-                    if scores:
-                        avg_score = sum(scores) / len(scores)
-                        if avg_score > best_avg:
-                            best_avg = avg_score
-                            best_timepart = timepart
+                for timepart in ["🌅 오전수업", "🌞 오후수업", "🌙 저녁자율학습"]:
+                    stats = timepart_stats.get(timepart)
+                    if stats and stats["count"] and stats["mean"] > best_avg:
+                        best_avg = stats["mean"]
+                        best_timepart = timepart
                 
                 weekday_patterns[weekday] = {
                     "best_timepart": best_timepart,
@@ -0,0 +1,426 @@
+"""
+시간대별 스트리밍 분위수 스케치 (KLL)
+
+시간대/지표마다 KLL 스케치 하나를 두고 관측값이 들어올 때마다 갱신합니다.
+스케치는 압축기(compactor) 계층에 최대 약 3k개의 값만 보관하므로 이력 길이와 무관하게
+메모리와 분위수 조회 시간이 일정하고, 다른 샤드/학습자의 스케치와 그대로 합칠 수 있습니다.
+히트맵 강도와 효율성 등급은 고정 임계값 대신 이 스케치의 실시간 분위수로 구간을 나눕니다.
+
+저장할 때는 파일 잠금 안에서 다른 프로세스가 저장한 스케치를 다시 읽고, 이 객체가 마지막 저장 이후
+반영한 관측값만 그 위에 다시 반영합니다 (날짜 비트맵이 같은 날 중복 반영을 거름).
+"""
+
+import base64
+import bisect
+import json
+import math
+import os
+import threading
+from datetime import datetime, date as date_type
+from typing import Dict, List, Any, Optional, Iterable, Tuple, Union
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.file_lock import file_lock
+
+DEFAULT_K = 200
+DEFAULT_SHRINK = 2 / 3
+STATE_VERSION = 1
+MIN_SKETCH_SAMPLES = 20  # 이보다 관측값이 적으면 분위수 구간 대신 고정 임계값 사용
+
+DateLike = Union[datetime, date_type, str]
+
+
+def _to_ordinal(date: DateLike) -> int:
+    if isinstance(date, str):
+        date = datetime.strptime(date[:10], "%Y-%m-%d")
+    if isinstance(date, datetime):
+        date = date.date()
+    return date.toordinal()
+
+
+class KLLSketch:
+    """
+    KLL 분위수 스케치
+
+    높이 h의 압축기에 있는 값은 가중치 2^h를 가집니다. 압축기가 용량을 넘으면 정렬 후
+    한 칸 건너 하나씩만 위 압축기로 올립니다 (홀/짝 시작 위치는 번갈아 선택).
+    순위 오차는 대략 1.7 / k 수준입니다.
+    """
+
+    __slots__ = ("k", "shrink", "compactors", "count", "min", "max", "_parity", "_cache")
+
+    def __init__(self, k: int = DEFAULT_K, shrink: float = DEFAULT_SHRINK):
+        self.k = k
+        self.shrink = shrink
+        self.compactors: List[List[float]] = [[]]
+        self.count = 0
+        self.min = None
+        self.max = None
+        self._parity = 0
+        self._cache = None
+
+    def _capacity(self, height: int) -> int:
+        depth = len(self.compactors) - height - 1
+        return max(2, int(math.ceil(self.k * self.shrink ** depth)))
+
+    def _size(self) -> int:
+        return sum(len(compactor) for compactor in self.compactors)
+
+    def _max_size(self) -> int:
+        return sum(self._capacity(height) for height in range(len(self.compactors)))
+
+    def update(self, value: float):
+        """값 하나 반영"""
+        value = float(value)
+        self.compactors[0].append(value)
+        self.count += 1
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self._cache = None
+        if len(self.compactors[0]) >= self._capacity(0):
+            self._compress()
+
+    def _compress(self):
+        while self._size() >= self._max_size():
+            for height, compactor in enumerate(self.compactors):
+                if len(compactor) < self._capacity(height):
+                    continue
+                if height + 1 == len(self.compactors):
+                    self.compactors.append([])
+
+                compactor.sort()
+                keep_last = compactor.pop() if len(compactor) % 2 else None
+                self.compactors[height + 1].extend(compactor[self._parity::2])
+                self._parity ^= 1
+                compactor[:] = [] if keep_last is None else [keep_last]
+                break
+            else:
+                return
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """다른 스케치를 합침 (다른 샤드/학습자의 스케치도 가능)"""
+        if other.count == 0:
+            return self
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append([])
+        for height, compactor in enumerate(other.compactors):
+            self.compactors[height].extend(compactor)
+
+        self.count += other.count
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self._cache = None
+        self._compress()
+        return self
+
+    def _cdf(self) -> Tuple[List[float], List[int], int]:
+        """(정렬된 값, 누적 가중치, 전체 가중치) - 갱신 전까지 재사용"""
+        if self._cache is None:
+            weighted = sorted(
+                (value, 1 << height)
+                for height, compactor in enumerate(self.compactors)
+                for value in compactor
+            )
+            values, cumulative, total = [], [], 0
+            for value, weight in weighted:
+                total += weight
+                values.append(value)
+                cumulative.append(total)
+            self._cache = (values, cumulative, total)
+        return self._cache
+
+    def quantile(self, q: float) -> Optional[float]:
+        """q 분위수 (0~1, 값이 없으면 None)"""
+        if self.count == 0:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        values, cumulative, total = self._cdf()
+        index = bisect.bisect_left(cumulative, q * total)
+        return values[min(index, len(values) - 1)]
+
+    def quantiles(self, qs: Iterable[float]) -> List[Optional[float]]:
+        return [self.quantile(q) for q in qs]
+
+    def rank(self, value: float) -> float:
+        """value 이하인 값의 비율 추정"""
+        if self.count == 0:
+            return 0.0
+        values, cumulative, total = self._cdf()
+        index = bisect.bisect_right(values, value)
+        return cumulative[index - 1] / total if index else 0.0
+
+    def retained(self) -> int:
+        """보관 중인 값 개수 (메모리 사용량 지표)"""
+        return self._size()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"k": self.k, "shrink": self.shrink, "compactors": self.compactors, "count": self.count,
+                "min": self.min, "max": self.max, "parity": self._parity}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "KLLSketch":
+        sketch = cls(data.get("k", DEFAULT_K), data.get("shrink", DEFAULT_SHRINK))
+        sketch.compactors = [list(compactor) for compactor in data.get("compactors", [[]])] or [[]]
+        sketch.count = data.get("count", 0)
+        sketch.min = data.get("min")
+        sketch.max = data.get("max")
+        sketch._parity = data.get("parity", 0)
+        return sketch
+
+
+def _mark_seen(series: Dict[str, Any], ordinal: int) -> bool:
+    """날짜를 반영 비트맵에 표시 (이미 표시되어 있으면 False)"""
+    if series["base"] is None:
+        series["base"] = ordinal
+    if ordinal < series["base"]:
+        shift = series["base"] - ordinal
+        # 앞쪽으로 확장: 바이트 단위로 맞춰 이동
+        pad = (shift + 7) // 8
+        series["seen"] = bytearray(pad) + series["seen"]
+        series["base"] -= pad * 8
+
+    offset = ordinal - series["base"]
+    byte, bit = divmod(offset, 8)
+    if byte >= len(series["seen"]):
+        series["seen"].extend(bytearray(byte - len(series["seen"]) + 1))
+    if series["seen"][byte] & (1 << bit):
+        return False
+    series["seen"][byte] |= 1 << bit
+    return True
+
+
+class TimePartQuantileSketches:
+    """시간대/지표별 영속 분위수 스케치 저장소"""
+
+    def __init__(self, state_path: str, k: int = DEFAULT_K, logger: Optional[ThreePartLogger] = None):
+        """
+        Args:
+            state_path: 상태 저장 JSON 파일 경로
+            k: 스케치 정확도 (클수록 정확하고 메모리 증가)
+            logger: 로깅 시스템 (선택사항)
+        """
+        self.state_path = state_path
+        self.k = k
+        self.logger = logger or ThreePartLogger(name="quantile_sketch")
+        self._lock = threading.Lock()
+        self._dirty = False
+        # 키 → {"sketch": KLLSketch, "base": 비트맵 시작 날짜 서수, "seen": 반영한 날짜 비트맵}
+        self.series: Dict[str, Dict[str, Any]] = self._read_state()
+        # 마지막 저장 이후 변경 (저장 시 디스크 상태 위에 다시 반영)
+        self._pending_observations: List[Tuple[str, int, float]] = []
+        self._pending_merges: List[Tuple[str, Dict[str, Any]]] = []
+        self._pending_reset = False
+
+    @staticmethod
+    def _key(timepart: str, metric: str) -> str:
+        return f"{timepart}|{metric}"
+
+    def _new_series(self) -> Dict[str, Any]:
+        return {"sketch": KLLSketch(self.k), "base": None, "seen": bytearray()}
+
+    def _read_state(self) -> Dict[str, Dict[str, Any]]:
+        """저장된 스케치 읽기 (파일이 없거나 버전이 다르면 빈 상태)"""
+        if not os.path.exists(self.state_path):
+            return {}
+
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get("version") != STATE_VERSION:
+                return {}
+
+            return {
+                key: {
+                    "sketch": KLLSketch.from_dict(series["sketch"]),
+                    "base": series["base"],
+                    "seen": bytearray(base64.b64decode(series["seen"]))
+                }
+                for key, series in state.get("series", {}).items()
+            }
+        except Exception as e:
+            self.logger.log_error(e, "분위수 스케치 상태 로드")
+            return {}
+
+    def save(self):
+        """
+        변경된 상태를 파일에 저장
+
+        잠금 안에서 디스크 상태를 다시 읽어(reset 후면 빈 상태에서) 마지막 저장 이후의 관측값과
+        병합을 다시 반영하고, 저장한 결과를 메모리 상태로 삼습니다.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+
+            with file_lock(self.state_path):
+                merged = {} if self._pending_reset else self._read_state()
+                for key, ordinal, value in self._pending_observations:
+                    self._observe_series(merged, key, ordinal, value)
+                for key, other_series in self._pending_merges:
+                    self._merge_series(merged, key, other_series)
+
+                state = {
+                    "version": STATE_VERSION,
+                    "updated_at": datetime.now().isoformat(),
+                    "series": {
+                        key: {
+                            "sketch": series["sketch"].to_dict(),
+                            "base": series["base"],
+                            "seen": base64.b64encode(bytes(series["seen"])).decode("ascii")
+                        }
+                        for key, series in merged.items()
+                    }
+                }
+                temp_path = f"{self.state_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(state, f, ensure_ascii=False, separators=(",", ":"))
+                os.replace(temp_path, self.state_path)
+
+            self.series = merged
+            self._pending_observations = []
+            self._pending_merges = []
+            self._pending_reset = False
+            self._dirty = False
+
+    def _observe_series(self, series_map: Dict[str, Dict[str, Any]], key: str, ordinal: int, value: float) -> bool:
+        series = series_map.get(key)
+        if series is None:
+            series = series_map[key] = self._new_series()
+        if not _mark_seen(series, ordinal):
+            return False
+        series["sketch"].update(value)
+        return True
+
+    def _merge_series(self, series_map: Dict[str, Dict[str, Any]], key: str, other_series: Dict[str, Any]):
+        series = series_map.get(key)
+        if series is None:
+            series = series_map[key] = self._new_series()
+        series["sketch"].merge(KLLSketch.from_dict(other_series["sketch"].to_dict()))
+        if other_series["base"] is not None:
+            for offset, byte in enumerate(other_series["seen"]):
+                for bit in range(8):
+                    if byte & (1 << bit):
+                        _mark_seen(series, other_series["base"] + offset * 8 + bit)
+
+    def observe(self, timepart: str, metric: str, date: DateLike, value: float) -> bool:
+        """
+        특정 날짜의 관측값 반영
+
+        스케치는 값을 빼는 연산이 없으므로 (시간대, 지표)마다 날짜당 한 번만 반영합니다.
+        이미 반영한 날짜는 날짜 비트맵(1년에 약 46바이트)으로 걸러 여러 번 호출해도 안전합니다.
+
+        Returns:
+            새로 반영했는지 여부
+        """
+        key = self._key(timepart, metric)
+        ordinal = _to_ordinal(date)
+        value = float(value)
+        with self._lock:
+            if not self._observe_series(self.series, key, ordinal, value):
+                return False
+            self._pending_observations.append((key, ordinal, value))
+            self._dirty = True
+            return True
+
+    def observe_many(self, rows: Iterable[Tuple[str, str, DateLike, float]]) -> int:
+        """(시간대, 지표, 날짜, 값) 관측값 일괄 반영, 새로 반영한 개수 반환"""
+        return sum(self.observe(timepart, metric, date, value) for timepart, metric, date, value in rows)
+
+    def reset(self):
+        """모든 스케치와 날짜 비트맵 비우기 (원본에서 다시 쌓을 때)"""
+        with self._lock:
+            self.series = {}
+            self._pending_observations = []
+            self._pending_merges = []
+            self._pending_reset = True
+            self._dirty = True
+
+    def sketch(self, timepart: str, metric: str) -> Optional[KLLSketch]:
+        series = self.series.get(self._key(timepart, metric))
+        return series["sketch"] if series else None
+
+    def count(self, timepart: str, metric: str) -> int:
+        sketch = self.sketch(timepart, metric)
+        return sketch.count if sketch else 0
+
+    def quantiles(self, timepart: str, metric: str, qs: Iterable[float]) -> List[Optional[float]]:
+        """시간대/지표의 분위수 목록 (관측값이 없으면 None 목록)"""
+        qs = list(qs)
+        sketch = self.sketch(timepart, metric)
+        return sketch.quantiles(qs) if sketch else [None] * len(qs)
+
+    def band(self, timepart: str, metric: str, value: float, qs: Iterable[float],
+             side: str = "left", min_count: int = MIN_SKETCH_SAMPLES) -> Optional[int]:
+        """
+        value가 분위수 경계 qs로 나눈 구간 중 몇 번째인지 (0 ~ len(qs))
+
+        Args:
+            side: "left"면 경계값과 같은 값은 아래 구간, "right"면 위 구간
+            min_count: 이보다 관측값이 적으면 None (호출 측에서 고정 임계값 사용)
+        """
+        sketch = self.sketch(timepart, metric)
+        if sketch is None or sketch.count < min_count:
+            return None
+        cuts = sketch.quantiles(qs)
+        return (bisect.bisect_left if side == "left" else bisect.bisect_right)(cuts, value)
+
+    def merge(self, other: "TimePartQuantileSketches") -> "TimePartQuantileSketches":
+        """다른 저장소(샤드/학습자)의 스케치를 시간대/지표별로 합침 (반영 날짜는 합집합)"""
+        with self._lock:
+            for key, other_series in other.series.items():
+                snapshot = {"sketch": KLLSketch.from_dict(other_series["sketch"].to_dict()),
+                            "base": other_series["base"], "seen": bytearray(other_series["seen"])}
+                self._merge_series(self.series, key, snapshot)
+                self._pending_merges.append((key, snapshot))
+            self._dirty = True
+        return self
+
+    def merged_sketch(self, metric: str, timeparts: Optional[Iterable[str]] = None) -> KLLSketch:
+        """여러 시간대의 같은 지표 스케치를 합친 새 스케치 (원본은 변경하지 않음)"""
+        merged = KLLSketch(self.k)
+        for key, series in self.series.items():
+            timepart, series_metric = key.rsplit("|", 1)
+            if series_metric == metric and (timeparts is None or timepart in timeparts):
+                merged.merge(KLLSketch.from_dict(series["sketch"].to_dict()))
+        return merged
+
+
+def test_quantile_sketch():
+    """스케치 분위수 오차와 보관 크기 확인"""
+    import random
+    import tempfile
+    from datetime import timedelta
+
+    print("📏 분위수 스케치 테스트 시작")
+
+    rng = random.Random(5)
+    values = [rng.lognormvariate(1.5, 0.6) for _ in range(200_000)]
+    sketch = KLLSketch()
+    for value in values:
+        sketch.update(value)
+
+    exact = sorted(values)
+    for q in (0.1, 0.5, 0.9, 0.99):
+        estimate = sketch.quantile(q)
+        rank_error = abs(bisect.bisect_left(exact, estimate) / len(exact) - q)
+        print(f"✅ p{int(q * 100)}: 추정 {estimate:.3f} / 정확 {exact[int(q * len(exact))]:.3f} (순위 오차 {rank_error:.4f})")
+    print(f"✅ 관측 {sketch.count:,}개 중 보관 {sketch.retained()}개")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = TimePartQuantileSketches(os.path.join(temp_dir, "sketches.json"))
+        today = datetime.now()
+        for offset in range(365):
+            store.observe("🌅 오전수업", "efficiency", today - timedelta(days=offset), rng.uniform(3, 9))
+        store.save()
+        print(f"✅ 오전수업 효율성 사분위수: {[round(v, 2) for v in store.quantiles('🌅 오전수업', 'efficiency', (0.25, 0.5, 0.75))]}")
+
+
+if __name__ == "__main__":
+    test_quantile_sketch()
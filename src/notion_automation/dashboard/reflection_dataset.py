@@ -0,0 +1,102 @@
+"""
+3-Part 반성 데이터 공용 로더
+대시보드 섹션들이 같은 반성 파일을 한 번만 읽고 공유하도록 지원
+"""
+
+import json
+import os
+from datetime import datetime, date as date_type, timedelta
+from typing import Dict, Any, Optional, Iterator, Tuple
+
+# 시간대별 (데이터 폴더, 파일 접두사)
+TIMEPART_FILES = {
+    "🌅 오전수업": ("morning_reflections", "morning_reflection"),
+    "🌞 오후수업": ("afternoon_reflections", "afternoon_reflection"),
+    "🌙 저녁자율학습": ("evening_reflections", "evening_reflection")
+}
+
+
+def reflection_file_path(data_dir: str, timepart: str, date: datetime) -> str:
+    """시간대/날짜에 해당하는 반성 파일 경로 반환"""
+    folder, prefix = TIMEPART_FILES[timepart]
+    return os.path.join(data_dir, folder, f"{prefix}_{date.strftime('%Y%m%d')}.json")
+
+
+def iter_reflection_files(data_dir: str) -> Iterator[Tuple[str, date_type, os.DirEntry]]:
+    """
+    반성 폴더의 (시간대, 날짜, 파일 항목) 순회 (파일 내용은 읽지 않음)
+
+    파일명이 "{접두사}_YYYYMMDD.json" 형식이 아니거나 날짜가 잘못된 파일은 건너뜁니다.
+    """
+    for timepart, (folder, prefix) in TIMEPART_FILES.items():
+        folder_path = os.path.join(data_dir, folder)
+        if not os.path.isdir(folder_path):
+            continue
+
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith(prefix + "_") and name.endswith(".json")):
+                    continue
+                stem = name[len(prefix) + 1:-5]
+                if len(stem) != 8 or not stem.isdigit():
+                    continue
+                try:
+                    day = date_type(int(stem[:4]), int(stem[4:6]), int(stem[6:]))
+                except ValueError:
+                    continue
+                yield timepart, day, entry
+
+
+def load_reflection_dataset(data_dir: str, days: int, end_date: Optional[datetime] = None) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    최근 N일간의 3-Part 반성 파일을 한 번에 로드
+
+    Args:
+        data_dir: 데이터 디렉터리
+        days: 로드할 일수
+        end_date: 기준 날짜 (기본값: 현재 시각)
+
+    Returns:
+        {YYYYMMDD: {시간대: 반성 데이터}} 형태의 데이터셋.
+        범위 내 모든 날짜 키가 존재하며, 파일이 없는 시간대는 빠져 있음
+    """
+    end_date = end_date or datetime.now()
+    dataset = {}
+
+    for day_offset in range(days):
+        date = end_date - timedelta(days=day_offset)
+        day_entries = {}
+
+        for timepart in TIMEPART_FILES:
+            file_path = reflection_file_path(data_dir, timepart, date)
+            if os.path.exists(file_path):
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    day_entries[timepart] = json.load(f)
+
+        dataset[date.strftime("%Y%m%d")] = day_entries
+
+    return dataset
+
+
+def get_reflection(data_dir: str, timepart: str, date: datetime,
+                   dataset: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None) -> Optional[Dict[str, Any]]:
+    """
+    특정 날짜/시간대 반성 데이터 조회
+
+    공유 데이터셋에 해당 날짜가 있으면 파일을 다시 열지 않고 재사용하고,
+    데이터셋 범위 밖이면 파일에서 직접 읽음
+
+    Returns:
+        반성 데이터 (파일이 없으면 None)
+    """
+    date_key = date.strftime("%Y%m%d")
+    if dataset is not None and date_key in dataset:
+        return dataset[date_key].get(timepart)
+
+    file_path = reflection_file_path(data_dir, timepart, date)
+    if not os.path.exists(file_path):
+        return None
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
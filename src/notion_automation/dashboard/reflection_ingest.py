@@ -0,0 +1,377 @@
+"""
+반성 입력 시점 통계 반영
+
+오전/오후/저녁 반성 스크립트가 반성 파일을 저장하는 즉시 시간대별 누적 통계를 갱신합니다.
+차트와 대시보드는 이 저장소를 읽기만 하므로, 30/90/365일 구간 통계가 이전에 어떤 차트가
+어느 기간을 불러왔는지에 좌우되지 않습니다.
+
+- 같은 날짜/시간대를 다시 저장하면 그날 값을 새 값으로 바꾸고, 파일이 지워지면 그날 값을 뺍니다.
+- 상태 파일이 없으면(처음 사용) 기존 반성 파일 전체를 한 번 반영(backfill)합니다.
+- sync_reflection_files는 수정 시각/크기가 바뀐 파일만 날짜순으로 다시 읽어, 스크립트를 거치지 않은
+  수정/삭제도 반영합니다.
+- 반성 스크립트와 대시보드가 동시에 저장할 수 있으므로 상태 파일은 파일 잠금 안에서 다시 읽어
+  이 객체에서 바뀐 항목만 덮어쓴 뒤 저장합니다.
+
+관리하는 저장소: 효율성/총점 누적 통계(rolling_stats), 분석 지표 큐브(metric_cube),
+효율성/GitHub 활동 분위수 스케치(quantile_sketch)와 활동 요약(activity_summary)
+
+분위수 스케치는 값을 뺄 수 없으므로 끝난 날짜(오늘 이전)만 finalize_days에서 한 번 반영하며,
+한 번 반영된 날의 값은 확정으로 봅니다. 이후 그날 반성을 고치거나 webhook 건수가 늦게 늘어도
+누적 통계/큐브/활동 요약은 바뀌지만 스케치는 그대로입니다. 반영 기준일(finalized_through)이
+없으면(처음 사용 또는 상태 버전 변경) 스케치를 비우고 원본에서 다시 쌓습니다.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime, date as date_type, timedelta
+from typing import Dict, List, Any, Optional, Union
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.file_lock import file_lock
+from src.notion_automation.dashboard.reflection_dataset import TIMEPART_FILES, iter_reflection_files
+from src.notion_automation.dashboard.reflection_metrics import efficiency_score, total_score, timepart_metrics
+from src.notion_automation.dashboard.rolling_stats import TimePartRollingStats
+from src.notion_automation.dashboard.metric_cube import TimePartMetricCube
+from src.notion_automation.dashboard.quantile_sketch import TimePartQuantileSketches
+from src.notion_automation.dashboard.activity_summary import DailyActivitySummary
+
+DateLike = Union[datetime, date_type, str]
+
+# 관리하는 저장소가 늘면 올려서 다음 실행 때 기존 파일 전체를 다시 backfill
+STATE_VERSION = 3
+
+logger = ThreePartLogger("reflection_ingest")
+
+
+def _to_date(value: DateLike) -> date_type:
+    if isinstance(value, str):
+        return datetime.strptime(value[:10], "%Y-%m-%d").date()
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+class ReflectionStatsIngestor:
+    """반성 저장 시점에 시간대별 통계 저장소를 갱신하는 반영기"""
+
+    def __init__(self, data_dir: str, logger: Optional[ThreePartLogger] = None, backfill: bool = True):
+        """
+        Args:
+            data_dir: 반성 폴더와 stats 폴더가 있는 데이터 디렉토리
+            logger: 로깅 시스템 (선택사항)
+            backfill: 처음 사용일 때 기존 반성 파일을 한 번 반영할지 여부
+        """
+        self.data_dir = data_dir
+        self.logger = logger or ThreePartLogger(name="reflection_ingest")
+        stats_dir = os.path.join(data_dir, 'stats')
+
+        self.efficiency_stats = TimePartRollingStats(os.path.join(stats_dir, 'efficiency_trend.json'), logger=self.logger)
+        self.score_stats = TimePartRollingStats(os.path.join(stats_dir, 'dashboard.json'), logger=self.logger)
+        self.metric_cube = TimePartMetricCube(os.path.join(stats_dir, 'metric_cube.db'), logger=self.logger)
+        self.efficiency_sketches = TimePartQuantileSketches(os.path.join(stats_dir, 'efficiency_sketches.json'), logger=self.logger)
+        self.activity_sketches = TimePartQuantileSketches(os.path.join(stats_dir, 'github_heatmap_sketches.json'), logger=self.logger)
+        self.activity_summary = DailyActivitySummary(os.path.join(stats_dir, 'activity_summary.db'), logger=self.logger)
+
+        self.state_path = os.path.join(stats_dir, 'reflection_ingest.json')
+        self._lock = threading.RLock()
+        self._dirty = False
+        state = self._read_state()
+        self.sources: Dict[str, List[Any]] = state.get("sources", {})  # 상대 경로 → [mtime_ns, 크기, 시간대, 날짜]
+        self.backfilled_at: Optional[str] = state.get("backfilled_at")
+        self.finalized_through: Optional[str] = state.get("finalized_through")  # 스케치에 반영을 마친 마지막 날짜
+        self._source_changes: Dict[str, Optional[List[Any]]] = {}  # 마지막 저장 이후 바뀐 추적 항목 (None은 삭제)
+
+        if backfill and self.backfilled_at is None:
+            self.backfill()
+
+    def _read_state(self) -> Dict[str, Any]:
+        """저장된 반영 상태 (파일이 없거나 버전이 다르면 빈 상태)"""
+        if not os.path.exists(self.state_path):
+            return {}
+
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            return state if state.get("version") == STATE_VERSION else {}
+        except Exception as e:
+            self.logger.log_error(e, "반성 통계 반영 상태 로드")
+            return {}
+
+    def save(self):
+        """통계 저장소와 파일 추적 상태 저장 (변경된 것만, 다른 프로세스가 저장한 항목과 병합)"""
+        self.efficiency_stats.save()
+        self.score_stats.save()
+        self.efficiency_sketches.save()
+        self.activity_sketches.save()
+
+        with self._lock:
+            if not self._dirty:
+                return
+
+            with file_lock(self.state_path):
+                disk = self._read_state()
+                sources = dict(disk.get("sources", {}))
+                for key, entry in self._source_changes.items():
+                    if entry is None:
+                        sources.pop(key, None)
+                    else:
+                        sources[key] = entry
+                finalized = [day for day in (self.finalized_through, disk.get("finalized_through")) if day]
+
+                state = {
+                    "version": STATE_VERSION,
+                    "updated_at": datetime.now().isoformat(),
+                    "backfilled_at": self.backfilled_at or disk.get("backfilled_at"),
+                    "finalized_through": max(finalized) if finalized else None,
+                    "sources": sources
+                }
+                temp_path = f"{self.state_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(state, f, ensure_ascii=False, separators=(",", ":"))
+                os.replace(temp_path, self.state_path)
+
+            self.sources = sources
+            self.backfilled_at = state["backfilled_at"]
+            self.finalized_through = state["finalized_through"]
+            self._source_changes = {}
+            self._dirty = False
+
+    def _source_key(self, path: str) -> str:
+        return os.path.relpath(os.path.abspath(path), os.path.abspath(self.data_dir))
+
+    def _apply(self, timepart: str, day: date_type, reflection: Dict[str, Any]) -> bool:
+        """반성 한 건의 지표를 그날 값으로 반영 (이전 값은 대체)"""
+        changed = self.efficiency_stats.observe(timepart, "efficiency", day, efficiency_score(reflection, timepart))
+        changed |= self.score_stats.observe(timepart, "total_score", day, total_score(reflection))
+        changed |= self.metric_cube.record(day, timepart, timepart_metrics(reflection)) > 0
+        return changed
+
+    def _retract(self, timepart: str, day: date_type) -> bool:
+        """그날 값 제거"""
+        changed = self.efficiency_stats.discard(timepart, "efficiency", day)
+        changed |= self.score_stats.discard(timepart, "total_score", day)
+        changed |= self.metric_cube.remove(day, timepart) > 0
+        return changed
+
+    def _is_finalized(self, day: date_type) -> bool:
+        return self.finalized_through is not None and day.isoformat() <= self.finalized_through
+
+    def _observe_finished(self, start: date_type, end: date_type) -> int:
+        """start~end(끝난 날짜들)의 효율성 값과 활동이 있는 칸을 스케치에 반영 (이미 반영한 날은 비트맵이 거름)"""
+        self.activity_summary.sync_reflection_files(self.data_dir)
+
+        observed = self.efficiency_sketches.observe_many(
+            (timepart, "efficiency", day, value)
+            for timepart in TIMEPART_FILES
+            for day, value in self.efficiency_stats.daily_values(timepart, "efficiency", start, end)
+        )
+        observed += self.activity_sketches.observe_many(
+            (timepart, "github_activity", day, activity)
+            for day, cells in self.activity_summary.activity_grid(start, end).items()
+            for timepart, activity in cells.items()
+            if activity > 0
+        )
+        return observed
+
+    def finalize_days(self, today: Optional[DateLike] = None) -> int:
+        """
+        어제까지 끝난 날짜 중 아직 스케치에 반영하지 않은 날을 반영
+
+        오늘 값은 반성 정정과 webhook으로 계속 바뀌므로 반영하지 않습니다.
+
+        Args:
+            today: 기준일 (기본값: 오늘)
+
+        Returns:
+            스케치에 새로 반영한 관측값 수
+        """
+        last = _to_date(today or datetime.now()) - timedelta(days=1)
+        with self._lock:
+            if self.finalized_through is None:
+                # 반영 기준일이 없으면 기존 스케치에 어떤 값이 들어갔는지 알 수 없으므로 다시 쌓음
+                self.efficiency_sketches.reset()
+                self.activity_sketches.reset()
+                start = date_type.min
+            else:
+                start = _to_date(self.finalized_through) + timedelta(days=1)
+            if start > last:
+                return 0
+
+            observed = self._observe_finished(start, last)
+            self.finalized_through = last.isoformat()
+            self._dirty = True
+
+        self.save()
+        return observed
+
+    def _track(self, path: Optional[str], timepart: str, day: date_type):
+        if not path or not os.path.exists(path):
+            return
+        stat = os.stat(path)
+        self._set_source(self._source_key(path), [stat.st_mtime_ns, stat.st_size, timepart, day.isoformat()])
+
+    def _set_source(self, key: str, entry: Optional[List[Any]]):
+        """파일 추적 항목 변경 (entry가 None이면 삭제)"""
+        if entry is None:
+            self.sources.pop(key, None)
+        else:
+            self.sources[key] = entry
+        self._source_changes[key] = entry
+        self._dirty = True
+
+    def ingest(self, timepart: str, date: DateLike, reflection: Dict[str, Any], path: Optional[str] = None) -> bool:
+        """
+        저장된 반성 한 건 반영
+
+        Args:
+            timepart: 시간대
+            date: 반성 날짜
+            reflection: 반성 파일에 저장한 내용
+            path: 저장한 파일 경로 (주면 다음 동기화 때 같은 파일을 다시 읽지 않음)
+
+        Returns:
+            통계가 바뀌었는지 여부
+        """
+        day = _to_date(date)
+        with self._lock:
+            changed = self._apply(timepart, day, reflection)
+            self._track(path, timepart, day)
+            if self._is_finalized(day):
+                # 지난 날짜를 처음 입력한 경우 (이미 반영된 날이면 스케치는 그대로)
+                self._observe_finished(day, day)
+        self.finalize_days()
+        self.save()
+        return changed
+
+    def remove(self, timepart: str, date: DateLike, path: Optional[str] = None) -> bool:
+        """삭제된 반성 한 건의 값 제거"""
+        day = _to_date(date)
+        with self._lock:
+            changed = self._retract(timepart, day)
+            if path and self._source_key(path) in self.sources:
+                self._set_source(self._source_key(path), None)
+        self.save()
+        return changed
+
+    def sync_reflection_files(self) -> int:
+        """
+        반성 폴더를 훑어 새로 생기거나 바뀐 파일만 읽어 반영하고, 사라진 파일의 값은 제거
+
+        Returns:
+            다시 읽거나 제거한 파일 수
+        """
+        updated = 0
+        late_days = set()
+        timepart_order = {timepart: index for index, timepart in enumerate(TIMEPART_FILES)}
+        with self._lock:
+            seen = set()
+            # 날짜순으로 반영해야 누적 통계가 과거 날짜 정정(재계산) 없이 끝에 이어 붙음
+            files = sorted(iter_reflection_files(self.data_dir), key=lambda item: (item[1], timepart_order[item[0]]))
+            for timepart, day, entry in files:
+                key = self._source_key(entry.path)
+                seen.add(key)
+                stat = entry.stat()
+                if self.sources.get(key, [None, None])[:2] == [stat.st_mtime_ns, stat.st_size]:
+                    continue
+
+                try:
+                    with open(entry.path, 'r', encoding='utf-8') as f:
+                        reflection = json.load(f)
+                except (OSError, ValueError) as e:
+                    self.logger.warning(f"반성 파일 읽기 실패, 건너뜀: {entry.path} ({str(e)})")
+                    continue
+
+                self._apply(timepart, day, reflection)
+                self._set_source(key, [stat.st_mtime_ns, stat.st_size, timepart, day.isoformat()])
+                if self._is_finalized(day):
+                    late_days.add(day)
+                updated += 1
+
+            for key in [key for key in self.sources if key not in seen]:
+                _, _, timepart, day = self.sources[key]
+                self._set_source(key, None)
+                self._retract(timepart, _to_date(day))
+                updated += 1
+
+            for day in sorted(late_days):
+                self._observe_finished(day, day)
+
+            if updated:
+                self._dirty = True
+
+        self.save()
+        if updated:
+            self.logger.info(f"반성 통계 동기화: 파일 {updated}개 반영")
+        return updated
+
+    def backfill(self) -> int:
+        """기존 반성 파일 전체를 한 번 반영"""
+        updated = self.sync_reflection_files()
+        with self._lock:
+            self.backfilled_at = datetime.now().isoformat()
+            self._dirty = True
+        self.finalize_days()
+        self.save()
+        self.logger.info(f"반성 통계 backfill 완료: 파일 {updated}개")
+        return updated
+
+
+_ingestors: Dict[str, ReflectionStatsIngestor] = {}
+_ingestors_lock = threading.Lock()
+
+
+def get_reflection_ingestor(data_dir: str) -> ReflectionStatsIngestor:
+    """데이터 디렉토리별 반영기를 프로세스 안에서 공유 (같은 상태 파일을 여러 객체가 덮어쓰지 않도록)"""
+    key = os.path.abspath(data_dir)
+    with _ingestors_lock:
+        ingestor = _ingestors.get(key)
+        if ingestor is None:
+            ingestor = _ingestors[key] = ReflectionStatsIngestor(data_dir)
+        return ingestor
+
+
+def ingest_reflection_file(path: str, timepart: str, date: DateLike, reflection: Dict[str, Any]) -> bool:
+    """
+    반성 스크립트가 파일을 저장한 직후 호출
+
+    통계 반영에 실패해도 반성 저장은 성공한 것으로 두고 오류만 기록합니다.
+    """
+    try:
+        data_dir = os.path.dirname(os.path.dirname(os.path.abspath(path)))
+        return get_reflection_ingestor(data_dir).ingest(timepart, date, reflection, path=path)
+    except Exception as e:
+        logger.log_error(e, "반성 통계 반영")
+        return False
+
+
+def test_reflection_ingest():
+    """반영/정정/삭제와 backfill 확인"""
+    import tempfile
+    from src.notion_automation.dashboard.reflection_dataset import reflection_file_path
+
+    print("📥 반성 통계 반영 테스트 시작")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        today = datetime.now()
+        path = reflection_file_path(temp_dir, "🌅 오전수업", today)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"총점": 80, "이해도": 8}, f)
+
+        ingestor = ReflectionStatsIngestor(temp_dir)
+        print(f"✅ backfill 후 총점 평균: {ingestor.score_stats.window('🌅 오전수업', 'total_score', today, 1)['mean']}")
+
+        ingestor.ingest("🌅 오전수업", today, {"총점": 90, "이해도": 9}, path=path)
+        print(f"✅ 정정 후 총점 평균: {ingestor.score_stats.window('🌅 오전수업', 'total_score', today, 1)['mean']}")
+
+        os.remove(path)
+        ingestor.sync_reflection_files()
+        print(f"✅ 삭제 후 관측 수: {ingestor.score_stats.window('🌅 오전수업', 'total_score', today, 1)['count']}")
+
+
+if __name__ == "__main__":
+    test_reflection_ingest()
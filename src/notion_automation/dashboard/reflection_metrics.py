@@ -0,0 +1,81 @@
+"""
+반성 데이터 → 지표 변환
+
+차트가 화면을 그릴 때와 반성 입력 시점에 누적 통계를 갱신할 때 같은 계산을 쓰도록
+반성 데이터 한 건에서 지표를 뽑는 함수만 모아 둡니다.
+"""
+
+from typing import Dict, Any
+
+CONDITION_SCORES = {"좋음": 8, "보통": 5, "나쁨": 2}
+
+
+def efficiency_score(data: Dict[str, Any], timepart: str) -> float:
+    """
+    반성 데이터 한 건의 시간대별 효율성 점수 (0-10)
+
+    Args:
+        data: 시간대별 반성 데이터
+        timepart: 시간대
+    """
+    # 기본 학습 지표들
+    understanding = data.get('학습이해도', data.get('이해도', 5))
+    concentration = data.get('집중도', data.get('계획달성도', 5))
+    condition = data.get('컨디션', '보통')
+
+    # 컨디션을 숫자로 변환
+    condition_score = CONDITION_SCORES.get(condition, 5)
+
+    # GitHub 활동 점수
+    github_data = data.get('github_data', {})
+    github_score = github_data.get('productivity_score', 0)
+
+    # 학습 시간
+    study_time = data.get('학습시간', data.get('실제학습시간', 3))
+
+    # 시간대별 특화 가중치
+    if "오전" in timepart:
+        # 오전: 이해도와 컨디션 중요
+        efficiency = (understanding * 0.3 + concentration * 0.2 +
+                    condition_score * 0.3 + min(github_score/2, 5) * 0.1 +
+                    min(study_time/3, 3.33) * 0.1)
+    elif "오후" in timepart:
+        # 오후: 실습과 GitHub 활동 중요
+        efficiency = (understanding * 0.2 + concentration * 0.3 +
+                    condition_score * 0.2 + min(github_score/2, 5) * 0.2 +
+                    min(study_time/4, 2.5) * 0.1)
+    else:  # 저녁
+        # 저녁: 집중도와 자기주도성 중요
+        efficiency = (understanding * 0.2 + concentration * 0.4 +
+                    condition_score * 0.2 + min(github_score/2, 5) * 0.15 +
+                    min(study_time/3, 3.33) * 0.05)
+
+    return round(min(efficiency, 10), 1)
+
+
+def total_score(data: Dict[str, Any]) -> float:
+    """반성 데이터 한 건의 시간대 총점"""
+    return data.get('총점', 0)
+
+
+def timepart_metrics(data: Dict[str, Any]) -> Dict[str, Any]:
+    """반성 데이터 한 건의 분석 지표 (지표 큐브에 쌓는 값)"""
+    # 컨디션 (숫자로 변환)
+    condition = CONDITION_SCORES.get(data.get('컨디션', '보통'), 5)
+
+    # GitHub 활동
+    github_data = data.get('github_data', {})
+    github_activity = (
+        github_data.get('commits', 0) * 2 +
+        github_data.get('issues', 0) * 1.5 +
+        github_data.get('pull_requests', 0) * 3
+    )
+
+    return {
+        "understanding": data.get('학습이해도', data.get('이해도', 0)),
+        "concentration": data.get('집중도', data.get('계획달성도', 0)),
+        "condition": condition,
+        "github_activity": min(github_activity, 20),  # 최대 20점으로 제한
+        "learning_time": data.get('학습시간', data.get('실제학습시간', 0)),
+        "overall_score": total_score(data)
+    }
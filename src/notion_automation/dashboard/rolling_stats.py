@@ -0,0 +1,429 @@
+"""
+시간대별 온라인(누적) 통계
+
+반성 데이터가 들어올 때마다 시간대/지표별 평균, 분산(Welford), EWMA, 기울기
+누적값을 O(1)로 갱신하고 파일로 저장합니다.
+일별 누적합(prefix sum)을 함께 보관하여 30/90/365일 같은 기간 조회도
+전체 이력을 다시 읽지 않고 누적값의 차이로 계산합니다.
+
+여러 프로세스가 같은 파일을 쓰므로 저장할 때는 파일 잠금 안에서 디스크 상태를 다시 읽고,
+이 객체에서 바뀐 날짜 값만 덮어쓴 뒤 저장합니다 (마지막 저장이 다른 프로세스의 값을 지우지 않음).
+"""
+
+import json
+import os
+import threading
+from datetime import datetime, date as date_type, timedelta
+from typing import Dict, List, Any, Optional, Iterable, Tuple, Union
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.file_lock import file_lock
+
+DEFAULT_EWMA_ALPHA = 0.3
+STATE_VERSION = 1
+
+# 일별 누적합 항목 순서: 개수, 값 합, 값 제곱합, x 합, x 제곱합, x*값 합
+_N, _S, _SS, _SX, _SXX, _SXY = range(6)
+
+
+def _to_ordinal(date: Union[datetime, date_type, str]) -> int:
+    if isinstance(date, str):
+        date = datetime.strptime(date[:10], "%Y-%m-%d")
+    if isinstance(date, datetime):
+        date = date.date()
+    return date.toordinal()
+
+
+class RunningStats:
+    """Welford 평균/분산, EWMA, 최소제곱 기울기 누적기"""
+
+    __slots__ = ("alpha", "count", "mean", "m2", "ewma", "sum_x", "sum_xx", "sum_xy", "min", "max", "last")
+
+    def __init__(self, alpha: float = DEFAULT_EWMA_ALPHA):
+        self.alpha = alpha
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.ewma = None
+        self.sum_x = 0.0
+        self.sum_xx = 0.0
+        self.sum_xy = 0.0
+        self.min = None
+        self.max = None
+        self.last = None
+
+    def update(self, value: float, x: Optional[float] = None):
+        """값 하나 반영 (x는 기울기 계산용 위치, 기본값은 관측 순번)"""
+        x = float(self.count if x is None else x)
+        self.count += 1
+
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+        self.ewma = value if self.ewma is None else self.alpha * value + (1 - self.alpha) * self.ewma
+
+        self.sum_x += x
+        self.sum_xx += x * x
+        self.sum_xy += x * value
+
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.last = value
+
+    @property
+    def variance(self) -> float:
+        """모분산"""
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def std_dev(self) -> float:
+        return self.variance ** 0.5
+
+    @property
+    def slope(self) -> float:
+        """x 단위당 값의 변화량 (최소제곱 기울기)"""
+        denominator = self.count * self.sum_xx - self.sum_x ** 2
+        if self.count < 2 or denominator == 0:
+            return 0.0
+        sum_y = self.mean * self.count
+        return (self.count * self.sum_xy - self.sum_x * sum_y) / denominator
+
+    @classmethod
+    def from_values(cls, values: Iterable[float], alpha: float = DEFAULT_EWMA_ALPHA) -> "RunningStats":
+        """값 목록을 한 번 훑어 누적기 생성"""
+        stats = cls(alpha)
+        for value in values:
+            stats.update(value)
+        return stats
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RunningStats":
+        stats = cls(data.get("alpha", DEFAULT_EWMA_ALPHA))
+        for slot in cls.__slots__:
+            if slot in data:
+                setattr(stats, slot, data[slot])
+        return stats
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": round(self.mean, 4),
+            "std_dev": round(self.std_dev, 4),
+            "ewma": round(self.ewma, 4) if self.ewma is not None else None,
+            "slope": round(self.slope, 4),
+            "min": self.min,
+            "max": self.max,
+            "last": self.last
+        }
+
+
+class TimePartRollingStats:
+    """시간대/지표별 영속 누적 통계 저장소"""
+
+    def __init__(self, state_path: str, alpha: float = DEFAULT_EWMA_ALPHA,
+                 logger: Optional[ThreePartLogger] = None):
+        """
+        Args:
+            state_path: 상태 저장 JSON 파일 경로
+            alpha: EWMA 평활 계수
+            logger: 로깅 시스템 (선택사항)
+        """
+        self.state_path = state_path
+        self.alpha = alpha
+        self.logger = logger or ThreePartLogger(name="rolling_stats")
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.series: Dict[str, Dict[str, Any]] = self._read_state()
+        # 마지막 저장 이후 바뀐 날짜 값 {키: {날짜 서수: 값 또는 None(삭제)}}
+        self._changes: Dict[str, Dict[int, Optional[float]]] = {}
+
+    @staticmethod
+    def _key(timepart: str, metric: str) -> str:
+        return f"{timepart}|{metric}"
+
+    def _read_state(self) -> Dict[str, Dict[str, Any]]:
+        """저장된 시리즈 읽기 (파일이 없거나 버전이 다르면 빈 상태)"""
+        if not os.path.exists(self.state_path):
+            return {}
+
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get("version") != STATE_VERSION:
+                return {}
+
+            series_by_key = {}
+            for key, series in state.get("series", {}).items():
+                series["values"] = {int(ordinal): value for ordinal, value in series["values"].items()}
+                series["running"] = RunningStats.from_dict(series["running"])
+                series_by_key[key] = series
+            return series_by_key
+        except Exception as e:
+            self.logger.log_error(e, "누적 통계 상태 로드")
+            return {}
+
+    def _build_series(self, values: Dict[int, float]) -> Dict[str, Any]:
+        """날짜별 값으로 누적합과 누적기를 새로 계산한 시리즈"""
+        base = min(values)
+        series = {"base": base, "shift": values[base], "values": dict(values),
+                  "prefix": [], "running": RunningStats(self.alpha)}
+        self._rebuild(series, base)
+        return series
+
+    def save(self):
+        """
+        변경된 상태를 파일에 저장
+
+        잠금 안에서 다른 프로세스가 저장한 상태를 다시 읽어 이 객체에서 바뀐 날짜 값만 덮어쓰고,
+        저장한 병합 결과를 메모리 상태로 삼습니다.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+
+            with file_lock(self.state_path):
+                merged = self._read_state()
+                for key, changes in self._changes.items():
+                    values = dict(merged[key]["values"]) if key in merged else {}
+                    for ordinal, value in changes.items():
+                        if value is None:
+                            values.pop(ordinal, None)
+                        else:
+                            values[ordinal] = value
+                    current = self.series.get(key)
+                    if current is not None and current["values"] == values:
+                        merged[key] = current  # 다른 프로세스가 바꾼 값이 없으면 재계산 없이 그대로
+                    elif values:
+                        merged[key] = self._build_series(values)
+                    else:
+                        merged.pop(key, None)
+
+                state = {
+                    "version": STATE_VERSION,
+                    "updated_at": datetime.now().isoformat(),
+                    "series": {
+                        key: {
+                            "base": series["base"],
+                            "shift": series["shift"],
+                            "values": {str(ordinal): value for ordinal, value in series["values"].items()},
+                            "prefix": series["prefix"],
+                            "running": series["running"].to_dict()
+                        }
+                        for key, series in merged.items()
+                    }
+                }
+
+                temp_path = f"{self.state_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(state, f, ensure_ascii=False, separators=(",", ":"))
+                os.replace(temp_path, self.state_path)
+
+            self.series = merged
+            self._changes = {}
+            self._dirty = False
+
+    def observe(self, timepart: str, metric: str, date: Union[datetime, date_type, str], value: float) -> bool:
+        """
+        특정 날짜의 관측값 반영
+
+        이미 같은 값이 반영된 날짜는 무시하므로 여러 번 호출해도 안전합니다.
+        최신 날짜 이후로 들어오는 값은 O(1)로 누적하고, 과거 날짜의 정정/지연 입력은
+        해당 날짜 이후의 누적값만 다시 계산합니다.
+
+        Returns:
+            상태가 변경되었는지 여부
+        """
+        ordinal = _to_ordinal(date)
+        value = float(value)
+        key = self._key(timepart, metric)
+
+        with self._lock:
+            series = self.series.get(key)
+            if series is None:
+                series = {
+                    "base": ordinal,
+                    "shift": value,  # 제곱합 정밀도를 위해 첫 관측값 기준으로 이동
+                    "values": {},
+                    "prefix": [],
+                    "running": RunningStats(self.alpha)
+                }
+                self.series[key] = series
+
+            if series["values"].get(ordinal) == value:
+                return False
+
+            last_ordinal = series["base"] + len(series["prefix"]) - 1
+            is_append = ordinal not in series["values"] and ordinal > last_ordinal
+
+            series["values"][ordinal] = value
+            if is_append:
+                self._extend_prefix(series, ordinal, value)
+                series["running"].update(value, ordinal - series["base"])
+            else:
+                self._rebuild(series, min(ordinal, last_ordinal + 1))
+
+            self._changes.setdefault(key, {})[ordinal] = value
+            self._dirty = True
+            return True
+
+    def discard(self, timepart: str, metric: str, date: Union[datetime, date_type, str]) -> bool:
+        """
+        특정 날짜의 관측값 제거 (반성 삭제 시)
+
+        해당 날짜 이후의 누적값과 전체 누적기만 다시 계산합니다.
+
+        Returns:
+            상태가 변경되었는지 여부
+        """
+        ordinal = _to_ordinal(date)
+        key = self._key(timepart, metric)
+
+        with self._lock:
+            series = self.series.get(key)
+            if series is None or ordinal not in series["values"]:
+                return False
+
+            del series["values"][ordinal]
+            if series["values"]:
+                self._rebuild(series, ordinal)
+            else:
+                del self.series[key]
+
+            self._changes.setdefault(key, {})[ordinal] = None
+            self._dirty = True
+            return True
+
+    def _extend_prefix(self, series: Dict[str, Any], ordinal: int, value: float):
+        """마지막 날짜 이후 값을 누적합에 추가 (빈 날짜는 이전 누적값 유지)"""
+        prefix = series["prefix"]
+        previous = prefix[-1] if prefix else [0, 0.0, 0.0, 0.0, 0.0, 0.0]
+
+        while series["base"] + len(prefix) < ordinal:
+            prefix.append(list(previous))
+
+        x = ordinal - series["base"]
+        y = value - series["shift"]
+        prefix.append([
+            previous[_N] + 1,
+            previous[_S] + y,
+            previous[_SS] + y * y,
+            previous[_SX] + x,
+            previous[_SXX] + x * x,
+            previous[_SXY] + x * y
+        ])
+
+    def _rebuild(self, series: Dict[str, Any], from_ordinal: int):
+        """정정/지연 입력 시 from_ordinal 이후 누적값과 전체 누적기 재계산"""
+        new_base = min(series["values"])
+        if new_base < series["base"]:
+            series["base"] = new_base
+            series["prefix"] = []
+            from_ordinal = new_base
+
+        keep = max(0, from_ordinal - series["base"])
+        series["prefix"] = series["prefix"][:keep]
+        for ordinal in sorted(o for o in series["values"] if o >= from_ordinal):
+            self._extend_prefix(series, ordinal, series["values"][ordinal])
+
+        running = RunningStats(self.alpha)
+        for ordinal in sorted(series["values"]):
+            running.update(series["values"][ordinal], ordinal - series["base"])
+        series["running"] = running
+
+    def _prefix_at(self, series: Dict[str, Any], ordinal: int) -> List[float]:
+        index = ordinal - series["base"]
+        if index < 0 or not series["prefix"]:
+            return [0, 0.0, 0.0, 0.0, 0.0, 0.0]
+        return series["prefix"][min(index, len(series["prefix"]) - 1)]
+
+    def window(self, timepart: str, metric: str, end_date: Union[datetime, date_type, str], days: int) -> Dict[str, Any]:
+        """
+        end_date를 포함한 최근 days일 구간 통계 (누적합 두 번 조회)
+
+        Returns:
+            count, mean, variance, std_dev, slope(일 단위), ewma(최신 평활값)
+        """
+        empty = {"count": 0, "mean": 0.0, "variance": 0.0, "std_dev": 0.0, "slope": 0.0, "ewma": None}
+
+        with self._lock:
+            series = self.series.get(self._key(timepart, metric))
+            if series is None or days <= 0:
+                return empty
+
+            end_ordinal = _to_ordinal(end_date)
+            upper = self._prefix_at(series, end_ordinal)
+            lower = self._prefix_at(series, end_ordinal - days)
+            ewma = series["running"].ewma
+            shift = series["shift"]
+
+        n = upper[_N] - lower[_N]
+        if n <= 0:
+            return empty
+
+        s, ss = upper[_S] - lower[_S], upper[_SS] - lower[_SS]
+        sx, sxx, sxy = upper[_SX] - lower[_SX], upper[_SXX] - lower[_SXX], upper[_SXY] - lower[_SXY]
+
+        mean_shifted = s / n
+        variance = max(0.0, ss / n - mean_shifted ** 2)
+        denominator = n * sxx - sx ** 2
+        slope = (n * sxy - sx * s) / denominator if n >= 2 and denominator else 0.0
+
+        return {
+            "count": int(n),
+            "mean": mean_shifted + shift,
+            "variance": variance,
+            "std_dev": variance ** 0.5,
+            "slope": slope,
+            "ewma": ewma
+        }
+
+    def running(self, timepart: str, metric: str) -> Optional[RunningStats]:
+        """전체 기간 누적기"""
+        series = self.series.get(self._key(timepart, metric))
+        return series["running"] if series else None
+
+    def daily_values(self, timepart: str, metric: str,
+                     start: Optional[Union[datetime, date_type, str]] = None,
+                     end: Optional[Union[datetime, date_type, str]] = None) -> List[Tuple[date_type, float]]:
+        """기간 내(양끝 포함, 생략 시 전체) 날짜별 값 (날짜순)"""
+        low = _to_ordinal(start) if start is not None else None
+        high = _to_ordinal(end) if end is not None else None
+
+        with self._lock:
+            series = self.series.get(self._key(timepart, metric))
+            values = dict(series["values"]) if series else {}
+
+        return [
+            (date_type.fromordinal(ordinal), values[ordinal])
+            for ordinal in sorted(values)
+            if (low is None or ordinal >= low) and (high is None or ordinal <= high)
+        ]
+
+
+def test_rolling_stats():
+    """TimePartRollingStats 테스트 함수"""
+    import tempfile
+
+    print("📐 누적 통계 테스트 시작")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        stats = TimePartRollingStats(os.path.join(temp_dir, "stats.json"))
+        today = datetime.now()
+
+        for offset, value in enumerate([6.0, 6.5, 7.0, 7.5, 8.0]):
+            stats.observe("🌅 오전수업", "efficiency", today - timedelta(days=4 - offset), value)
+        stats.save()
+
+        window = stats.window("🌅 오전수업", "efficiency", today, 5)
+        print(f"✅ 5일 평균 {window['mean']:.2f}, 표준편차 {window['std_dev']:.2f}, 기울기 {window['slope']:.2f}/일")
+
+
+if __name__ == "__main__":
+    test_rolling_stats()
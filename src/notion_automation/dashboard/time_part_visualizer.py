@@ -3,7 +3,6 @@
 오전수업/오후수업/저녁자율학습 3개 시간대의 성과를 비교 시각화
 """
 
-import json
 import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
@@ -14,6 +13,8 @@ project_root = os.path.join(os.path.dirname(__file__), '..', '..', '..')
 sys.path.append(project_root)
 
 from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.artifact_store import ArtifactStore
+from src.notion_automation.dashboard.reflection_dataset import get_reflection
 
 class TimePartVisualizer:
     """시간대별 성과 비교 시각화 클래스"""
@@ -21,6 +22,7 @@ class TimePartVisualizer:
     def __init__(self):
         self.logger = ThreePartLogger()
         self.data_dir = os.path.join(project_root, 'data')
+        self.artifact_store = ArtifactStore(os.path.join(self.data_dir, 'artifacts'), logger=self.logger)
         
         # 시간대별 색상 정의
         self.timepart_colors = {
@@ -34,12 +36,13 @@ class TimePartVisualizer:
             "이해도", "집중도", "GitHub활동", "컨디션", "종합효율성"
         ]
     
-    def load_3part_data(self, days: int = 7) -> Dict[str, List[Dict]]:
+    def load_3part_data(self, days: int = 7, dataset: Optional[Dict[str, Dict]] = None) -> Dict[str, List[Dict]]:
         """
         최근 N일간의 3-Part 데이터 로드
         
         Args:
             days: 로드할 일수 (기본값: 7일)
+            dataset: 미리 로드된 공유 반성 데이터셋 (선택사항)
             
         Returns:
             시간대별로 분류된 데이터 딕셔너리
@@ -53,25 +56,13 @@ class TimePartVisualizer:
             
             # 각 시간대별 데이터 파일 로드
             for timepart in timepart_data.keys():
-                data_files = []
-                
-                # 최근 N일간의 데이터 파일 찾기
+                # 최근 N일간의 데이터 찾기
                 for day_offset in range(days):
                     date = datetime.now() - timedelta(days=day_offset)
-                    date_str = date.strftime("%Y%m%d")
-                    
-                    # 각 시간대별 파일 경로
-                    if "오전" in timepart:
-                        file_path = os.path.join(self.data_dir, "morning_reflections", f"morning_reflection_{date_str}.json")
-                    elif "오후" in timepart:
-                        file_path = os.path.join(self.data_dir, "afternoon_reflections", f"afternoon_reflection_{date_str}.json")
-                    else:  # 저녁
-                        file_path = os.path.join(self.data_dir, "evening_reflections", f"evening_reflection_{date_str}.json")
                     
-                    if os.path.exists(file_path):
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            timepart_data[timepart].append(data)
+                    data = get_reflection(self.data_dir, timepart, date, dataset)
+                    if data is not None:
+                        timepart_data[timepart].append(data)
             
             self.logger.info(f"3-Part 데이터 로드 완료: {sum(len(data) for data in timepart_data.values())}개 엔트리")
             return timepart_data
@@ -139,19 +130,20 @@ class TimePartVisualizer:
             "efficiency": round(total_efficiency / count, 1)
         }
     
-    def create_3part_performance_radar(self, days: int = 7) -> Dict[str, Any]:
+    def create_3part_performance_radar(self, days: int = 7, dataset: Optional[Dict[str, Dict]] = None) -> Dict[str, Any]:
         """
         오전/오후/저녁 시간대별 성과를 레이더 차트로 시각화
         
         Args:
             days: 분석할 일수 (기본값: 7일)
+            dataset: 미리 로드된 공유 반성 데이터셋 (선택사항)
             
         Returns:
             레이더 차트 데이터 및 메타데이터
         """
         try:
             # 3-Part 데이터 로드
-            timepart_data = self.load_3part_data(days)
+            timepart_data = self.load_3part_data(days, dataset)
             
             # 각 시간대별 평균 계산
             radar_data = {}
@@ -206,14 +198,10 @@ class TimePartVisualizer:
                 "data_period": f"{days}일간"
             }
             
-            # 레이더 차트 데이터 저장
-            output_path = os.path.join(self.data_dir, f"3part_radar_chart_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(chart_structure, f, ensure_ascii=False, indent=2)
+            # 레이더 차트 데이터 저장 (내용이 같으면 새로 기록하지 않음)
+            content_hash = self.artifact_store.put("3part_radar_chart", chart_structure, window=f"{days}d")
             
-            self.logger.info(f"3-Part 레이더 차트 생성 완료: {output_path}")
+            self.logger.info(f"3-Part 레이더 차트 생성 완료: {content_hash[:12]}")
             return chart_structure
             
         except Exception as e:
@@ -19,6 +19,43 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
 
 from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.dedup_repository import DedupBackupRepository, MANIFEST_SUFFIX
+from src.notion_automation.optimization.local_db_migrations import migrate
+
+TIME_PART_ORDER = {"morning": 1, "afternoon": 2, "evening": 3}
+
+# 조회 SQL (인덱스 설계와 쿼리 플랜 테스트가 같은 문장을 사용)
+LOAD_LOCAL_DATA_SQL = '''
+    SELECT date, time_part, focus_level, understanding_level, fatigue_level,
+           satisfaction_level, difficulty_level, study_amount, notes,
+           github_commits, github_prs, github_issues, data_hash,
+           created_at, updated_at
+    FROM three_part_data
+    WHERE date BETWEEN ? AND ?
+    ORDER BY date DESC, time_part_order
+'''
+
+BACKUP_STATS_SQL = '''
+    SELECT backup_type, COUNT(*) as count, 
+           SUM(file_size) as total_size,
+           AVG(record_count) as avg_records
+    FROM backup_history
+    GROUP BY backup_type
+'''
+
+RECENT_BACKUPS_SQL = '''
+    SELECT backup_type, backup_date, file_path, created_at
+    FROM backup_history
+    ORDER BY created_at DESC
+    LIMIT 5
+'''
+
+RECENT_SYNCS_SQL = '''
+    SELECT sync_date, source, target, action, record_count, status, created_at
+    FROM sync_log
+    ORDER BY created_at DESC
+    LIMIT 5
+'''
 
 class ThreePartBackupSystem:
     """3-Part 시스템 데이터 백업 클래스"""
@@ -45,6 +82,9 @@ class ThreePartBackupSystem:
         # 디렉터리 생성
         self._create_backup_directories()
         
+        # 청크 중복 제거 저장소 (매니페스트는 daily/weekly/monthly 디렉터리에 저장)
+        self.backup_repository = DedupBackupRepository(self.backup_root, logger=self.logger)
+        
         # 로컬 DB 초기화
         self._initialize_local_database()
         
@@ -56,65 +96,11 @@ class ThreePartBackupSystem:
             os.makedirs(directory, exist_ok=True)
     
     def _initialize_local_database(self):
-        """로컬 SQLite 데이터베이스 초기화"""
+        """로컬 SQLite 데이터베이스 초기화 (버전별 마이그레이션 적용)"""
         try:
             with sqlite3.connect(self.local_db_path) as conn:
-                cursor = conn.cursor()
-                
-                # 3-Part 데이터 테이블 생성
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS three_part_data (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        date TEXT NOT NULL,
-                        time_part TEXT NOT NULL,
-                        focus_level INTEGER,
-                        understanding_level INTEGER,
-                        fatigue_level INTEGER,
-                        satisfaction_level INTEGER,
-                        difficulty_level INTEGER,
-                        study_amount INTEGER,
-                        notes TEXT,
-                        github_commits INTEGER DEFAULT 0,
-                        github_prs INTEGER DEFAULT 0,
-                        github_issues INTEGER DEFAULT 0,
-                        data_hash TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        UNIQUE(date, time_part)
-                    )
-                ''')
-                
-                # 백업 히스토리 테이블 생성
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS backup_history (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        backup_type TEXT NOT NULL,
-                        backup_date TEXT NOT NULL,
-                        file_path TEXT NOT NULL,
-                        file_size INTEGER,
-                        record_count INTEGER,
-                        backup_hash TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                ''')
-                
-                # 동기화 로그 테이블 생성
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS sync_log (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        sync_date TEXT NOT NULL,
-                        source TEXT NOT NULL,
-                        target TEXT NOT NULL,
-                        action TEXT NOT NULL,
-                        record_count INTEGER,
-                        status TEXT,
-                        error_message TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                ''')
-                
-                conn.commit()
-                self.logger.info("로컬 데이터베이스 초기화 완료")
+                version = migrate(conn, logger=self.logger)
+                self.logger.info(f"로컬 데이터베이스 초기화 완료 (스키마 v{version})")
                 
         except Exception as e:
             self.logger.error(f"로컬 데이터베이스 초기화 실패: {str(e)}")
@@ -149,12 +135,12 @@ class ThreePartBackupSystem:
                 # UPSERT 작업 (INSERT OR REPLACE)
                 cursor.execute('''
                     INSERT OR REPLACE INTO three_part_data 
-                    (date, time_part, focus_level, understanding_level, fatigue_level,
+                    (date, time_part, time_part_order, focus_level, understanding_level, fatigue_level,
                      satisfaction_level, difficulty_level, study_amount, notes,
                      github_commits, github_prs, github_issues, data_hash, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
                 ''', (
-                    date, time_part,
+                    date, time_part, TIME_PART_ORDER.get(time_part, 9),
                     data.get('focus_level'),
                     data.get('understanding_level'),
                     data.get('fatigue_level'),
@@ -191,20 +177,7 @@ class ThreePartBackupSystem:
             with sqlite3.connect(self.local_db_path) as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('''
-                    SELECT date, time_part, focus_level, understanding_level, fatigue_level,
-                           satisfaction_level, difficulty_level, study_amount, notes,
-                           github_commits, github_prs, github_issues, data_hash,
-                           created_at, updated_at
-                    FROM three_part_data
-                    WHERE date BETWEEN ? AND ?
-                    ORDER BY date DESC, 
-                             CASE time_part 
-                                 WHEN 'morning' THEN 1 
-                                 WHEN 'afternoon' THEN 2 
-                                 WHEN 'evening' THEN 3 
-                             END
-                ''', (date_from, date_to))
+                cursor.execute(LOAD_LOCAL_DATA_SQL, (date_from, date_to))
                 
                 rows = cursor.fetchall()
                 
@@ -236,6 +209,22 @@ class ThreePartBackupSystem:
             self.logger.error(f"로컬 데이터 로드 실패: {str(e)}")
             return []
     
+    def _create_backup(self, backup_type: str, name: str, date_from: str, date_to: str,
+                       backup_info: Dict[str, Any]) -> str:
+        """기간 데이터를 청크 저장소에 백업하고 매니페스트 경로 반환"""
+        data = self.load_local_data(date_from, date_to)
+        
+        # 날짜 오름차순으로 직렬화해야 일일/주간/월간 백업의 청크가 일치함
+        data.sort(key=lambda item: (item['date'], TIME_PART_ORDER.get(item['time_part'], 9)))
+        
+        manifest = self.backup_repository.write_backup(backup_type, name, data, backup_info)
+        manifest_path = self.backup_repository.manifest_path(backup_type, name)
+        
+        # 백업 히스토리 기록 (file_size는 이번 백업으로 새로 저장된 청크 크기)
+        self._record_backup_history(backup_type, backup_info.get("backup_date", name), manifest_path,
+                                    manifest["new_bytes"], len(data), manifest["stream_sha256"])
+        return manifest_path
+    
     def create_daily_backup(self, date: Optional[str] = None) -> str:
         """
         일일 백업 생성
@@ -244,7 +233,7 @@ class ThreePartBackupSystem:
             date: 백업할 날짜 (기본값: 오늘)
             
         Returns:
-            백업 파일 경로
+            백업 매니페스트 경로
         """
         if date is None:
             date = datetime.now().strftime("%Y-%m-%d")
@@ -252,35 +241,11 @@ class ThreePartBackupSystem:
         self.logger.info(f"일일 백업 시작: {date}")
         
         try:
-            # 해당 날짜의 데이터 로드
-            data = self.load_local_data(date, date)
-            
-            # 백업 파일명 생성
-            backup_filename = f"3part_daily_backup_{date}.json"
-            backup_filepath = os.path.join(self.daily_backup_dir, backup_filename)
-            
-            # 백업 데이터 구조 생성
-            backup_data = {
-                "backup_info": {
-                    "backup_type": "daily",
-                    "backup_date": date,
-                    "created_at": datetime.now().isoformat(),
-                    "record_count": len(data)
-                },
-                "data": data
-            }
-            
-            # JSON 파일로 저장
-            with open(backup_filepath, 'w', encoding='utf-8') as f:
-                json.dump(backup_data, f, indent=2, ensure_ascii=False)
-            
-            # 백업 히스토리 기록
-            file_size = os.path.getsize(backup_filepath)
-            backup_hash = self.calculate_data_hash(backup_data)
-            
-            self._record_backup_history("daily", date, backup_filepath, file_size, len(data), backup_hash)
-            
-            self.logger.info(f"일일 백업 완료: {backup_filepath} ({file_size} bytes)")
+            backup_filepath = self._create_backup(
+                "daily", f"3part_daily_backup_{date}", date, date,
+                {"backup_date": date}
+            )
+            self.logger.info(f"일일 백업 완료: {backup_filepath}")
             return backup_filepath
             
         except Exception as e:
@@ -295,7 +260,7 @@ class ThreePartBackupSystem:
             week_start_date: 주간 시작 날짜 (기본값: 이번 주 월요일)
             
         Returns:
-            백업 파일 경로
+            백업 매니페스트 경로
         """
         if week_start_date is None:
             # 이번 주 월요일 계산
@@ -312,43 +277,79 @@ class ThreePartBackupSystem:
         self.logger.info(f"주간 백업 시작: {week_start_date} ~ {week_end_date}")
         
         try:
-            # 주간 데이터 로드
-            data = self.load_local_data(week_start_date, week_end_date)
-            
-            # 백업 파일명 생성
-            backup_filename = f"3part_weekly_backup_{week_start_date}_{week_end_date}.json"
-            backup_filepath = os.path.join(self.weekly_backup_dir, backup_filename)
-            
-            # 백업 데이터 구조 생성
-            backup_data = {
-                "backup_info": {
-                    "backup_type": "weekly",
-                    "week_start": week_start_date,
-                    "week_end": week_end_date,
-                    "created_at": datetime.now().isoformat(),
-                    "record_count": len(data)
-                },
-                "data": data
-            }
-            
-            # JSON 파일로 저장
-            with open(backup_filepath, 'w', encoding='utf-8') as f:
-                json.dump(backup_data, f, indent=2, ensure_ascii=False)
-            
-            # 백업 히스토리 기록
-            file_size = os.path.getsize(backup_filepath)
-            backup_hash = self.calculate_data_hash(backup_data)
+            backup_filepath = self._create_backup(
+                "weekly", f"3part_weekly_backup_{week_start_date}_{week_end_date}",
+                week_start_date, week_end_date,
+                {"backup_date": f"{week_start_date}_{week_end_date}", "week_start": week_start_date, "week_end": week_end_date}
+            )
+            self.logger.info(f"주간 백업 완료: {backup_filepath}")
+            return backup_filepath
             
-            self._record_backup_history("weekly", f"{week_start_date}_{week_end_date}", 
-                                      backup_filepath, file_size, len(data), backup_hash)
+        except Exception as e:
+            self.logger.error(f"주간 백업 실패: {str(e)}")
+            return ""
+    
+    def create_monthly_backup(self, month: Optional[str] = None) -> str:
+        """
+        월간 백업 생성
+        
+        Args:
+            month: 백업할 월 (YYYY-MM, 기본값: 이번 달)
             
-            self.logger.info(f"주간 백업 완료: {backup_filepath} ({file_size} bytes)")
+        Returns:
+            백업 매니페스트 경로
+        """
+        if month is None:
+            month = datetime.now().strftime("%Y-%m")
+        
+        self.logger.info(f"월간 백업 시작: {month}")
+        
+        try:
+            backup_filepath = self._create_backup(
+                "monthly", f"3part_monthly_backup_{month}", f"{month}-01", f"{month}-31",
+                {"backup_date": month}
+            )
+            self.logger.info(f"월간 백업 완료: {backup_filepath}")
             return backup_filepath
             
         except Exception as e:
-            self.logger.error(f"주간 백업 실패: {str(e)}")
+            self.logger.error(f"월간 백업 실패: {str(e)}")
             return ""
     
+    def load_backup(self, backup_filepath: str) -> List[Dict[str, Any]]:
+        """백업 파일(매니페스트 또는 이전 JSON 형식)의 레코드 복원"""
+        try:
+            if backup_filepath.endswith(MANIFEST_SUFFIX):
+                manifest = self.backup_repository.load_manifest(backup_filepath)
+                return list(self.backup_repository.iter_records(manifest))
+            
+            with open(backup_filepath, 'r', encoding='utf-8') as f:
+                return json.load(f).get("data", [])
+                
+        except Exception as e:
+            self.logger.error(f"백업 로드 실패: {str(e)}")
+            return []
+    
+    def prune_backups(self, keep_daily: int = 90, keep_weekly: int = 26, keep_monthly: int = 24) -> Dict[str, int]:
+        """
+        보존 개수를 넘는 오래된 백업 매니페스트 삭제 후 참조 없는 청크 정리
+        
+        Returns:
+            삭제된 매니페스트/청크 수
+        """
+        try:
+            result = self.backup_repository.prune({
+                "daily": keep_daily,
+                "weekly": keep_weekly,
+                "monthly": keep_monthly
+            })
+            self.logger.info(f"백업 정리 완료: {result}")
+            return result
+            
+        except Exception as e:
+            self.logger.error(f"백업 정리 실패: {str(e)}")
+            return {}
+    
     def _record_backup_history(self, backup_type: str, backup_date: str, 
                               file_path: str, file_size: int, record_count: int, backup_hash: str):
         """백업 히스토리 기록"""
@@ -397,6 +398,10 @@ class ThreePartBackupSystem:
             
             result["file_exists"] = True
             
+            # 청크 저장소 매니페스트: 청크 존재/해시/레코드 수 검증
+            if backup_filepath.endswith(MANIFEST_SUFFIX):
+                return self._verify_manifest_integrity(backup_filepath, result)
+            
             # 파일 읽기 가능 확인
             try:
                 with open(backup_filepath, 'r', encoding='utf-8') as f:
@@ -446,6 +451,27 @@ class ThreePartBackupSystem:
         
         return result
     
+    def _verify_manifest_integrity(self, manifest_path: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """매니페스트 백업 무결성 검증"""
+        try:
+            manifest = self.backup_repository.load_manifest(manifest_path)
+            result["file_readable"] = True
+            result["json_valid"] = True
+        except Exception as e:
+            result["errors"].append(f"매니페스트 읽기 실패: {str(e)}")
+            return result
+        
+        errors = self.backup_repository.verify(manifest)
+        result["errors"].extend(errors)
+        result["data_integrity"] = not any("청크" in error for error in errors)
+        result["hash_match"] = result["data_integrity"] and "스트림 해시 불일치" not in errors
+        result["record_count_match"] = not any("레코드 개수" in error for error in errors)
+        result["current_hash"] = manifest.get("stream_sha256")
+        result["success"] = not errors
+        
+        self.logger.info(f"백업 무결성 검증 완료: {result['success']}")
+        return result
+    
     def sync_with_notion_data(self, notion_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Notion 데이터와 로컬 데이터 동기화
@@ -554,13 +580,7 @@ class ThreePartBackupSystem:
                 cursor = conn.cursor()
                 
                 # 백업 히스토리 통계
-                cursor.execute('''
-                    SELECT backup_type, COUNT(*) as count, 
-                           SUM(file_size) as total_size,
-                           AVG(record_count) as avg_records
-                    FROM backup_history
-                    GROUP BY backup_type
-                ''')
+                cursor.execute(BACKUP_STATS_SQL)
                 
                 backup_stats = {}
                 for row in cursor.fetchall():
@@ -571,12 +591,7 @@ class ThreePartBackupSystem:
                     }
                 
                 # 최근 백업 정보
-                cursor.execute('''
-                    SELECT backup_type, backup_date, file_path, created_at
-                    FROM backup_history
-                    ORDER BY created_at DESC
-                    LIMIT 5
-                ''')
+                cursor.execute(RECENT_BACKUPS_SQL)
                 
                 recent_backups = []
                 for row in cursor.fetchall():
@@ -587,10 +602,27 @@ class ThreePartBackupSystem:
                         "created_at": row[3]
                     })
                 
+                # 최근 동기화 로그
+                cursor.execute(RECENT_SYNCS_SQL)
+                recent_syncs = [
+                    {
+                        "sync_date": row[0],
+                        "source": row[1],
+                        "target": row[2],
+                        "action": row[3],
+                        "record_count": row[4],
+                        "status": row[5],
+                        "created_at": row[6]
+                    }
+                    for row in cursor.fetchall()
+                ]
+                
                 return {
                     "backup_statistics": backup_stats,
+                    "recent_syncs": recent_syncs,
                     "recent_backups": recent_backups,
-                    "total_backups": sum(stats["count"] for stats in backup_stats.values())
+                    "total_backups": sum(stats["count"] for stats in backup_stats.values()),
+                    "storage_bytes": self.backup_repository.storage_bytes()
                 }
                 
         except Exception as e:
@@ -671,6 +703,11 @@ def main():
     else:
         print("❌ 주간 백업 생성 실패")
     
+    # 월간 백업은 일일/주간 백업과 같은 청크를 참조하므로 추가 저장 공간이 거의 없음
+    monthly_backup_path = backup_system.create_monthly_backup()
+    if monthly_backup_path:
+        print(f"✅ 월간 백업 생성 완료: {monthly_backup_path}")
+    
     # 4. Notion 동기화 시뮬레이션
     print("\n🔄 Notion 동기화 시뮬레이션 중...")
     
@@ -721,6 +758,7 @@ def main():
     
     if stats:
         print(f"  📊 총 백업 수: {stats.get('total_backups', 0)}개")
+        print(f"  💽 청크 저장소 사용량: {stats.get('storage_bytes', 0) / 1024:.1f}KB")
         
         backup_stats = stats.get("backup_statistics", {})
         for backup_type, stat in backup_stats.items():
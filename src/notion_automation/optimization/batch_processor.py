@@ -6,7 +6,6 @@ API 호출 횟수를 최소화하고 성능을 개선합니다.
 """
 
 import asyncio
-import json
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
@@ -17,30 +16,32 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
 
 from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.artifact_store import ArtifactStore
+from src.notion_automation.utils.time_part_calendar import get_time_part_calendar
 
 class ThreePartBatchProcessor:
     """3-Part 데이터 배치 처리 및 최적화 클래스"""
     
-    def __init__(self, logger: Optional[ThreePartLogger] = None):
+    def __init__(self, logger: Optional[ThreePartLogger] = None, artifact_root: Optional[str] = None):
         """
         배치 처리기 초기화
         
         Args:
             logger: 로깅 시스템 (선택사항)
+            artifact_root: 결과 저장소 디렉토리 (기본값: 프로젝트 루트의 data/artifacts)
         """
         self.logger = logger or ThreePartLogger(name="batch_processor")
         self.time_parts = ["morning", "afternoon", "evening"]
-        self.time_schedules = {
-            "morning": {"start": "09:00", "end": "12:00"},
-            "afternoon": {"start": "13:00", "end": "17:00"},
-            "evening": {"start": "19:00", "end": "22:00"}
-        }
+        self.time_schedules = get_time_part_calendar().clock_ranges(by="code")
         
         # 캐시 시스템
         self.cache = {}
         self.cache_expiry = {}
         self.cache_duration = 300  # 5분 캐시
         
+        # 결과 저장소 (프로젝트 루트의 data/artifacts)
+        self.artifact_store = ArtifactStore(root=artifact_root, logger=self.logger)
+        
         self.logger.info("3-Part 배치 처리기 초기화 완료")
     
     def clear_expired_cache(self):
@@ -414,28 +415,21 @@ class ThreePartBatchProcessor:
     
     def save_batch_results(self, results: Dict[str, Any], filename_prefix: str = "3part_batch_optimization") -> str:
         """
-        배치 처리 결과를 파일로 저장
+        배치 처리 결과를 결과 저장소에 저장
+        
+        내용이 직전 결과와 같으면 새로 기록하지 않습니다.
         
         Args:
             results: 저장할 결과 데이터
-            filename_prefix: 파일명 접두사
+            filename_prefix: 결과 유형 이름
             
         Returns:
-            저장된 파일 경로
+            저장된 결과 객체 경로
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{filename_prefix}_{timestamp}.json"
-        
-        # 프로젝트 루트의 data 디렉터리에 저장
-        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-        data_dir = os.path.join(project_root, "data")
-        os.makedirs(data_dir, exist_ok=True)
-        
-        filepath = os.path.join(data_dir, filename)
-        
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
+            date_range = results.get("processing_info", {}).get("processed_date_range", "")
+            content_hash = self.artifact_store.put(filename_prefix, results, window=f"{date_range}d" if date_range else "")
+            filepath = self.artifact_store.object_path(content_hash)
             
             self.logger.info(f"배치 처리 결과 저장 완료: {filepath}")
             return filepath
@@ -444,7 +438,6 @@ class ThreePartBatchProcessor:
             self.logger.error(f"배치 처리 결과 저장 실패: {str(e)}")
             return ""
 
-
 def main():
     """배치 처리 시스템 테스트 실행"""
     print("🚀 3-Part API 최적화 배치 처리 시스템 테스트")
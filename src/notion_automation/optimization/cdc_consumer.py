@@ -0,0 +1,584 @@
+"""
+Supabase → Notion 변경 데이터 캡처(CDC) 소비자
+
+`reflection_changes` 변경 로그를 seq 순서로 읽어(LISTEN/NOTIFY로 깨우고 없으면 주기적 폴링),
+같은 리플렉션의 연속 수정은 마지막 상태 하나로 합친 뒤 일정 시간 조용해지거나 최대 지연에
+도달하면 Notion에 마이크로 배치로 반영합니다. 처리 완료된 seq만 체크포인트에 기록하므로
+중단 후 재시작해도 변경을 잃지 않습니다 (재시작 직후 일부 변경은 같은 최종 상태로 다시 반영될 수 있음).
+
+Postgres의 seq(BIGSERIAL)는 INSERT 시점에 정해지지만 커밋 시점에 보이므로, 낮은 seq를 받은
+트랜잭션이 더 늦게 커밋될 수 있습니다. 그래서 읽다가 건너뛴 seq(gap)는 gap_timeout_seconds 동안
+따로 다시 조회하고, 체크포인트는 아직 채워지지 않은 gap 앞에서 멈춥니다.
+(롤백된 트랜잭션의 seq는 영원히 비므로 시간이 지나면 gap을 포기합니다.)
+
+Notion이 거부한 변경(429/409/408 외의 4xx, 매핑 실패)과 max_attempts번 실패한 변경은
+dead letter 파일(JSONL)에 남기고 넘어가므로, 레코드 하나가 체크포인트를 붙잡지 않습니다.
+DB-API 연결(psycopg2 또는 sqlite3)을 받으므로 로컬 SQLite 대역으로 테스트할 수 있습니다.
+"""
+
+import json
+import select
+import threading
+import time
+from typing import Dict, List, Any, Optional, Callable
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.notion_property_mapper import get_mapper, PropertyMappingError, SUPABASE_MCP_SCHEMA
+from src.notion_automation.dashboard.notion_block_uploader import RateLimiter
+from src.notion_automation.utils.shared_rate_limiter import get_rate_limiter
+
+CHANGE_LOG_TABLE = "reflection_changes"
+NOTIFY_CHANNEL = "reflection_changes"
+CHANGE_COLUMNS = ("seq", "reflection_id", "operation", "record", "changed_at")
+
+# 로컬 테스트용 SQLite 대역 스키마 (supabase-cdc-changelog.sql과 같은 컬럼)
+SQLITE_STANDIN_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reflection_changes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    reflection_id TEXT NOT NULL,
+    operation TEXT NOT NULL CHECK (operation IN ('INSERT', 'UPDATE', 'DELETE')),
+    record TEXT,
+    changed_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+DEFAULT_QUIET_SECONDS = 0.5
+DEFAULT_MAX_DELAY_SECONDS = 2.0
+DEFAULT_MAX_BATCH = 50
+DEFAULT_GAP_TIMEOUT_SECONDS = 300.0
+MAX_TRACKED_GAPS = 1000  # 이보다 큰 seq 점프는 로그 정리/시퀀스 재설정으로 보고 추적하지 않음
+MAX_RETRY_BACKOFF_SECONDS = 30.0
+DEFAULT_MAX_ATTEMPTS = 8
+
+# 4xx 중 다시 보내면 성공할 수 있는 상태 코드 (나머지 4xx는 같은 요청이면 계속 실패)
+RETRYABLE_STATUSES = {408, 409, 429}
+
+
+def _is_sqlite(conn) -> bool:
+    return type(conn).__module__.startswith("sqlite3")
+
+
+def _placeholder(conn) -> str:
+    return "?" if _is_sqlite(conn) else "%s"
+
+
+def is_permanent_error(error: Exception) -> bool:
+    """재시도해도 같은 결과인 API 오류인지 (notion_client.APIResponseError / requests.HTTPError)"""
+    response = getattr(error, "response", None)
+    status = getattr(error, "status", None) or getattr(response, "status_code", None)
+    return isinstance(status, int) and 400 <= status < 500 and status not in RETRYABLE_STATUSES
+
+
+class ChangeLogSource:
+    """변경 로그 테이블 읽기 (Postgres면 LISTEN/NOTIFY로 대기)"""
+
+    def __init__(self, connect: Callable[[], Any], table: str = CHANGE_LOG_TABLE,
+                 channel: str = NOTIFY_CHANNEL, fetch_size: int = 500):
+        """
+        Args:
+            connect: DB-API 연결을 반환하는 함수 (psycopg2.connect, sqlite3.connect 등)
+            table: 변경 로그 테이블
+            channel: NOTIFY 채널 (Postgres 전용)
+            fetch_size: 한 번에 읽을 최대 변경 수
+        """
+        self.connect = connect
+        self.table = table
+        self.channel = channel
+        self.fetch_size = fetch_size
+        self._conn = None
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            self._conn = self.connect()
+            if not _is_sqlite(self._conn):
+                self._conn.autocommit = True
+                with self._conn.cursor() as cursor:
+                    cursor.execute(f"LISTEN {self.channel}")
+        return self._conn
+
+    def _query(self, where: str, params: tuple) -> List[Dict[str, Any]]:
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(f"SELECT {', '.join(CHANGE_COLUMNS)} FROM {self.table} WHERE {where}", params)
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+
+        changes = []
+        for values in rows:
+            change = dict(zip(CHANGE_COLUMNS, values))
+            # psycopg2는 JSONB를 dict로, sqlite3는 문자열로 돌려줌
+            if isinstance(change["record"], str):
+                change["record"] = json.loads(change["record"])
+            change["reflection_id"] = str(change["reflection_id"])
+            changes.append(change)
+        return changes
+
+    def fetch_after(self, seq: int) -> List[Dict[str, Any]]:
+        """seq 이후 변경을 순서대로 조회"""
+        mark = _placeholder(self.conn)
+        return self._query(f"seq > {mark} ORDER BY seq LIMIT {mark}", (seq, self.fetch_size))
+
+    def fetch_seqs(self, seqs: List[int]) -> List[Dict[str, Any]]:
+        """지정한 seq 중 지금 보이는 변경만 조회 (늦게 커밋된 gap 확인용)"""
+        mark = _placeholder(self.conn)
+        changes = []
+        for start in range(0, len(seqs), self.fetch_size):
+            chunk = tuple(seqs[start:start + self.fetch_size])
+            changes.extend(self._query(f"seq IN ({', '.join([mark] * len(chunk))}) ORDER BY seq", chunk))
+        return changes
+
+    def wait(self, timeout: float) -> bool:
+        """새 변경 알림 대기 (알림을 받으면 True, SQLite는 timeout만큼 대기 후 False)"""
+        conn = self.conn
+        if _is_sqlite(conn):
+            time.sleep(timeout)
+            return False
+
+        if select.select([conn], [], [], timeout) == ([], [], []):
+            return False
+        conn.poll()
+        notified = bool(conn.notifies)
+        del conn.notifies[:]
+        return notified
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class OffsetCheckpoint:
+    """처리 완료된 마지막 seq 저장"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> int:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return int(json.load(f).get("last_seq", 0))
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def save(self, last_seq: int):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({"last_seq": last_seq, "updated_at": time.time()}, f)
+        os.replace(temp_path, self.path)
+
+
+class ChangeCoalescer:
+    """리플렉션별로 최신 변경만 남기는 대기열"""
+
+    def __init__(self, quiet_seconds: float = DEFAULT_QUIET_SECONDS,
+                 max_delay_seconds: float = DEFAULT_MAX_DELAY_SECONDS,
+                 max_batch: int = DEFAULT_MAX_BATCH, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            quiet_seconds: 마지막 수정 후 이만큼 조용하면 반영
+            max_delay_seconds: 계속 수정 중이어도 처음 본 뒤 이 시간이 지나면 반영
+            max_batch: 한 번에 꺼낼 최대 리플렉션 수
+            clock: 단조 시계 (테스트에서 교체)
+        """
+        self.quiet_seconds = quiet_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.max_batch = max_batch
+        self.clock = clock
+        self.pending: Dict[str, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def add(self, change: Dict[str, Any]) -> bool:
+        """변경 추가 (기존 대기 항목에 합쳐졌으면 True)"""
+        now = self.clock()
+        entry = self.pending.get(change["reflection_id"])
+        if entry is None:
+            self.pending[change["reflection_id"]] = {
+                "change": change, "first_seq": change["seq"], "first_at": now,
+                "last_at": now, "edits": 1, "attempts": 0, "retry_at": 0.0
+            }
+            return False
+
+        # 늦게 보인 gap 변경이 더 최신 상태를 덮어쓰지 않도록 seq가 큰 쪽을 유지
+        if change["seq"] >= entry["change"]["seq"]:
+            entry["change"] = change
+        entry["first_seq"] = min(entry["first_seq"], change["seq"])
+        entry["last_at"] = now
+        entry["edits"] += 1
+        return True
+
+    def _is_due(self, entry: Dict[str, Any], now: float) -> bool:
+        if entry["retry_at"] > now:
+            return False
+        return now - entry["last_at"] >= self.quiet_seconds or now - entry["first_at"] >= self.max_delay_seconds
+
+    def take_due(self, force: bool = False) -> List[Dict[str, Any]]:
+        """반영할 항목을 먼저 들어온 순서로 꺼냄 (force면 대기 중인 항목 전부)"""
+        now = self.clock()
+        due = [entry for entry in self.pending.values() if force or self._is_due(entry, now)]
+        due.sort(key=lambda entry: entry["first_seq"])
+        if not force:
+            due = due[:self.max_batch]
+        for entry in due:
+            del self.pending[entry["change"]["reflection_id"]]
+        return due
+
+    def requeue(self, entry: Dict[str, Any]):
+        """실패한 항목을 백오프 후 재시도하도록 되돌림 (그 사이 새 변경이 왔으면 새 변경 유지)"""
+        entry["attempts"] += 1
+        entry["retry_at"] = self.clock() + min(MAX_RETRY_BACKOFF_SECONDS, 0.5 * 2 ** entry["attempts"])
+
+        newer = self.pending.get(entry["change"]["reflection_id"])
+        if newer is not None:
+            newer["first_seq"] = min(newer["first_seq"], entry["first_seq"])
+            newer["first_at"] = min(newer["first_at"], entry["first_at"])
+            newer["edits"] += entry["edits"]
+            return
+        self.pending[entry["change"]["reflection_id"]] = entry
+
+    def min_pending_seq(self) -> Optional[int]:
+        if not self.pending:
+            return None
+        return min(entry["first_seq"] for entry in self.pending.values())
+
+    def next_due_in(self) -> Optional[float]:
+        """다음 항목이 반영 가능해질 때까지 남은 시간"""
+        if not self.pending:
+            return None
+        now = self.clock()
+        waits = []
+        for entry in self.pending.values():
+            ready_at = min(entry["last_at"] + self.quiet_seconds, entry["first_at"] + self.max_delay_seconds)
+            waits.append(max(0.0, max(ready_at, entry["retry_at"]) - now))
+        return min(waits)
+
+
+class NotionReflectionSink:
+    """합쳐진 변경을 Notion 페이지 생성/수정/보관으로 반영"""
+
+    def __init__(self, client: Any, database_id: str, requests_per_second: Optional[float] = None,
+                 key_property: str = "Supabase_ID", schema=SUPABASE_MCP_SCHEMA,
+                 logger: Optional[ThreePartLogger] = None):
+        """
+        Args:
+            client: notion_client.Client 호환 클라이언트 (databases.query, pages.create/update)
+            database_id: 대상 Notion 데이터베이스 ID
+            requests_per_second: Notion API 초당 요청 한도 (None이면 프로세스 간 공유 기본 한도, 0이면 제한 없음)
+            key_property: Supabase ID를 저장한 rich_text 속성
+            schema: 속성 매핑 스키마
+            logger: 로깅 시스템 (선택사항)
+        """
+        self.client = client
+        self.database_id = database_id
+        self.key_property = key_property
+        self.mapper = get_mapper(schema, database_id)
+        if requests_per_second is not None and requests_per_second <= 0:
+            self.rate_limiter = RateLimiter(0)
+        else:
+            self.rate_limiter = get_rate_limiter("notion", rate=requests_per_second)
+        self.logger = logger or ThreePartLogger(name="cdc_notion_sink")
+        self.page_ids: Dict[str, Optional[str]] = {}
+        self.api_calls = 0
+
+    def _call(self, func: Callable, **kwargs) -> Dict[str, Any]:
+        self.rate_limiter.acquire()
+        self.api_calls += 1
+        return func(**kwargs) or {}
+
+    def _find_page(self, reflection_id: str) -> Optional[str]:
+        if reflection_id in self.page_ids:
+            return self.page_ids[reflection_id]
+
+        response = self._call(
+            self.client.databases.query,
+            database_id=self.database_id,
+            filter={"property": self.key_property, "rich_text": {"equals": reflection_id}},
+            page_size=1
+        )
+        results = response.get("results", [])
+        page_id = results[0]["id"] if results else None
+        self.page_ids[reflection_id] = page_id
+        return page_id
+
+    def _apply(self, change: Dict[str, Any]) -> str:
+        reflection_id = change["reflection_id"]
+        page_id = self._find_page(reflection_id)
+
+        if change["operation"] == "DELETE":
+            if page_id:
+                self._call(self.client.pages.update, page_id=page_id, archived=True)
+                self.page_ids[reflection_id] = None
+                return "archived"
+            return "skipped"
+
+        properties = self.mapper.map_row(dict(change.get("record") or {}, id=reflection_id))
+        if page_id:
+            self._call(self.client.pages.update, page_id=page_id, properties=properties)
+            return "updated"
+
+        response = self._call(self.client.pages.create, parent={"database_id": self.database_id}, properties=properties)
+        self.page_ids[reflection_id] = response.get("id")
+        return "created"
+
+    def write_batch(self, changes: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        변경 묶음 반영
+
+        Returns:
+            결과별 개수, failed(재시도할 reflection_id 목록), rejected(매핑 실패/Notion 거부로 건너뛴 목록),
+            errors(reflection_id → 오류 메시지)
+        """
+        result = {"created": 0, "updated": 0, "archived": 0, "skipped": 0, "failed": [], "rejected": [], "errors": {}}
+        for change in changes:
+            try:
+                result[self._apply(change)] += 1
+            except PropertyMappingError as e:
+                # 데이터 자체 문제는 재시도해도 같으므로 기록만 하고 넘어감
+                self.logger.warning(f"리플렉션 {change['reflection_id']} 매핑 실패: {e}")
+                result["rejected"].append(change["reflection_id"])
+                result["errors"][change["reflection_id"]] = str(e)
+            except Exception as e:
+                if is_permanent_error(e):
+                    self.logger.warning(f"리플렉션 {change['reflection_id']} Notion 거부: {e}")
+                    result["rejected"].append(change["reflection_id"])
+                else:
+                    self.logger.error(f"리플렉션 {change['reflection_id']} Notion 반영 실패: {e}")
+                    result["failed"].append(change["reflection_id"])
+                result["errors"][change["reflection_id"]] = str(e)
+        return result
+
+
+class CDCConsumer:
+    """변경 로그 → 합치기 → Notion 마이크로 배치 반영 루프"""
+
+    def __init__(self, source: ChangeLogSource, sink: Any, checkpoint_path: str,
+                 quiet_seconds: float = DEFAULT_QUIET_SECONDS,
+                 max_delay_seconds: float = DEFAULT_MAX_DELAY_SECONDS,
+                 max_batch: int = DEFAULT_MAX_BATCH, poll_interval: float = 1.0,
+                 gap_timeout_seconds: float = DEFAULT_GAP_TIMEOUT_SECONDS,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS, dead_letter_path: Optional[str] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 logger: Optional[ThreePartLogger] = None):
+        """
+        Args:
+            source: 변경 로그 소스
+            sink: write_batch(changes) -> {"failed": [...], ...}를 제공하는 반영 대상
+            checkpoint_path: 처리 완료 seq 체크포인트 파일
+            quiet_seconds / max_delay_seconds / max_batch: 합치기 설정 (ChangeCoalescer 참고)
+            poll_interval: 알림이 없을 때 최대 대기 시간
+            gap_timeout_seconds: 건너뛴 seq가 늦게 커밋되기를 기다리는 시간 (지나면 롤백된 것으로 봄)
+            max_attempts: 이 횟수만큼 실패한 변경은 dead letter로 넘김
+            dead_letter_path: 포기한 변경을 남길 JSONL 파일 (기본값: 체크포인트 옆 *_dead_letters.jsonl)
+            clock: 단조 시계 (테스트에서 교체)
+            logger: 로깅 시스템 (선택사항)
+        """
+        self.source = source
+        self.sink = sink
+        self.checkpoint = OffsetCheckpoint(checkpoint_path)
+        self.coalescer = ChangeCoalescer(quiet_seconds, max_delay_seconds, max_batch, clock)
+        self.poll_interval = poll_interval
+        self.gap_timeout_seconds = gap_timeout_seconds
+        self.max_attempts = max_attempts
+        self.dead_letter_path = dead_letter_path or f"{os.path.splitext(checkpoint_path)[0]}_dead_letters.jsonl"
+        self.clock = clock
+        self.logger = logger or ThreePartLogger(name="cdc_consumer")
+
+        self.committed_seq = self.checkpoint.load()
+        self.fetched_seq = self.committed_seq
+        self.gaps: Dict[int, float] = {}  # 아직 보이지 않은 seq → 처음 건너뛴 시각
+        self.stats = {
+            "changes_read": 0,
+            "late_changes": 0,
+            "gaps_expired": 0,
+            "changes_coalesced": 0,
+            "batches_flushed": 0,
+            "records_written": 0,
+            "records_failed": 0,
+            "records_rejected": 0,
+            "records_dead": 0,
+            "max_latency_seconds": 0.0
+        }
+
+    def _check_gaps(self) -> List[Dict[str, Any]]:
+        """늦게 커밋되어 이제 보이는 gap 변경 조회 (오래된 gap은 포기)"""
+        now = self.clock()
+        expired = [seq for seq, seen_at in self.gaps.items() if now - seen_at >= self.gap_timeout_seconds]
+        for seq in expired:
+            del self.gaps[seq]
+        if expired:
+            self.stats["gaps_expired"] += len(expired)
+            self.logger.warning(f"seq {min(expired)}~{max(expired)} 중 {len(expired)}개가 나타나지 않아 롤백된 것으로 처리")
+        if not self.gaps:
+            return []
+
+        late = self.source.fetch_seqs(sorted(self.gaps))
+        for change in late:
+            del self.gaps[change["seq"]]
+        self.stats["late_changes"] += len(late)
+        return late
+
+    def _track_gap(self, seq: int):
+        """fetched_seq와 seq 사이에 비어 있는 번호를 gap으로 기록"""
+        missing = seq - self.fetched_seq - 1
+        if missing <= 0:
+            return
+        if missing > MAX_TRACKED_GAPS:
+            self.logger.warning(f"seq {self.fetched_seq} → {seq} 점프 ({missing}개)는 gap으로 추적하지 않음")
+            return
+        now = self.clock()
+        for gap in range(self.fetched_seq + 1, seq):
+            self.gaps.setdefault(gap, now)
+
+    def poll_once(self) -> int:
+        """새 변경(늦게 커밋된 gap 포함)을 읽어 대기열에 추가 (읽은 개수 반환)"""
+        changes = self._check_gaps()
+        new_changes = self.source.fetch_after(self.fetched_seq)
+        for change in new_changes:
+            self._track_gap(change["seq"])
+            self.fetched_seq = change["seq"]
+        changes.extend(new_changes)
+
+        for change in changes:
+            if self.coalescer.add(change):
+                self.stats["changes_coalesced"] += 1
+        self.stats["changes_read"] += len(changes)
+        if changes and not len(self.coalescer):
+            self._commit()
+        return len(changes)
+
+    def flush(self, force: bool = False) -> int:
+        """반영 시점이 된 항목을 Notion에 기록 (기록 시도한 리플렉션 수 반환)"""
+        entries = self.coalescer.take_due(force)
+        if not entries:
+            self._commit()
+            return 0
+
+        result = self.sink.write_batch([entry["change"] for entry in entries])
+        failed = set(result.get("failed", []))
+        rejected = set(result.get("rejected", []))
+        errors = result.get("errors", {})
+        now = self.clock()
+
+        for entry in entries:
+            reflection_id = entry["change"]["reflection_id"]
+            if reflection_id in rejected:
+                self._dead_letter(entry, "rejected", errors.get(reflection_id))
+            elif reflection_id not in failed:
+                self.stats["max_latency_seconds"] = max(self.stats["max_latency_seconds"], now - entry["first_at"])
+            elif entry["attempts"] + 1 >= self.max_attempts:
+                entry["attempts"] += 1
+                self._dead_letter(entry, "max_attempts", errors.get(reflection_id))
+            else:
+                self.coalescer.requeue(entry)
+
+        self.stats["batches_flushed"] += 1
+        self.stats["records_written"] += len(entries) - len(failed) - len(rejected)
+        self.stats["records_failed"] += len(failed)
+        self.stats["records_rejected"] += len(rejected)
+        self._commit()
+        return len(entries)
+
+    def _dead_letter(self, entry: Dict[str, Any], reason: str, error: Optional[str]):
+        """반영을 포기한 변경을 dead letter 파일에 남김 (체크포인트는 이 변경을 넘어감)"""
+        change = entry["change"]
+        os.makedirs(os.path.dirname(os.path.abspath(self.dead_letter_path)), exist_ok=True)
+        with open(self.dead_letter_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({
+                "reflection_id": change["reflection_id"],
+                "seq": change["seq"],
+                "operation": change["operation"],
+                "record": change.get("record"),
+                "reason": reason,
+                "error": error,
+                "attempts": entry["attempts"],
+                "dead_at": time.time()
+            }, ensure_ascii=False, default=str) + "\n")
+        self.stats["records_dead"] += 1
+        self.logger.warning(f"리플렉션 {change['reflection_id']} (seq {change['seq']}) 반영 포기: {reason} - {error}")
+
+    def _commit(self):
+        """대기 중인 가장 오래된 변경(또는 아직 보이지 않은 gap) 직전까지를 처리 완료로 기록"""
+        safe_seq = self.fetched_seq
+        pending_seq = self.coalescer.min_pending_seq()
+        if pending_seq is not None:
+            safe_seq = min(safe_seq, pending_seq - 1)
+        if self.gaps:
+            safe_seq = min(safe_seq, min(self.gaps) - 1)
+        if safe_seq > self.committed_seq:
+            self.checkpoint.save(safe_seq)
+            self.committed_seq = safe_seq
+
+    def run(self, stop_event: Optional[threading.Event] = None, max_seconds: Optional[float] = None):
+        """
+        중지될 때까지 변경 소비
+
+        Args:
+            stop_event: set되면 남은 항목을 모두 반영하고 종료
+            max_seconds: 실행 시간 제한 (None이면 무제한)
+        """
+        stop_event = stop_event or threading.Event()
+        deadline = None if max_seconds is None else self.clock() + max_seconds
+        self.logger.info(f"CDC 소비 시작 (seq {self.committed_seq} 이후)")
+
+        try:
+            while not stop_event.is_set() and (deadline is None or self.clock() < deadline):
+                read = self.poll_once()
+                self.flush()
+                if read:
+                    continue
+
+                next_due = self.coalescer.next_due_in()
+                timeout = self.poll_interval if next_due is None else min(self.poll_interval, next_due)
+                self.source.wait(timeout)
+        finally:
+            self.flush(force=True)
+            self.logger.info(
+                f"CDC 소비 종료: 변경 {self.stats['changes_read']}개 중 {self.stats['changes_coalesced']}개 합침, "
+                f"반영 {self.stats['records_written']}건 / 배치 {self.stats['batches_flushed']}회, "
+                f"최대 지연 {self.stats['max_latency_seconds']:.2f}초"
+            )
+
+
+def test_cdc_consumer():
+    """SQLite 대역으로 CDCConsumer 테스트"""
+    import sqlite3
+    import tempfile
+
+    print("📡 CDC 소비자 테스트 시작")
+
+    class PrintingSink:
+        def write_batch(self, changes):
+            print(f"  → 배치 {len(changes)}건: {[change['reflection_id'] for change in changes]}")
+            return {"failed": []}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "changes.db")
+        with sqlite3.connect(db_path) as conn:
+            conn.executescript(SQLITE_STANDIN_SCHEMA)
+            for edit in range(30):
+                record = {"date": "2025-07-23", "time_part": "morning", "understanding_score": edit % 10}
+                conn.execute(
+                    "INSERT INTO reflection_changes (reflection_id, operation, record) VALUES (?, 'UPDATE', ?)",
+                    (f"reflection-{edit % 3}", json.dumps(record))
+                )
+
+        consumer = CDCConsumer(
+            ChangeLogSource(lambda: sqlite3.connect(db_path)), PrintingSink(),
+            os.path.join(temp_dir, "cdc_offset.json"), quiet_seconds=0.1, poll_interval=0.1
+        )
+        consumer.run(max_seconds=0.5)
+        consumer.source.close()
+        print(f"✅ 변경 {consumer.stats['changes_read']}개 → 반영 {consumer.stats['records_written']}건, "
+              f"체크포인트 seq {consumer.committed_seq}")
+
+
+if __name__ == "__main__":
+    test_cdc_consumer()
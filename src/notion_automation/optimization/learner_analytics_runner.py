@@ -0,0 +1,361 @@
+"""
+다중 학습자 3-Part 분석 실행기
+
+Supabase `daily_reflections` 테이블을 user_id 순으로 스트리밍하여 학습자별로 묶고,
+학습자 분석을 프로세스 풀에서 병렬 실행한 뒤 `daily_statistics`에 일괄 upsert 합니다.
+DB-API 연결(psycopg2 또는 sqlite3)을 받으므로 로컬 Postgres나 SQLite 대역으로 테스트할 수 있습니다.
+"""
+
+import itertools
+import multiprocessing
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime, date as date_type
+from typing import Dict, List, Any, Optional, Callable, Iterator, Tuple
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+
+TIME_PARTS = ("morning", "afternoon", "evening")
+MAX_PART_SCORE = 30  # understanding + concentration + achievement (각 1-10점)
+
+REFLECTION_COLUMNS = (
+    "user_id", "date", "time_part",
+    "understanding_score", "concentration_score", "achievement_score",
+    "condition", "github_commits", "github_issues", "github_prs"
+)
+
+STATISTICS_COLUMNS = (
+    "user_id", "date", "reflections_completed", "total_reflection_score",
+    "average_reflection_score", "github_activity_score", "daily_grade",
+    "consistency_score", "calculated_at"
+)
+
+# 로컬 테스트용 SQLite 대역 스키마 (Supabase 스키마의 분석 관련 컬럼만 포함)
+SQLITE_STANDIN_SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_reflections (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    time_part TEXT NOT NULL CHECK (time_part IN ('morning', 'afternoon', 'evening')),
+    understanding_score INTEGER,
+    concentration_score INTEGER,
+    achievement_score INTEGER,
+    condition TEXT,
+    github_commits INTEGER DEFAULT 0,
+    github_issues INTEGER DEFAULT 0,
+    github_prs INTEGER DEFAULT 0,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(user_id, date, time_part)
+);
+CREATE INDEX IF NOT EXISTS idx_daily_reflections_user_date ON daily_reflections(user_id, date);
+CREATE TABLE IF NOT EXISTS daily_statistics (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    reflections_completed INTEGER DEFAULT 0,
+    total_reflection_score INTEGER DEFAULT 0,
+    average_reflection_score REAL DEFAULT 0,
+    github_activity_score INTEGER DEFAULT 0,
+    daily_grade TEXT,
+    consistency_score REAL DEFAULT 0,
+    calculated_at TEXT,
+    UNIQUE(user_id, date)
+);
+"""
+
+
+def create_sqlite_standin_schema(conn) -> None:
+    """SQLite 연결에 대역 스키마 생성"""
+    conn.executescript(SQLITE_STANDIN_SCHEMA)
+    conn.commit()
+
+
+def _is_sqlite(conn) -> bool:
+    return type(conn).__module__.startswith("sqlite3")
+
+
+def _placeholder(conn) -> str:
+    return "?" if _is_sqlite(conn) else "%s"
+
+
+def _get_day_grade(average_score: float, completed_parts: int) -> str:
+    """하루 전체 등급 (대시보드 등급 기준을 100점 환산 점수에 적용)"""
+    if completed_parts == 0:
+        return "데이터 없음"
+
+    percent = average_score / MAX_PART_SCORE * 100
+    if completed_parts == 3:
+        if percent >= 80:
+            return "완벽한 하루"
+        elif percent >= 60:
+            return "훌륭한 하루"
+        return "충실한 하루"
+    return f"부분 완료 ({completed_parts}/3)"
+
+
+def analyze_learner(user_id: str, rows: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], List[Tuple]]:
+    """
+    학습자 한 명의 반성 데이터 분석 (프로세스 풀에서 실행되는 최상위 함수)
+
+    Args:
+        user_id: 학습자 ID
+        rows: 해당 학습자의 daily_reflections 행 목록
+
+    Returns:
+        (학습자 요약, daily_statistics upsert 행 목록)
+    """
+    by_date: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    part_scores: Dict[str, List[int]] = defaultdict(list)
+    weekday_part_scores: Dict[Tuple[int, str], List[int]] = defaultdict(list)
+
+    for row in rows:
+        day = row["date"] if isinstance(row["date"], str) else row["date"].isoformat()
+        score = sum(row.get(key) or 0 for key in ("understanding_score", "concentration_score", "achievement_score"))
+        row = dict(row, date=day, total_score=score)
+        by_date[day].append(row)
+        part_scores[row["time_part"]].append(score)
+        weekday_part_scores[(datetime.strptime(day[:10], "%Y-%m-%d").weekday(), row["time_part"])].append(score)
+
+    calculated_at = datetime.now().isoformat()
+    statistics_rows = []
+
+    for day, day_rows in sorted(by_date.items()):
+        scores = [r["total_score"] for r in day_rows]
+        completed = len({r["time_part"] for r in day_rows})
+        total = sum(scores)
+        average = total / len(scores)
+        variance = sum((s - average) ** 2 for s in scores) / len(scores)
+        github_score = sum(
+            (r.get("github_commits") or 0) * 2 + (r.get("github_issues") or 0) * 1.5 + (r.get("github_prs") or 0) * 3
+            for r in day_rows
+        )
+
+        statistics_rows.append((
+            user_id, day, completed, total, round(average, 2), int(round(github_score)),
+            _get_day_grade(average, completed),
+            round(max(0.0, 10 - variance ** 0.5), 2),  # 표준편차가 낮을수록 일관성 높음
+            calculated_at
+        ))
+
+    part_averages = {part: sum(scores) / len(scores) for part, scores in part_scores.items()}
+    best_weekday_parts = {}
+    for (weekday, part), scores in weekday_part_scores.items():
+        average = sum(scores) / len(scores)
+        if average > best_weekday_parts.get(weekday, (None, -1))[1]:
+            best_weekday_parts[weekday] = (part, average)
+
+    summary = {
+        "user_id": user_id,
+        "reflection_count": len(rows),
+        "active_days": len(by_date),
+        "timepart_averages": {part: round(avg, 2) for part, avg in part_averages.items()},
+        "best_timepart": max(part_averages, key=part_averages.get) if part_averages else None,
+        "weekday_best_timepart": {weekday: part for weekday, (part, _) in sorted(best_weekday_parts.items())}
+    }
+    return summary, statistics_rows
+
+
+def _analyze_learner_chunk(analysis_func: Callable, chunk: List[Tuple[str, List[Dict[str, Any]]]]) -> List[Tuple[Dict, List[Tuple]]]:
+    """여러 학습자를 한 작업으로 묶어 프로세스 간 전달 비용 절감"""
+    return [analysis_func(user_id, rows) for user_id, rows in chunk]
+
+
+class LearnerAnalyticsRunner:
+    """user_id 단위 샤딩 분석 실행기"""
+
+    def __init__(self, connect: Callable[[], Any], max_workers: int = 4, learners_per_task: int = 16,
+                 fetch_size: int = 2000, write_batch_size: int = 500,
+                 analysis_func: Callable = analyze_learner,
+                 logger: Optional[ThreePartLogger] = None):
+        """
+        실행기 초기화
+
+        Args:
+            connect: DB-API 연결을 반환하는 함수 (psycopg2.connect, sqlite3.connect 등)
+            max_workers: 분석 프로세스 수 (0이면 현재 프로세스에서 순차 실행)
+            learners_per_task: 프로세스 작업 하나에 묶을 학습자 수
+            fetch_size: 반성 데이터 스트리밍 시 한 번에 가져올 행 수
+            write_batch_size: daily_statistics 일괄 upsert 단위
+            analysis_func: (user_id, rows) -> (요약, 통계 행) 함수 (pickle 가능한 최상위 함수)
+            logger: 로깅 시스템 (선택사항)
+        """
+        self.connect = connect
+        self.max_workers = max_workers
+        self.learners_per_task = learners_per_task
+        self.fetch_size = fetch_size
+        self.write_batch_size = write_batch_size
+        self.analysis_func = analysis_func
+        self.logger = logger or ThreePartLogger(name="learner_analytics")
+
+    def iter_learner_reflections(self, conn, start_date: Optional[date_type] = None,
+                                 end_date: Optional[date_type] = None) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        반성 데이터를 user_id 순으로 스트리밍하며 학습자별로 묶어서 반환
+
+        한 번에 fetch_size 행만 메모리에 올리며, 학습자 경계에서 묶음을 내보냅니다.
+        """
+        mark = _placeholder(conn)
+        conditions, params = [], []
+        if start_date:
+            conditions.append(f"date >= {mark}")
+            params.append(str(start_date))
+        if end_date:
+            conditions.append(f"date <= {mark}")
+            params.append(str(end_date))
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        query = f"SELECT {', '.join(REFLECTION_COLUMNS)} FROM daily_reflections{where} ORDER BY user_id, date, time_part"
+
+        # psycopg2는 이름 있는 커서(서버 측 커서)를 써야 결과 전체를 메모리에 올리지 않음
+        cursor = conn.cursor() if _is_sqlite(conn) else conn.cursor(name="learner_reflections_stream")
+        cursor.execute(query, params)
+
+        def iter_rows():
+            while True:
+                batch = cursor.fetchmany(self.fetch_size)
+                if not batch:
+                    break
+                for values in batch:
+                    yield dict(zip(REFLECTION_COLUMNS, values))
+
+        try:
+            for user_id, rows in itertools.groupby(iter_rows(), key=lambda row: row["user_id"]):
+                yield str(user_id), list(rows)
+        finally:
+            cursor.close()
+
+    def _write_statistics(self, conn, rows: List[Tuple]) -> None:
+        """daily_statistics 일괄 upsert"""
+        if not rows:
+            return
+
+        mark = _placeholder(conn)
+        updates = ", ".join(f"{column} = excluded.{column}" for column in STATISTICS_COLUMNS[2:])
+        sql = (
+            f"INSERT INTO daily_statistics ({', '.join(STATISTICS_COLUMNS)}) "
+            f"VALUES ({', '.join([mark] * len(STATISTICS_COLUMNS))}) "
+            f"ON CONFLICT (user_id, date) DO UPDATE SET {updates}"
+        )
+
+        write_cursor = conn.cursor()
+        try:
+            write_cursor.executemany(sql, rows)
+        finally:
+            write_cursor.close()
+
+    def run(self, start_date: Optional[date_type] = None, end_date: Optional[date_type] = None) -> Dict[str, Any]:
+        """
+        전체 학습자 분석 실행
+
+        Args:
+            start_date: 분석 시작 날짜 (선택사항)
+            end_date: 분석 종료 날짜 (선택사항)
+
+        Returns:
+            학습자별 요약과 실행 통계
+        """
+        self.logger.info("다중 학습자 분석 시작")
+        start_time = time.perf_counter()
+
+        conn = self.connect()
+        summaries: List[Dict[str, Any]] = []
+        pending_rows: List[Tuple] = []
+        written_rows = 0
+
+        def collect(results):
+            nonlocal pending_rows, written_rows
+            for summary, statistics_rows in results:
+                summaries.append(summary)
+                pending_rows.extend(statistics_rows)
+            if len(pending_rows) >= self.write_batch_size:
+                self._write_statistics(conn, pending_rows)
+                written_rows += len(pending_rows)
+                pending_rows = []
+
+        try:
+            learners = self.iter_learner_reflections(conn, start_date, end_date)
+            chunks = iter(lambda: list(itertools.islice(learners, self.learners_per_task)), [])
+
+            if self.max_workers <= 0:
+                for chunk in chunks:
+                    collect(_analyze_learner_chunk(self.analysis_func, chunk))
+            else:
+                # 제출 대기 작업 수를 제한하여 스트리밍 중 메모리 사용량을 일정하게 유지
+                max_in_flight = self.max_workers * 2
+                with ProcessPoolExecutor(max_workers=self.max_workers,
+                                         mp_context=multiprocessing.get_context("spawn")) as pool:
+                    running = set()
+                    for chunk in chunks:
+                        running.add(pool.submit(_analyze_learner_chunk, self.analysis_func, chunk))
+                        if len(running) >= max_in_flight:
+                            done, running = wait(running, return_when=FIRST_COMPLETED)
+                            for future in done:
+                                collect(future.result())
+                    for future in running:
+                        collect(future.result())
+
+            self._write_statistics(conn, pending_rows)
+            written_rows += len(pending_rows)
+            conn.commit()
+
+        except Exception as e:
+            conn.rollback()
+            self.logger.log_error(e, "다중 학습자 분석")
+            raise
+        finally:
+            conn.close()
+
+        duration = time.perf_counter() - start_time
+        self.logger.log_performance(f"다중 학습자 분석 ({len(summaries)}명)", duration)
+
+        return {
+            "learners": summaries,
+            "learner_count": len(summaries),
+            "statistics_rows_written": written_rows,
+            "duration_seconds": round(duration, 3),
+            "learners_per_second": round(len(summaries) / duration, 1) if duration > 0 else 0.0
+        }
+
+
+def main():
+    """SQLite 대역 DB로 다중 학습자 분석 실행 예시"""
+    import random
+    import sqlite3
+    import tempfile
+    from datetime import timedelta
+
+    print("👥 다중 학습자 분석 실행기 테스트")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "standin.db")
+        conn = sqlite3.connect(db_path)
+        create_sqlite_standin_schema(conn)
+
+        today = datetime.now().date()
+        rows = [
+            (f"learner-{learner:03d}", str(today - timedelta(days=day)), part,
+             random.randint(1, 10), random.randint(1, 10), random.randint(1, 10), "보통",
+             random.randint(0, 5), random.randint(0, 2), random.randint(0, 1))
+            for learner in range(100) for day in range(30) for part in TIME_PARTS
+        ]
+        conn.executemany(
+            f"INSERT INTO daily_reflections ({', '.join(REFLECTION_COLUMNS)}) VALUES ({', '.join('?' * len(REFLECTION_COLUMNS))})",
+            rows
+        )
+        conn.commit()
+        conn.close()
+
+        runner = LearnerAnalyticsRunner(lambda: sqlite3.connect(db_path), max_workers=4)
+        result = runner.run()
+
+        print(f"✅ 학습자 {result['learner_count']}명, 통계 {result['statistics_rows_written']}행, "
+              f"{result['duration_seconds']}초 ({result['learners_per_second']}명/초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+로컬 3part_local.db 스키마 마이그레이션
+
+SQLite `PRAGMA user_version`에 적용된 스키마 버전을 기록하고,
+아직 적용되지 않은 마이그레이션만 버전 순서대로 하나의 트랜잭션씩 실행합니다.
+새 스키마 변경은 MIGRATIONS 끝에 (버전, 설명, SQL 목록)을 추가하면 됩니다.
+"""
+
+import sqlite3
+from typing import List, Optional, Tuple
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+
+MIGRATIONS: List[Tuple[int, str, List[str]]] = [
+    (1, "기본 테이블 생성", [
+        '''
+        CREATE TABLE IF NOT EXISTS three_part_data (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            date TEXT NOT NULL,
+            time_part TEXT NOT NULL,
+            focus_level INTEGER,
+            understanding_level INTEGER,
+            fatigue_level INTEGER,
+            satisfaction_level INTEGER,
+            difficulty_level INTEGER,
+            study_amount INTEGER,
+            notes TEXT,
+            github_commits INTEGER DEFAULT 0,
+            github_prs INTEGER DEFAULT 0,
+            github_issues INTEGER DEFAULT 0,
+            data_hash TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(date, time_part)
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS backup_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            backup_type TEXT NOT NULL,
+            backup_date TEXT NOT NULL,
+            file_path TEXT NOT NULL,
+            file_size INTEGER,
+            record_count INTEGER,
+            backup_hash TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS sync_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            sync_date TEXT NOT NULL,
+            source TEXT NOT NULL,
+            target TEXT NOT NULL,
+            action TEXT NOT NULL,
+            record_count INTEGER,
+            status TEXT,
+            error_message TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+    ]),
+    (2, "시간대 정렬 순서 컬럼 추가", [
+        "ALTER TABLE three_part_data ADD COLUMN time_part_order INTEGER",
+        '''
+        UPDATE three_part_data SET time_part_order = CASE time_part
+            WHEN 'morning' THEN 1
+            WHEN 'afternoon' THEN 2
+            WHEN 'evening' THEN 3
+            ELSE 9
+        END
+        ''',
+    ]),
+    (3, "조회 패턴별 인덱스 생성", [
+        # 기간 조회 + (date DESC, time_part_order) 정렬을 임시 정렬 없이 인덱스 순서로 처리
+        "CREATE INDEX IF NOT EXISTS idx_three_part_data_date_order ON three_part_data(date DESC, time_part_order)",
+        # 유형별 집계를 테이블 접근 없이 인덱스만으로 처리 (커버링 인덱스)
+        "CREATE INDEX IF NOT EXISTS idx_backup_history_type_stats ON backup_history(backup_type, file_size, record_count)",
+        "CREATE INDEX IF NOT EXISTS idx_backup_history_created_at ON backup_history(created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_sync_log_created_at ON sync_log(created_at)",
+    ]),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection, target_version: Optional[int] = None,
+            logger: Optional[ThreePartLogger] = None) -> int:
+    """
+    미적용 마이그레이션 실행
+
+    Args:
+        conn: SQLite 연결
+        target_version: 이 버전까지만 적용 (기본값: 최신)
+        logger: 로깅 시스템 (선택사항)
+
+    Returns:
+        적용 후 스키마 버전
+    """
+    logger = logger or ThreePartLogger(name="local_db_migrations")
+    target_version = LATEST_VERSION if target_version is None else target_version
+    current = get_schema_version(conn)
+
+    for version, description, statements in MIGRATIONS:
+        if version <= current or version > target_version:
+            continue
+
+        # 마이그레이션 하나와 버전 기록을 같은 트랜잭션으로 처리
+        # (sqlite3 모듈은 DDL 앞에서 트랜잭션을 자동으로 열지 않으므로 직접 BEGIN)
+        conn.commit()
+        conn.execute("BEGIN")
+        try:
+            for statement in statements:
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+        logger.info(f"로컬 DB 마이그레이션 v{version} 적용: {description}")
+        current = version
+
+    return current
+
+
+def main():
+    """임시 DB에 마이그레이션 적용 예시"""
+    import tempfile
+
+    print("🧱 로컬 DB 마이그레이션 테스트")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with sqlite3.connect(os.path.join(temp_dir, "3part_local.db")) as conn:
+            version = migrate(conn)
+            indexes = [row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'"
+            )]
+        print(f"✅ 스키마 버전 {version}, 인덱스: {', '.join(indexes)}")
+
+
+if __name__ == "__main__":
+    main()
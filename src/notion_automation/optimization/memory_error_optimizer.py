@@ -22,6 +22,9 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
 
 from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.resilience import (
+    DecorrelatedJitterBackoff, get_circuit_breaker, remaining_timeout
+)
 
 class ErrorSeverity(Enum):
     """에러 심각도 레벨"""
@@ -196,6 +199,8 @@ class ErrorHandler:
         self.error_history = []
         self.recovery_attempts = {}
         self.max_retry_attempts = 3
+        self.retry_backoff = DecorrelatedJitterBackoff(base=1.0, cap=30.0)
+        self.retry_delays = {}
         
         self.logger.info("3-Part 향상된 에러 처리 시스템 초기화 완료")
     
@@ -273,15 +278,40 @@ class ErrorHandler:
             return self._abort_operation(error_id, context)
     
     def _retry_operation(self, error_id: str, context: str) -> Dict[str, Any]:
-        """재시도 전략"""
+        """재시도 전략 (컨텍스트별 서킷 브레이커 + 지터 백오프 + 데드라인)"""
         retry_count = self.recovery_attempts.get(error_id, 0)
+        breaker = get_circuit_breaker(f"error_handler:{context}")
+        breaker.record_failure()
         
         if retry_count < self.max_retry_attempts:
+            if not breaker.allow():
+                self.logger.error(f"서킷 브레이커 열림 [{context}]: 재시도 차단 ({breaker.retry_in():.1f}초 후 재개)")
+                return {
+                    "strategy": "retry",
+                    "attempt": retry_count,
+                    "max_attempts": self.max_retry_attempts,
+                    "success": False,
+                    "circuit_state": breaker.state,
+                    "fallback_to": "abort"
+                }
+            
+            # 재시도 간격 (decorrelated jitter backoff)
+            wait_time = self.retry_backoff.next_delay(self.retry_delays.get(error_id))
+            remaining = remaining_timeout()
+            if remaining is not None and remaining < wait_time:
+                self.logger.error(f"데드라인 초과 [{error_id}]: 남은 {remaining:.1f}초 < 대기 {wait_time:.1f}초")
+                return {
+                    "strategy": "retry",
+                    "attempt": retry_count,
+                    "max_attempts": self.max_retry_attempts,
+                    "success": False,
+                    "deadline_exceeded": True,
+                    "fallback_to": "abort"
+                }
+            
             self.recovery_attempts[error_id] = retry_count + 1
+            self.retry_delays[error_id] = wait_time
             self.logger.info(f"재시도 실행 [{error_id}]: {retry_count + 1}/{self.max_retry_attempts}")
-            
-            # 재시도 간격 (exponential backoff)
-            wait_time = 2 ** retry_count
             time.sleep(wait_time)
             
             return {
@@ -289,6 +319,7 @@ class ErrorHandler:
                 "attempt": retry_count + 1,
                 "max_attempts": self.max_retry_attempts,
                 "wait_time": wait_time,
+                "circuit_state": breaker.state,
                 "success": True
             }
         else:
@@ -374,7 +405,9 @@ class ErrorHandler:
                         # 재시도 로직
                         retry_result = error_result["recovery_result"]
                         if retry_result["success"]:
-                            return func(*args, **kwargs)  # 재시도
+                            result = func(*args, **kwargs)  # 재시도
+                            get_circuit_breaker(f"error_handler:{context}").record_success()
+                            return result
                     elif recovery_strategy == RecoveryStrategy.FALLBACK:
                         # 폴백 데이터 반환
                         return error_result["recovery_result"]["fallback_data"]
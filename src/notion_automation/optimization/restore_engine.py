@@ -0,0 +1,329 @@
+"""
+재개 가능한 백업 복구 엔진
+
+백업 아카이브(전체 → 증분 체인)의 레코드를 스트리밍으로 읽어 배치 단위 upsert로
+로컬 SQLite 미러 또는 Supabase에 기록합니다. 배치는 제한된 수의 스레드에서 병렬로
+기록하고, 연속으로 완료된 배치 위치를 체크포인트 파일에 저장하므로 중단된 복구를
+다시 실행하면 남은 배치부터 이어서 진행합니다. upsert라 같은 배치를 다시 써도 안전합니다.
+"""
+
+import itertools
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Iterable, Sequence
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.backup_archive import BackupArchiveReader, manifest_digest
+
+DEFAULT_BATCH_SIZE = 500
+
+# Supabase daily_reflections와 같은 컬럼 구성의 로컬 미러 테이블
+MIRROR_COLUMNS = (
+    "id", "user_id", "date", "time_part",
+    "understanding_score", "concentration_score", "achievement_score",
+    "condition", "total_score",
+    "github_commits", "github_issues", "github_prs", "github_reviews",
+    "created_at", "updated_at"
+)
+
+MIRROR_SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_reflections (
+    id TEXT PRIMARY KEY,
+    user_id TEXT,
+    date TEXT,
+    time_part TEXT,
+    understanding_score INTEGER,
+    concentration_score INTEGER,
+    achievement_score INTEGER,
+    condition TEXT,
+    total_score INTEGER,
+    github_commits INTEGER DEFAULT 0,
+    github_issues INTEGER DEFAULT 0,
+    github_prs INTEGER DEFAULT 0,
+    github_reviews INTEGER DEFAULT 0,
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_mirror_reflections_user_date ON daily_reflections(user_id, date);
+"""
+
+
+class SQLiteRestoreTarget:
+    """로컬 SQLite 미러 테이블 복구 대상"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(MIRROR_SCHEMA)
+        self._conn.commit()
+
+        updates = ", ".join(f"{column} = excluded.{column}" for column in MIRROR_COLUMNS[1:])
+        self._sql = (
+            f"INSERT INTO daily_reflections ({', '.join(MIRROR_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(MIRROR_COLUMNS))}) "
+            f"ON CONFLICT (id) DO UPDATE SET {updates}"
+        )
+
+    def write_batch(self, records: List[Dict[str, Any]]) -> int:
+        rows = [tuple(record.get(column) for column in MIRROR_COLUMNS) for record in records]
+        # SQLite는 쓰기가 직렬화되므로 연결 하나를 잠금으로 공유 (배치마다 커밋)
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(self._sql, rows)
+        return len(rows)
+
+    def close(self):
+        self._conn.close()
+
+
+class SupabaseRestoreTarget:
+    """Supabase 테이블 복구 대상 (id 기준 upsert)"""
+
+    # 생성 컬럼은 값을 넣으면 Postgres가 거부함
+    GENERATED_COLUMNS = ("total_score",)
+
+    def __init__(self, client, table: str = "daily_reflections"):
+        self.client = client
+        self.table = table
+
+    def write_batch(self, records: List[Dict[str, Any]]) -> int:
+        payload = [{k: v for k, v in record.items() if k not in self.GENERATED_COLUMNS} for record in records]
+        self.client.table(self.table).upsert(payload, on_conflict="id").execute()
+        return len(payload)
+
+    def close(self):
+        pass
+
+
+class RestoreCheckpoint:
+    """복구 진행 위치 파일 (스트림별 연속 완료 배치 수)"""
+
+    def __init__(self, path: str, identity: List[Dict[str, Any]]):
+        self.path = path
+        self.identity = identity
+        self.progress: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            # 같은 백업 체인일 때만 이어서 진행
+            if state.get("identity") == identity:
+                self.progress = state.get("progress", {})
+
+    def completed_batches(self, stream_key: str) -> int:
+        return self.progress.get(stream_key, {}).get("completed_batches", 0)
+
+    def is_done(self, stream_key: str) -> bool:
+        return self.progress.get(stream_key, {}).get("done", False)
+
+    def update(self, stream_key: str, completed_batches: int, done: bool = False):
+        with self._lock:
+            self.progress[stream_key] = {"completed_batches": completed_batches, "done": done}
+            state = {"identity": self.identity, "progress": self.progress, "updated_at": datetime.now().isoformat()}
+
+            temp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class RestoreEngine:
+    """배치 upsert + 체크포인트 기반 복구 실행기"""
+
+    def __init__(self, target, checkpoint_path: str, batch_size: int = DEFAULT_BATCH_SIZE,
+                 max_workers: int = 4, logger: Optional[ThreePartLogger] = None):
+        """
+        Args:
+            target: write_batch(records)를 제공하는 복구 대상
+            checkpoint_path: 체크포인트 JSON 파일 경로
+            batch_size: upsert 배치 크기
+            max_workers: 동시에 기록할 배치 수 (0이면 현재 스레드에서 순차 기록)
+            logger: 로깅 시스템 (선택사항)
+        """
+        self.target = target
+        self.checkpoint_path = checkpoint_path
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.logger = logger or ThreePartLogger(name="restore_engine")
+
+    @staticmethod
+    def _chain_identity(chain: Sequence[BackupArchiveReader]) -> List[Dict[str, Any]]:
+        return [
+            {"backup": os.path.basename(reader.path), "digest": manifest_digest(reader.manifest) if reader.manifest else None}
+            for reader in chain
+        ]
+
+    def verify(self, chain: Sequence[BackupArchiveReader], datasets: Iterable[str] = ("supabase_data",)) -> List[Dict[str, Any]]:
+        """기록 전 전체 청크 체크섬 확인 (불일치 청크 목록 반환)"""
+        invalid = []
+        for reader in chain:
+            for dataset in datasets:
+                for _ in reader.iter_records(dataset):
+                    pass
+            invalid.extend(reader.invalid_chunks)
+        return invalid
+
+    def restore_chain(self, chain: Sequence[BackupArchiveReader], datasets: Iterable[str] = ("supabase_data",),
+                      verify_first: bool = True) -> Dict[str, Any]:
+        """
+        백업 체인을 전체 → 증분 순서로 복구
+
+        같은 id가 뒤 백업에서 갱신될 수 있으므로 아카이브 사이에는 순서를 지키고,
+        한 아카이브 안의 배치만 병렬로 기록합니다.
+        """
+        datasets = tuple(datasets)
+        if verify_first:
+            invalid = self.verify(chain, datasets)
+            if invalid:
+                self.logger.error(f"청크 체크섬 불일치로 복구 중단: {invalid}")
+                return self._result({"written": 0, "batches": 0, "skipped": 0}, 0.0, completed=False,
+                                    error="checksum_mismatch", invalid_chunks=invalid)
+
+        checkpoint = RestoreCheckpoint(self.checkpoint_path, self._chain_identity(chain))
+        streams = [
+            (f"{os.path.basename(reader.path)}/{dataset}", reader, dataset)
+            for reader in chain for dataset in datasets
+        ]
+        return self._run(checkpoint, [(key, lambda r=reader, d=dataset: r.iter_records(d)) for key, reader, dataset in streams])
+
+    def restore_records(self, stream_key: str, records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """이미 읽은 레코드 목록(이전 형식 백업 등) 복구"""
+        checkpoint = RestoreCheckpoint(self.checkpoint_path, [{"backup": stream_key, "digest": None}])
+        return self._run(checkpoint, [(stream_key, lambda: iter(records))])
+
+    def _run(self, checkpoint: RestoreCheckpoint, streams) -> Dict[str, Any]:
+        start_time = time.perf_counter()
+        totals = {"written": 0, "batches": 0, "skipped": 0}
+
+        try:
+            for stream_key, open_stream in streams:
+                if checkpoint.is_done(stream_key):
+                    self.logger.info(f"이미 복구됨, 건너뜀: {stream_key}")
+                    continue
+                self._restore_stream(checkpoint, stream_key, open_stream(), totals)
+        except Exception as e:
+            self.logger.log_error(e, "백업 복구")
+            return self._result(totals, time.perf_counter() - start_time, completed=False, error=str(e))
+
+        checkpoint.clear()
+        duration = time.perf_counter() - start_time
+        self.logger.log_performance(f"백업 복구 ({totals['written']}개 레코드)", duration)
+        return self._result(totals, duration, completed=True)
+
+    def _restore_stream(self, checkpoint: RestoreCheckpoint, stream_key: str,
+                        records: Iterable[Dict[str, Any]], totals: Dict[str, int]):
+        """스트림 하나를 배치로 나눠 기록하고 연속 완료 위치를 체크포인트에 반영"""
+        resume_from = checkpoint.completed_batches(stream_key)
+        batch_iter = iter(lambda: list(itertools.islice(records, self.batch_size)), [])
+
+        # 완료된 배치까지는 읽기만 하고 건너뜀 (아카이브 순서가 고정이라 같은 배치가 나옴)
+        for _ in range(resume_from):
+            if next(batch_iter, None) is None:
+                break
+        if resume_from:
+            totals["skipped"] += resume_from
+            self.logger.info(f"{stream_key}: 배치 {resume_from}개 이후부터 재개")
+
+        finished = set()
+        watermark = resume_from
+
+        def advance(index: int, count: int):
+            nonlocal watermark
+            totals["written"] += count
+            totals["batches"] += 1
+            finished.add(index)
+            moved = False
+            while watermark in finished:
+                finished.discard(watermark)
+                watermark += 1
+                moved = True
+            if moved:
+                checkpoint.update(stream_key, watermark)
+
+        indexed_batches = enumerate(batch_iter, start=resume_from)
+        if self.max_workers <= 0:
+            for index, batch in indexed_batches:
+                advance(index, self.target.write_batch(batch))
+        else:
+            # 제출 대기 배치 수를 제한하여 메모리 사용량을 일정하게 유지
+            max_in_flight = self.max_workers * 2
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                running = {}
+                try:
+                    for index, batch in indexed_batches:
+                        running[pool.submit(self.target.write_batch, batch)] = index
+                        if len(running) >= max_in_flight:
+                            done, _ = wait(running, return_when=FIRST_COMPLETED)
+                            for future in done:
+                                advance(running.pop(future), future.result())
+                finally:
+                    # 실패하더라도 이미 끝난 배치는 체크포인트에 반영
+                    error = None
+                    for future in list(running):
+                        try:
+                            advance(running.pop(future), future.result())
+                        except Exception as e:
+                            error = error or e
+                    if error is not None:
+                        raise error
+
+        checkpoint.update(stream_key, watermark, done=True)
+
+    @staticmethod
+    def _result(totals: Dict[str, int], duration: float, completed: bool, **extra) -> Dict[str, Any]:
+        result = {
+            "completed": completed,
+            "records_written": totals["written"],
+            "batches_written": totals["batches"],
+            "batches_skipped": totals["skipped"],
+            "duration_seconds": round(duration, 3),
+            "records_per_second": round(totals["written"] / duration, 1) if duration > 0 else 0.0
+        }
+        result.update(extra)
+        return result
+
+
+def main():
+    """임시 백업 아카이브를 SQLite 미러로 복구하는 예시"""
+    import tempfile
+    from src.notion_automation.utils.backup_archive import StreamingBackupWriter
+
+    print("♻️ 복구 엔진 테스트")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        archive_path = os.path.join(temp_dir, "full.zip")
+        with StreamingBackupWriter(archive_path) as writer:
+            writer.write_dataset("supabase_data", (
+                {"id": f"r{i}", "user_id": "learner", "date": f"2025-{1 + i % 12:02d}-{1 + i % 28:02d}",
+                 "time_part": ("morning", "afternoon", "evening")[i % 3], "understanding_score": i % 10 + 1}
+                for i in range(365 * 3)
+            ))
+            writer.write_manifest({"backup_name": "full", "mode": "full"})
+
+        target = SQLiteRestoreTarget(os.path.join(temp_dir, "mirror.db"))
+        engine = RestoreEngine(target, os.path.join(temp_dir, "restore.json"), batch_size=200)
+        result = engine.restore_chain([BackupArchiveReader(archive_path)])
+        target.close()
+
+        print(f"✅ {result['records_written']}개 레코드, {result['records_per_second']}개/초")
+
+
+if __name__ == "__main__":
+    main()
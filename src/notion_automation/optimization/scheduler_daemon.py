@@ -0,0 +1,472 @@
+"""
+3-Part 시간대 스케줄러 데몬
+
+config/time_schedules.json의 시간대 종료(반성) 시각마다 GitHub 수집 → 로컬 백업 → Notion 동기화를,
+automation_settings.dashboard_update_time에 대시보드 갱신을 한 프로세스 안에서 실행합니다.
+작업마다 프로세스를 새로 띄우지 않으므로 모듈/클라이언트를 한 번만 초기화하고,
+여러 cron 작업이 같은 시각에 겹쳐 실행되는 문제도 작업별 동시 실행 제한으로 막습니다.
+
+- jitter: 정해진 시각에서 0 ~ jitter_seconds 사이 무작위로 늦춰 다른 사용자/프로세스와 몰리지 않게 함
+- 동시 실행 제한: 작업별 세마포어, 이전 실행이 끝나지 않았으면 이번 실행은 건너뜀 (겹침 방지)
+- 놓친 실행 보충: 데몬이 꺼져 있던 동안 지난 시각은 catch_up_hours 안이면 재시작 시 한 번만 실행
+- 시간대 경계와 시각 기준은 TimePartCalendar(기본 Asia/Seoul)를 따르므로 서버 시간대와 무관하게 같은 시각에 실행
+"""
+
+import argparse
+import json
+import random
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, time as dt_time
+from typing import Dict, List, Any, Optional, Callable, Tuple
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.notion_property_mapper import TIME_PART_OPTIONS
+from src.notion_automation.utils.time_part_calendar import TimePartCalendar, get_time_part_calendar
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+DEFAULT_SCHEDULE_PATH = os.path.join(project_root, "config", "time_schedules.json")
+DEFAULT_STATE_PATH = os.getenv("SCHEDULER_STATE_PATH", os.path.join(project_root, "data", "scheduler_state.json"))
+DEFAULT_JITTER_SECONDS = 120.0
+DEFAULT_CATCH_UP_HOURS = 12.0
+DEFAULT_POLL_SECONDS = 30.0
+HISTORY_LIMIT = 200
+
+TIME_PART_JOBS = ("github_collection", "local_persistence", "notion_sync")
+DASHBOARD_JOBS = ("dashboard_refresh",)
+
+
+@dataclass
+class SchedulerJob:
+    """스케줄러 작업 정의"""
+    name: str
+    func: Callable[[Dict[str, Any]], Any]
+    max_concurrent: int = 1
+
+
+@dataclass
+class ScheduleTrigger:
+    """매일 정해진 시각에 순서대로 실행할 작업 묶음"""
+    key: str
+    at: dt_time
+    jobs: Tuple[str, ...]
+    time_part: Optional[str] = None
+    description: str = ""
+
+    def occurrence_on(self, day, tz=None) -> datetime:
+        return datetime.combine(day, self.at, tzinfo=tz)
+
+
+@dataclass
+class TriggerRun:
+    """트리거 한 번 실행 결과"""
+    trigger: str
+    scheduled_at: str
+    started_at: str
+    catch_up: bool
+    jobs: Dict[str, str] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    finished_at: Optional[str] = None
+
+
+def _parse_time(value: str) -> dt_time:
+    hour, minute = value.strip().split(":")
+    return dt_time(int(hour), int(minute))
+
+
+def load_schedule_config(path: str = DEFAULT_SCHEDULE_PATH) -> Dict[str, Any]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def build_triggers(config: Dict[str, Any], calendar: Optional[TimePartCalendar] = None) -> List[ScheduleTrigger]:
+    """
+    time_schedules.json에서 트리거 생성
+
+    시간대 구간은 TimePartCalendar.clock_ranges에서 가져와 시간대마다 reflection_time(없으면 종료 시각)에
+    수집/백업/동기화를 실행하고, auto_dashboard_update가 켜져 있으면 dashboard_update_time에 대시보드를
+    갱신합니다. auto_github_sync가 꺼져 있으면 GitHub 수집 단계는 제외합니다.
+
+    Args:
+        config: time_schedules.json 내용
+        calendar: 시간대 달력 (기본값: config의 3_part_schedule로 생성)
+    """
+    settings = config.get("automation_settings", {})
+    schedules = config.get("3_part_schedule", {})
+    calendar = calendar or TimePartCalendar.from_schedule(schedules)
+    part_jobs = tuple(
+        job for job in TIME_PART_JOBS
+        if job != "github_collection" or settings.get("auto_github_sync", True)
+    )
+
+    triggers = []
+    for time_part, clock_range in calendar.clock_ranges(by="code").items():
+        name = TIME_PART_OPTIONS[time_part].split(" ", 1)[1]
+        boundary = schedules.get(name, {}).get("reflection_time") or clock_range["end"]
+        triggers.append(ScheduleTrigger(
+            key=f"{time_part}_boundary",
+            at=_parse_time(boundary),
+            jobs=part_jobs,
+            time_part=time_part,
+            description=f"{name} 종료 ({clock_range['start']}~{clock_range['end']})"
+        ))
+
+    if settings.get("auto_dashboard_update", True) and settings.get("dashboard_update_time"):
+        triggers.append(ScheduleTrigger(
+            key="dashboard_refresh",
+            at=_parse_time(settings["dashboard_update_time"]),
+            jobs=DASHBOARD_JOBS,
+            description="일일 대시보드 갱신"
+        ))
+
+    return sorted(triggers, key=lambda trigger: trigger.at)
+
+
+class TimePartScheduler:
+    """시간대 경계 작업을 실행하는 장기 실행 스케줄러"""
+
+    def __init__(self, jobs: Dict[str, SchedulerJob], triggers: List[ScheduleTrigger],
+                 state_path: Optional[str] = None,
+                 jitter_seconds: float = DEFAULT_JITTER_SECONDS,
+                 catch_up_hours: float = DEFAULT_CATCH_UP_HOURS,
+                 max_workers: int = 4,
+                 clock: Optional[Callable[[], datetime]] = None,
+                 rng: Optional[random.Random] = None,
+                 logger: Optional[ThreePartLogger] = None,
+                 calendar: Optional[TimePartCalendar] = None):
+        """
+        Args:
+            jobs: 작업 이름 → 작업 정의
+            triggers: 실행 시각과 작업 묶음
+            state_path: 트리거별 마지막 처리 시각 저장 파일 (재시작 시 놓친 실행 판단)
+            jitter_seconds: 실행 시각을 늦출 최대 무작위 시간
+            catch_up_hours: 이 시간 안에 놓친 실행만 재시작 시 보충
+            max_workers: 동시에 실행할 트리거 수
+            clock: 현재 시각 함수 (기본값: 달력 시간대의 현재 시각)
+            calendar: 트리거 시각의 기준 시간대를 가진 달력 (기본값: 공유 달력)
+        """
+        missing = {job for trigger in triggers for job in trigger.jobs} - set(jobs)
+        if missing:
+            raise ValueError(f"정의되지 않은 작업: {sorted(missing)}")
+
+        self.jobs = jobs
+        self.triggers = {trigger.key: trigger for trigger in triggers}
+        self.state_path = state_path or DEFAULT_STATE_PATH
+        self.jitter_seconds = jitter_seconds
+        self.catch_up_window = timedelta(hours=catch_up_hours)
+        self.calendar = calendar or get_time_part_calendar()
+        self.tz = self.calendar.tz
+        self.clock = clock or self.calendar.now
+        self.rng = rng or random.Random()
+        self.logger = logger or ThreePartLogger(name="scheduler_daemon")
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scheduler")
+        self.job_slots = {name: threading.BoundedSemaphore(job.max_concurrent) for name, job in jobs.items()}
+        self.history: List[Dict[str, Any]] = []
+        self.stats = {"runs": 0, "catch_up_runs": 0, "skipped_overlap": 0, "missed": 0, "job_failures": 0}
+        self._jitter: Dict[Tuple[str, datetime], float] = {}
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+
+        self.last_handled = self._load_state()
+
+    def _local(self, moment: datetime) -> datetime:
+        """달력 시간대의 aware 시각으로 변환 (naive 시각은 달력 시간대의 현지 시각으로 봄)"""
+        if moment.tzinfo is None:
+            return moment.replace(tzinfo=self.tz)
+        return moment.astimezone(self.tz)
+
+    def _now(self, now: Optional[datetime] = None) -> datetime:
+        return self._local(now or self.clock())
+
+    def _load_state(self) -> Dict[str, datetime]:
+        # 처음 실행이거나 새로 추가된 트리거는 지금 이전 시각을 보충하지 않음
+        now = self._now()
+        last_handled = {key: now for key in self.triggers}
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            for key, value in state.get("last_handled", {}).items():
+                if key in last_handled:
+                    last_handled[key] = self._local(datetime.fromisoformat(value))
+        except (FileNotFoundError, ValueError):
+            pass
+        return last_handled
+
+    def _save_state(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.state_path)), exist_ok=True)
+        temp_path = f"{self.state_path}.tmp"
+        with self._lock:
+            state = {
+                "last_handled": {key: value.isoformat() for key, value in self.last_handled.items()},
+                "stats": dict(self.stats),
+                "history": self.history[-HISTORY_LIMIT:]
+            }
+        with self._save_lock:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.state_path)
+
+    def _jitter_for(self, trigger: ScheduleTrigger, occurrence: datetime) -> timedelta:
+        key = (trigger.key, occurrence)
+        if key not in self._jitter:
+            self._jitter[key] = self.rng.uniform(0, self.jitter_seconds) if self.jitter_seconds > 0 else 0.0
+        return timedelta(seconds=self._jitter[key])
+
+    def _latest_occurrence(self, trigger: ScheduleTrigger, now: datetime) -> datetime:
+        occurrence = trigger.occurrence_on(now.date(), self.tz)
+        return occurrence if occurrence <= now else trigger.occurrence_on(now.date() - timedelta(days=1), self.tz)
+
+    def _next_occurrence(self, trigger: ScheduleTrigger, now: datetime) -> datetime:
+        """오늘 예정 시각이 이미 처리됐으면 내일 예정 시각"""
+        occurrence = trigger.occurrence_on(now.date(), self.tz)
+        last = self.last_handled.get(trigger.key)
+        if last is not None and occurrence <= last:
+            occurrence = trigger.occurrence_on(now.date() + timedelta(days=1), self.tz)
+        return occurrence
+
+    def due_triggers(self, now: Optional[datetime] = None) -> List[Tuple[ScheduleTrigger, datetime, bool]]:
+        """
+        실행할 트리거 목록 (트리거, 예정 시각, 보충 실행 여부)
+
+        마지막 처리 이후 여러 번 놓쳤어도 가장 최근 한 번만 실행합니다.
+        """
+        now = self._now(now)
+        due = []
+        for trigger in self.triggers.values():
+            occurrence = self._latest_occurrence(trigger, now)
+            last = self.last_handled.get(trigger.key)
+            if last is not None and occurrence <= last:
+                continue
+
+            if now - occurrence > self.catch_up_window:
+                self.logger.warning(f"보충 기간을 넘긴 실행 건너뜀 [{trigger.key}]: {occurrence.isoformat()}")
+                self.last_handled[trigger.key] = occurrence
+                self.stats["missed"] += 1
+                continue
+
+            jitter = self._jitter_for(trigger, occurrence)
+            catch_up = now - occurrence > timedelta(seconds=self.jitter_seconds) + timedelta(minutes=5)
+            if catch_up or occurrence + jitter <= now:
+                due.append((trigger, occurrence, catch_up))
+        return due
+
+    def seconds_until_next(self, now: Optional[datetime] = None) -> float:
+        """다음 트리거 실행 시각(jitter 포함)까지 남은 시간"""
+        now = self._now(now)
+        upcoming = []
+        for trigger in self.triggers.values():
+            occurrence = self._next_occurrence(trigger, now)
+            upcoming.append(occurrence + self._jitter_for(trigger, occurrence))
+        return max(0.0, (min(upcoming) - now).total_seconds()) if upcoming else DEFAULT_POLL_SECONDS
+
+    def run_pending(self, now: Optional[datetime] = None) -> List[Future]:
+        """예정 시각이 지난 트리거를 작업 스레드로 실행"""
+        futures = []
+        for trigger, occurrence, catch_up in self.due_triggers(now):
+            with self._lock:
+                self.last_handled[trigger.key] = occurrence
+                self._jitter.pop((trigger.key, occurrence), None)
+                self.stats["runs"] += 1
+                self.stats["catch_up_runs"] += 1 if catch_up else 0
+
+            if catch_up:
+                self.logger.info(f"놓친 실행 보충 [{trigger.key}]: {occurrence.isoformat()}")
+            future = self.executor.submit(self.run_trigger, trigger, occurrence, catch_up)
+            futures.append(future)
+
+        if futures:
+            self._save_state()
+        return futures
+
+    def run_trigger(self, trigger: ScheduleTrigger, scheduled_at: Optional[datetime] = None,
+                    catch_up: bool = False) -> TriggerRun:
+        """트리거의 작업을 순서대로 실행 (작업이 이미 실행 중이면 그 작업은 건너뜀)"""
+        scheduled_at = self._now(scheduled_at)
+        run = TriggerRun(trigger=trigger.key, scheduled_at=scheduled_at.isoformat(),
+                         started_at=self._now().isoformat(), catch_up=catch_up)
+        context = {
+            "trigger": trigger.key,
+            "time_part": trigger.time_part,
+            "time_part_label": TIME_PART_OPTIONS.get(trigger.time_part),
+            "scheduled_at": scheduled_at,
+            "catch_up": catch_up
+        }
+
+        for job_name in trigger.jobs:
+            slot = self.job_slots[job_name]
+            if not slot.acquire(blocking=False):
+                self.logger.warning(f"이전 실행이 진행 중이라 건너뜀 [{job_name}]")
+                run.jobs[job_name] = "skipped_overlap"
+                with self._lock:
+                    self.stats["skipped_overlap"] += 1
+                continue
+
+            try:
+                self.logger.info(f"작업 시작 [{trigger.key}/{job_name}]")
+                self.jobs[job_name].func(context)
+                run.jobs[job_name] = "success"
+            except Exception as e:
+                # 앞 단계가 실패해도 뒤 단계(대기 중인 쓰기 전송 등)는 계속 진행
+                self.logger.error(f"작업 실패 [{trigger.key}/{job_name}]: {str(e)}")
+                run.jobs[job_name] = "failed"
+                run.errors[job_name] = str(e)
+                with self._lock:
+                    self.stats["job_failures"] += 1
+            finally:
+                slot.release()
+
+        run.finished_at = self._now().isoformat()
+        with self._lock:
+            self.history.append(vars(run))
+        self._save_state()
+        return run
+
+    def run_forever(self, stop_event: Optional[threading.Event] = None,
+                    poll_seconds: float = DEFAULT_POLL_SECONDS):
+        """stop_event가 설정될 때까지 다음 실행 시각에 맞춰 대기하며 반복 실행"""
+        stop_event = stop_event or threading.Event()
+        self.logger.info(f"스케줄러 시작: 트리거 {len(self.triggers)}개")
+
+        while not stop_event.is_set():
+            self.run_pending()
+            stop_event.wait(min(poll_seconds, self.seconds_until_next()))
+
+        self.logger.info("스케줄러 종료 중: 실행 중인 작업 완료 대기")
+        self.executor.shutdown(wait=True)
+        self._save_state()
+
+    def upcoming(self, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """트리거별 다음 예정 시각"""
+        now = self._now(now)
+        result = []
+        for trigger in self.triggers.values():
+            occurrence = self._next_occurrence(trigger, now)
+            result.append({
+                "trigger": trigger.key,
+                "next_run": occurrence.isoformat(),
+                "jobs": list(trigger.jobs),
+                "description": trigger.description
+            })
+        return sorted(result, key=lambda item: item["next_run"])
+
+
+class _DefaultJobs:
+    """기본 작업 구현 (데몬 프로세스 안에서 한 번만 초기화해 재사용)"""
+
+    def __init__(self, logger: Optional[ThreePartLogger] = None):
+        self.logger = logger or ThreePartLogger(name="scheduler_daemon")
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, name: str, factory: Callable[[], Any]) -> Any:
+        with self._lock:
+            if name not in self._instances:
+                self._instances[name] = factory()
+            return self._instances[name]
+
+    def github_collection(self, context: Dict[str, Any]):
+        from src.notion_automation.scripts.github_realtime_collector import GitHubRealtimeCollector
+        from src.notion_automation.utils.github_activity_store import GitHubActivityStore, DEFAULT_ACTIVITY_DB
+
+        def create_collector():
+            # webhook 수신기가 돌고 있으면 API 폴링 대신 수신 결과를 읽음
+            store = GitHubActivityStore() if os.path.exists(DEFAULT_ACTIVITY_DB) else None
+            return GitHubRealtimeCollector(activity_store=store)
+
+        collector = self._get("collector", create_collector)
+        result = collector.collect_realtime_github_data(
+            target_date=context["scheduled_at"].date(),
+            specific_timepart=context["time_part_label"]
+        )
+        if not result.get("collection_success"):
+            raise RuntimeError(result.get("error_message", "GitHub 수집 실패"))
+        return result
+
+    def local_persistence(self, context: Dict[str, Any]):
+        from src.notion_automation.optimization.backup_sync_system import ThreePartBackupSystem
+        backup_system = self._get("backup", ThreePartBackupSystem)
+        return backup_system.create_daily_backup(context["scheduled_at"].strftime("%Y-%m-%d"))
+
+    def notion_sync(self, context: Dict[str, Any]):
+        from src.notion_automation.utils.reflection_outbox import ReflectionOutbox, OutboxFlusher, default_senders
+
+        def create_flusher():
+            senders = default_senders(os.getenv("NOTION_3PART_DATABASE_ID"))
+            return OutboxFlusher(ReflectionOutbox(), senders)
+
+        flusher = self._get("flusher", create_flusher)
+        pending = flusher.drain(timeout=120.0)
+        if pending and not flusher.senders:
+            self.logger.warning(f"전송 대상(NOTION_API_TOKEN / NOTION_3PART_DATABASE_ID)이 설정되지 않아 대기 항목 {pending}건을 보내지 못함")
+        elif pending:
+            self.logger.warning(f"Notion 동기화 후 대기 항목 {pending}건 남음")
+        return pending
+
+    def dashboard_refresh(self, context: Dict[str, Any]):
+        from src.notion_automation.dashboard.create_3part_dashboard import ThreePartDashboard
+        dashboard = self._get("dashboard", ThreePartDashboard)
+        return dashboard.create_main_3part_dashboard()
+
+
+def build_default_jobs() -> Dict[str, SchedulerJob]:
+    """GitHub 수집 / 로컬 백업 / Notion 동기화 / 대시보드 갱신 작업"""
+    implementations = _DefaultJobs()
+    return {
+        name: SchedulerJob(name, getattr(implementations, name))
+        for name in TIME_PART_JOBS + DASHBOARD_JOBS
+    }
+
+
+def create_scheduler(config_path: str = DEFAULT_SCHEDULE_PATH, **kwargs) -> TimePartScheduler:
+    calendar = get_time_part_calendar(config_path)
+    triggers = build_triggers(load_schedule_config(config_path), calendar)
+    return TimePartScheduler(build_default_jobs(), triggers, calendar=calendar, **kwargs)
+
+
+def main():
+    """스케줄러 데몬 실행"""
+    parser = argparse.ArgumentParser(description="3-Part 시간대 스케줄러 데몬")
+    parser.add_argument("--config", default=DEFAULT_SCHEDULE_PATH, help="time_schedules.json 경로")
+    parser.add_argument("--state", default=DEFAULT_STATE_PATH, help="스케줄러 상태 파일 경로")
+    parser.add_argument("--jitter", type=float, default=DEFAULT_JITTER_SECONDS, help="최대 실행 지연(초)")
+    parser.add_argument("--list", action="store_true", help="다음 실행 예정 시각 출력")
+    parser.add_argument("--once", action="store_true", help="지금 실행할 작업만 처리하고 종료")
+    parser.add_argument("--run", metavar="TRIGGER", help="지정한 트리거를 즉시 실행")
+    args = parser.parse_args()
+
+    scheduler = create_scheduler(args.config, state_path=args.state, jitter_seconds=args.jitter)
+
+    if args.list:
+        for item in scheduler.upcoming():
+            print(f"⏰ {item['next_run']}  {item['trigger']}: {', '.join(item['jobs'])} ({item['description']})")
+        return
+
+    if args.run:
+        if args.run not in scheduler.triggers:
+            print(f"❌ 알 수 없는 트리거: {args.run} (사용 가능: {', '.join(scheduler.triggers)})")
+            return
+        run = scheduler.run_trigger(scheduler.triggers[args.run])
+        print(json.dumps(vars(run), ensure_ascii=False, indent=2))
+        return
+
+    if args.once:
+        for future in scheduler.run_pending():
+            future.result()
+        scheduler.executor.shutdown(wait=True)
+        return
+
+    stop_event = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop_event.set())
+    scheduler.run_forever(stop_event)
+
+
+if __name__ == "__main__":
+    main()
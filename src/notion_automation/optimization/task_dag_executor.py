@@ -0,0 +1,198 @@
+"""
+3-Part 대시보드 섹션 빌드용 DAG 실행기
+
+섹션(작업)마다 의존성을 선언하면 의존성이 해결된 작업부터 동시에 실행합니다.
+파일/Notion I/O 작업은 스레드 풀에서, 무거운 분석 작업은 프로세스 풀에서
+실행하며 섹션별 소요 시간을 기록합니다.
+"""
+
+import multiprocessing
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Callable, Sequence
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+
+TASK_KINDS = ("thread", "process")
+
+
+class DAGTask:
+    """DAG 작업 정의"""
+
+    __slots__ = ("name", "func", "dependencies", "kind")
+
+    def __init__(self, name: str, func: Callable, dependencies: Sequence[str] = (), kind: str = "thread"):
+        if kind not in TASK_KINDS:
+            raise ValueError(f"지원하지 않는 작업 유형: {kind} (thread/process 중 선택)")
+
+        self.name = name
+        self.func = func
+        self.dependencies = tuple(dependencies)
+        self.kind = kind
+
+
+class TaskDAGExecutor:
+    """의존성 기반 동시 작업 실행기"""
+
+    def __init__(self, max_threads: int = 4, max_processes: int = 2,
+                 logger: Optional[ThreePartLogger] = None):
+        """
+        DAG 실행기 초기화
+
+        Args:
+            max_threads: I/O 작업용 스레드 수
+            max_processes: 분석 작업용 프로세스 수
+            logger: 로깅 시스템 (선택사항)
+        """
+        self.logger = logger or ThreePartLogger(name="dag_executor")
+        self.max_threads = max_threads
+        self.max_processes = max_processes
+        self.tasks: Dict[str, DAGTask] = {}
+        self.timings: Dict[str, Dict[str, Any]] = {}
+        self.total_seconds = 0.0
+
+    def add_task(self, name: str, func: Callable, dependencies: Sequence[str] = (), kind: str = "thread") -> "TaskDAGExecutor":
+        """
+        작업 등록
+
+        작업 함수는 의존 작업의 결과를 선언 순서대로 위치 인자로 받습니다.
+        process 작업의 함수와 인자는 pickle 가능해야 합니다.
+
+        Args:
+            name: 작업 이름
+            func: 실행할 함수
+            dependencies: 먼저 끝나야 하는 작업 이름 목록
+            kind: "thread" (I/O) 또는 "process" (CPU 분석)
+        """
+        if name in self.tasks:
+            raise ValueError(f"이미 등록된 작업: {name}")
+
+        self.tasks[name] = DAGTask(name, func, dependencies, kind)
+        return self
+
+    def _topological_order(self) -> List[str]:
+        """의존성 검증 및 위상 정렬"""
+        for task in self.tasks.values():
+            for dependency in task.dependencies:
+                if dependency not in self.tasks:
+                    raise ValueError(f"{task.name} 작업의 의존성 {dependency}이(가) 등록되지 않았습니다")
+
+        indegree = {name: len(task.dependencies) for name, task in self.tasks.items()}
+        ready = [name for name, count in indegree.items() if count == 0]
+        order = []
+
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for other in self.tasks.values():
+                if name in other.dependencies:
+                    indegree[other.name] -= 1
+                    if indegree[other.name] == 0:
+                        ready.append(other.name)
+
+        if len(order) != len(self.tasks):
+            cyclic = sorted(set(self.tasks) - set(order))
+            raise ValueError(f"순환 의존성이 있습니다: {', '.join(cyclic)}")
+
+        return order
+
+    def run(self) -> Dict[str, Any]:
+        """
+        등록된 작업을 의존성 순서에 따라 동시에 실행
+
+        실패한 작업의 결과는 None이며, 이에 의존하는 작업은 건너뜁니다.
+
+        Returns:
+            작업 이름별 결과 딕셔너리
+        """
+        order = self._topological_order()
+
+        results: Dict[str, Any] = {}
+        status: Dict[str, str] = {name: "pending" for name in self.tasks}
+        self.timings = {}
+        total_start = time.perf_counter()
+
+        uses_processes = any(task.kind == "process" for task in self.tasks.values())
+        thread_pool = ThreadPoolExecutor(max_workers=self.max_threads)
+        # 스레드가 실행 중인 상태에서 fork하면 락이 복제될 수 있으므로 spawn 사용
+        process_pool = ProcessPoolExecutor(
+            max_workers=self.max_processes,
+            mp_context=multiprocessing.get_context("spawn")
+        ) if uses_processes else None
+
+        running = {}
+
+        try:
+            while True:
+                # 의존 작업이 실패/건너뜀이면 함께 건너뜀 (위상 순서로 돌아 손자 작업까지 한 번에 전파)
+                for name in order:
+                    task = self.tasks[name]
+                    if status[name] != "pending":
+                        continue
+                    if any(status[dep] in ("failed", "skipped") for dep in task.dependencies):
+                        status[name] = "skipped"
+                        results[name] = None
+                        self.timings[name] = {"kind": task.kind, "status": "skipped", "duration_seconds": 0.0}
+                        self.logger.warning(f"{name} 작업 건너뜀 (의존 작업 실패)")
+
+                # 준비된 작업 제출
+                for name, task in self.tasks.items():
+                    if status[name] != "pending":
+                        continue
+                    if all(status[dep] == "done" for dep in task.dependencies):
+                        args = [results[dep] for dep in task.dependencies]
+                        pool = process_pool if task.kind == "process" else thread_pool
+                        future = pool.submit(task.func, *args)
+                        running[future] = (name, time.perf_counter())
+                        status[name] = "running"
+
+                if not running:
+                    break
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, started = running.pop(future)
+                    duration = time.perf_counter() - started
+                    task = self.tasks[name]
+
+                    try:
+                        results[name] = future.result()
+                        status[name] = "done"
+                    except Exception as e:
+                        results[name] = None
+                        status[name] = "failed"
+                        self.logger.error(f"{name} 작업 실패: {str(e)}")
+
+                    self.timings[name] = {
+                        "kind": task.kind,
+                        "status": status[name],
+                        "duration_seconds": round(duration, 4)
+                    }
+                    self.logger.log_performance(f"DAG 작업 {name}", duration)
+        finally:
+            thread_pool.shutdown(wait=True)
+            if process_pool is not None:
+                process_pool.shutdown(wait=True)
+
+        stranded = [name for name in order if status[name] == "pending"]
+        if stranded:
+            raise RuntimeError(f"실행되지 않은 작업이 남아 있습니다: {', '.join(stranded)}")
+
+        self.total_seconds = time.perf_counter() - total_start
+        return results
+
+    def get_timing_breakdown(self) -> Dict[str, Any]:
+        """마지막 실행의 작업별 소요 시간 요약"""
+        durations = [timing["duration_seconds"] for timing in self.timings.values()]
+        return {
+            "tasks": dict(self.timings),
+            "total_seconds": round(self.total_seconds, 4),
+            "sequential_seconds": round(sum(durations), 4),
+            "slowest_task": max(self.timings, key=lambda k: self.timings[k]["duration_seconds"]) if self.timings else None,
+            "measured_at": datetime.now().isoformat()
+        }
@@ -20,6 +20,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
 
 # 로거 설정
 from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.reflection_outbox import ReflectionOutbox, OutboxFlusher, default_senders
+from src.notion_automation.dashboard.reflection_ingest import ingest_reflection_file
 
 logger = ThreePartLogger("evening_reflection")
 
@@ -39,6 +41,10 @@ class EveningReflectionInput:
         self.end_time = "22:00"
         self.current_date = date.today()
         
+        # 원격 저장은 outbox에 기록한 뒤 백그라운드에서 전송
+        self.outbox = ReflectionOutbox()
+        self.flusher = OutboxFlusher(self.outbox, default_senders(self.database_id))
+        
         # 저녁 특화 질문 정의 (자기주도학습 중심)
         self.questions = {
             "study_plan": {
@@ -372,19 +378,78 @@ class EveningReflectionInput:
             return 70  # 기본 점수
     
     def save_to_notion(self, user_data: Dict[str, Any], github_data: Dict[str, Any], score: int) -> bool:
-        """Notion 데이터베이스에 저장 (시뮬레이션)"""
+        """Notion 데이터베이스 저장 (outbox에 기록 후 백그라운드 전송)"""
         logger.info("Notion DB 입력 시작")
         
         try:
-            # 실제 환경에서는 여기서 Notion MCP 호출
-            print("💾 Notion DB 저장 시뮬레이션...")
+            notion_properties = {
+                "reflection_date": {
+                    "date": {"start": self.current_date.isoformat()}
+                },
+                "time_part": {
+                    "select": {"name": self.time_part}
+                },
+                "start_time": {
+                    "rich_text": [{"text": {"content": self.start_time}}]
+                },
+                "end_time": {
+                    "rich_text": [{"text": {"content": self.end_time}}]
+                },
+                "subject": {
+                    "rich_text": [{"text": {"content": user_data.get("study_subjects", "")}}]
+                },
+                "condition": {
+                    "select": {"name": user_data.get("condition", "😐 보통")}
+                },
+                "learning_hours": {
+                    "number": user_data.get("learning_hours", 2.0)
+                },
+                "key_learning": {
+                    "rich_text": [{"text": {"content": user_data.get("productive_activities", "")}}]
+                },
+                "challenges": {
+                    "rich_text": [{"text": {"content": user_data.get("challenges", "")}}]
+                },
+                "reflection": {
+                    "rich_text": [{"text": {"content": user_data.get("overall_reflection", "")}}]
+                },
+                "github_commits": {
+                    "number": github_data.get("commits", 0)
+                },
+                "github_prs": {
+                    "number": github_data.get("prs", 0)
+                },
+                "github_issues": {
+                    "number": github_data.get("issues", 0)
+                },
+                "time_part_score": {
+                    "number": score
+                }
+            }
+            
+            if user_data.get("memo"):
+                notion_properties["memo"] = {
+                    "rich_text": [{"text": {"content": user_data["memo"]}}]
+                }
+            
+            # 로컬 outbox에 기록하고 바로 반환 (Notion 전송은 백그라운드 flusher가 재시도 포함 처리)
+            self.outbox.enqueue(
+                f"{self.current_date.isoformat()}:evening",
+                {
+                    "properties": notion_properties,
+                    "match": {"reflection_date": self.current_date.isoformat(), "time_part": self.time_part}
+                }
+            )
+            self.flusher.start()
+            
+            print("📮 Notion 전송 대기열에 저장...")
             print(f"   📅 날짜: {self.current_date}")
             print(f"   🌙 시간대: {self.time_part}")
             print(f"   📊 점수: {score}점")
             print(f"   📝 주요 과목: {user_data.get('study_subjects', 'N/A')}")
             print(f"   🎯 목표달성도: {user_data.get('daily_goals', 'N/A')}/10")
             
-            logger.info("Notion DB 입력 완료")
+            logger.info("Notion DB 입력 대기열 저장 완료")
             return True
             
         except Exception as e:
@@ -415,10 +480,25 @@ class EveningReflectionInput:
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(backup_data, f, ensure_ascii=False, indent=2)
         
+        # 시간대별 누적 통계에 바로 반영 (대시보드는 읽기만 함)
+        ingest_reflection_file(filepath, self.time_part, self.current_date, backup_data)
+        
         print(f"💾 로컬 백업 저장: {filepath}")
         logger.info(f"로컬 백업 저장 완료: {filepath}")
         return filepath
 
+    def finish_pending_writes(self, drain_timeout: float = 3.0) -> int:
+        """종료 전 대기 중인 전송을 잠시 기다림 (남은 항목은 다음 실행 때 전송)"""
+        remaining = self.flusher.stop(drain_timeout)
+        if remaining and not self.flusher.senders:
+            # 전송 대상이 없으면 다음 실행에서도 보내지 못하므로 설정 방법을 안내
+            print(f"⚠️ 전송 대상이 설정되지 않아 전송 대기 {remaining}건을 보내지 못했습니다.")
+            print("   NOTION_API_TOKEN / NOTION_3PART_DATABASE_ID 설정(notion-client 설치 포함) 후 "
+                  "python src/notion_automation/utils/reflection_outbox.py --flush 로 전송하세요.")
+        elif remaining:
+            print(f"📮 전송 대기 {remaining}건은 다음 실행 때 자동으로 다시 전송됩니다.")
+        return remaining
+
     def display_summary(self, user_data: Dict[str, Any], github_data: Dict[str, Any], score: int) -> None:
         """입력 완료 요약 출력"""
         print("\n" + "=" * 50)
@@ -466,6 +546,7 @@ class EveningReflectionInput:
             
             # 결과 요약 출력
             self.display_summary(user_data, github_data, score)
+            self.finish_pending_writes()
             
             logger.info("=== 저녁자율학습 반성 입력 완료 ===")
             return True
@@ -22,30 +22,41 @@ sys.path.insert(0, project_root)
 
 from src.notion_automation.utils.logger import ThreePartLogger
 from src.notion_automation.core.github_time_analyzer import GitHubTimeAnalyzer
+from src.notion_automation.utils.shared_rate_limiter import get_rate_limiter
+from src.notion_automation.utils.resilience import resilient
+from src.notion_automation.utils.github_activity_store import GitHubActivityStore
+from src.notion_automation.utils.time_part_calendar import get_time_part_calendar
+from src.notion_automation.utils.segment_log import SegmentLog, open_segment_log
 
 logger = ThreePartLogger("github_realtime_collector")
 
 class GitHubRealtimeCollector:
     """GitHub MCP 실시간 데이터 수집 및 Notion 연동 시스템"""
     
-    def __init__(self, owner: Optional[str] = None, repo: Optional[str] = None):
+    def __init__(self, owner: Optional[str] = None, repo: Optional[str] = None,
+                 activity_store: Optional[GitHubActivityStore] = None,
+                 backup_dir: Optional[str] = None):
         """
         실시간 GitHub 수집기 초기화
         
         Args:
             owner: GitHub 저장소 소유자
             repo: GitHub 저장소 이름
+            activity_store: webhook 활동 저장소 (지정하면 API 폴링 없이 저장소에서 읽음)
+            backup_dir: 로컬 백업(세그먼트 로그) 디렉토리 (기본값: 프로젝트 data/github_realtime)
         """
         self.owner = owner or os.getenv("GITHUB_OWNER", "user")
         self.repo = repo or os.getenv("GITHUB_REPO", "LG_DX_School")
+        self.activity_store = activity_store
         
         # GitHub 시간대별 분석기 초기화
-        self.analyzer = GitHubTimeAnalyzer(owner=self.owner, repo=self.repo)
+        self.analyzer = GitHubTimeAnalyzer(owner=self.owner, repo=self.repo, activity_store=activity_store)
         
         # 실시간 수집 설정
         self.collection_config = {
             "enable_real_github_api": False,  # 실제 GitHub API 사용 여부
-            "use_simulation": True,           # 시뮬레이션 모드 사용
+            "use_webhook_store": activity_store is not None,  # webhook 수신 결과 사용 여부
+            "use_simulation": activity_store is None,         # 시뮬레이션 모드 사용
             "backup_to_local": True,         # 로컬 백업 활성화
             "auto_notion_sync": True,        # Notion 자동 동기화
             "error_retry_count": 3,          # 에러 시 재시도 횟수
@@ -53,7 +64,7 @@ class GitHubRealtimeCollector:
         }
         
         # 백업 디렉토리 생성
-        self.backup_dir = os.path.join(project_root, "data", "github_realtime")
+        self.backup_dir = backup_dir or os.path.join(project_root, "data", "github_realtime")
         os.makedirs(self.backup_dir, exist_ok=True)
         
         logger.info("GitHub 실시간 수집기 초기화 완료")
@@ -71,7 +82,7 @@ class GitHubRealtimeCollector:
             시간대별 GitHub 활동 데이터
         """
         if target_date is None:
-            target_date = datetime.now().date()
+            target_date = get_time_part_calendar().now().date()
         
         logger.info(f"실시간 GitHub 데이터 수집 시작: {target_date}")
         
@@ -117,7 +128,7 @@ class GitHubRealtimeCollector:
                 "total_timeparts": len(collected_data),
                 "data": collected_data,
                 "collection_success": True,
-                "collection_method": "simulation" if self.collection_config["use_simulation"] else "real_api",
+                "collection_method": self._collection_method(),
                 "notes": f"실시간 수집 완료 - {len(collected_data)}개 시간대"
             }
             
@@ -129,31 +140,20 @@ class GitHubRealtimeCollector:
             return self._create_empty_collection_result(target_date, str(e))
 
     def _get_current_timepart(self) -> str:
-        """현재 시간을 기준으로 해당 시간대 반환"""
-        current_hour = datetime.now().hour
-        
-        # 시간대 매핑
-        if 9 <= current_hour < 12:
-            return "🌅 오전수업"
-        elif 13 <= current_hour < 17:
-            return "🌞 오후수업"
-        elif 19 <= current_hour < 22:
-            return "🌙 저녁자율학습"
-        else:
-            # 수업 시간이 아닌 경우 가장 가까운 시간대 반환
-            if current_hour < 9:
-                return "🌅 오전수업"
-            elif current_hour < 13:
-                return "🌅 오전수업"
-            elif current_hour < 19:
-                return "🌞 오후수업"
-            else:
-                return "🌙 저녁자율학습"
+        """현재 시간을 기준으로 해당 시간대 반환 (서버 시간대와 무관하게 달력 시간대 기준)"""
+        return get_time_part_calendar().classify(get_time_part_calendar().now())
+
+    def _collection_method(self) -> str:
+        if self.collection_config["use_webhook_store"]:
+            return "webhook"
+        return "simulation" if self.collection_config["use_simulation"] else "real_api"
 
     def _collect_timepart_activities(self, target_date: date, timepart: str) -> Dict[str, Any]:
         """특정 시간대의 GitHub 활동 수집"""
         try:
-            if self.collection_config["enable_real_github_api"]:
+            if self.collection_config["use_webhook_store"]:
+                return self._collect_webhook_activities(target_date, timepart)
+            elif self.collection_config["enable_real_github_api"]:
                 # 실제 GitHub API 호출 (향후 구현)
                 return self._collect_real_github_activities(target_date, timepart)
             else:
@@ -172,6 +172,16 @@ class GitHubRealtimeCollector:
         # 현재는 기존 분석기 활용
         return self.analyzer.get_time_part_activities(target_date, timepart)
 
+    def _collect_webhook_activities(self, target_date: date, timepart: str) -> Dict[str, Any]:
+        """webhook 수신기가 기록한 활동 조회 (API 호출 없음)"""
+        activities = self.analyzer.get_time_part_activities(target_date, timepart)
+        activities.update({
+            "collection_method": "webhook",
+            "collection_timestamp": datetime.now().isoformat(),
+            "is_realtime": True
+        })
+        return activities
+
     def _collect_simulated_activities(self, target_date: date, timepart: str) -> Dict[str, Any]:
         """시뮬레이션 모드로 GitHub 활동 수집"""
         logger.info(f"시뮬레이션 모드로 {timepart} 활동 수집")
@@ -225,16 +235,8 @@ class GitHubRealtimeCollector:
             return raw_data
 
     def _backup_to_local(self, data: Dict[str, Any], target_date: date, timepart: str):
-        """로컬 파일로 데이터 백업"""
+        """수집 결과를 세그먼트 로그에 추가 (같은 날짜/시간대의 이전 스냅샷은 컴팩션 때 정리)"""
         try:
-            # 파일명 생성
-            timepart_safe = timepart.replace("🌅", "morning").replace("🌞", "afternoon").replace("🌙", "evening")
-            timepart_safe = timepart_safe.replace(" ", "_").replace("자율학습", "study")
-            
-            filename = f"github_realtime_{timepart_safe}_{target_date.strftime('%Y%m%d')}.json"
-            filepath = os.path.join(self.backup_dir, filename)
-            
-            # JSON 형태로 저장
             backup_data = {
                 "backup_info": {
                     "created_at": datetime.now().isoformat(),
@@ -245,18 +247,45 @@ class GitHubRealtimeCollector:
                 "github_data": data
             }
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(backup_data, f, ensure_ascii=False, indent=2)
-            
-            logger.info(f"로컬 백업 완료: {filepath}")
+            seq, offset = self._get_activity_log().append(f"{target_date.isoformat()}|{timepart}", backup_data)
+            logger.info(f"로컬 백업 완료: segment {seq} @ {offset}")
             
         except Exception as e:
             logger.error(f"로컬 백업 실패: {str(e)}")
 
+    def _get_activity_log(self) -> SegmentLog:
+        return open_segment_log(os.path.join(self.backup_dir, "segments"))
+
+    def load_backup_history(self, start_date: Optional[date] = None, end_date: Optional[date] = None,
+                            latest_only: bool = True) -> List[Dict[str, Any]]:
+        """
+        로컬 백업 이력을 세그먼트 순서대로 한 번에 재생
+        
+        Args:
+            start_date: 시작 날짜 (포함, 선택사항)
+            end_date: 종료 날짜 (포함, 선택사항)
+            latest_only: 날짜/시간대별 최신 스냅샷만 반환할지 여부
+            
+        Returns:
+            백업 레코드 목록 (backup_info + github_data)
+        """
+        history = []
+        try:
+            for key, record in self._get_activity_log().replay(latest_only=latest_only):
+                record_date = date.fromisoformat(key.split("|", 1)[0])
+                if start_date and record_date < start_date:
+                    continue
+                if end_date and record_date > end_date:
+                    continue
+                history.append(record)
+        except Exception as e:
+            logger.error(f"로컬 백업 이력 조회 실패: {str(e)}")
+        return history
+
     def _create_empty_timepart_data(self, timepart: str) -> Dict[str, Any]:
         """빈 시간대 데이터 생성"""
         return {
-            "date": datetime.now().date().isoformat(),
+            "date": get_time_part_calendar().now().date().isoformat(),
             "time_part": timepart,
             "commits": [],
             "issues": [],
@@ -414,33 +443,36 @@ class GitHubRealtimeCollector:
         if max_retries is None:
             max_retries = self.collection_config["error_retry_count"]
         
-        last_error: Optional[Exception] = None
+        # 같은 토큰을 쓰는 다른 프로세스와 요청 한도 공유
+        rate_limiter = get_rate_limiter("github")
+        attempts = {"count": 0}
         
-        for attempt in range(max_retries + 1):
-            try:
-                logger.info(f"API 호출 시도 {attempt + 1}/{max_retries + 1}")
-                result = operation_func()
-                logger.info("API 호출 성공")
-                return result
-                
-            except Exception as e:
-                last_error = e
-                logger.warning(f"API 호출 실패 (시도 {attempt + 1}): {str(e)}")
-                
-                if attempt < max_retries:
-                    # 지수 백오프 적용
-                    wait_time = 2 ** attempt
-                    logger.info(f"{wait_time}초 대기 후 재시도...")
-                    import time
-                    time.sleep(wait_time)
-                else:
-                    logger.error(f"최대 재시도 횟수 초과. 마지막 에러: {str(e)}")
-        
-        # 모든 재시도 실패
-        if last_error is not None:
-            raise last_error
-        else:
-            raise Exception("알 수 없는 오류로 인한 실패")
+        def attempt_operation():
+            attempts["count"] += 1
+            logger.info(f"API 호출 시도 {attempts['count']}/{max_retries + 1}")
+            rate_limiter.acquire()
+            return operation_func()
+        
+        def log_retry(attempt: int, error: BaseException, delay: float):
+            logger.warning(f"API 호출 실패 (시도 {attempt}): {str(error)}")
+            logger.info(f"{delay:.1f}초 대기 후 재시도...")
+        
+        # 지터 백오프 + GitHub 공용 서킷 브레이커 + 전체 제한 시간
+        policy = resilient(
+            "github",
+            max_attempts=max_retries + 1,
+            deadline_seconds=self.collection_config["api_timeout_seconds"],
+            on_retry=log_retry
+        )
+        
+        try:
+            result = policy.call(attempt_operation)
+        except Exception as e:
+            logger.error(f"API 호출 최종 실패 (시도 {attempts['count']}회): {str(e)}")
+            raise
+        
+        logger.info("API 호출 성공")
+        return result
 
     def get_collection_status(self) -> Dict[str, Any]:
         """수집기 상태 정보 반환"""
@@ -0,0 +1,228 @@
+"""
+GitHub webhook 수신기 (asyncio)
+
+GitHub 저장소 webhook(push, pull_request, issues, pull_request_review)을 받아
+X-Hub-Signature-256 서명을 검증하고, 도착 시각의 시간대로 GitHubActivityStore에 추가합니다.
+수집기는 주기적으로 API를 호출하는 대신 저장소를 읽으므로 활동이 몇 초 안에 반영됩니다.
+
+실행:
+    GITHUB_WEBHOOK_SECRET=... python src/notion_automation/scripts/github_webhook_receiver.py --port 8787
+
+로컬 테스트 (기록해 둔 payload 재전송):
+    python src/notion_automation/scripts/github_webhook_receiver.py --replay push payload.json
+"""
+
+import argparse
+import asyncio
+import hashlib
+import hmac
+import json
+from datetime import datetime
+from typing import Dict, Any, Optional, Tuple, Callable
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.github_activity_store import GitHubActivityStore, DEFAULT_ACTIVITY_DB
+from src.notion_automation.dashboard.activity_summary import DailyActivitySummary, DEFAULT_SUMMARY_DB
+from src.notion_automation.utils.time_part_calendar import get_time_part_calendar
+
+logger = ThreePartLogger("github_webhook_receiver")
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8787
+MAX_BODY_BYTES = 5 * 1024 * 1024  # GitHub webhook payload 상한 (25MB)보다 작게 제한
+READ_TIMEOUT_SECONDS = 10.0
+
+HTTP_STATUS = {200: "OK", 202: "Accepted", 400: "Bad Request", 401: "Unauthorized",
+               404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large"}
+
+
+def sign_payload(secret: str, body: bytes) -> str:
+    """X-Hub-Signature-256 헤더 값 계산"""
+    return "sha256=" + hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    if not signature:
+        return False
+    return hmac.compare_digest(sign_payload(secret, body), signature)
+
+
+class GitHubWebhookReceiver:
+    """asyncio 기반 최소 HTTP 서버로 GitHub webhook 수신"""
+
+    def __init__(self, store: GitHubActivityStore, secret: str, path: str = "/webhook",
+                 clock: Optional[Callable[[], datetime]] = None):
+        """
+        Args:
+            store: 활동을 기록할 저장소
+            secret: GitHub webhook secret (서명 검증용)
+            path: webhook URL 경로
+            clock: 도착 시각 (시간대 배정 기준, 기본값: 달력 시간대의 현재 시각)
+        """
+        if not secret:
+            raise ValueError("GitHub webhook secret이 필요합니다 (GITHUB_WEBHOOK_SECRET)")
+
+        self.store = store
+        self.secret = secret
+        self.path = path
+        self.clock = clock or get_time_part_calendar().now
+        self.stats = {"received": 0, "stored": 0, "duplicate": 0, "ignored": 0, "rejected": 0}
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> Tuple[str, int]:
+        """서버 시작 후 실제 (host, port) 반환 (port=0이면 임의 포트)"""
+        self.server = await asyncio.start_server(self._handle_connection, host, port)
+        address = self.server.sockets[0].getsockname()
+        logger.info(f"GitHub webhook 수신 대기: http://{address[0]}:{address[1]}{self.path}")
+        return address[0], address[1]
+
+    async def stop(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    async def serve_forever(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        await self.start(host, port)
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Tuple[str, str, Dict[str, str], bytes]:
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        method, path, _ = request_line.split(" ", 2)
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1")
+            if line in ("\r\n", "\n", ""):
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        length = int(headers.get("content-length", 0))
+        if length > MAX_BODY_BYTES:
+            raise ValueError("payload too large")
+        body = await reader.readexactly(length) if length else b""
+        return method, path.split("?", 1)[0], headers, body
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            try:
+                method, path, headers, body = await asyncio.wait_for(self._read_request(reader), READ_TIMEOUT_SECONDS)
+            except ValueError as e:
+                status, response = (413, {"error": str(e)}) if "too large" in str(e) else (400, {"error": "bad request"})
+            except (asyncio.TimeoutError, asyncio.IncompleteReadError):
+                status, response = 400, {"error": "incomplete request"}
+            else:
+                status, response = await self.handle_request(method, path, headers, body)
+
+            data = json.dumps(response, ensure_ascii=False).encode("utf-8")
+            writer.write(
+                f"HTTP/1.1 {status} {HTTP_STATUS.get(status, '')}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(data)}\r\n"
+                f"Connection: close\r\n\r\n".encode("latin-1") + data
+            )
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def handle_request(self, method: str, path: str, headers: Dict[str, str],
+                             body: bytes) -> Tuple[int, Dict[str, Any]]:
+        """요청 하나 처리 (HTTP 파싱과 분리해 직접 호출로도 테스트 가능)"""
+        if method == "GET" and path == "/health":
+            return 200, {"status": "ok", "stats": self.stats}
+        if path != self.path:
+            return 404, {"error": "not found"}
+        if method != "POST":
+            return 405, {"error": "method not allowed"}
+
+        self.stats["received"] += 1
+        if not verify_signature(self.secret, body, headers.get("x-hub-signature-256")):
+            self.stats["rejected"] += 1
+            logger.warning("서명 검증 실패한 webhook 요청 거부")
+            return 401, {"error": "invalid signature"}
+
+        event = headers.get("x-github-event", "")
+        if event == "ping":
+            return 200, {"status": "pong"}
+
+        try:
+            payload = json.loads(body.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            return 400, {"error": "invalid json"}
+
+        # SQLite 쓰기가 이벤트 루프를 막지 않도록 작업 스레드에서 기록
+        result = await asyncio.to_thread(
+            self.store.append_event, event, payload, headers.get("x-github-delivery"), self.clock()
+        )
+        self.stats[result["status"]] += 1
+        return (200 if result["status"] == "stored" else 202), result
+
+
+async def replay_payload(url: str, secret: str, event: str, body: bytes,
+                         delivery_id: Optional[str] = None) -> Tuple[int, Dict[str, Any]]:
+    """기록해 둔 payload를 서명해서 수신기에 POST (로컬 테스트용)"""
+    from urllib.parse import urlsplit
+
+    parts = urlsplit(url)
+    reader, writer = await asyncio.open_connection(parts.hostname, parts.port or 80)
+    headers = {
+        "Host": parts.netloc,
+        "Content-Type": "application/json",
+        "Content-Length": str(len(body)),
+        "X-GitHub-Event": event,
+        "X-GitHub-Delivery": delivery_id or hashlib.sha1(body).hexdigest(),
+        "X-Hub-Signature-256": sign_payload(secret, body),
+        "Connection": "close",
+    }
+    request = f"POST {parts.path or '/'} HTTP/1.1\r\n" + "".join(f"{k}: {v}\r\n" for k, v in headers.items()) + "\r\n"
+    writer.write(request.encode("latin-1") + body)
+    await writer.drain()
+
+    status_line = (await reader.readline()).decode("latin-1")
+    response = await reader.read()
+    writer.close()
+    _, _, response_body = response.partition(b"\r\n\r\n")
+    return int(status_line.split(" ")[1]), json.loads(response_body or b"{}")
+
+
+def main():
+    """webhook 수신기 실행 또는 payload 재전송"""
+    parser = argparse.ArgumentParser(description="GitHub webhook 수신기")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--db", default=DEFAULT_ACTIVITY_DB, help="활동 저장소 DB 경로")
+    parser.add_argument("--summary-db", default=DEFAULT_SUMMARY_DB, help="히트맵용 일별 활동 요약 DB 경로")
+    parser.add_argument("--replay", nargs=2, metavar=("EVENT", "PAYLOAD_FILE"),
+                        help="기록한 payload를 실행 중인 수신기에 전송")
+    args = parser.parse_args()
+
+    secret = os.getenv("GITHUB_WEBHOOK_SECRET", "")
+
+    if args.replay:
+        event, payload_file = args.replay
+        with open(payload_file, 'rb') as f:
+            body = f.read()
+        status, response = asyncio.run(
+            replay_payload(f"http://{args.host}:{args.port}/webhook", secret, event, body)
+        )
+        print(f"📨 {status}: {json.dumps(response, ensure_ascii=False)}")
+        return
+
+    store = GitHubActivityStore(args.db, summary=DailyActivitySummary(args.summary_db))
+    receiver = GitHubWebhookReceiver(store, secret)
+    try:
+        asyncio.run(receiver.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        print(f"\n🛑 수신기 종료: {receiver.stats}")
+
+
+if __name__ == "__main__":
+    main()
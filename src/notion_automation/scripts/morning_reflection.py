@@ -20,6 +20,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
 
 # 로거 설정
 from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.reflection_outbox import ReflectionOutbox, OutboxFlusher, default_senders
+from src.notion_automation.dashboard.reflection_ingest import ingest_reflection_file
 
 logger = ThreePartLogger("morning_reflection")
 
@@ -39,6 +41,10 @@ class MorningReflectionInput:
         self.end_time = "12:00"
         self.current_date = date.today()
         
+        # 원격 저장은 outbox에 기록한 뒤 백그라운드에서 전송
+        self.outbox = ReflectionOutbox()
+        self.flusher = OutboxFlusher(self.outbox, default_senders(self.database_id))
+        
         # 오전 특화 질문 정의
         self.questions = {
             "subject": {
@@ -371,9 +377,16 @@ class MorningReflectionInput:
                     "rich_text": [{"text": {"content": user_data["memo"]}}]
                 }
             
-            # 실제 환경에서는 mcp_notion_create-page 호출
-            # 현재는 시뮬레이션으로 성공 처리
-            print(f"💾 Notion DB 저장 시뮬레이션...")
+            # 로컬 outbox에 기록하고 바로 반환 (Notion 전송은 백그라운드 flusher가 재시도 포함 처리)
+            self.outbox.enqueue(
+                f"{self.current_date.isoformat()}:morning",
+                {
+                    "properties": notion_properties,
+                    "match": {"reflection_date": self.current_date.isoformat(), "time_part": self.time_part}
+                }
+            )
+            self.flusher.start()
+            print(f"📮 Notion 전송 대기열에 저장...")
             print(f"   📅 날짜: {self.current_date}")
             print(f"   🌅 시간대: {self.time_part}")
             print(f"   📊 점수: {time_part_score}점")
@@ -382,7 +395,7 @@ class MorningReflectionInput:
             # 로컬 백업도 함께 저장
             self.save_local_backup(user_data, github_data, time_part_score)
             
-            logger.info("Notion DB 입력 완료")
+            logger.info("Notion DB 입력 대기열 저장 완료")
             return True
             
         except Exception as e:
@@ -422,6 +435,9 @@ class MorningReflectionInput:
             with open(filepath, "w", encoding="utf-8") as f:
                 json.dump(backup_data, f, ensure_ascii=False, indent=2)
             
+            # 시간대별 누적 통계에 바로 반영 (대시보드는 읽기만 함)
+            ingest_reflection_file(filepath, self.time_part, self.current_date, backup_data)
+            
             print(f"💾 로컬 백업 저장: {filepath}")
             logger.info(f"로컬 백업 저장 완료: {filepath}")
             return True
@@ -431,6 +447,18 @@ class MorningReflectionInput:
             print(f"❌ 로컬 백업 저장 실패: {e}")
             return False
 
+    def finish_pending_writes(self, drain_timeout: float = 3.0) -> int:
+        """종료 전 대기 중인 전송을 잠시 기다림 (남은 항목은 다음 실행 때 전송)"""
+        remaining = self.flusher.stop(drain_timeout)
+        if remaining and not self.flusher.senders:
+            # 전송 대상이 없으면 다음 실행에서도 보내지 못하므로 설정 방법을 안내
+            print(f"⚠️ 전송 대상이 설정되지 않아 전송 대기 {remaining}건을 보내지 못했습니다.")
+            print("   NOTION_API_TOKEN / NOTION_3PART_DATABASE_ID 설정(notion-client 설치 포함) 후 "
+                  "python src/notion_automation/utils/reflection_outbox.py --flush 로 전송하세요.")
+        elif remaining:
+            print(f"📮 전송 대기 {remaining}건은 다음 실행 때 자동으로 다시 전송됩니다.")
+        return remaining
+
     def display_summary(self, user_data: Dict[str, Any], github_data: Dict[str, Any], success: bool) -> None:
         """오전 반성 입력 결과 요약 출력"""
         print("\n" + "=" * 50)
@@ -475,6 +503,7 @@ class MorningReflectionInput:
             
             # 5. 결과 요약
             self.display_summary(user_data, github_data, success)
+            self.finish_pending_writes()
             
             logger.info("=== 오전수업 반성 입력 완료 ===")
             return success
@@ -18,6 +18,28 @@ project_root = Path(__file__).parent.parent.parent.parent
 sys.path.append(str(project_root))
 
 from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.resilience import (
+    RetryPolicy, CircuitBreaker, CircuitOpenError, DecorrelatedJitterBackoff, DeadlineExceeded
+)
+
+
+def flaky_operation(failures: int, error: Exception):
+    """처음 failures번은 error를 발생시키고 이후 성공하는 호출 (재시도 시나리오용)"""
+    calls = {"count": 0}
+
+    def operation():
+        calls["count"] += 1
+        if calls["count"] <= failures:
+            raise error
+        return {"success": True, "calls": calls["count"]}
+
+    return operation
+
+
+def scenario_policy(**kwargs) -> RetryPolicy:
+    """실제 대기 없이 재시도 경로만 확인하는 정책"""
+    kwargs.setdefault("backoff", DecorrelatedJitterBackoff(base=0.5, cap=30.0))
+    return RetryPolicy(sleep=lambda seconds: None, **kwargs)
 
 class ErrorHandlingTester:
     """에러 핸들링 테스트 클래스"""
@@ -74,21 +96,35 @@ class ErrorHandlingTester:
                 # 각 시나리오별 에러 핸들링 테스트
                 try:
                     # 에러 발생 시뮬레이션
+                    resilience_stats = None
                     if scenario == "연결 타임아웃":
-                        # 타임아웃 에러 처리 로직
-                        time.sleep(0.1)  # 짧은 대기로 시뮬레이션
-                        recovery_result = "재시도 후 성공"
+                        # 두 번 실패 후 성공하는 호출을 지터 백오프로 재시도
+                        policy = scenario_policy(max_attempts=4)
+                        result = policy.call(flaky_operation(2, ConnectionError(scenario)))
+                        assert result["calls"] == 3 and policy.stats["retries"] == 2
+                        resilience_stats = policy.stats
+                        recovery_result = f"재시도 {policy.stats['retries']}회 후 성공"
                     elif scenario == "DNS 해결 실패":
                         # DNS 에러 처리 로직
                         recovery_result = "대체 엔드포인트 사용"
                     else:
-                        # 기타 네트워크 에러 처리
-                        recovery_result = "백오프 후 재시도"
+                        # 계속 실패하는 엔드포인트는 서킷 브레이커가 차단
+                        breaker = CircuitBreaker("scenario:no_response", failure_threshold=3, recovery_timeout=60)
+                        policy = scenario_policy(max_attempts=10, breaker=breaker)
+                        try:
+                            policy.call(flaky_operation(100, ConnectionError(scenario)))
+                            raise AssertionError("서킷 브레이커가 열리지 않음")
+                        except CircuitOpenError:
+                            pass
+                        assert breaker.state == CircuitBreaker.OPEN and policy.stats["attempts"] == 4
+                        resilience_stats = {**policy.stats, "circuit_state": breaker.state}
+                        recovery_result = f"연속 {breaker.failure_threshold}회 실패 후 서킷 브레이커 차단"
                     
                     handled_scenarios.append({
                         "scenario": scenario,
                         "handled": True,
-                        "recovery_action": recovery_result
+                        "recovery_action": recovery_result,
+                        "resilience_stats": resilience_stats
                     })
                     
                 except Exception as e:
@@ -217,7 +253,11 @@ class ErrorHandlingTester:
                 try:
                     # API 제한 에러 핸들링 로직 시뮬레이션
                     if scenario == "분당 호출 제한 초과":
-                        recovery_result = "지수적 백오프 적용 (60초 대기)"
+                        # 재시도 간격이 무작위로 흩어지되 상한(cap)을 넘지 않는지 확인
+                        policy = scenario_policy(max_attempts=6)
+                        policy.call(flaky_operation(5, ConnectionError("429 Too Many Requests")))
+                        assert policy.stats["slept_seconds"] <= 5 * policy.backoff.cap
+                        recovery_result = f"지터 백오프 적용 ({policy.stats['slept_seconds']:.1f}초 대기)"
                     elif scenario == "일일 호출 제한 근접":
                         recovery_result = "호출 빈도 자동 조절"
                     else:
@@ -355,7 +395,15 @@ class ErrorHandlingTester:
                 try:
                     # 타임아웃 에러 핸들링 로직 시뮬레이션
                     if scenario == "요청 타임아웃":
-                        recovery_result = "재시도 간격 증가 (3회 재시도)"
+                        # 다음 재시도가 전체 제한 시간을 넘기면 더 기다리지 않고 중단
+                        policy = scenario_policy(max_attempts=10, deadline_seconds=0.2)
+                        try:
+                            policy.call(flaky_operation(100, TimeoutError(scenario)))
+                            raise AssertionError("데드라인이 적용되지 않음")
+                        except DeadlineExceeded:
+                            pass
+                        assert policy.stats["deadline_exceeded"] == 1
+                        recovery_result = f"데드라인 초과로 {policy.stats['attempts']}회 시도 후 중단"
                     elif scenario == "응답 타임아웃":
                         recovery_result = "타임아웃 시간 연장 후 재시도"
                     else:
@@ -21,6 +21,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
 
 # 로거 설정
 from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.notion_page_decoder import REFLECTION_PAGE_SCHEMA, MISSING, decode_pages
 
 logger = ThreePartLogger("query_filter_tester")
 
@@ -47,6 +48,7 @@ class QueryFilterTester:
         
         # 테스트용 Mock 데이터 생성
         self.mock_data = self._generate_comprehensive_mock_data()
+        self.records = decode_pages(self.mock_data, REFLECTION_PAGE_SCHEMA)
 
     def _generate_comprehensive_mock_data(self) -> List[Dict[str, Any]]:
         """포괄적인 테스트용 Mock 데이터 생성"""
@@ -142,7 +144,7 @@ class QueryFilterTester:
         
         try:
             # 테스트 1: 전체 데이터 조회
-            all_data = self.mock_data
+            all_data = self.records
             if len(all_data) > 0:
                 self.test_results["basic_query"]["passed"] += 1
                 self.test_results["basic_query"]["details"].append(
@@ -159,7 +161,7 @@ class QueryFilterTester:
                 
                 missing_fields = []
                 for field in required_fields:
-                    if field not in sample_record.get("properties", {}):
+                    if getattr(sample_record, field) is MISSING:
                         missing_fields.append(field)
                 
                 if not missing_fields:
@@ -170,17 +172,14 @@ class QueryFilterTester:
                     self.test_results["basic_query"]["details"].append(f"필수 필드 누락: {missing_fields}")
             
             # 테스트 3: 데이터 구조 유효성
-            valid_records = 0
-            for record in all_data:
-                if "id" in record and "properties" in record:
-                    valid_records += 1
+            valid_records = sum(1 for record in all_data if record.page_id)
             
-            if valid_records == len(all_data):
+            if valid_records == len(self.mock_data):
                 self.test_results["basic_query"]["passed"] += 1
                 self.test_results["basic_query"]["details"].append("데이터 구조 유효성 검증 통과")
             else:
                 self.test_results["basic_query"]["failed"] += 1
-                self.test_results["basic_query"]["details"].append(f"유효하지 않은 레코드: {len(all_data) - valid_records}개")
+                self.test_results["basic_query"]["details"].append(f"유효하지 않은 레코드: {len(self.mock_data) - valid_records}개")
                 
         except Exception as e:
             self.test_results["basic_query"]["failed"] += 1
@@ -195,8 +194,8 @@ class QueryFilterTester:
             target_date = (date.today() - timedelta(days=3)).isoformat()
             
             filtered_data = [
-                record for record in self.mock_data
-                if record["properties"].get("reflection_date", {}).get("date", {}).get("start") == target_date
+                record for record in self.records
+                if record.reflection_date == target_date
             ]
             
             if len(filtered_data) == 3:  # 하루에 3개 시간대
@@ -215,8 +214,8 @@ class QueryFilterTester:
             end_date = date.today()
             
             range_filtered_data = [
-                record for record in self.mock_data
-                if start_date.isoformat() <= record["properties"].get("reflection_date", {}).get("date", {}).get("start", "") <= end_date.isoformat()
+                record for record in self.records
+                if start_date.isoformat() <= (record.reflection_date or "") <= end_date.isoformat()
             ]
             
             expected_count = 3 * 3  # 3일 * 3시간대
@@ -234,8 +233,8 @@ class QueryFilterTester:
             # 테스트 3: 주간 데이터 조회
             week_ago = date.today() - timedelta(days=7)
             weekly_data = [
-                record for record in self.mock_data
-                if record["properties"].get("reflection_date", {}).get("date", {}).get("start", "") >= week_ago.isoformat()
+                record for record in self.records
+                if (record.reflection_date or "") >= week_ago.isoformat()
             ]
             
             if len(weekly_data) >= 15:  # 최소 5일 * 3시간대
@@ -260,15 +259,15 @@ class QueryFilterTester:
         try:
             # 테스트 1: 날짜순 정렬 (최신순)
             sorted_by_date = sorted(
-                self.mock_data,
-                key=lambda x: x["properties"].get("reflection_date", {}).get("date", {}).get("start", ""),
+                self.records,
+                key=lambda x: x.reflection_date or "",
                 reverse=True
             )
             
-            if len(sorted_by_date) == len(self.mock_data):
+            if len(sorted_by_date) == len(self.records):
                 # 정렬 순서 확인
                 dates = [
-                    record["properties"].get("reflection_date", {}).get("date", {}).get("start", "")
+                    (record.reflection_date or "")
                     for record in sorted_by_date
                 ]
                 is_sorted_desc = all(dates[i] >= dates[i+1] for i in range(len(dates)-1))
@@ -282,13 +281,13 @@ class QueryFilterTester:
             
             # 테스트 2: 학습 난이도순 정렬
             sorted_by_difficulty = sorted(
-                self.mock_data,
-                key=lambda x: x["properties"].get("learning_difficulty", {}).get("number", 0),
+                self.records,
+                key=lambda x: x.learning_difficulty or 0,
                 reverse=True
             )
             
             difficulties = [
-                record["properties"].get("learning_difficulty", {}).get("number", 0)
+                (record.learning_difficulty or 0)
                 for record in sorted_by_difficulty
             ]
             is_sorted_by_difficulty = all(difficulties[i] >= difficulties[i+1] for i in range(len(difficulties)-1))
@@ -302,14 +301,14 @@ class QueryFilterTester:
                 
             # 테스트 3: 복합 정렬 (날짜 + 시간대)
             sorted_complex = sorted(
-                self.mock_data,
+                self.records,
                 key=lambda x: (
-                    x["properties"].get("reflection_date", {}).get("date", {}).get("start", ""),
-                    x["properties"].get("time_part", {}).get("select", {}).get("name", "")
+                    x.reflection_date or "",
+                    x.time_part or ""
                 )
             )
             
-            if len(sorted_complex) == len(self.mock_data):
+            if len(sorted_complex) == len(self.records):
                 self.test_results["sorting_tests"]["passed"] += 1
                 self.test_results["sorting_tests"]["details"].append("복합 정렬 (날짜+시간대) 성공")
             else:
@@ -330,8 +329,8 @@ class QueryFilterTester:
             for time_part in time_parts:
                 # 특정 시간대 데이터 필터링
                 filtered_data = [
-                    record for record in self.mock_data
-                    if record["properties"].get("time_part", {}).get("select", {}).get("name") == time_part
+                    record for record in self.records
+                    if record.time_part == time_part
                 ]
                 
                 expected_count = 7  # 7일치
@@ -348,8 +347,8 @@ class QueryFilterTester:
             
             # 오전+오후 조합 필터링
             morning_afternoon = [
-                record for record in self.mock_data
-                if record["properties"].get("time_part", {}).get("select", {}).get("name") in ["🌅 오전수업", "🌞 오후수업"]
+                record for record in self.records
+                if record.time_part in ["🌅 오전수업", "🌞 오후수업"]
             ]
             
             expected_combined = 14  # 7일 * 2시간대
@@ -375,9 +374,9 @@ class QueryFilterTester:
         try:
             # 테스트 1: 컨디션 + 학습난이도 복합 필터
             good_condition_high_difficulty = [
-                record for record in self.mock_data
-                if (record["properties"].get("condition", {}).get("select", {}).get("name") == "😊 좋음" and
-                    record["properties"].get("learning_difficulty", {}).get("number", 0) >= 7)
+                record for record in self.records
+                if (record.condition == "😊 좋음" and
+                    (record.learning_difficulty or 0) >= 7)
             ]
             
             self.test_results["complex_filters"]["passed"] += 1
@@ -387,10 +386,10 @@ class QueryFilterTester:
             
             # 테스트 2: 날짜 + 시간대 + 성과 복합 필터
             recent_evening_productive = [
-                record for record in self.mock_data
-                if (record["properties"].get("reflection_date", {}).get("date", {}).get("start", "") >= (date.today() - timedelta(days=3)).isoformat() and
-                    record["properties"].get("time_part", {}).get("select", {}).get("name") == "🌙 저녁자율학습" and
-                    record["properties"].get("commit_count", {}).get("number", 0) > 5)
+                record for record in self.records
+                if ((record.reflection_date or "") >= (date.today() - timedelta(days=3)).isoformat() and
+                    record.time_part == "🌙 저녁자율학습" and
+                    (record.commit_count or 0) > 5)
             ]
             
             self.test_results["complex_filters"]["passed"] += 1
@@ -400,9 +399,9 @@ class QueryFilterTester:
             
             # 테스트 3: 범위 필터 (학습시간 + 이해도)
             optimal_learning = [
-                record for record in self.mock_data
-                if (record["properties"].get("learning_hours", {}).get("number", 0) >= 2.5 and
-                    record["properties"].get("understanding", {}).get("number", 0) >= 7)
+                record for record in self.records
+                if ((record.learning_hours or 0) >= 2.5 and
+                    (record.understanding or 0) >= 7)
             ]
             
             self.test_results["complex_filters"]["passed"] += 1
@@ -424,10 +423,10 @@ class QueryFilterTester:
             
             # 복잡한 쿼리 시뮬레이션
             complex_query_result = [
-                record for record in self.mock_data
-                if (record["properties"].get("learning_difficulty", {}).get("number", 0) >= 5 and
-                    record["properties"].get("understanding", {}).get("number", 0) >= 6 and
-                    record["properties"].get("commit_count", {}).get("number", 0) > 0)
+                record for record in self.records
+                if ((record.learning_difficulty or 0) >= 5 and
+                    (record.understanding or 0) >= 6 and
+                    (record.commit_count or 0) > 0)
             ]
             
             end_time = datetime.now()
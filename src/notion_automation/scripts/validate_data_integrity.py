@@ -21,9 +21,14 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
 
 # 로거 설정
 from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.time_part_calendar import get_time_part_calendar
+from src.notion_automation.utils.notion_page_decoder import NotionPageSchema, MISSING, decode_pages
 
 logger = ThreePartLogger("data_integrity_validator")
 
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+DEFAULT_REPORT_DIR = os.path.join(project_root, "logs")
+
 class DataIntegrityValidator:
     """3-Part DB 데이터 무결성 검증 클래스"""
     
@@ -68,12 +73,11 @@ class DataIntegrityValidator:
             "optimal_flag": {"type": "select", "required": False, "values": ["최적", "보통", "비최적"]}
         }
         
+        # 검증 규칙의 필드/타입으로 페이지 디코더 컴파일
+        self.page_schema = NotionPageSchema.from_field_rules(self.field_rules, name="IntegrityRecord")
+        
         # 시간대별 시간 범위 정의
-        self.time_ranges = {
-            "🌅 오전수업": {"start": "09:00", "end": "12:00"},
-            "🌞 오후수업": {"start": "13:00", "end": "17:00"},
-            "🌙 저녁자율학습": {"start": "19:00", "end": "22:00"}
-        }
+        self.time_ranges = get_time_part_calendar().clock_ranges()
 
     def fetch_all_data(self) -> List[Dict[str, Any]]:
         """데이터베이스에서 모든 데이터 조회"""
@@ -108,11 +112,7 @@ class DataIntegrityValidator:
             current_date = base_date + timedelta(days=i)
             
             for j, time_part in enumerate(["🌅 오전수업", "🌞 오후수업", "🌙 저녁자율학습"]):
-                time_ranges = {
-                    "🌅 오전수업": {"start": "09:00", "end": "12:00"},
-                    "🌞 오후수업": {"start": "13:00", "end": "17:00"},
-                    "🌙 저녁자율학습": {"start": "19:00", "end": "22:00"}
-                }
+                time_ranges = self.time_ranges
                 
                 record = {
                     "id": f"mock_record_{i}_{j}",
@@ -174,248 +174,171 @@ class DataIntegrityValidator:
         
         return mock_data
 
-    def check_duplicates(self, data: List[Dict[str, Any]]) -> None:
+    def check_duplicates(self, records: List[Any]) -> None:
         """중복 데이터 검사"""
         logger.info("중복 데이터 검사 시작...")
         
         seen_combinations = set()
         duplicates_found = []
         
-        for record in data:
-            try:
-                # 날짜와 시간대 조합으로 중복 검사
-                props = record.get("properties", {})
-                
-                # 날짜 추출
-                reflection_date = None
-                if "reflection_date" in props and props["reflection_date"].get("date"):
-                    reflection_date = props["reflection_date"]["date"]["start"]
-                
-                # 시간대 추출
-                time_part = None
-                if "time_part" in props and props["time_part"].get("select"):
-                    time_part = props["time_part"]["select"]["name"]
+        for record in records:
+            # 날짜와 시간대 조합으로 중복 검사
+            reflection_date = record.reflection_date
+            time_part = record.time_part
+            
+            if reflection_date and time_part:
+                combination = (reflection_date, time_part)
                 
-                if reflection_date and time_part:
-                    combination = f"{reflection_date}_{time_part}"
-                    
-                    if combination in seen_combinations:
-                        duplicate_info = {
-                            "date": reflection_date,
-                            "time_part": time_part,
-                            "record_id": record.get("id", "unknown")
-                        }
-                        duplicates_found.append(duplicate_info)
-                        self.validation_results["duplicate_check"]["failed"] += 1
-                        self.validation_results["duplicate_check"]["details"].append(
-                            f"중복 발견: {reflection_date} - {time_part}"
-                        )
-                    else:
-                        seen_combinations.add(combination)
-                        self.validation_results["duplicate_check"]["passed"] += 1
-                        
-            except Exception as e:
-                logger.warning(f"중복 검사 중 레코드 파싱 오류: {e}")
+                if combination in seen_combinations:
+                    duplicate_info = {
+                        "date": reflection_date,
+                        "time_part": time_part,
+                        "record_id": record.page_id or "unknown"
+                    }
+                    duplicates_found.append(duplicate_info)
+                    self.validation_results["duplicate_check"]["failed"] += 1
+                    self.validation_results["duplicate_check"]["details"].append(
+                        f"중복 발견: {reflection_date} - {time_part}"
+                    )
+                else:
+                    seen_combinations.add(combination)
+                    self.validation_results["duplicate_check"]["passed"] += 1
                 
         if duplicates_found:
             logger.warning(f"중복 데이터 {len(duplicates_found)}개 발견")
         else:
             logger.info("중복 데이터 없음 - 통과")
 
-    def validate_field_types(self, data: List[Dict[str, Any]]) -> None:
+    def validate_field_types(self, records: List[Any]) -> None:
         """필드 타입 검증"""
         logger.info("필드 타입 검증 시작...")
         
-        for i, record in enumerate(data):
-            try:
-                props = record.get("properties", {})
-                record_id = record.get("id", f"record_{i}")
+        type_errors = {
+            "date": "날짜 필드 오류",
+            "number": "숫자 필드 오류",
+            "string": "텍스트 필드 오류",
+            "select": "선택 필드 오류"
+        }
+        results = self.validation_results["type_validation"]
+        
+        for i, record in enumerate(records):
+            record_id = record.page_id or f"record_{i}"
+            
+            for field_name, rules in self.field_rules.items():
+                value = getattr(record, field_name)
                 
-                for field_name, rules in self.field_rules.items():
-                    if field_name not in props:
-                        if rules.get("required", False):
-                            self.validation_results["type_validation"]["failed"] += 1
-                            self.validation_results["type_validation"]["details"].append(
-                                f"필수 필드 누락: {field_name} in {record_id[:8]}"
-                            )
-                        continue
-                    
-                    field_data = props[field_name]
-                    expected_type = rules["type"]
-                    
-                    # 타입별 검증
-                    if expected_type == "date":
-                        if not field_data.get("date"):
-                            self.validation_results["type_validation"]["failed"] += 1
-                            self.validation_results["type_validation"]["details"].append(
-                                f"날짜 필드 오류: {field_name} in {record_id[:8]}"
-                            )
-                        else:
-                            self.validation_results["type_validation"]["passed"] += 1
-                            
-                    elif expected_type == "number":
-                        if not field_data.get("number") and field_data.get("number") != 0:
-                            self.validation_results["type_validation"]["failed"] += 1
-                            self.validation_results["type_validation"]["details"].append(
-                                f"숫자 필드 오류: {field_name} in {record_id[:8]}"
-                            )
-                        else:
-                            self.validation_results["type_validation"]["passed"] += 1
-                            
-                    elif expected_type == "string":
-                        if not field_data.get("rich_text") and not field_data.get("title"):
-                            self.validation_results["type_validation"]["failed"] += 1
-                            self.validation_results["type_validation"]["details"].append(
-                                f"텍스트 필드 오류: {field_name} in {record_id[:8]}"
-                            )
-                        else:
-                            self.validation_results["type_validation"]["passed"] += 1
-                            
-                    elif expected_type == "select":
-                        if not field_data.get("select"):
-                            self.validation_results["type_validation"]["failed"] += 1
-                            self.validation_results["type_validation"]["details"].append(
-                                f"선택 필드 오류: {field_name} in {record_id[:8]}"
-                            )
-                        else:
-                            # 허용된 값인지 확인
-                            selected_value = field_data["select"]["name"]
-                            allowed_values = rules.get("values", [])
-                            if allowed_values and selected_value not in allowed_values:
-                                self.validation_results["type_validation"]["failed"] += 1
-                                self.validation_results["type_validation"]["details"].append(
-                                    f"허용되지 않은 값: {field_name}={selected_value} in {record_id[:8]}"
-                                )
-                            else:
-                                self.validation_results["type_validation"]["passed"] += 1
-                    
-            except Exception as e:
-                logger.warning(f"타입 검증 중 오류: {e}")
+                if value is MISSING:
+                    if rules.get("required", False):
+                        results["failed"] += 1
+                        results["details"].append(f"필수 필드 누락: {field_name} in {record_id[:8]}")
+                    continue
+                
+                # 속성은 있지만 값이 비어 있으면 타입 오류
+                if value is None:
+                    results["failed"] += 1
+                    results["details"].append(
+                        f"{type_errors.get(rules['type'], '필드 오류')}: {field_name} in {record_id[:8]}"
+                    )
+                    continue
+                
+                # 선택 필드는 허용된 값인지 확인
+                allowed_values = rules.get("values", []) if rules["type"] == "select" else []
+                if allowed_values and value not in allowed_values:
+                    results["failed"] += 1
+                    results["details"].append(
+                        f"허용되지 않은 값: {field_name}={value} in {record_id[:8]}"
+                    )
+                else:
+                    results["passed"] += 1
 
-    def validate_ranges(self, data: List[Dict[str, Any]]) -> None:
+    def validate_ranges(self, records: List[Any]) -> None:
         """범위 검증"""
         logger.info("숫자 범위 검증 시작...")
         
-        for i, record in enumerate(data):
-            try:
-                props = record.get("properties", {})
-                record_id = record.get("id", f"record_{i}")
+        number_rules = [(field_name, rules) for field_name, rules in self.field_rules.items()
+                        if rules["type"] == "number"]
+        
+        for i, record in enumerate(records):
+            record_id = record.page_id or f"record_{i}"
+            
+            for field_name, rules in number_rules:
+                value = getattr(record, field_name)
+                if value is None or value is MISSING:
+                    continue
                 
-                for field_name, rules in self.field_rules.items():
-                    if rules["type"] == "number" and field_name in props:
-                        field_data = props[field_name]
-                        if field_data.get("number") is not None:
-                            value = field_data["number"]
-                            min_val = rules.get("min")
-                            max_val = rules.get("max")
-                            
-                            if min_val is not None and value < min_val:
-                                self.validation_results["range_validation"]["failed"] += 1
-                                self.validation_results["range_validation"]["details"].append(
-                                    f"최소값 위반: {field_name}={value} < {min_val} in {record_id[:8]}"
-                                )
-                            elif max_val is not None and value > max_val:
-                                self.validation_results["range_validation"]["failed"] += 1
-                                self.validation_results["range_validation"]["details"].append(
-                                    f"최대값 위반: {field_name}={value} > {max_val} in {record_id[:8]}"
-                                )
-                            else:
-                                self.validation_results["range_validation"]["passed"] += 1
-                                
-            except Exception as e:
-                logger.warning(f"범위 검증 중 오류: {e}")
+                min_val = rules.get("min")
+                max_val = rules.get("max")
+                
+                if min_val is not None and value < min_val:
+                    self.validation_results["range_validation"]["failed"] += 1
+                    self.validation_results["range_validation"]["details"].append(
+                        f"최소값 위반: {field_name}={value} < {min_val} in {record_id[:8]}"
+                    )
+                elif max_val is not None and value > max_val:
+                    self.validation_results["range_validation"]["failed"] += 1
+                    self.validation_results["range_validation"]["details"].append(
+                        f"최대값 위반: {field_name}={value} > {max_val} in {record_id[:8]}"
+                    )
+                else:
+                    self.validation_results["range_validation"]["passed"] += 1
 
-    def validate_time_consistency(self, data: List[Dict[str, Any]]) -> None:
+    def validate_time_consistency(self, records: List[Any]) -> None:
         """시간대 일관성 검증"""
         logger.info("시간대 일관성 검증 시작...")
         
-        for i, record in enumerate(data):
-            try:
-                props = record.get("properties", {})
-                record_id = record.get("id", f"record_{i}")
-                
-                # time_part 추출
-                time_part = None
-                if "time_part" in props and props["time_part"].get("select"):
-                    time_part = props["time_part"]["select"]["name"]
-                
-                # start_time, end_time 추출
-                start_time = None
-                end_time = None
-                
-                if "start_time" in props and props["start_time"].get("rich_text"):
-                    start_time = props["start_time"]["rich_text"][0]["text"]["content"]
-                    
-                if "end_time" in props and props["end_time"].get("rich_text"):
-                    end_time = props["end_time"]["rich_text"][0]["text"]["content"]
+        for i, record in enumerate(records):
+            record_id = record.page_id or f"record_{i}"
+            time_part = record.time_part
+            
+            # 시간대 일관성 검사
+            if time_part and time_part in self.time_ranges:
+                expected_start = self.time_ranges[time_part]["start"]
+                expected_end = self.time_ranges[time_part]["end"]
+                start_time = record.start_time or None
+                end_time = record.end_time or None
                 
-                # 시간대 일관성 검사
-                if time_part and time_part in self.time_ranges:
-                    expected_start = self.time_ranges[time_part]["start"]
-                    expected_end = self.time_ranges[time_part]["end"]
-                    
-                    if start_time == expected_start and end_time == expected_end:
-                        self.validation_results["time_consistency"]["passed"] += 1
-                    else:
-                        self.validation_results["time_consistency"]["failed"] += 1
-                        self.validation_results["time_consistency"]["details"].append(
-                            f"시간대 불일치: {time_part} - 예상({expected_start}-{expected_end}) vs 실제({start_time}-{end_time}) in {record_id[:8]}"
-                        )
-                        
-            except Exception as e:
-                logger.warning(f"시간대 일관성 검증 중 오류: {e}")
+                if start_time == expected_start and end_time == expected_end:
+                    self.validation_results["time_consistency"]["passed"] += 1
+                else:
+                    self.validation_results["time_consistency"]["failed"] += 1
+                    self.validation_results["time_consistency"]["details"].append(
+                        f"시간대 불일치: {time_part} - 예상({expected_start}-{expected_end}) vs 실제({start_time}-{end_time}) in {record_id[:8]}"
+                    )
 
-    def validate_cross_fields(self, data: List[Dict[str, Any]]) -> None:
+    def validate_cross_fields(self, records: List[Any]) -> None:
         """교차 필드 검증 (논리적 일관성)"""
         logger.info("교차 필드 검증 시작...")
         
-        for i, record in enumerate(data):
-            try:
-                props = record.get("properties", {})
-                record_id = record.get("id", f"record_{i}")
-                
-                # GitHub 커밋 수와 GitHub 활동 일관성
-                commit_count = None
-                github_commits = None
-                
-                if "commit_count" in props and props["commit_count"].get("number") is not None:
-                    commit_count = props["commit_count"]["number"]
-                    
-                if "github_commits" in props and props["github_commits"].get("number") is not None:
-                    github_commits = props["github_commits"]["number"]
-                
-                if commit_count is not None and github_commits is not None:
-                    # 커밋 수는 일반적으로 같거나 유사해야 함
-                    if abs(commit_count - github_commits) > 5:  # 5개 이상 차이나면 문제
-                        self.validation_results["cross_field_validation"]["failed"] += 1
-                        self.validation_results["cross_field_validation"]["details"].append(
-                            f"GitHub 커밋 수 불일치: commit_count={commit_count} vs github_commits={github_commits} in {record_id[:8]}"
-                        )
-                    else:
-                        self.validation_results["cross_field_validation"]["passed"] += 1
-                
-                # 학습 난이도와 이해도 논리적 관계
-                difficulty = None
-                understanding = None
-                
-                if "learning_difficulty" in props and props["learning_difficulty"].get("number") is not None:
-                    difficulty = props["learning_difficulty"]["number"]
-                    
-                if "understanding" in props and props["understanding"].get("number") is not None:
-                    understanding = props["understanding"]["number"]
-                
-                if difficulty is not None and understanding is not None:
-                    # 매우 어려운 내용(9-10)인데 이해도가 매우 높은(9-10) 경우는 드물어야 함
-                    if difficulty >= 9 and understanding >= 9:
-                        self.validation_results["cross_field_validation"]["failed"] += 1
-                        self.validation_results["cross_field_validation"]["details"].append(
-                            f"논리적 불일치: 높은 난이도({difficulty})에 높은 이해도({understanding}) in {record_id[:8]}"
-                        )
-                    else:
-                        self.validation_results["cross_field_validation"]["passed"] += 1
-                        
-            except Exception as e:
-                logger.warning(f"교차 필드 검증 중 오류: {e}")
+        for i, record in enumerate(records):
+            record_id = record.page_id or f"record_{i}"
+            
+            # GitHub 커밋 수와 GitHub 활동 일관성
+            commit_count = record.commit_count
+            github_commits = record.github_commits
+            
+            if commit_count not in (None, MISSING) and github_commits not in (None, MISSING):
+                # 커밋 수는 일반적으로 같거나 유사해야 함
+                if abs(commit_count - github_commits) > 5:  # 5개 이상 차이나면 문제
+                    self.validation_results["cross_field_validation"]["failed"] += 1
+                    self.validation_results["cross_field_validation"]["details"].append(
+                        f"GitHub 커밋 수 불일치: commit_count={commit_count} vs github_commits={github_commits} in {record_id[:8]}"
+                    )
+                else:
+                    self.validation_results["cross_field_validation"]["passed"] += 1
+            
+            # 학습 난이도와 이해도 논리적 관계
+            difficulty = record.learning_difficulty
+            understanding = record.understanding
+            
+            if difficulty not in (None, MISSING) and understanding not in (None, MISSING):
+                # 매우 어려운 내용(9-10)인데 이해도가 매우 높은(9-10) 경우는 드물어야 함
+                if difficulty >= 9 and understanding >= 9:
+                    self.validation_results["cross_field_validation"]["failed"] += 1
+                    self.validation_results["cross_field_validation"]["details"].append(
+                        f"논리적 불일치: 높은 난이도({difficulty})에 높은 이해도({understanding}) in {record_id[:8]}"
+                    )
+                else:
+                    self.validation_results["cross_field_validation"]["passed"] += 1
 
     def generate_summary(self) -> Dict[str, Any]:
         """검증 결과 요약 생성"""
@@ -459,21 +382,21 @@ class DataIntegrityValidator:
         logger.info("=== 3-Part DB 데이터 무결성 검증 시작 ===")
         
         try:
-            # 1. 데이터 조회
-            data = self.fetch_all_data()
+            # 1. 데이터 조회 후 레코드로 한 번만 디코딩
+            records = decode_pages(self.fetch_all_data(), self.page_schema)
             
-            if not data:
+            if not records:
                 logger.error("검증할 데이터가 없습니다.")
                 return {"error": "No data to validate"}
             
-            logger.info(f"총 {len(data)}개 레코드 검증 시작")
+            logger.info(f"총 {len(records)}개 레코드 검증 시작")
             
             # 2. 각종 검증 실행
-            self.check_duplicates(data)
-            self.validate_field_types(data)
-            self.validate_ranges(data)
-            self.validate_time_consistency(data)
-            self.validate_cross_fields(data)
+            self.check_duplicates(records)
+            self.validate_field_types(records)
+            self.validate_ranges(records)
+            self.validate_time_consistency(records)
+            self.validate_cross_fields(records)
             
             # 3. 결과 요약
             summary = self.generate_summary()
@@ -488,12 +411,21 @@ class DataIntegrityValidator:
             logger.error(f"데이터 무결성 검증 중 치명적 오류: {e}")
             return {"error": str(e)}
 
-def save_validation_report(results: Dict[str, Any], database_id: str) -> str:
-    """검증 결과를 상세 보고서로 저장"""
+def save_validation_report(results: Dict[str, Any], database_id: str, report_dir: Optional[str] = None) -> str:
+    """
+    검증 결과를 상세 보고서로 저장
+
+    Args:
+        results: run_full_validation 결과
+        database_id: 검증한 데이터베이스 ID
+        report_dir: 보고서 디렉토리 (기본값: 프로젝트 루트의 logs)
+    """
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    report_file = f"c:\\Users\\profe\\LG_DX_School\\logs\\data_integrity_validation_report_{timestamp}.md"
+    report_dir = report_dir or DEFAULT_REPORT_DIR
+    report_file = os.path.join(report_dir, f"data_integrity_validation_report_{timestamp}.md")
     
     try:
+        os.makedirs(report_dir, exist_ok=True)
         with open(report_file, "w", encoding="utf-8") as f:
             f.write("# 3-Part Daily Reflection DB 데이터 무결성 검증 보고서\n\n")
             f.write(f"**검증 일시**: {datetime.now().strftime('%Y년 %m월 %d일 %H:%M:%S')}\n")
@@ -1,9 +1,16 @@
 import os
+import sys
 import requests
 from notion_client import Client
 from datetime import datetime, timedelta # Added timedelta
 from dotenv import load_dotenv
 
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.notion_automation.utils.http_transport import get_transport
+from src.notion_automation.utils.shared_rate_limiter import get_rate_limiter
+from src.notion_automation.utils.notion_page_decoder import NotionPageSchema, query_records
+
 load_dotenv()
 
 def get_today_commits(owner, repo, token):
@@ -11,10 +18,21 @@ def get_today_commits(owner, repo, token):
     url = f"https://api.github.com/repos/{owner}/{repo}/commits"
     headers = {'Authorization': f'token {token}', 'Accept': 'application/vnd.github.v3+json'}
     params = {'since': today_start}
-    response = requests.get(url, headers=headers, params=params)
+    # cron으로 함께 도는 다른 스크립트와 GitHub 토큰 한도를 공유
+    get_rate_limiter("github", token).acquire()
+    response = get_transport().get(url, headers=headers, params=params)
     response.raise_for_status()
     return response.json()
 
+# 대시보드 차트에 쓰는 Notion 속성 (속성이 없으면 빈 값과 같이 None)
+DASHBOARD_PAGE_SCHEMA = NotionPageSchema({
+    "date": ("Date", "date"),
+    "commit_count": ("Commit Count", "number"),
+    "difficulty": ("난이도", "number"),
+    "understanding": ("이해도", "number"),
+    "condition": ("컨디션", "number"),
+}, name="DashboardRecord", missing=None)
+
 # New function to get historical Notion data
 def get_historical_notion_data(notion_client, database_id, days=30):
     end_date = datetime.now()
@@ -32,39 +50,16 @@ def get_historical_notion_data(notion_client, database_id, days=30):
         "direction": "ascending"
     }
 
-    results = []
-    has_more = True
-    next_cursor = None
-
-    while has_more:
-        query_response = notion_client.databases.query(
-            database_id=database_id,
-            filter=filter_payload,
-            sorts=[sort_payload],
-            start_cursor=next_cursor
-        )
-        results.extend(query_response["results"])
-        has_more = query_response["has_more"]
-        next_cursor = query_response["next_cursor"]
-
-    parsed_data = []
-    for page in results:
-        props = page["properties"]
-        date = props.get("Date", {}).get("date", {}).get("start")
-        commit_count = props.get("Commit Count", {}).get("number")
-        difficulty = props.get("난이도", {}).get("number") # Assuming '난이도' property exists
-        understanding = props.get("이해도", {}).get("number") # Assuming '이해도' property exists
-        condition = props.get("컨디션", {}).get("number") # Assuming '컨디션' property exists
-
-        if date and commit_count is not None:
-            parsed_data.append({
-                "date": date,
-                "commit_count": commit_count,
-                "difficulty": difficulty,
-                "understanding": understanding,
-                "condition": condition
-            })
-    return parsed_data
+    # 응답 배치를 받는 즉시 레코드로 디코딩 (원시 페이지 JSON은 배치 단위로만 보관)
+    records = query_records(
+        notion_client.databases.query,
+        database_id,
+        DASHBOARD_PAGE_SCHEMA,
+        limiter=get_rate_limiter("notion"),
+        filter=filter_payload,
+        sorts=[sort_payload]
+    )
+    return [record for record in records if record.date and record.commit_count is not None]
 
 # --------------------------------------------------------------------------------------
 # 📝 Notion Dashboard Helper
@@ -88,6 +83,7 @@ def update_notion_dashboard_page(notion_client: Client, page_id: str, mermaid_ch
         mermaid 차트 문자열 리스트 (```mermaid``` 태그 내부 내용만 전달)
     """
 
+    notion_limiter = get_rate_limiter("notion")
     for chart in mermaid_charts:
         # 코드 블록 내에 고유 태그를 삽입해 후처리(중복 제거)할 수도 있음
         code_content = f"""```mermaid\n{chart}\n```"""
@@ -107,6 +103,7 @@ def update_notion_dashboard_page(notion_client: Client, page_id: str, mermaid_ch
         }
 
         try:
+            notion_limiter.acquire()
             notion_client.blocks.children.append(block_id=page_id, children=[code_block_payload])
         except Exception as err:
             print(f"[update_notion_dashboard_page] 차트 추가 실패: {err}")
@@ -126,6 +123,7 @@ def main():
         return
 
     notion = Client(auth=notion_api_token)
+    notion_limiter = get_rate_limiter("notion", notion_api_token)
 
     try:
         commits = get_today_commits(github_user, github_repo, github_token)
@@ -142,6 +140,7 @@ def main():
 
     try:
         # Search for a page with today's date
+        notion_limiter.acquire()
         response = notion.databases.query(
             database_id=database_id,
             filter={
@@ -170,12 +169,14 @@ def main():
         if existing_page:
             # Update the existing page
             page_id = existing_page["id"]
+            notion_limiter.acquire()
             notion.pages.update(page_id=page_id, properties=properties_payload)
             print(f"Successfully updated today's page with {commit_count} commits.")
         else:
             # Create a new page
             properties_payload["Name"] = {"title": [{"text": {"content": page_title}}]}
             properties_payload["Date"] = {"date": {"start": today_str}}
+            notion_limiter.acquire()
             notion.pages.create(
                 parent={"database_id": database_id},
                 properties=properties_payload
@@ -191,7 +192,7 @@ def main():
         mermaid_charts = []
 
         # 1) 전체 학습량 및 진도율 (Pie Chart)
-        total_commits = sum(d["commit_count"] for d in historical_data)
+        total_commits = sum(d.commit_count for d in historical_data)
         # Assuming '완료' is based on total commits, and '진행중', '미시작' are placeholders
         completed_percentage = 0
         if total_commits > 0:
@@ -210,12 +211,12 @@ def main():
         condition_trend = []
         for i, data in enumerate(historical_data):
             day_label = f"Day {i+1}"
-            if data["difficulty"] is not None:
-                difficulty_trend.append(f"{day_label}: {data['difficulty']}")
-            if data["understanding"] is not None:
-                understanding_trend.append(f"{day_label}: {data['understanding']}")
-            if data["condition"] is not None:
-                condition_trend.append(f"{day_label}: {data['condition']}")
+            if data.difficulty is not None:
+                difficulty_trend.append(f"{day_label}: {data.difficulty}")
+            if data.understanding is not None:
+                understanding_trend.append(f"{day_label}: {data.understanding}")
+            if data.condition is not None:
+                condition_trend.append(f"{day_label}: {data.condition}")
 
         if difficulty_trend or understanding_trend or condition_trend:
             trend_chart = """flowchart TD"""
@@ -239,9 +240,9 @@ def main():
         # 3) 일별 학습량 변화 (Flowchart - using commit count as proxy for learning hours)
         daily_learning_trend = []
         for i, data in enumerate(historical_data):
-            date_obj = datetime.strptime(data["date"].split('T')[0], "%Y-%m-%d")
+            date_obj = datetime.strptime(data.date.split('T')[0], "%Y-%m-%d")
             daily_learning_trend.append(date_obj.strftime("%m/%d"))
-            daily_learning_trend.append(f"{data['commit_count']} 커밋") # Using commit count as proxy
+            daily_learning_trend.append(f"{data.commit_count} 커밋") # Using commit count as proxy
 
         if daily_learning_trend:
             # Format for flowchart: H1[7/1] --> H2[2시간] --> H3[7/2] ...
@@ -0,0 +1,317 @@
+"""
+3-Part 분석 결과 저장소 (콘텐츠 주소 기반)
+
+차트/분석/대시보드 결과를 내용 해시로 저장하여 같은 내용은 한 번만 기록합니다.
+결과는 압축된 JSON 객체로 저장하고, (결과 유형, 기간, 생성 시각) → 해시 인덱스는
+SQLite에 보관하여 최신 결과를 인덱스 조회 한 번으로 읽을 수 있습니다.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Iterable, Tuple, Union
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+VolatilePath = Union[str, Tuple[str, ...]]
+
+# 실행할 때마다 바뀌는 값의 위치 (해시 계산에서 제외)
+# 최상위부터의 키 경로이며 "*"는 임의의 리스트 항목/키와 맞음
+VOLATILE_WILDCARD = "*"
+DEFAULT_VOLATILE_PATHS = (
+    ("created_at",),
+    ("metadata", "last_updated"),
+    ("metadata", "next_update"),
+    ("metadata", "section_timings"),
+    ("processing_info", "total_time_seconds"),
+    ("processing_info", "timestamp"),
+    # 대시보드 섹션에 포함된 차트/분석 결과의 생성 시각
+    ("sections", "*", "content", "*", "created_at"),
+)
+
+
+# 인덱스에 등록되기 전의 객체를 보호하는 유예 시간
+OBJECT_GRACE_SECONDS = 300
+
+
+def strip_volatile(data: Any, volatile_paths: Iterable[VolatilePath] = DEFAULT_VOLATILE_PATHS) -> Any:
+    """
+    해시 계산용으로 지정한 경로의 가변 필드(실행 시각/소요 시간)만 제거
+
+    같은 이름이라도 지정하지 않은 위치(예: 결과에 담긴 반성 데이터의 timestamp)는 내용으로 보고 남깁니다.
+    문자열 하나는 최상위 키 경로로 취급합니다.
+    """
+    paths = [(path,) if isinstance(path, str) else tuple(path) for path in volatile_paths]
+
+    def _matches(step, key):
+        return step == VOLATILE_WILDCARD or step == key
+
+    def _strip(value, paths):
+        if not paths:
+            return value
+        if isinstance(value, dict):
+            result = {}
+            for k, v in value.items():
+                if any(len(path) == 1 and _matches(path[0], k) for path in paths):
+                    continue
+                result[k] = _strip(v, [path[1:] for path in paths if len(path) > 1 and _matches(path[0], k)])
+            return result
+        if isinstance(value, list):
+            rest = [path[1:] for path in paths if len(path) > 1 and path[0] == VOLATILE_WILDCARD]
+            return [_strip(v, rest) for v in value]
+        return value
+
+    return _strip(data, paths)
+
+
+def serialize_compact(data: Any) -> bytes:
+    """정렬된 키, 공백 없는 JSON 직렬화"""
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+
+
+class ArtifactStore:
+    """콘텐츠 해시 기반 분석 결과 저장소"""
+
+    def __init__(self, root: Optional[str] = None, keep_last: int = 20, max_age_days: Optional[int] = 30,
+                 volatile_paths: Iterable[VolatilePath] = DEFAULT_VOLATILE_PATHS,
+                 logger: Optional[ThreePartLogger] = None):
+        """
+        저장소 초기화
+
+        Args:
+            root: 저장소 디렉터리 (기본값: data/artifacts)
+            keep_last: (유형, 기간)별로 유지할 최근 인덱스 항목 수 (None이면 제한 없음)
+            max_age_days: 이보다 오래된 인덱스 항목 삭제 (None이면 제한 없음).
+                각 (유형, 기간)의 최신 항목은 항상 유지
+            volatile_paths: 해시 계산에서 제외할 필드 경로 (최상위부터의 키 튜플, *는 임의 항목)
+            logger: 로깅 시스템 (선택사항)
+        """
+        self.root = root or os.path.join(project_root, "data", "artifacts")
+        self.objects_dir = os.path.join(self.root, "objects")
+        self.index_path = os.path.join(self.root, "index.db")
+        self.keep_last = keep_last
+        self.max_age_days = max_age_days
+        self.volatile_paths = tuple(volatile_paths)
+        self.logger = logger or ThreePartLogger(name="artifact_store")
+
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self._initialize_index()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.index_path, timeout=30)
+
+    def _initialize_index(self):
+        """인덱스 테이블 생성"""
+        with self._connect() as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS artifacts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    artifact_type TEXT NOT NULL,
+                    window TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    size_bytes INTEGER NOT NULL
+                )
+            ''')
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_artifacts_latest
+                ON artifacts (artifact_type, window, created_at DESC, id DESC)
+            ''')
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_artifacts_hash ON artifacts (content_hash)
+            ''')
+
+    def content_hash(self, data: Any) -> str:
+        """가변 필드를 제외한 내용의 SHA-256 해시"""
+        return hashlib.sha256(serialize_compact(strip_volatile(data, self.volatile_paths))).hexdigest()
+
+    def object_path(self, content_hash: str) -> str:
+        """해시에 해당하는 객체 파일 경로"""
+        return os.path.join(self.objects_dir, content_hash[:2], f"{content_hash}.json.gz")
+
+    def put(self, artifact_type: str, data: Any, window: str = "") -> str:
+        """
+        결과 저장
+
+        직전 결과와 내용이 같으면 아무것도 기록하지 않고,
+        다른 결과와 내용이 같으면 기존 객체를 재사용해 인덱스 항목만 추가합니다.
+
+        Args:
+            artifact_type: 결과 유형 (예: "efficiency_trend")
+            data: 저장할 결과
+            window: 분석 기간 (예: "7d")
+
+        Returns:
+            콘텐츠 해시
+        """
+        content_hash = self.content_hash(data)
+
+        with self._connect() as conn:
+            latest = conn.execute(
+                "SELECT content_hash FROM artifacts WHERE artifact_type = ? AND window = ? "
+                "ORDER BY created_at DESC, id DESC LIMIT 1",
+                (artifact_type, window)
+            ).fetchone()
+
+            if latest and latest[0] == content_hash and os.path.exists(self.object_path(content_hash)):
+                self.logger.debug(f"{artifact_type}({window}) 결과 변경 없음: {content_hash[:12]}")
+                return content_hash
+
+            size_bytes = self._write_object(content_hash, data)
+            conn.execute(
+                "INSERT INTO artifacts (artifact_type, window, created_at, content_hash, size_bytes) VALUES (?, ?, ?, ?, ?)",
+                (artifact_type, window, datetime.now().isoformat(), content_hash, size_bytes)
+            )
+
+        self.apply_retention(artifact_type, window)
+        return content_hash
+
+    def _write_object(self, content_hash: str, data: Any) -> int:
+        """객체 파일 기록 (이미 있으면 건너뜀)"""
+        path = self.object_path(content_hash)
+        if os.path.exists(path):
+            return os.path.getsize(path)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with gzip.open(temp_path, "wb", compresslevel=6) as f:
+            f.write(serialize_compact(data))
+        os.replace(temp_path, path)
+        return os.path.getsize(path)
+
+    def get(self, content_hash: str) -> Optional[Any]:
+        """해시로 결과 조회"""
+        path = self.object_path(content_hash)
+        if not os.path.exists(path):
+            return None
+
+        with gzip.open(path, "rb") as f:
+            return json.loads(f.read().decode("utf-8"))
+
+    def latest_hash(self, artifact_type: str, window: str = "") -> Optional[str]:
+        """(유형, 기간)의 최신 결과 해시"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT content_hash FROM artifacts WHERE artifact_type = ? AND window = ? "
+                "ORDER BY created_at DESC, id DESC LIMIT 1",
+                (artifact_type, window)
+            ).fetchone()
+        return row[0] if row else None
+
+    def get_latest(self, artifact_type: str, window: str = "") -> Optional[Any]:
+        """(유형, 기간)의 최신 결과 조회"""
+        content_hash = self.latest_hash(artifact_type, window)
+        return self.get(content_hash) if content_hash else None
+
+    def list_entries(self, artifact_type: Optional[str] = None, window: Optional[str] = None) -> List[Dict[str, Any]]:
+        """인덱스 항목 목록 (최신순)"""
+        query = "SELECT artifact_type, window, created_at, content_hash, size_bytes FROM artifacts"
+        conditions, params = [], []
+        if artifact_type is not None:
+            conditions.append("artifact_type = ?")
+            params.append(artifact_type)
+        if window is not None:
+            conditions.append("window = ?")
+            params.append(window)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY created_at DESC, id DESC"
+
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        return [
+            {"artifact_type": row[0], "window": row[1], "created_at": row[2], "content_hash": row[3], "size_bytes": row[4]}
+            for row in rows
+        ]
+
+    def apply_retention(self, artifact_type: Optional[str] = None, window: Optional[str] = None) -> int:
+        """
+        보존 정책 적용 후 참조가 없는 객체 삭제
+
+        Returns:
+            삭제된 객체 파일 수
+        """
+        cutoff = (datetime.now() - timedelta(days=self.max_age_days)).isoformat() if self.max_age_days is not None else None
+        deleted_entries = 0
+
+        with self._connect() as conn:
+            if artifact_type is None:
+                groups = conn.execute("SELECT DISTINCT artifact_type, window FROM artifacts").fetchall()
+            else:
+                groups = [(artifact_type, window if window is not None else "")]
+
+            for group_type, group_window in groups:
+                ids = [row[0] for row in conn.execute(
+                    "SELECT id FROM artifacts WHERE artifact_type = ? AND window = ? "
+                    "ORDER BY created_at DESC, id DESC",
+                    (group_type, group_window)
+                ).fetchall()]
+                expired = set()
+
+                if self.keep_last is not None:
+                    expired.update(ids[self.keep_last:])
+                if cutoff is not None and len(ids) > 1:
+                    expired.update(row[0] for row in conn.execute(
+                        "SELECT id FROM artifacts WHERE artifact_type = ? AND window = ? AND created_at < ? AND id != ?",
+                        (group_type, group_window, cutoff, ids[0])
+                    ).fetchall())
+
+                if expired:
+                    conn.executemany("DELETE FROM artifacts WHERE id = ?", [(i,) for i in expired])
+                    deleted_entries += len(expired)
+
+            if not deleted_entries:
+                return 0
+
+            referenced = {row[0] for row in conn.execute("SELECT DISTINCT content_hash FROM artifacts").fetchall()}
+
+        # 다른 스레드/프로세스가 방금 기록하고 아직 인덱스에 올리지 않은 객체는 건드리지 않음
+        grace_cutoff = datetime.now().timestamp() - OBJECT_GRACE_SECONDS
+        removed = 0
+        for prefix in os.listdir(self.objects_dir):
+            prefix_dir = os.path.join(self.objects_dir, prefix)
+            if not os.path.isdir(prefix_dir):
+                continue
+            for filename in os.listdir(prefix_dir):
+                if not filename.endswith(".json.gz") or filename[:-len(".json.gz")] in referenced:
+                    continue
+                path = os.path.join(prefix_dir, filename)
+                if os.path.getmtime(path) < grace_cutoff:
+                    os.remove(path)
+                    removed += 1
+
+        if removed:
+            self.logger.info(f"보존 정책으로 결과 객체 {removed}개 삭제")
+        return removed
+
+
+def test_artifact_store():
+    """ArtifactStore 테스트 함수"""
+    import tempfile
+
+    print("🗄️ 결과 저장소 테스트 시작")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = ArtifactStore(root=temp_dir, keep_last=3)
+
+        chart = {"title": "테스트 차트", "values": [1, 2, 3], "created_at": datetime.now().isoformat()}
+        first = store.put("test_chart", chart, window="7d")
+        chart["created_at"] = datetime.now().isoformat()
+        second = store.put("test_chart", chart, window="7d")
+
+        print(f"✅ 동일 내용 재저장: {first == second}, 인덱스 항목 {len(store.list_entries('test_chart'))}개")
+        print(f"📦 최신 결과: {store.get_latest('test_chart', '7d')}")
+
+
+if __name__ == "__main__":
+    test_artifact_store()
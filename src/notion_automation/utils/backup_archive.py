@@ -0,0 +1,256 @@
+"""
+스트리밍 백업 아카이브 (청크 체크섬 + 매니페스트 체인)
+
+레코드를 ZIP 항목에 JSONL 청크 단위로 바로 기록하므로 백업 중 전체 데이터를
+메모리에 올리지 않습니다. 청크마다 SHA-256을 매니페스트에 남겨 복구 시 청크 단위로
+검증하고, 증분(delta) 백업은 부모 백업 이름과 매니페스트 해시를 기록하여
+전체 백업부터 증분 백업까지 순서대로 재생할 수 있습니다.
+"""
+
+import hashlib
+import json
+import os
+import zipfile
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Callable
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+
+FORMAT_VERSION = 2
+MANIFEST_NAME = "manifest.json"
+DEFAULT_CHUNK_RECORDS = 1000
+
+
+def _encode_record(record: Dict[str, Any]) -> bytes:
+    return (json.dumps(record, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str) + "\n").encode("utf-8")
+
+
+def manifest_digest(manifest: Dict[str, Any]) -> str:
+    """매니페스트 해시 (자식 백업이 부모를 고정하는 데 사용)"""
+    return hashlib.sha256(json.dumps(manifest, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class StreamingBackupWriter:
+    """레코드 스트림을 청크 단위로 ZIP에 기록"""
+
+    def __init__(self, path: str, chunk_records: int = DEFAULT_CHUNK_RECORDS,
+                 logger: Optional[ThreePartLogger] = None):
+        """
+        기록 중에는 {path}.part에 쓰고, 매니페스트까지 기록한 뒤 정상 종료하면 최종 이름으로 교체합니다.
+        레코드 스트림이 실패하면 임시 파일을 지우므로 잘린 ZIP이 백업 목록에 남지 않습니다.
+
+        Args:
+            path: 생성할 ZIP 파일 경로
+            chunk_records: 청크당 레코드 수
+            logger: 로깅 시스템 (선택사항)
+        """
+        self.path = path
+        self.part_path = f"{path}.part"
+        self.chunk_records = chunk_records
+        self.logger = logger or ThreePartLogger(name="backup_archive")
+        self.datasets: Dict[str, Dict[str, Any]] = {}
+        self.manifest: Optional[Dict[str, Any]] = None
+        self._zip = zipfile.ZipFile(self.part_path, "w", zipfile.ZIP_DEFLATED)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self._zip.close()
+        except Exception:
+            self._discard()
+            raise
+
+        if exc_type is not None:
+            self._discard()
+            self.logger.warning(f"백업 기록 실패, 임시 파일 삭제: {self.part_path}")
+        elif self.manifest is None:
+            self._discard()
+            self.logger.warning(f"매니페스트 없이 종료되어 백업을 만들지 않음: {self.path}")
+        else:
+            os.replace(self.part_path, self.path)
+
+    def _discard(self):
+        if os.path.exists(self.part_path):
+            os.remove(self.part_path)
+
+    def write_dataset(self, name: str, records: Iterable[Dict[str, Any]],
+                      watermark_field: Optional[str] = None) -> Dict[str, Any]:
+        """
+        데이터셋 하나를 JSONL 항목으로 스트리밍 기록
+
+        Args:
+            name: 데이터셋 이름 (항목 이름은 {name}.jsonl)
+            records: 레코드 이터러블
+            watermark_field: 최댓값을 워터마크로 기록할 필드 (예: updated_at)
+
+        Returns:
+            데이터셋 매니페스트 (청크별 레코드 수/바이트/해시 포함)
+        """
+        entry = f"{name}.jsonl"
+        chunks: List[Dict[str, Any]] = []
+        dataset_hash = hashlib.sha256()
+        watermark = None
+        total = 0
+
+        chunk_hash, chunk_count, chunk_bytes = hashlib.sha256(), 0, 0
+
+        def close_chunk():
+            digest = chunk_hash.hexdigest()
+            chunks.append({"records": chunk_count, "bytes": chunk_bytes, "sha256": digest})
+            dataset_hash.update(digest.encode("ascii"))
+
+        with self._zip.open(entry, "w", force_zip64=True) as stream:
+            for record in records:
+                line = _encode_record(record)
+                stream.write(line)
+                chunk_hash.update(line)
+                chunk_count += 1
+                chunk_bytes += len(line)
+                total += 1
+
+                if watermark_field and record.get(watermark_field) is not None:
+                    value = str(record[watermark_field])
+                    watermark = value if watermark is None or value > watermark else watermark
+
+                if chunk_count >= self.chunk_records:
+                    close_chunk()
+                    chunk_hash, chunk_count, chunk_bytes = hashlib.sha256(), 0, 0
+
+            if chunk_count:
+                close_chunk()
+
+        dataset = {
+            "entry": entry,
+            "records": total,
+            "chunks": chunks,
+            "sha256": dataset_hash.hexdigest(),
+            "watermark": watermark
+        }
+        self.datasets[name] = dataset
+        self.logger.debug(f"{name}: {total}개 레코드, {len(chunks)}개 청크 기록")
+        return dataset
+
+    def write_manifest(self, manifest: Dict[str, Any]) -> Dict[str, Any]:
+        """데이터셋 정보를 포함한 매니페스트 기록"""
+        manifest = dict(manifest)
+        manifest.setdefault("format_version", FORMAT_VERSION)
+        manifest.setdefault("created_at", datetime.now().isoformat())
+        manifest["datasets"] = self.datasets
+        self._zip.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2, ensure_ascii=False))
+        self.manifest = manifest
+        return manifest
+
+
+class BackupArchiveReader:
+    """청크 체크섬을 검증하며 백업 레코드를 스트리밍으로 읽기"""
+
+    def __init__(self, path: str, logger: Optional[ThreePartLogger] = None):
+        self.path = path
+        self.logger = logger or ThreePartLogger(name="backup_archive")
+        self.invalid_chunks: List[Dict[str, Any]] = []
+
+        with zipfile.ZipFile(path, "r") as zipf:
+            self.manifest = json.loads(zipf.read(MANIFEST_NAME)) if MANIFEST_NAME in zipf.namelist() else None
+
+    @property
+    def is_streaming_format(self) -> bool:
+        return self.manifest is not None and self.manifest.get("format_version", 0) >= FORMAT_VERSION
+
+    def iter_records(self, name: str) -> Iterator[Dict[str, Any]]:
+        """
+        데이터셋 레코드 순회
+
+        청크 끝에 도달할 때마다 해시를 비교하고, 불일치 청크는 invalid_chunks에 기록합니다.
+        """
+        dataset = (self.manifest or {}).get("datasets", {}).get(name)
+        if not dataset:
+            return
+
+        with zipfile.ZipFile(self.path, "r") as zipf, zipf.open(dataset["entry"], "r") as stream:
+            for index, chunk in enumerate(dataset["chunks"]):
+                chunk_hash = hashlib.sha256()
+                for _ in range(chunk["records"]):
+                    line = stream.readline()
+                    if not line:
+                        break
+                    chunk_hash.update(line)
+                    yield json.loads(line)
+
+                if chunk_hash.hexdigest() != chunk["sha256"]:
+                    self.invalid_chunks.append({"backup": os.path.basename(self.path), "dataset": name, "chunk": index})
+                    self.logger.warning(f"청크 체크섬 불일치: {self.path} {name}#{index}")
+
+
+def resolve_chain(backup_path: str, locate: Callable[[str], str],
+                  logger: Optional[ThreePartLogger] = None) -> List[BackupArchiveReader]:
+    """
+    증분 백업에서 전체 백업까지 부모를 따라가 재생 순서(전체 → 최신)로 반환
+
+    Args:
+        backup_path: 복구할 백업 경로
+        locate: 백업 이름 → 파일 경로 변환 함수
+
+    Raises:
+        FileNotFoundError: 체인 중간 백업이 없을 때
+        ValueError: 부모 매니페스트 해시가 기록과 다르거나 체인이 순환할 때
+    """
+    chain = [BackupArchiveReader(backup_path, logger)]
+    seen = {os.path.abspath(backup_path)}
+
+    while chain[-1].is_streaming_format and chain[-1].manifest.get("mode") == "delta":
+        child = chain[-1].manifest
+        parent_path = locate(child["parent"])
+        if os.path.abspath(parent_path) in seen:
+            raise ValueError(f"백업 체인이 순환합니다: {child['parent']}")
+        if not os.path.exists(parent_path):
+            raise FileNotFoundError(f"부모 백업을 찾을 수 없습니다: {child['parent']}")
+
+        parent = BackupArchiveReader(parent_path, logger)
+        if not parent.is_streaming_format or manifest_digest(parent.manifest) != child.get("parent_digest"):
+            raise ValueError(f"부모 백업 매니페스트가 기록과 다릅니다: {child['parent']}")
+
+        chain.append(parent)
+        seen.add(os.path.abspath(parent_path))
+
+    chain.reverse()
+    return chain
+
+
+def replay_chain(chain: List[BackupArchiveReader], name: str, key: str = "id") -> Dict[Any, Dict[str, Any]]:
+    """체인을 순서대로 재생하여 key 기준 최종 레코드 상태 구성 (뒤 백업이 우선)"""
+    state: Dict[Any, Dict[str, Any]] = {}
+    for reader in chain:
+        for record in reader.iter_records(name):
+            state[record.get(key)] = record
+    return state
+
+
+def test_backup_archive():
+    """StreamingBackupWriter/resolve_chain 테스트 함수"""
+    import tempfile
+
+    print("🗜️ 스트리밍 백업 아카이브 테스트 시작")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        locate = lambda name: os.path.join(temp_dir, f"{name}.zip")
+
+        with StreamingBackupWriter(locate("full"), chunk_records=2) as writer:
+            writer.write_dataset("supabase_data", ({"id": i, "score": i} for i in range(5)))
+            full_manifest = writer.write_manifest({"mode": "full"})
+
+        with StreamingBackupWriter(locate("delta"), chunk_records=2) as writer:
+            writer.write_dataset("supabase_data", [{"id": 1, "score": 10}, {"id": 5, "score": 5}])
+            writer.write_manifest({"mode": "delta", "parent": "full", "parent_digest": manifest_digest(full_manifest)})
+
+        chain = resolve_chain(locate("delta"), locate)
+        state = replay_chain(chain, "supabase_data")
+        print(f"✅ 체인 {len(chain)}개 재생: {len(state)}개 레코드, id=1 점수 {state[1]['score']}")
+
+
+if __name__ == "__main__":
+    test_backup_archive()
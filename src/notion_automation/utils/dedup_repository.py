@@ -0,0 +1,293 @@
+"""
+중복 제거 백업 저장소 (콘텐츠 정의 청크)
+
+레코드 스트림을 정렬된 JSONL로 직렬화한 뒤 내용으로 정한 경계에서 청크로 나누고,
+각 청크는 해시 이름으로 한 번만 저장합니다. 백업 하나는 청크 해시 목록(매니페스트)이 되므로
+일일/주간/월간 백업이 같은 레코드를 담아도 저장 공간은 한 번만 사용합니다.
+
+청크 경계는 레코드 해시의 하위 비트로 정하고(레코드 하나가 추가/변경되어도 주변 청크는 유지),
+날짜가 바뀌는 지점에서도 항상 끊어 일일 백업의 청크가 주간/월간 백업의 청크와 일치하도록 합니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import zlib
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Iterable, Iterator
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+
+# 평균 청크 크기 ≈ 2^AVERAGE_BITS 레코드
+AVERAGE_BITS = 4
+MIN_CHUNK_RECORDS = 4
+MAX_CHUNK_RECORDS = 64
+MAX_CHUNK_BYTES = 256 * 1024
+
+# 매니페스트에 아직 기록되지 않은 청크를 보호하는 유예 시간
+CHUNK_GRACE_SECONDS = 300
+
+MANIFEST_SUFFIX = ".manifest.json"
+
+
+def serialize_record(record: Dict[str, Any]) -> bytes:
+    """키 정렬 JSON 한 줄 (같은 레코드는 항상 같은 바이트)"""
+    return (json.dumps(record, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str) + "\n").encode("utf-8")
+
+
+def content_defined_chunks(records: Iterable[Dict[str, Any]], boundary_field: Optional[str] = "date",
+                           average_bits: int = AVERAGE_BITS, min_records: int = MIN_CHUNK_RECORDS,
+                           max_records: int = MAX_CHUNK_RECORDS, max_bytes: int = MAX_CHUNK_BYTES) -> Iterator[List[bytes]]:
+    """
+    레코드 스트림을 콘텐츠 정의 청크(직렬화된 줄 목록)로 분할
+
+    Args:
+        records: 정렬된 레코드 스트림
+        boundary_field: 값이 바뀌면 항상 청크를 끊는 필드 (None이면 사용 안 함)
+        average_bits: 레코드 해시 하위 비트가 모두 0이면 경계 (평균 2^bits 레코드)
+        min_records / max_records / max_bytes: 청크 크기 한계
+    """
+    mask = (1 << average_bits) - 1
+    lines: List[bytes] = []
+    size = 0
+    current_group = None
+
+    for record in records:
+        group = record.get(boundary_field) if boundary_field else None
+        if lines and group != current_group:
+            yield lines
+            lines, size = [], 0
+        current_group = group
+
+        line = serialize_record(record)
+        lines.append(line)
+        size += len(line)
+
+        fingerprint = int.from_bytes(hashlib.blake2b(line, digest_size=8).digest(), "big")
+        at_boundary = len(lines) >= min_records and (fingerprint & mask) == 0
+        if at_boundary or len(lines) >= max_records or size >= max_bytes:
+            yield lines
+            lines, size = [], 0
+
+    if lines:
+        yield lines
+
+
+class DedupBackupRepository:
+    """청크 단위 중복 제거 백업 저장소"""
+
+    def __init__(self, root: str, logger: Optional[ThreePartLogger] = None):
+        """
+        Args:
+            root: 저장소 루트 (청크는 root/chunks, 매니페스트는 root/<backup_type>)
+            logger: 로깅 시스템 (선택사항)
+        """
+        self.root = root
+        self.chunks_dir = os.path.join(root, "chunks")
+        self.logger = logger or ThreePartLogger(name="dedup_repository")
+        os.makedirs(self.chunks_dir, exist_ok=True)
+
+    def chunk_path(self, chunk_hash: str) -> str:
+        return os.path.join(self.chunks_dir, chunk_hash[:2], f"{chunk_hash}.zz")
+
+    def manifest_path(self, backup_type: str, name: str) -> str:
+        return os.path.join(self.root, backup_type, f"{name}{MANIFEST_SUFFIX}")
+
+    def _put_chunk(self, data: bytes) -> Dict[str, Any]:
+        chunk_hash = hashlib.sha256(data).hexdigest()
+        path = self.chunk_path(chunk_hash)
+        stored_bytes = 0
+
+        if os.path.exists(path):
+            # GC 유예 기간 계산을 위해 재사용 시각 갱신
+            os.utime(path)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            compressed = zlib.compress(data, 6)
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(compressed)
+            os.replace(temp_path, path)
+            stored_bytes = len(compressed)
+
+        return {"hash": chunk_hash, "bytes": len(data), "stored_bytes": stored_bytes}
+
+    def write_backup(self, backup_type: str, name: str, records: Iterable[Dict[str, Any]],
+                     backup_info: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        레코드 스트림을 청크로 나눠 저장하고 매니페스트 기록
+
+        Returns:
+            매니페스트 (logical_bytes: 원본 크기, new_bytes: 새로 저장된 압축 크기)
+        """
+        chunks = []
+        stream_hash = hashlib.sha256()
+        record_count = logical_bytes = new_bytes = 0
+
+        for lines in content_defined_chunks(records):
+            data = b"".join(lines)
+            chunk = self._put_chunk(data)
+            stream_hash.update(data)
+            chunks.append({"hash": chunk["hash"], "records": len(lines), "bytes": chunk["bytes"]})
+            record_count += len(lines)
+            logical_bytes += chunk["bytes"]
+            new_bytes += chunk["stored_bytes"]
+
+        manifest = {
+            "backup_info": dict(backup_info or {}, backup_type=backup_type, record_count=record_count,
+                                created_at=datetime.now().isoformat()),
+            "chunks": chunks,
+            "stream_sha256": stream_hash.hexdigest(),
+            "logical_bytes": logical_bytes,
+            "new_bytes": new_bytes
+        }
+
+        path = self.manifest_path(backup_type, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+        self.logger.info(
+            f"{backup_type} 백업 {name}: {record_count}개 레코드, 청크 {len(chunks)}개, "
+            f"논리 {logical_bytes}B / 신규 저장 {new_bytes}B"
+        )
+        return manifest
+
+    @staticmethod
+    def load_manifest(manifest_path: str) -> Dict[str, Any]:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def read_chunk(self, chunk_hash: str) -> bytes:
+        with open(self.chunk_path(chunk_hash), 'rb') as f:
+            return zlib.decompress(f.read())
+
+    def iter_records(self, manifest: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """매니페스트의 청크를 순서대로 읽어 레코드 복원"""
+        for chunk in manifest["chunks"]:
+            for line in self.read_chunk(chunk["hash"]).splitlines():
+                yield json.loads(line)
+
+    def verify(self, manifest: Dict[str, Any]) -> List[str]:
+        """청크 누락/손상 검사 (오류 메시지 목록 반환)"""
+        errors = []
+        stream_hash = hashlib.sha256()
+        record_count = 0
+
+        for chunk in manifest.get("chunks", []):
+            try:
+                data = self.read_chunk(chunk["hash"])
+            except FileNotFoundError:
+                errors.append(f"청크 누락: {chunk['hash'][:12]}")
+                continue
+            except zlib.error:
+                errors.append(f"청크 압축 손상: {chunk['hash'][:12]}")
+                continue
+
+            if hashlib.sha256(data).hexdigest() != chunk["hash"]:
+                errors.append(f"청크 해시 불일치: {chunk['hash'][:12]}")
+            stream_hash.update(data)
+            record_count += data.count(b"\n")
+
+        if not errors and stream_hash.hexdigest() != manifest.get("stream_sha256"):
+            errors.append("스트림 해시 불일치")
+        expected = manifest.get("backup_info", {}).get("record_count", 0)
+        if not errors and record_count != expected:
+            errors.append(f"레코드 개수 불일치: 예상 {expected}, 실제 {record_count}")
+        return errors
+
+    def list_manifests(self, backup_type: Optional[str] = None) -> List[str]:
+        """매니페스트 파일 경로 목록 (이름순)"""
+        types = [backup_type] if backup_type else [
+            entry for entry in os.listdir(self.root)
+            if entry != "chunks" and os.path.isdir(os.path.join(self.root, entry))
+        ]
+        paths = []
+        for entry in types:
+            directory = os.path.join(self.root, entry)
+            if os.path.isdir(directory):
+                paths.extend(os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(MANIFEST_SUFFIX))
+        return sorted(paths)
+
+    def prune(self, keep: Dict[str, int]) -> Dict[str, int]:
+        """
+        유형별로 최근 N개 매니페스트만 남기고 참조가 끊긴 청크 삭제
+
+        Args:
+            keep: {"daily": 90, "weekly": 26, "monthly": 24} 형태의 보존 개수
+        """
+        removed_manifests = 0
+        for backup_type, count in keep.items():
+            manifests = self.list_manifests(backup_type)
+            for path in manifests[:max(0, len(manifests) - count)]:
+                os.remove(path)
+                removed_manifests += 1
+
+        removed_chunks = self.collect_garbage() if removed_manifests else 0
+        return {"removed_manifests": removed_manifests, "removed_chunks": removed_chunks}
+
+    def collect_garbage(self) -> int:
+        """어떤 매니페스트에서도 참조하지 않는 청크 삭제 (mark & sweep)"""
+        referenced = set()
+        for path in self.list_manifests():
+            referenced.update(chunk["hash"] for chunk in self.load_manifest(path).get("chunks", []))
+
+        grace_cutoff = datetime.now().timestamp() - CHUNK_GRACE_SECONDS
+        removed = 0
+        for prefix in os.listdir(self.chunks_dir):
+            prefix_dir = os.path.join(self.chunks_dir, prefix)
+            if not os.path.isdir(prefix_dir):
+                continue
+            for filename in os.listdir(prefix_dir):
+                if not filename.endswith(".zz") or filename[:-3] in referenced:
+                    continue
+                path = os.path.join(prefix_dir, filename)
+                if os.path.getmtime(path) < grace_cutoff:
+                    os.remove(path)
+                    removed += 1
+
+        if removed:
+            self.logger.info(f"참조 없는 청크 {removed}개 삭제")
+        return removed
+
+    def storage_bytes(self) -> int:
+        """청크 저장소 실제 사용량"""
+        total = 0
+        for prefix in os.listdir(self.chunks_dir):
+            prefix_dir = os.path.join(self.chunks_dir, prefix)
+            if os.path.isdir(prefix_dir):
+                total += sum(os.path.getsize(os.path.join(prefix_dir, name)) for name in os.listdir(prefix_dir))
+        return total
+
+
+def test_dedup_repository():
+    """DedupBackupRepository 테스트 함수"""
+    import tempfile
+    from datetime import timedelta
+
+    print("🧩 중복 제거 백업 저장소 테스트 시작")
+
+    records = [
+        {"date": (datetime(2025, 7, 1) + timedelta(days=day)).strftime("%Y-%m-%d"), "time_part": part, "focus_level": day % 10}
+        for day in range(28) for part in ("morning", "afternoon", "evening")
+    ]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        repo = DedupBackupRepository(temp_dir)
+        for day in range(28):
+            day_records = records[day * 3:(day + 1) * 3]
+            repo.write_backup("daily", day_records[0]["date"], day_records)
+        monthly = repo.write_backup("monthly", "2025-07", records)
+
+        print(f"✅ 월간 백업 신규 저장 {monthly['new_bytes']}B (논리 {monthly['logical_bytes']}B), "
+              f"전체 저장소 {repo.storage_bytes()}B")
+
+
+if __name__ == "__main__":
+    test_dedup_repository()
@@ -0,0 +1,84 @@
+"""
+프로세스 간 파일 잠금
+
+반성 스크립트, 대시보드, 스케줄러 데몬처럼 여러 프로세스가 같은 JSON 상태 파일을 고쳐 쓸 때
+잠금 파일(<경로>.lock)에 flock을 잡은 상태에서 디스크의 최신 상태를 읽어 병합한 뒤 저장합니다.
+fcntl이 없는 플랫폼(Windows)에서는 프로세스 안의 스레드 잠금만 적용됩니다.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+try:
+    import fcntl
+except ImportError:  # fcntl이 없으면 프로세스 안에서만 잠금
+    fcntl = None
+
+_thread_locks: Dict[str, threading.Lock] = {}
+_thread_locks_guard = threading.Lock()
+
+
+def _thread_lock(lock_path: str) -> threading.Lock:
+    key = os.path.abspath(lock_path)
+    with _thread_locks_guard:
+        lock = _thread_locks.get(key)
+        if lock is None:
+            lock = _thread_locks[key] = threading.Lock()
+        return lock
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """
+    path의 잠금 파일(path + ".lock")에 배타 잠금
+
+    Args:
+        path: 보호할 상태 파일 경로 (디렉토리가 없으면 생성)
+    """
+    lock_path = f"{path}.lock"
+    os.makedirs(os.path.dirname(lock_path) or ".", exist_ok=True)
+
+    with _thread_lock(lock_path):
+        with open(lock_path, 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def test_file_lock():
+    """여러 스레드가 같은 파일의 카운터를 읽고-더하고-쓰기 해도 값을 잃지 않는지 확인"""
+    import tempfile
+
+    print("🔒 파일 잠금 테스트 시작")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "counter.txt")
+        with open(path, 'w') as f:
+            f.write("0")
+
+        def work():
+            for _ in range(100):
+                with file_lock(path):
+                    with open(path) as f:
+                        value = int(f.read())
+                    with open(path, 'w') as f:
+                        f.write(str(value + 1))
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with open(path) as f:
+            print(f"✅ 카운터: {f.read()} (기대값 400)")
+
+
+if __name__ == "__main__":
+    test_file_lock()
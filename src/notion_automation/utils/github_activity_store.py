@@ -0,0 +1,238 @@
+"""
+GitHub 활동 로컬 저장소 (webhook 수신 결과)
+
+webhook 수신기가 push / pull_request / issues / pull_request_review 이벤트를 받는 즉시
+도착 시각 기준 시간대를 정해 SQLite(data/github_activity.db)에 추가합니다.
+GitHubTimeAnalyzer와 GitHubRealtimeCollector는 API를 다시 호출하지 않고 이 저장소에서
+날짜 + 시간대별 활동을 읽습니다. 같은 delivery를 다시 받으면 무시하고,
+같은 커밋/이슈/PR/리뷰가 한 시간대에 여러 번 들어오면 최신 상태로 덮어씁니다.
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime, date
+from typing import Dict, List, Any, Optional, Tuple
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.time_part_calendar import get_time_part_calendar
+
+DEFAULT_ACTIVITY_DB = "data/github_activity.db"
+
+SUPPORTED_EVENTS = ("push", "pull_request", "issues", "pull_request_review")
+
+# 시간대 이름 → (시작 시, 종료 시) - config/time_schedules.json에서 컴파일한 달력 구간
+TIME_PART_HOURS = get_time_part_calendar().hour_ranges()
+
+# 활동 종류 → 분석기 결과의 목록 키
+ACTIVITY_LISTS = {
+    "commit": "commits",
+    "issue": "issues",
+    "pull_request": "pull_requests",
+    "code_review": "code_reviews",
+}
+
+ACTIVITY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS webhook_deliveries (
+    delivery_id TEXT PRIMARY KEY,
+    event TEXT NOT NULL,
+    received_at TEXT NOT NULL,
+    activities INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS github_activity (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    item_key TEXT NOT NULL,
+    activity_date TEXT NOT NULL,
+    time_part TEXT NOT NULL,
+    repo TEXT,
+    occurred_at TEXT,
+    received_at TEXT NOT NULL,
+    record TEXT NOT NULL,
+    UNIQUE (kind, item_key, activity_date, time_part)
+);
+
+CREATE INDEX IF NOT EXISTS idx_github_activity_date_part ON github_activity(activity_date, time_part);
+"""
+
+
+def time_part_for(moment: datetime) -> str:
+    """시각이 속한 시간대 (수업 시간 밖이면 직전 시간대, 첫 시간대 이전은 첫 시간대)"""
+    return get_time_part_calendar().classify(moment)
+
+
+def normalize_event(event: str, payload: Dict[str, Any]) -> List[Tuple[str, str, Dict[str, Any]]]:
+    """
+    webhook payload를 분석기 형식의 활동 레코드로 변환
+
+    Returns:
+        (종류, 항목 키, 레코드) 목록
+    """
+    repo = (payload.get("repository") or {}).get("full_name")
+    activities = []
+
+    if event == "push":
+        for commit in payload.get("commits") or []:
+            author = commit.get("author") or {}
+            files = (commit.get("added") or []) + (commit.get("removed") or []) + (commit.get("modified") or [])
+            activities.append(("commit", commit["id"], {
+                "sha": commit["id"][:7],
+                "message": commit.get("message", ""),
+                "timestamp": commit.get("timestamp"),
+                "author": author.get("username") or author.get("name"),
+                "additions": 0,  # push 이벤트에는 줄 수 통계가 없음
+                "deletions": 0,
+                "files_changed": len(files),
+                "type": "push",
+                "repo": repo
+            }))
+
+    elif event == "issues":
+        issue = payload.get("issue") or {}
+        if "pull_request" not in issue:
+            activities.append(("issue", str(issue.get("number")), {
+                "number": issue.get("number"),
+                "title": issue.get("title", ""),
+                "state": issue.get("state"),
+                "created_at": issue.get("created_at"),
+                "type": payload.get("action"),
+                "repo": repo
+            }))
+
+    elif event == "pull_request":
+        pr = payload.get("pull_request") or {}
+        activities.append(("pull_request", str(pr.get("number")), {
+            "number": pr.get("number"),
+            "title": pr.get("title", ""),
+            "state": "merged" if pr.get("merged") else pr.get("state"),
+            "created_at": pr.get("created_at"),
+            "additions": pr.get("additions", 0),
+            "deletions": pr.get("deletions", 0),
+            "changed_files": pr.get("changed_files", 0),
+            "type": payload.get("action"),
+            "repo": repo
+        }))
+
+    elif event == "pull_request_review":
+        review = payload.get("review") or {}
+        pr = payload.get("pull_request") or {}
+        activities.append(("code_review", str(review.get("id")), {
+            "pr_number": pr.get("number"),
+            "state": (review.get("state") or "").lower(),
+            "submitted_at": review.get("submitted_at"),
+            "type": "코드리뷰",
+            "repo": repo
+        }))
+
+    return activities
+
+
+class GitHubActivityStore:
+    """webhook으로 받은 GitHub 활동 저장소"""
+
+    def __init__(self, db_path: str = DEFAULT_ACTIVITY_DB, logger: Optional[ThreePartLogger] = None,
+                 summary=None):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            summary: 기록할 때마다 (날짜, 시간대) 건수를 갱신할 일별 활동 요약 (DailyActivitySummary, 선택사항)
+        """
+        self.db_path = db_path
+        self.logger = logger or ThreePartLogger(name="github_activity_store")
+        self.summary = summary
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(ACTIVITY_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def append_event(self, event: str, payload: Dict[str, Any], delivery_id: Optional[str] = None,
+                     received_at: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        이벤트 하나를 도착 시각의 시간대로 기록
+
+        Returns:
+            {"status": "stored" | "duplicate" | "ignored", "activities": 건수, "time_part": 시간대}
+        """
+        # 날짜와 시간대는 서버 시간대가 아니라 달력 시간대(Asia/Seoul) 기준
+        calendar = get_time_part_calendar()
+        received_at = received_at or calendar.now()
+        local_received = calendar.localize(received_at)
+        time_part = calendar.classify(local_received)
+        if event not in SUPPORTED_EVENTS:
+            return {"status": "ignored", "activities": 0, "time_part": time_part}
+
+        activities = normalize_event(event, payload)
+        activity_date = local_received.date().isoformat()
+
+        with self._lock, self._connect() as conn:
+            if delivery_id:
+                inserted = conn.execute(
+                    "INSERT OR IGNORE INTO webhook_deliveries (delivery_id, event, received_at, activities) VALUES (?, ?, ?, ?)",
+                    (delivery_id, event, received_at.isoformat(), len(activities))
+                ).rowcount
+                if not inserted:
+                    return {"status": "duplicate", "activities": 0, "time_part": time_part}
+
+            conn.executemany(
+                """
+                INSERT INTO github_activity
+                    (kind, item_key, activity_date, time_part, repo, occurred_at, received_at, record)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (kind, item_key, activity_date, time_part) DO UPDATE SET
+                    record = excluded.record,
+                    occurred_at = excluded.occurred_at,
+                    received_at = excluded.received_at
+                """,
+                [
+                    (kind, item_key, activity_date, time_part, record.get("repo"),
+                     record.get("timestamp") or record.get("created_at") or record.get("submitted_at"),
+                     received_at.isoformat(), json.dumps(record, ensure_ascii=False))
+                    for kind, item_key, record in activities
+                ]
+            )
+            counts = dict(conn.execute(
+                "SELECT kind, COUNT(*) FROM github_activity WHERE activity_date = ? AND time_part = ? GROUP BY kind",
+                (activity_date, time_part)
+            ).fetchall())
+
+        if self.summary is not None:
+            # 같은 항목의 갱신은 건수가 늘지 않도록 저장소의 현재 건수로 덮어씀
+            self.summary.record_counts(activity_date, time_part, "webhook",
+                                       {ACTIVITY_LISTS[kind]: count for kind, count in counts.items()})
+
+        self.logger.info(f"GitHub {event} 이벤트 기록: {len(activities)}건 ({activity_date} {time_part})")
+        return {"status": "stored", "activities": len(activities), "time_part": time_part}
+
+    def get_time_part_activities(self, target_date: date, time_part: str) -> Dict[str, List[Dict[str, Any]]]:
+        """날짜 + 시간대의 활동을 분석기 형식 목록으로 반환"""
+        result: Dict[str, List[Dict[str, Any]]] = {key: [] for key in ACTIVITY_LISTS.values()}
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    "SELECT kind, record FROM github_activity WHERE activity_date = ? AND time_part = ? ORDER BY id",
+                    (target_date.isoformat(), time_part)
+                ).fetchall()
+        except sqlite3.Error as e:
+            self.logger.error(f"GitHub 활동 조회 실패: {str(e)}")
+            return result
+
+        for kind, record in rows:
+            result[ACTIVITY_LISTS[kind]].append(json.loads(record))
+        return result
+
+    def counts(self) -> Dict[str, int]:
+        """종류별 저장된 활동 수와 수신한 delivery 수"""
+        with self._connect() as conn:
+            counts = dict(conn.execute("SELECT kind, COUNT(*) FROM github_activity GROUP BY kind").fetchall())
+            counts["deliveries"] = conn.execute("SELECT COUNT(*) FROM webhook_deliveries").fetchone()[0]
+        return counts
@@ -0,0 +1,532 @@
+"""
+공유 HTTP 전송 계층 (호스트별 연결 풀 + 요청 타이밍)
+
+Notion/GitHub/Supabase REST 호출이 매번 requests.get/post로 새 TCP+TLS 연결을 맺지 않도록
+호스트별 Session을 하나씩 두고 keep-alive 연결을 재사용합니다.
+모든 요청은 DNS/연결/TLS/TTFB/전체 시간을 기록하며, 호스트별 누적 통계(stats())와
+요청 단위 훅(add_hook())으로 핸드셰이크가 전체 시간에서 차지하는 비중을 확인할 수 있습니다.
+비동기 호출이 필요한 대량 동기화는 같은 설정을 쓰는 AsyncHttpTransport(aiohttp)를 사용합니다.
+429 응답을 받으면 호스트에 연결된 공유 요청 제한기를 Retry-After만큼 미뤄, 같은 토큰을 쓰는
+다른 호출자와 프로세스도 함께 물러나도록 합니다.
+"""
+
+import socket
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Callable, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError, ConnectTimeoutError
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.resilience import current_deadline, DeadlineExceeded
+from src.notion_automation.utils.shared_rate_limiter import (
+    DEFAULT_RATE_LIMIT_DB, get_rate_limiter, penalize_on_rate_limit
+)
+
+# 호스트별 연결 풀 크기와 (연결, 읽기) 타임아웃, 429 때 미룰 공유 요청 제한기 API
+HOST_PROFILES: Dict[str, Dict[str, Any]] = {
+    "api.notion.com": {"pool_maxsize": 4, "timeout": (5.0, 30.0), "rate_limit_api": "notion"},   # 통합당 3 req/s라 동시 연결이 많을 필요 없음
+    "api.github.com": {"pool_maxsize": 10, "timeout": (5.0, 20.0), "rate_limit_api": "github"},
+}
+DEFAULT_PROFILE: Dict[str, Any] = {"pool_maxsize": 10, "timeout": (5.0, 30.0)}
+DEFAULT_DNS_TTL = 300.0
+DEFAULT_KEEPALIVE_SECONDS = 60.0
+
+
+@dataclass
+class RequestTiming:
+    """요청 한 건의 단계별 소요 시간 (초)"""
+    method: str
+    host: str
+    status: Optional[int] = None
+    dns_seconds: float = 0.0
+    connect_seconds: float = 0.0
+    tls_seconds: float = 0.0
+    ttfb_seconds: float = 0.0
+    total_seconds: float = 0.0
+    new_connection: bool = False
+    error: Optional[str] = None
+
+    @property
+    def handshake_seconds(self) -> float:
+        return self.dns_seconds + self.connect_seconds + self.tls_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+TimingHook = Callable[[RequestTiming], None]
+
+
+class TimingRecorder:
+    """요청 타이밍 훅 호출 + 호스트별 누적 통계 (동기/비동기 전송 공용)"""
+
+    def __init__(self):
+        self.hooks: List[TimingHook] = []
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook: TimingHook):
+        self.hooks.append(hook)
+
+    def record(self, timing: RequestTiming):
+        with self._lock:
+            host = self._stats.setdefault(timing.host, {
+                "requests": 0, "errors": 0, "new_connections": 0,
+                "dns_seconds": 0.0, "connect_seconds": 0.0, "tls_seconds": 0.0,
+                "ttfb_seconds": 0.0, "total_seconds": 0.0
+            })
+            host["requests"] += 1
+            host["errors"] += 1 if timing.error else 0
+            host["new_connections"] += 1 if timing.new_connection else 0
+            for field in ("dns_seconds", "connect_seconds", "tls_seconds", "ttfb_seconds", "total_seconds"):
+                host[field] += getattr(timing, field)
+
+        for hook in self.hooks:
+            try:
+                hook(timing)
+            except Exception:
+                # 계측 훅 오류가 실제 요청을 실패시키지 않도록 무시
+                pass
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """호스트별 요청 수, 연결 재사용률, 핸드셰이크 비중"""
+        with self._lock:
+            snapshot = {host: dict(values) for host, values in self._stats.items()}
+
+        for values in snapshot.values():
+            requests_count = values["requests"]
+            handshake = values["dns_seconds"] + values["connect_seconds"] + values["tls_seconds"]
+            values["reused_connections"] = requests_count - values["new_connections"]
+            values["average_total_seconds"] = round(values["total_seconds"] / requests_count, 4) if requests_count else 0.0
+            values["handshake_share"] = round(handshake / values["total_seconds"], 4) if values["total_seconds"] else 0.0
+            for field in ("dns_seconds", "connect_seconds", "tls_seconds", "ttfb_seconds", "total_seconds"):
+                values[field] = round(values[field], 4)
+        return snapshot
+
+
+class DnsCache:
+    """getaddrinfo 결과를 TTL 동안 재사용 (새 연결마다 DNS를 다시 조회하지 않음)"""
+
+    def __init__(self, ttl: float = DEFAULT_DNS_TTL):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, host: str, port: int) -> List[str]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get((host, port))
+            if entry and entry[0] > now:
+                return entry[1]
+
+        try:
+            infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except socket.gaierror:
+            # 조회 실패는 urllib3가 원래 오류(NameResolutionError)로 보고하도록 그대로 넘김
+            return []
+
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        with self._lock:
+            self._entries[(host, port)] = (now + self.ttl, addresses)
+        return addresses
+
+
+_dns_cache = DnsCache()
+_current = threading.local()
+
+
+def _current_timing() -> Optional[RequestTiming]:
+    return getattr(_current, "timing", None)
+
+
+class _TimedConnectionMixin:
+    """새 연결을 맺을 때 DNS/TCP/TLS 시간을 현재 요청 타이밍에 기록"""
+
+    def _new_conn(self):
+        timing = _current_timing()
+        started = time.perf_counter()
+        addresses = _dns_cache.resolve(self._dns_host, self.port) or [self._dns_host]
+        resolved = time.perf_counter()
+
+        # SNI와 인증서 검증은 self.host를 쓰므로 접속 주소(_dns_host)만 조회한 IP로 바꿈
+        original_host = self._dns_host
+        try:
+            for index, address in enumerate(addresses):
+                self._dns_host = address
+                try:
+                    sock = super()._new_conn()
+                    break
+                except (NewConnectionError, ConnectTimeoutError):
+                    if index == len(addresses) - 1:
+                        raise
+        finally:
+            self._dns_host = original_host
+
+        if timing is not None:
+            timing.dns_seconds += resolved - started
+            timing.connect_seconds += time.perf_counter() - resolved
+        return sock
+
+    def connect(self):
+        timing = _current_timing()
+        before = (timing.dns_seconds + timing.connect_seconds) if timing else 0.0
+        started = time.perf_counter()
+        super().connect()
+
+        if timing is not None:
+            elapsed = time.perf_counter() - started
+            socket_seconds = timing.dns_seconds + timing.connect_seconds - before
+            timing.tls_seconds += max(0.0, elapsed - socket_seconds)
+            timing.new_connection = True
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class PooledAdapter(HTTPAdapter):
+    """연결 생성 시간을 기록하는 풀을 쓰는 어댑터 (재시도 여부는 호출자가 결정)"""
+
+    def __init__(self, pool_maxsize: int):
+        super().__init__(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=0)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+class InstrumentedSession(requests.Session):
+    """기본 타임아웃(데드라인이 있으면 남은 시간으로 축소)을 적용하고 요청마다 타이밍을 기록하는 Session"""
+
+    def __init__(self, recorder: TimingRecorder, timeout: Tuple[float, float], pool_maxsize: int):
+        super().__init__()
+        self.recorder = recorder
+        self.default_timeout = timeout
+        adapter = PooledAdapter(pool_maxsize)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def request(self, method, url, *args, **kwargs):
+        kwargs["timeout"] = _deadline_timeout(kwargs.get("timeout", self.default_timeout))
+        timing = RequestTiming(method=method.upper(), host=urlsplit(url).hostname or "")
+        _current.timing = timing
+        started = time.perf_counter()
+        try:
+            # stream=False이면 본문까지 읽은 뒤 반환되므로 total_seconds에 다운로드 시간이 포함됨
+            response = super().request(method, url, *args, **kwargs)
+            timing.status = response.status_code
+            timing.ttfb_seconds = response.elapsed.total_seconds()
+            response.timing = timing
+            return response
+        except Exception as e:
+            timing.error = type(e).__name__
+            raise
+        finally:
+            _current.timing = None
+            timing.total_seconds = time.perf_counter() - started
+            self.recorder.record(timing)
+
+
+def _deadline_timeout(timeout):
+    """resilience.deadline()이 걸려 있으면 남은 시간 안으로 타임아웃 축소"""
+    current = current_deadline()
+    if current is None or timeout is None:
+        return timeout
+    remaining = current.remaining()
+    if remaining <= 0:
+        raise DeadlineExceeded("요청 전 데드라인 초과")
+    if isinstance(timeout, tuple):
+        return tuple(min(value, remaining) if value is not None else remaining for value in timeout)
+    return min(timeout, remaining)
+
+
+def _host_profile(profiles: Dict[str, Dict[str, Any]], host: str) -> Dict[str, Any]:
+    return {**DEFAULT_PROFILE, **profiles.get(host, {})}
+
+
+def _request_credential(headers: Optional[Dict[str, str]]) -> Optional[str]:
+    """Authorization 헤더의 토큰 ("Bearer x"/"token x") - 호출자가 쓰는 제한기 버킷과 맞추기 위함"""
+    authorization = CaseInsensitiveDict(headers or {}).get("authorization")
+    if not authorization:
+        return None
+    return authorization.split(None, 1)[-1]
+
+
+def _penalize_rate_limited(profile: Dict[str, Any], response: Any, request_headers: Optional[Dict[str, str]],
+                           rate_limit_db: str) -> bool:
+    """429 응답이면 호스트의 공유 요청 제한기를 Retry-After만큼 미룸 (제한기가 없는 호스트는 무시)"""
+    api = profile.get("rate_limit_api")
+    if response.status_code != 429 or not api:
+        return False
+    limiter = get_rate_limiter(api, _request_credential(request_headers), db_path=rate_limit_db)
+    return penalize_on_rate_limit(limiter, requests.HTTPError(response=response))
+
+
+class HttpTransport:
+    """호스트별 keep-alive Session을 재사용하는 동기 HTTP 전송"""
+
+    def __init__(self, profiles: Optional[Dict[str, Dict[str, Any]]] = None,
+                 rate_limit_db: str = DEFAULT_RATE_LIMIT_DB):
+        """
+        Args:
+            profiles: 호스트별 설정 (pool_maxsize, timeout, rate_limit_api) - 기본값은 HOST_PROFILES
+            rate_limit_db: 429 응답 때 미룰 공유 요청 제한기 DB 경로
+        """
+        self.profiles = profiles if profiles is not None else HOST_PROFILES
+        self.rate_limit_db = rate_limit_db
+        self.recorder = TimingRecorder()
+        self._sessions: Dict[str, InstrumentedSession] = {}
+        self._lock = threading.Lock()
+
+    def session(self, url: str) -> InstrumentedSession:
+        """URL 호스트의 공유 Session (없으면 생성)"""
+        host = urlsplit(url).hostname or url
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                profile = _host_profile(self.profiles, host)
+                session = InstrumentedSession(self.recorder, profile["timeout"], profile["pool_maxsize"])
+                self._sessions[host] = session
+            return session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        response = self.session(url).request(method, url, **kwargs)
+        host = urlsplit(url).hostname or url
+        _penalize_rate_limited(_host_profile(self.profiles, host), response, kwargs.get("headers"), self.rate_limit_db)
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> requests.Response:
+        return self.request("PATCH", url, **kwargs)
+
+    def add_hook(self, hook: TimingHook):
+        """요청이 끝날 때마다 RequestTiming을 받는 훅 등록"""
+        self.recorder.add_hook(hook)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return self.recorder.stats()
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+@dataclass
+class TransportResponse:
+    """비동기 전송 응답 (세션 밖에서도 쓸 수 있도록 본문을 읽어 둔 상태)"""
+    status_code: int
+    headers: CaseInsensitiveDict
+    content: bytes
+    timing: RequestTiming
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        import json
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error: {self.text[:200]}")
+
+
+class AsyncHttpTransport:
+    """
+    aiohttp 기반 비동기 전송 (호스트별 ClientSession + TCPConnector 풀)
+
+    aiohttp의 TraceConfig로 DNS/연결/TTFB 시간을 기록합니다.
+    aiohttp는 TLS 핸드셰이크를 연결 생성과 따로 알려 주지 않으므로 connect_seconds에 TLS가 포함됩니다.
+    """
+
+    def __init__(self, profiles: Optional[Dict[str, Dict[str, Any]]] = None,
+                 dns_ttl: float = DEFAULT_DNS_TTL, recorder: Optional[TimingRecorder] = None,
+                 rate_limit_db: str = DEFAULT_RATE_LIMIT_DB):
+        import aiohttp
+        self._aiohttp = aiohttp
+        self.profiles = profiles if profiles is not None else HOST_PROFILES
+        self.rate_limit_db = rate_limit_db
+        self.dns_ttl = dns_ttl
+        self.recorder = recorder or TimingRecorder()
+        self._sessions: Dict[str, Any] = {}
+
+    def _trace_config(self):
+        trace = self._aiohttp.TraceConfig()
+        marks: Dict[Tuple[int, str], float] = {}
+
+        def mark(name):
+            async def handler(session, context, params):
+                timing = context.trace_request_ctx
+                now = time.perf_counter()
+                if name.endswith("_start"):
+                    marks[(id(timing), name[:-6])] = now
+                    return
+                started = marks.pop((id(timing), name[:-4]), now)
+                if name == "dns_end":
+                    timing.dns_seconds += now - started
+                elif name == "connect_end":
+                    timing.new_connection = True
+                    timing.connect_seconds += max(0.0, now - started - timing.dns_seconds)
+                elif name == "request_end":
+                    timing.ttfb_seconds = now - started
+            return handler
+
+        trace.on_dns_resolvehost_start.append(mark("dns_start"))
+        trace.on_dns_resolvehost_end.append(mark("dns_end"))
+        trace.on_connection_create_start.append(mark("connect_start"))
+        trace.on_connection_create_end.append(mark("connect_end"))
+        trace.on_request_start.append(mark("request_start"))
+        trace.on_request_end.append(mark("request_end"))
+        return trace
+
+    def _session(self, host: str):
+        session = self._sessions.get(host)
+        if session is None or session.closed:
+            profile = _host_profile(self.profiles, host)
+            connect_timeout, read_timeout = profile["timeout"]
+            connector = self._aiohttp.TCPConnector(
+                limit_per_host=profile["pool_maxsize"],
+                ttl_dns_cache=self.dns_ttl,
+                keepalive_timeout=DEFAULT_KEEPALIVE_SECONDS
+            )
+            session = self._aiohttp.ClientSession(
+                connector=connector,
+                timeout=self._aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout),
+                trace_configs=[self._trace_config()]
+            )
+            self._sessions[host] = session
+        return session
+
+    async def request(self, method: str, url: str, **kwargs) -> TransportResponse:
+        host = urlsplit(url).hostname or url
+        timing = RequestTiming(method=method.upper(), host=host)
+        current = current_deadline()
+        if current is not None and "timeout" not in kwargs:
+            kwargs["timeout"] = self._aiohttp.ClientTimeout(total=current.remaining())
+        started = time.perf_counter()
+        try:
+            async with self._session(host).request(method, url, trace_request_ctx=timing, **kwargs) as response:
+                content = await response.read()
+                timing.status = response.status
+                result = TransportResponse(response.status, CaseInsensitiveDict(response.headers), content, timing)
+            _penalize_rate_limited(_host_profile(self.profiles, host), result, kwargs.get("headers"), self.rate_limit_db)
+            return result
+        except Exception as e:
+            timing.error = type(e).__name__
+            raise
+        finally:
+            timing.total_seconds = time.perf_counter() - started
+            self.recorder.record(timing)
+
+    async def get(self, url: str, **kwargs) -> TransportResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> TransportResponse:
+        return await self.request("POST", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs) -> TransportResponse:
+        return await self.request("PATCH", url, **kwargs)
+
+    def add_hook(self, hook: TimingHook):
+        self.recorder.add_hook(hook)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return self.recorder.stats()
+
+    async def close(self):
+        for session in self._sessions.values():
+            await session.close()
+        self._sessions.clear()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+_transport: Optional[HttpTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> HttpTransport:
+    """프로세스 공용 동기 전송 (모든 API 클라이언트가 같은 연결 풀을 사용)"""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = HttpTransport()
+        return _transport
+
+
+def test_http_transport():
+    """로컬 HTTP 서버로 연결 재사용과 타이밍 기록 확인"""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            body = b'{"ok": true}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    print("🌐 HTTP 전송 계층 테스트 시작")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        transport = HttpTransport()
+        url = f"http://127.0.0.1:{server.server_address[1]}/ping"
+        for _ in range(50):
+            transport.get(url).raise_for_status()
+
+        for host, values in transport.stats().items():
+            print(f"✅ {host}: {values['requests']}회 요청, 새 연결 {values['new_connections']}개, "
+                  f"평균 {values['average_total_seconds'] * 1000:.2f}ms, 핸드셰이크 비중 {values['handshake_share']:.1%}")
+        transport.close()
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    test_http_transport()
@@ -22,8 +22,8 @@ class ThreePartLogger:
     
     def _setup_handlers(self):
         """로그 핸들러 설정"""
-        # 파일 핸들러
-        log_dir = "logs"
+        # 파일 핸들러 (THREE_PART_LOG_DIR로 로그 디렉토리 변경 가능)
+        log_dir = os.getenv("THREE_PART_LOG_DIR", "logs")
         os.makedirs(log_dir, exist_ok=True)
         
         file_handler = logging.FileHandler(
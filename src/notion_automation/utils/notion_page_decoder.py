@@ -0,0 +1,279 @@
+"""
+Notion 페이지 디코더 (원시 페이지 JSON → 압축 레코드)
+
+스키마(속성명, 타입)를 속성별 추출 함수 목록으로 한 번 컴파일해 두고, 페이지마다 그 목록을 순서대로
+적용해 namedtuple 레코드 하나를 만듭니다. 이후 코드는 props["x"]["select"]["name"] 같은 dict 탐색 대신
+record.x 속성 접근만 하고, 페이지별 중첩 dict/list는 디코딩 직후 버려집니다.
+
+- select/status/multi_select 값과 날짜 문자열은 sys.intern으로 공유해 같은 값이 레코드마다 복제되지 않습니다.
+- 속성 자체가 없으면 MISSING, 속성은 있는데 값이 비어 있으면 None입니다 (필수 필드 누락과 빈 값 구분).
+- query_records는 페이지네이션 응답을 한 배치씩 받아 바로 디코딩하므로 원시 JSON은 한 배치만 메모리에 남습니다.
+"""
+
+import sys
+import os
+from collections import namedtuple
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Callable, Tuple, Union
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+
+logger = ThreePartLogger("notion_page_decoder")
+
+DEFAULT_PAGE_SIZE = 100  # Notion databases.query 최대 page_size
+
+
+class _Missing:
+    """페이지에 속성 자체가 없음을 나타내는 표식 (None은 '있지만 비어 있음')"""
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+    def __reduce__(self):
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+
+def _plain_text(pieces: Optional[List[Dict[str, Any]]]) -> Optional[str]:
+    if not pieces:
+        return None
+    if len(pieces) == 1:
+        piece = pieces[0]
+        text = piece.get("plain_text")
+        return text if text is not None else piece.get("text", {}).get("content", "")
+    return "".join(
+        piece["plain_text"] if piece.get("plain_text") is not None else piece.get("text", {}).get("content", "")
+        for piece in pieces
+    )
+
+
+def _decode_title(prop: Dict[str, Any]) -> Optional[str]:
+    return _plain_text(prop.get("title"))
+
+
+def _decode_rich_text(prop: Dict[str, Any]) -> Optional[str]:
+    return _plain_text(prop.get("rich_text"))
+
+
+def _decode_text(prop: Dict[str, Any]) -> Optional[str]:
+    # rich_text/title 어느 쪽이든 문자열 필드로 취급
+    return _plain_text(prop.get("rich_text") or prop.get("title"))
+
+
+def _decode_number(prop: Dict[str, Any]) -> Optional[Union[int, float]]:
+    value = prop.get("number")
+    if value is None and "formula" in prop:
+        value = (prop["formula"] or {}).get("number")
+    return value
+
+
+def _decode_select(prop: Dict[str, Any]) -> Optional[str]:
+    option = prop.get("select")
+    return sys.intern(option["name"]) if option and option.get("name") else None
+
+
+def _decode_status(prop: Dict[str, Any]) -> Optional[str]:
+    option = prop.get("status")
+    return sys.intern(option["name"]) if option and option.get("name") else None
+
+
+def _decode_multi_select(prop: Dict[str, Any]) -> Tuple[str, ...]:
+    return tuple(sys.intern(option["name"]) for option in prop.get("multi_select") or () if option.get("name"))
+
+
+def _decode_date(prop: Dict[str, Any]) -> Optional[str]:
+    value = prop.get("date")
+    return sys.intern(value["start"]) if value and value.get("start") else None
+
+
+def _decode_checkbox(prop: Dict[str, Any]) -> Optional[bool]:
+    return prop.get("checkbox")
+
+
+def _decode_scalar(key: str) -> Callable[[Dict[str, Any]], Any]:
+    return lambda prop: prop.get(key)
+
+
+DECODERS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "title": _decode_title,
+    "rich_text": _decode_rich_text,
+    "text": _decode_text,
+    "number": _decode_number,
+    "select": _decode_select,
+    "status": _decode_status,
+    "multi_select": _decode_multi_select,
+    "date": _decode_date,
+    "checkbox": _decode_checkbox,
+    "url": _decode_scalar("url"),
+    "email": _decode_scalar("email"),
+    "phone_number": _decode_scalar("phone_number"),
+}
+
+# 검증 규칙(field_rules)에서 쓰는 타입명 → 디코더 타입
+KIND_ALIASES = {"string": "text"}
+
+FieldSpec = Union[str, Tuple[str, str]]
+
+
+class NotionPageSchema:
+    """
+    속성명/타입 목록을 컴파일한 페이지 디코더
+
+    Args:
+        fields: 레코드 속성명 → 타입 또는 (Notion 속성명, 타입).
+            속성명이 Python 식별자가 아니면(공백, 특수문자) 튜플로 Notion 속성명을 따로 지정합니다.
+        name: 레코드 namedtuple 클래스명
+        missing: 속성이 없을 때 넣을 값 (없음/빈 값을 구분할 필요가 없으면 None)
+    """
+
+    def __init__(self, fields: Dict[str, FieldSpec], name: str = "NotionRecord", missing: Any = MISSING):
+        plan = []
+        for attr, spec in fields.items():
+            prop_name, kind = (attr, spec) if isinstance(spec, str) else spec
+            kind = KIND_ALIASES.get(kind, kind)
+            if kind not in DECODERS:
+                raise ValueError(f"지원하지 않는 속성 타입: {attr}={kind}")
+            plan.append((prop_name, DECODERS[kind]))
+
+        self.fields = tuple(fields)
+        self.missing = missing
+        self.record_type = namedtuple(name, ("page_id",) + self.fields)
+        self._plan = tuple(plan)
+
+    @classmethod
+    def from_field_rules(cls, field_rules: Dict[str, Dict[str, Any]], name: str = "NotionRecord") -> "NotionPageSchema":
+        """{필드: {"type": ...}} 형태의 검증 규칙에서 스키마 생성"""
+        return cls({field: rules["type"] for field, rules in field_rules.items()}, name)
+
+    def decode(self, page: Dict[str, Any]) -> Any:
+        """페이지 하나를 레코드로 변환 (형식이 깨진 페이지는 예외)"""
+        props = page.get("properties") or {}
+        missing = self.missing
+        values = [page.get("id")]
+        for prop_name, decoder in self._plan:
+            prop = props.get(prop_name)
+            values.append(missing if prop is None else decoder(prop))
+        return self.record_type._make(values)
+
+
+def iter_decoded(pages: Iterable[Dict[str, Any]], schema: NotionPageSchema) -> Iterator[Any]:
+    """페이지를 하나씩 디코딩 (형식이 깨진 페이지는 경고 후 건너뜀)"""
+    decode = schema.decode
+    for page in pages:
+        try:
+            yield decode(page)
+        except (AttributeError, TypeError, KeyError) as e:
+            page_id = page.get("id", "unknown") if isinstance(page, dict) else "unknown"
+            logger.warning(f"페이지 디코딩 실패 (건너뜀): {page_id} - {e}")
+
+
+def decode_pages(pages: Iterable[Dict[str, Any]], schema: NotionPageSchema) -> List[Any]:
+    """페이지 목록을 레코드 목록으로 일괄 변환"""
+    return list(iter_decoded(pages, schema))
+
+
+def iter_query_pages(query: Callable[..., Dict[str, Any]], database_id: str,
+                     page_size: int = DEFAULT_PAGE_SIZE, limiter: Any = None,
+                     **params: Any) -> Iterator[Dict[str, Any]]:
+    """
+    databases.query 페이지네이션을 따라가며 원시 페이지를 배치 단위로 흘려보냄
+
+    Args:
+        query: notion_client의 databases.query 같은 호출 가능 객체
+        database_id: 조회할 데이터베이스 ID
+        page_size: 요청당 페이지 수
+        limiter: 요청 전에 acquire()할 레이트 리미터
+        **params: filter, sorts 등 query에 그대로 넘길 인자
+    """
+    cursor = None
+    while True:
+        if limiter is not None:
+            limiter.acquire()
+        request = dict(params, database_id=database_id, page_size=page_size)
+        if cursor:
+            request["start_cursor"] = cursor
+        response = query(**request)
+        yield from response.get("results", [])
+        cursor = response.get("next_cursor")
+        if not response.get("has_more") or not cursor:
+            break
+
+
+def query_records(query: Callable[..., Dict[str, Any]], database_id: str, schema: NotionPageSchema,
+                  **kwargs: Any) -> Iterator[Any]:
+    """데이터베이스 조회 결과를 받는 즉시 레코드로 디코딩 (인자는 iter_query_pages와 동일)"""
+    return iter_decoded(iter_query_pages(query, database_id, **kwargs), schema)
+
+
+# 3-Part Daily Reflection DB 검증/쿼리 스크립트가 공유하는 속성 구성
+REFLECTION_PAGE_SCHEMA = NotionPageSchema({
+    "title": "title",
+    "reflection_date": "date",
+    "time_part": "select",
+    "start_time": "rich_text",
+    "end_time": "rich_text",
+    "subject": "rich_text",
+    "condition": "select",
+    "learning_difficulty": "number",
+    "understanding": "number",
+    "key_learning": "rich_text",
+    "challenges": "rich_text",
+    "reflection": "rich_text",
+    "commit_count": "number",
+    "github_activities": "rich_text",
+    "learning_hours": "number",
+    "github_commits": "number",
+    "github_prs": "number",
+    "github_issues": "number",
+    "time_part_score": "number",
+    "tags": "multi_select",
+}, name="ReflectionRecord")
+
+
+def test_notion_page_decoder():
+    """원시 페이지 대비 레코드 메모리와 디코딩 속도 확인"""
+    import json
+    import time
+    import tracemalloc
+
+    print("📄 Notion 페이지 디코더 테스트 시작")
+    time_parts = ["🌅 오전수업", "🌞 오후수업", "🌙 저녁자율학습"]
+    payload = json.dumps([
+        {
+            "id": f"page-{i}",
+            "properties": {
+                "reflection_date": {"type": "date", "date": {"start": f"2026-03-{i % 28 + 1:02d}", "end": None}},
+                "time_part": {"type": "select", "select": {"id": "tp", "name": time_parts[i % 3], "color": "blue"}},
+                "subject": {"type": "rich_text", "rich_text": [
+                    {"type": "text", "text": {"content": f"과목 {i}", "link": None}, "plain_text": f"과목 {i}"}]},
+                "learning_difficulty": {"type": "number", "number": i % 10 + 1},
+                "commit_count": {"type": "number", "number": i % 7},
+            },
+        }
+        for i in range(20_000)
+    ], ensure_ascii=False)
+
+    tracemalloc.start()
+    pages = json.loads(payload)
+    raw_bytes = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    records = decode_pages(pages, REFLECTION_PAGE_SCHEMA)
+    decode_seconds = time.perf_counter() - started
+    del pages
+    record_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"✅ {len(records):,}개 페이지 디코딩 {decode_seconds:.3f}초")
+    print(f"✅ 원시 JSON {raw_bytes / len(records):.0f}B/페이지 → 레코드 {record_bytes / len(records):.0f}B/페이지")
+    print(f"  예시: {records[0]}")
+
+
+if __name__ == "__main__":
+    test_notion_page_decoder()
@@ -0,0 +1,494 @@
+"""
+Supabase → Notion 속성 매퍼 (선언적 스키마 컴파일)
+
+속성마다 (Notion 속성명, 타입, 원본 필드, 매핑 테이블, 기본값)을 선언해 두면
+생성 시점에 속성별 빌더 함수로 한 번만 컴파일합니다. 매핑 테이블 조회, 원본 필드 접근,
+타입 검증이 모두 클로저에 묶여 있어 레코드마다 스키마를 다시 해석하지 않고,
+map_batch()로 수천 건을 변환하면서 실패한 행만 따로 모아 보고합니다.
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime, date as date_type
+from typing import Dict, List, Any, Optional, Callable, Iterable, Sequence, Tuple, Union
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+
+# Notion rich_text 한 블록 최대 길이
+RICH_TEXT_LIMIT = 2000
+
+PROPERTY_TYPES = ("title", "rich_text", "number", "select", "multi_select", "date", "checkbox")
+
+TIME_PART_EMOJI = {
+    "morning": "🌅",
+    "afternoon": "🌞",
+    "evening": "🌙"
+}
+
+TIME_PART_OPTIONS = {
+    "morning": "🌅 오전수업",
+    "afternoon": "🌞 오후수업",
+    "evening": "🌙 저녁자율학습"
+}
+
+CONDITION_OPTIONS = {
+    "좋음": "😊 좋음",
+    "보통": "😐 보통",
+    "나쁨": "😞 나쁨"
+}
+
+FOCUS_LEVEL_OPTIONS = {
+    1: "😴 매우낮음",
+    2: "😑 낮음",
+    3: "😐 보통",
+    4: "🙂 좋음",
+    5: "😊 매우좋음"
+}
+
+# 종합 점수(30점 만점)가 이 값 이상이면 optimal_flag 체크
+OPTIMAL_TOTAL_SCORE = 24
+
+Source = Union[str, Sequence[str], Callable[[Dict[str, Any]], Any]]
+
+
+class PropertyMappingError(ValueError):
+    """속성 하나를 Notion 형식으로 만들 수 없을 때 발생"""
+
+    def __init__(self, property_name: str, message: str):
+        super().__init__(f"{property_name}: {message}")
+        self.property_name = property_name
+
+
+@dataclass(frozen=True)
+class PropertySpec:
+    """
+    Notion 속성 하나의 선언
+
+    Args:
+        name: Notion 속성명
+        type: PROPERTY_TYPES 중 하나
+        source: 원본 필드명, 필드명 목록(처음으로 값이 있는 필드 사용) 또는 row → 값 함수
+        mapping: select/multi_select 값 변환 테이블 (없는 값은 원본 그대로)
+        default: 값이 비었을 때 사용할 값 (select에서는 매핑에 없는 값의 대체값,
+            함수이면 원본 값 → 옵션 이름)
+        required: 값이 비면 오류
+        limit: multi_select 최대 항목 수
+    """
+    name: str
+    type: str
+    source: Source
+    mapping: Optional[Dict[Any, str]] = None
+    default: Any = None
+    required: bool = False
+    limit: Optional[int] = None
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == []
+
+
+def _compile_getter(source: Source) -> Callable[[Dict[str, Any]], Any]:
+    if callable(source):
+        return source
+    if isinstance(source, str):
+        return lambda row: row.get(source)
+
+    fields = tuple(source)
+
+    def first_present(row: Dict[str, Any]) -> Any:
+        for field in fields:
+            value = row.get(field)
+            if not _is_empty(value):
+                return value
+        return None
+
+    return first_present
+
+
+def _as_text(value: Any) -> str:
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(item) for item in value)
+    return str(value)
+
+
+def _as_date(value: Any) -> str:
+    if isinstance(value, (datetime, date_type)):
+        return value.isoformat()
+    text = str(value)
+    datetime.fromisoformat(text)
+    return text
+
+
+def _compile_value_builder(spec: PropertySpec) -> Callable[[Any], Dict[str, Any]]:
+    """타입별 값 → Notion 속성 페이로드 함수 (매핑 테이블은 여기서 한 번만 바인딩)"""
+    kind = spec.type
+
+    if kind in ("title", "rich_text"):
+        def build_text(value):
+            return {kind: [{"text": {"content": _as_text(value)[:RICH_TEXT_LIMIT]}}]}
+        return build_text
+
+    if kind == "number":
+        def build_number(value):
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise PropertyMappingError(spec.name, f"숫자가 아닌 값 {value!r}")
+            return {"number": value}
+        return build_number
+
+    if kind == "select":
+        if not spec.mapping:
+            return lambda value: {"select": {"name": str(value)}}
+
+        lookup = spec.mapping.get
+        fallback = spec.default
+
+        if callable(fallback):
+            def build_select_with_fallback(value):
+                name = lookup(value)
+                return {"select": {"name": str(name if name is not None else fallback(value))}}
+            return build_select_with_fallback
+
+        def build_select(value):
+            name = lookup(value, fallback if fallback is not None else value)
+            return {"select": {"name": str(name)}}
+        return build_select
+
+    if kind == "multi_select":
+        lookup = (spec.mapping or {}).get
+        limit = spec.limit
+
+        def build_multi_select(value):
+            items = [value] if isinstance(value, str) else list(value)
+            if limit is not None:
+                items = items[:limit]
+            return {"multi_select": [{"name": str(lookup(item, item))} for item in items]}
+        return build_multi_select
+
+    if kind == "date":
+        def build_date(value):
+            try:
+                return {"date": {"start": _as_date(value)}}
+            except ValueError:
+                raise PropertyMappingError(spec.name, f"날짜 형식 오류 {value!r}")
+        return build_date
+
+    if kind == "checkbox":
+        return lambda value: {"checkbox": bool(value)}
+
+    raise ValueError(f"지원하지 않는 속성 타입: {kind}")
+
+
+def compile_property(spec: PropertySpec) -> Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    PropertySpec을 row → 속성 페이로드 함수로 컴파일
+
+    값이 비어 있고 기본값도 없으면 None을 반환해 해당 속성을 생략합니다.
+    select의 default는 매핑 대체값이므로 빈 값 대체에는 쓰지 않습니다.
+    """
+    get_value = _compile_getter(spec.source)
+    build_value = _compile_value_builder(spec)
+    empty_default = None if spec.type == "select" and spec.mapping else spec.default
+    name = spec.name
+    required = spec.required
+
+    def build(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        value = get_value(row)
+        if _is_empty(value):
+            value = empty_default
+            if value is None:
+                if required:
+                    raise PropertyMappingError(name, "필수 값 누락")
+                return None
+        return build_value(value)
+
+    return build
+
+
+def _validate_number(payload: Dict[str, Any]) -> Optional[str]:
+    value = payload.get("number")
+    if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+        return f"숫자 필드 타입 오류: {value!r}"
+    return None
+
+
+def _validate_date(payload: Dict[str, Any]) -> Optional[str]:
+    start = (payload.get("date") or {}).get("start")
+    if start:
+        try:
+            datetime.fromisoformat(start)
+        except (TypeError, ValueError):
+            return f"날짜 형식 오류: {start!r}"
+    return None
+
+
+def _validate_select(payload: Dict[str, Any]) -> Optional[str]:
+    if not (payload.get("select") or {}).get("name"):
+        return "선택 값 없음"
+    return None
+
+
+_PAYLOAD_VALIDATORS = {
+    "number": _validate_number,
+    "date": _validate_date,
+    "select": _validate_select,
+}
+
+
+class NotionPropertyMapper:
+    """선언적 스키마에서 컴파일된 Supabase → Notion 속성 매퍼"""
+
+    def __init__(self, schema: Iterable[PropertySpec], database_id: Optional[str] = None,
+                 key_field: str = "id", logger: Optional[ThreePartLogger] = None):
+        """
+        Args:
+            schema: 속성 선언 목록 (선언 순서대로 속성 생성)
+            database_id: 페이지 생성 페이로드의 parent 데이터베이스 ID
+            key_field: 배치 오류 보고에 사용할 레코드 키 필드
+            logger: 로깅 시스템 (선택사항)
+        """
+        self.schema: Tuple[PropertySpec, ...] = tuple(schema)
+        self.database_id = database_id
+        self.key_field = key_field
+        self.logger = logger or ThreePartLogger(name="notion_property_mapper")
+
+        names = [spec.name for spec in self.schema]
+        if len(set(names)) != len(names):
+            raise ValueError("속성명이 중복된 스키마입니다")
+        for spec in self.schema:
+            if spec.type not in PROPERTY_TYPES:
+                raise ValueError(f"지원하지 않는 속성 타입: {spec.name} ({spec.type})")
+
+        self._builders = [(spec.name, compile_property(spec)) for spec in self.schema]
+        self._required = tuple(spec.name for spec in self.schema if spec.required)
+        self._validators = [
+            (spec.name, _PAYLOAD_VALIDATORS[spec.type])
+            for spec in self.schema if spec.type in _PAYLOAD_VALIDATORS
+        ]
+
+    def map_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """레코드 하나를 Notion 속성으로 변환 (실패 시 PropertyMappingError)"""
+        properties = {}
+        for name, build in self._builders:
+            payload = build(row)
+            if payload is not None:
+                properties[name] = payload
+        return properties
+
+    def to_page(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """pages.create에 바로 넘길 수 있는 페이로드"""
+        return {
+            "parent": {"database_id": self.database_id},
+            "properties": self.map_row(row)
+        }
+
+    def map_batch(self, rows: Iterable[Dict[str, Any]], as_pages: bool = False) -> Dict[str, Any]:
+        """
+        여러 레코드를 한 번에 변환
+
+        Args:
+            rows: 원본 레코드 스트림
+            as_pages: True면 parent가 포함된 페이지 페이로드로 반환
+
+        Returns:
+            results(성공한 변환 결과, 입력 순서 유지), errors(index/key/error), 처리 통계
+        """
+        started = time.perf_counter()
+        convert = self.to_page if as_pages else self.map_row
+        key_field = self.key_field
+        results, errors = [], []
+        total = 0
+
+        for index, row in enumerate(rows):
+            total += 1
+            try:
+                results.append(convert(row))
+            except PropertyMappingError as e:
+                errors.append({"index": index, "key": row.get(key_field), "error": str(e)})
+
+        duration = time.perf_counter() - started
+        if errors:
+            self.logger.warning(f"Notion 속성 변환 실패 {len(errors)}/{total}건 (첫 오류: {errors[0]['error']})")
+
+        return {
+            "results": results,
+            "errors": errors,
+            "rows": total,
+            "mapped": len(results),
+            "failed": len(errors),
+            "duration_seconds": duration,
+            "rows_per_second": total / duration if duration > 0 else 0.0
+        }
+
+    def validate(self, properties: Dict[str, Any]) -> List[str]:
+        """이미 만들어진 속성 딕셔너리 검증 (오류 메시지 목록 반환)"""
+        errors = [f"필수 필드 누락: {name}" for name in self._required if name not in properties]
+        for name, validate in self._validators:
+            payload = properties.get(name)
+            if payload is not None:
+                error = validate(payload)
+                if error:
+                    errors.append(f"{name}: {error}")
+        return errors
+
+    def validate_batch(self, items: Iterable[Dict[str, Any]]) -> Dict[int, List[str]]:
+        """속성 딕셔너리 목록 검증 ({index: 오류 목록}, 오류 없는 항목은 제외)"""
+        failures = {}
+        for index, properties in enumerate(items):
+            errors = self.validate(properties)
+            if errors:
+                failures[index] = errors
+        return failures
+
+
+def _reflection_title(fallback_subject: Optional[str]) -> Callable[[Dict[str, Any]], str]:
+    def title(row: Dict[str, Any]) -> str:
+        emoji = TIME_PART_EMOJI.get(row.get("time_part"), "📝")
+        subject = row.get("subject") if fallback_subject is None else row.get("subject") or fallback_subject
+        return f"{emoji} {subject} - {row.get('date')}"
+    return title
+
+
+def _time_range_field(field: str) -> Callable[[Dict[str, Any]], Any]:
+    """시작/종료 시각이 모두 있을 때만 값을 보냄 (한쪽만 있는 구간은 생략)"""
+    def get(row: Dict[str, Any]) -> Any:
+        return row.get(field) if row.get("start_time") and row.get("end_time") else None
+    return get
+
+
+def _github_activities(row: Dict[str, Any]) -> Optional[str]:
+    commits, issues, prs = (row.get("github_commits") or 0, row.get("github_issues") or 0, row.get("github_prs") or 0)
+    if not (commits or issues or prs):
+        return None
+    return f"커밋: {commits}, 이슈: {issues}, PR: {prs}"
+
+
+def _optimal_flag(row: Dict[str, Any]) -> bool:
+    total = (row.get("understanding_score") or 0) + (row.get("concentration_score") or 0) + (row.get("achievement_score") or 0)
+    return total >= OPTIMAL_TOTAL_SCORE
+
+
+# 3-Part Daily Reflection DB - Supabase daily_reflections 행 (notion-sync-phase2 SupabaseToNotionMapper)
+# 매핑에 없는 시간대/컨디션은 원본 값 그대로 보냄
+REFLECTION_DB_SCHEMA: Tuple[PropertySpec, ...] = (
+    PropertySpec("name", "title", _reflection_title("일일 반성"), required=True),
+    PropertySpec("reflection_date", "date", "date", required=True),
+    PropertySpec("time_part", "select", "time_part", mapping=TIME_PART_OPTIONS, required=True),
+    PropertySpec("understanding", "number", "understanding_score"),
+    PropertySpec("difficulty", "number", lambda row: row.get("difficulty_rating") or row.get("concentration_score")),
+    PropertySpec("condition", "select", "condition", mapping=CONDITION_OPTIONS),
+    PropertySpec("focus_level", "select", "achievement_score", mapping=FOCUS_LEVEL_OPTIONS, default="😐 보통"),
+    PropertySpec("github_commits", "number", "github_commits"),
+    PropertySpec("github_issues", "number", "github_issues"),
+    PropertySpec("github_prs", "number", "github_prs"),
+    PropertySpec("subject", "rich_text", "subject"),
+    PropertySpec("key_learning", "rich_text", "key_topics"),
+    PropertySpec("challenges", "rich_text", "challenges"),
+    PropertySpec("reflection", "rich_text", "notes"),
+    PropertySpec("start_time", "rich_text", _time_range_field("start_time")),
+    PropertySpec("end_time", "rich_text", _time_range_field("end_time")),
+    # 학습 시간 0은 미입력으로 보고 생략
+    PropertySpec("learning_hours", "number", lambda row: row.get("study_hours") or None),
+    PropertySpec("github_activities", "rich_text", _github_activities),
+    PropertySpec("optimal_flag", "checkbox", _optimal_flag),
+)
+
+# 같은 DB - 일일 반성 입력(ReflectionData) 동기화 (notion-sync NotionSyncManager)
+# 매핑에 없는 시간대/컨디션은 📝/😐 접두어를 붙이고, 텍스트 필드는 비어 있어도 항상 보냄
+REFLECTION_SYNC_SCHEMA: Tuple[PropertySpec, ...] = (
+    PropertySpec("name", "title", _reflection_title(None), required=True),
+    PropertySpec("reflection_date", "date", "date", required=True),
+    PropertySpec("time_part", "select", "time_part", mapping=TIME_PART_OPTIONS,
+                 default=lambda value: f"📝 {value}", required=True),
+    PropertySpec("subject", "rich_text", "subject", default=""),
+    PropertySpec("understanding", "number", "understanding_score"),
+    PropertySpec("difficulty", "number", "concentration_score"),  # 일단 집중도로 매핑
+    PropertySpec("condition", "select", "condition", mapping=CONDITION_OPTIONS,
+                 default=lambda value: f"😐 {value}"),
+    PropertySpec("focus_level", "select", "achievement_score", mapping=FOCUS_LEVEL_OPTIONS, default="😐 보통"),
+    PropertySpec("key_learning", "rich_text", "key_learning", default=""),
+    PropertySpec("challenges", "rich_text", "challenges", default=""),
+    PropertySpec("reflection", "rich_text", "reflection", default=""),
+    PropertySpec("github_commits", "number", "github_commits"),
+    PropertySpec("github_issues", "number", "github_issues"),
+    PropertySpec("github_prs", "number", "github_prs"),
+    PropertySpec("memo", "rich_text", "memo", default=""),
+    PropertySpec("tags", "multi_select", "tags"),
+)
+
+# Supabase MCP 동기화용 한국어 속성 DB (lg-dx-dashboard/scripts/supabase_mcp.py)
+SUPABASE_MCP_SCHEMA: Tuple[PropertySpec, ...] = (
+    PropertySpec("제목", "title",
+                 lambda row: f"{row.get('date') or 'Unknown'} - {row.get('time_part') or 'Unknown'} 리플렉션"),
+    PropertySpec("날짜", "date", lambda row: row.get("date") or datetime.now().strftime('%Y-%m-%d')),
+    PropertySpec("시간대", "select", "time_part", default="morning"),
+    PropertySpec("이해도", "number", "understanding_score", default=0),
+    PropertySpec("집중도", "number", "concentration_score", default=0),
+    PropertySpec("성취도", "number", "achievement_score", default=0),
+    # 총점은 formula이므로 제외 (Notion에서 자동 계산)
+    PropertySpec("컨디션", "select", "condition", default="보통"),
+    PropertySpec(" 오늘의 성취", "multi_select", "achievements", limit=5),
+    PropertySpec("어려웠던 점", "multi_select", "challenges", limit=5),
+    PropertySpec("내일목표", "multi_select", "tomorrow_goals", limit=5),
+    PropertySpec("추가 메모", "rich_text", "notes"),
+    # Supabase ID 저장 (중복 방지용)
+    PropertySpec("Supabase_ID", "rich_text", "id"),
+)
+
+_shared_mappers: Dict[Tuple[Any, Optional[str]], NotionPropertyMapper] = {}
+
+
+def _freeze(value: Any) -> Any:
+    """캐시 키용으로 값을 해시 가능한 형태로 변환 (함수는 객체 자체로 구분)"""
+    if isinstance(value, dict):
+        return tuple(sorted(((_freeze(k), _freeze(v)) for k, v in value.items()), key=repr))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = tuple(_freeze(item) for item in value)
+        return tuple(sorted(items, key=repr)) if isinstance(value, (set, frozenset)) else items
+    return value
+
+
+def _schema_key(schema: Sequence[PropertySpec]) -> Tuple[Any, ...]:
+    """스키마 내용으로 만든 캐시 키 - 같은 내용이면 객체가 달라도 같은 키"""
+    return tuple(
+        (spec.name, spec.type, _freeze(spec.source), _freeze(spec.mapping),
+         _freeze(spec.default), spec.required, spec.limit)
+        for spec in schema
+    )
+
+
+def get_mapper(schema: Sequence[PropertySpec] = REFLECTION_DB_SCHEMA,
+               database_id: Optional[str] = None) -> NotionPropertyMapper:
+    """스키마 내용별로 한 번만 컴파일된 매퍼 재사용"""
+    cache_key = (_schema_key(schema), database_id)
+    mapper = _shared_mappers.get(cache_key)
+    if mapper is None:
+        mapper = _shared_mappers[cache_key] = NotionPropertyMapper(schema, database_id=database_id)
+    return mapper
+
+
+def test_notion_property_mapper():
+    """NotionPropertyMapper 테스트 함수"""
+    print("🗺️ Notion 속성 매퍼 테스트 시작")
+
+    rows = [
+        {"id": f"r{i}", "date": f"2025-07-{1 + i % 28:02d}", "time_part": ("morning", "afternoon", "evening")[i % 3],
+         "understanding_score": i % 10, "concentration_score": 7, "achievement_score": 1 + i % 5,
+         "condition": "좋음", "subject": "Python 기초", "key_topics": ["변수", "데이터타입"], "github_commits": i % 4}
+        for i in range(5000)
+    ]
+    rows[42]["date"] = "07/23"
+
+    mapper = get_mapper()
+    result = mapper.map_batch(rows)
+    failures = mapper.validate_batch(result["results"])
+
+    print(f"✅ {result['mapped']}/{result['rows']}건 변환 ({result['rows_per_second']:.0f} rows/s), "
+          f"실패 {result['errors']}, 검증 오류 {len(failures)}건")
+
+
+if __name__ == "__main__":
+    test_notion_property_mapper()
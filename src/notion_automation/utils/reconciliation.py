@@ -0,0 +1,222 @@
+"""
+Supabase ↔ Notion 범위 다이제스트 기반 대사(reconciliation) 엔진
+
+양쪽 레코드를 한 번 훑으며 월/일 단위 다이제스트(레코드 해시의 XOR + 개수)를 만들고,
+월 다이제스트가 다른 달만 일 단위로, 일 다이제스트가 다른 날만 레코드 단위로
+내려가 비교합니다. 레코드 비교는 키 해시 조인으로 처리하므로 전체 비용이 O(n + m)이고,
+대부분 일치하는 데이터는 다이제스트 몇 개만 비교하면 끝납니다.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime, date as date_type
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Callable, Sequence, Tuple
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+
+# 비교 대상 필드 (Supabase daily_reflections 기준)
+DEFAULT_COMPARE_FIELDS = (
+    "date",
+    "time_part",
+    "understanding_score",
+    "concentration_score",
+    "achievement_score",
+    "condition",
+)
+
+UNKNOWN_DAY = "unknown"
+_EMPTY_DIGEST = (0, 0)
+
+
+def _normalize_value(value: Any) -> Any:
+    """양쪽 표현 차이(7 vs 7.0, date vs 문자열) 제거"""
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, (datetime, date_type)):
+        return value.isoformat()
+    return str(value)
+
+
+def record_fingerprint(record: Dict[str, Any], fields: Sequence[str] = DEFAULT_COMPARE_FIELDS) -> str:
+    """비교 필드만으로 만든 레코드 해시"""
+    payload = [_normalize_value(record.get(field)) for field in fields]
+    return hashlib.sha256(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+
+def _day_of(record: Dict[str, Any], date_field: str) -> str:
+    value = record.get(date_field)
+    if not value:
+        return UNKNOWN_DAY
+    return _normalize_value(value)[:10]
+
+
+class RangeDigestSource:
+    """한쪽 데이터셋의 월/일 다이제스트와 일 단위 레코드 조회"""
+
+    def __init__(self, records: Iterable[Dict[str, Any]], key_field: str = "id", date_field: str = "date",
+                 fields: Sequence[str] = DEFAULT_COMPARE_FIELDS,
+                 fetch_day: Optional[Callable[[str], Iterable[Dict[str, Any]]]] = None):
+        """
+        Args:
+            records: 다이제스트를 만들 레코드 스트림 (한 번만 순회)
+            key_field: 조인 키 필드 (Supabase는 id, Notion은 supabase_id)
+            date_field: 범위를 나눌 날짜 필드
+            fields: 비교 필드
+            fetch_day: 특정 날짜 레코드 조회 함수. 없으면 스트림을 보관해 두었다가 사용
+        """
+        self.key_field = key_field
+        self.date_field = date_field
+        self.fields = tuple(fields)
+        self.fetch_day = fetch_day
+        self.total = 0
+        self.skipped = 0
+        self.days: Dict[str, Tuple[int, int]] = {}
+        self._retained: Optional[Dict[str, List[Dict[str, Any]]]] = None if fetch_day else {}
+        self._build(records)
+
+    def _entry_hash(self, key: Any, fingerprint: str) -> int:
+        return int.from_bytes(hashlib.sha256(f"{key}|{fingerprint}".encode("utf-8")).digest()[:16], "big")
+
+    def _build(self, records: Iterable[Dict[str, Any]]):
+        for record in records:
+            key = record.get(self.key_field)
+            if key is None:
+                self.skipped += 1
+                continue
+
+            day = _day_of(record, self.date_field)
+            count, digest = self.days.get(day, _EMPTY_DIGEST)
+            self.days[day] = (count + 1, digest ^ self._entry_hash(key, record_fingerprint(record, self.fields)))
+            self.total += 1
+
+            if self._retained is not None:
+                self._retained.setdefault(day, []).append(record)
+
+    def month_digests(self) -> Dict[str, str]:
+        """월별 다이제스트 (일 다이제스트를 날짜순으로 이은 해시)"""
+        months: Dict[str, Any] = {}
+        for day in sorted(self.days):
+            count, digest = self.days[day]
+            months.setdefault(day[:7], hashlib.sha256()).update(f"{day}:{count}:{digest:032x};".encode("ascii"))
+        return {month: h.hexdigest() for month, h in months.items()}
+
+    def day_digests(self, month: str) -> Dict[str, Tuple[int, int]]:
+        return {day: digest for day, digest in self.days.items() if day[:7] == month}
+
+    def iter_day(self, day: str) -> Iterator[Dict[str, Any]]:
+        if self._retained is not None:
+            yield from self._retained.get(day, [])
+            return
+        for record in self.fetch_day(day):
+            if record.get(self.key_field) is not None and _day_of(record, self.date_field) == day:
+                yield record
+
+
+class RangeReconciler:
+    """월 → 일 → 레코드 순으로 불일치 범위만 내려가는 대사 엔진"""
+
+    def __init__(self, source: RangeDigestSource, target: RangeDigestSource,
+                 logger: Optional[ThreePartLogger] = None):
+        self.source = source
+        self.target = target
+        self.logger = logger or ThreePartLogger(name="reconciliation")
+
+    def reconcile(self) -> Dict[str, Any]:
+        """
+        Returns:
+            missing_in_target/orphaned_in_target/inconsistent 키 목록과 비교 통계
+        """
+        missing, orphaned, inconsistent = [], [], []
+        source_months = self.source.month_digests()
+        target_months = self.target.month_digests()
+
+        months = sorted(set(source_months) | set(target_months))
+        mismatched_months = [m for m in months if source_months.get(m) != target_months.get(m)]
+
+        days_compared = 0
+        mismatched_days = []
+        for month in mismatched_months:
+            source_days = self.source.day_digests(month)
+            target_days = self.target.day_digests(month)
+            for day in sorted(set(source_days) | set(target_days)):
+                days_compared += 1
+                if source_days.get(day) != target_days.get(day):
+                    mismatched_days.append(day)
+
+        records_compared = 0
+        unmatched_source: Dict[Any, str] = {}
+        unmatched_target: Dict[Any, str] = {}
+        for day in mismatched_days:
+            # 해시 조인: 대상 쪽을 키로 색인한 뒤 원본 쪽을 한 번 순회
+            target_index = {}
+            for record in self.target.iter_day(day):
+                target_index[record[self.target.key_field]] = record_fingerprint(record, self.target.fields)
+
+            for record in self.source.iter_day(day):
+                records_compared += 1
+                key = record[self.source.key_field]
+                fingerprint = record_fingerprint(record, self.source.fields)
+                target_fingerprint = target_index.pop(key, None)
+                if target_fingerprint is None:
+                    unmatched_source[key] = fingerprint
+                elif target_fingerprint != fingerprint:
+                    inconsistent.append(key)
+
+            unmatched_target.update(target_index)
+
+        # 날짜가 서로 다르게 기록된 레코드는 양쪽 모두 다른 날에 남으므로 불일치로 분류
+        for key in unmatched_source:
+            if key in unmatched_target:
+                del unmatched_target[key]
+                inconsistent.append(key)
+            else:
+                missing.append(key)
+        orphaned.extend(unmatched_target)
+
+        report = {
+            "total_source": self.source.total,
+            "total_target": self.target.total,
+            "missing_in_target": missing,
+            "orphaned_in_target": orphaned,
+            "inconsistent": inconsistent,
+            "months_compared": len(months),
+            "mismatched_months": mismatched_months,
+            "days_compared": days_compared,
+            "mismatched_days": mismatched_days,
+            "records_compared": records_compared
+        }
+        self.logger.info(
+            f"대사 완료: 월 {len(months)}개 중 {len(mismatched_months)}개, "
+            f"일 {days_compared}개 중 {len(mismatched_days)}개 불일치, 레코드 {records_compared}개 비교"
+        )
+        return report
+
+
+def test_reconciliation():
+    """RangeReconciler 테스트 함수"""
+    print("🧮 범위 다이제스트 대사 테스트 시작")
+
+    supabase = [
+        {"id": f"r{i}", "date": f"2025-07-{1 + i % 28:02d}", "time_part": "morning", "understanding_score": i % 10}
+        for i in range(1000)
+    ]
+    notion = [dict(record, supabase_id=record["id"]) for record in supabase[:-1]]
+    notion[10]["understanding_score"] = 99
+
+    report = RangeReconciler(
+        RangeDigestSource(supabase, key_field="id"),
+        RangeDigestSource(notion, key_field="supabase_id")
+    ).reconcile()
+
+    print(f"✅ 누락 {report['missing_in_target']}, 불일치 {report['inconsistent']}, "
+          f"비교한 레코드 {report['records_compared']}개")
+
+
+if __name__ == "__main__":
+    test_reconciliation()
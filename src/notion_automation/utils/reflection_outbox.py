@@ -0,0 +1,409 @@
+"""
+리플렉션 쓰기 outbox (오프라인 우선 write-behind)
+
+입력 CLI는 원격 저장 대신 로컬 SQLite outbox에 한 건을 기록하고 바로 반환합니다.
+백그라운드 flusher가 대상(notion, supabase)별로 대기 항목을 묶어 전송하며,
+실패하면 지수 백오프로 재시도하고 max_attempts를 넘기면 dead로 남겨 둡니다.
+같은 리플렉션(날짜 + 시간대)은 같은 idempotency key를 쓰므로 다시 제출하면
+대기 중인 내용을 덮어쓰고, 전송 쪽도 키로 기존 페이지/행을 찾아 갱신하므로 중복이 생기지 않습니다.
+"""
+
+import argparse
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Any, Optional, Callable, Iterable
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.shared_rate_limiter import get_rate_limiter
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+# 입력 CLI(실행 디렉토리 무관)와 cron flusher가 같은 대기열을 보도록 프로젝트 루트 기준 경로 사용
+DEFAULT_OUTBOX_PATH = os.getenv("REFLECTION_OUTBOX_PATH", os.path.join(project_root, "data", "reflection_outbox.db"))
+DEFAULT_BATCH_SIZE = 20
+DEFAULT_MAX_ATTEMPTS = 8
+DEFAULT_LEASE_SECONDS = 120.0
+MAX_BACKOFF_SECONDS = 3600.0
+
+OUTBOX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    idempotency_key TEXT NOT NULL,
+    target TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1,
+    status TEXT NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'sent', 'dead')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    lease_until REAL NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    sent_at TEXT,
+    UNIQUE(idempotency_key, target)
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_ready ON outbox(target, status, next_attempt_at);
+"""
+
+# 전송 함수: 항목 목록을 받아 실패한 항목의 {idempotency_key: 오류 메시지} 반환
+Sender = Callable[[List[Dict[str, Any]]], Dict[str, str]]
+
+
+def retry_delay(attempts: int) -> float:
+    """재시도 대기 시간 (2, 4, 8, ... 초, 최대 1시간)"""
+    return min(MAX_BACKOFF_SECONDS, 2.0 ** attempts)
+
+
+class ReflectionOutbox:
+    """SQLite 기반 영속 전송 대기열"""
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Args:
+            db_path: outbox DB 경로 (기본값: DEFAULT_OUTBOX_PATH)
+        """
+        db_path = db_path or DEFAULT_OUTBOX_PATH
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(OUTBOX_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # CLI 프로세스와 flusher 스레드가 함께 쓰므로 호출마다 연결을 엶
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def enqueue(self, idempotency_key: str, payload: Dict[str, Any],
+                targets: Iterable[str] = ("notion",)) -> int:
+        """
+        대상별 전송 항목 기록 (로컬 트랜잭션 하나로 끝나므로 즉시 반환)
+
+        같은 키가 이미 있으면 내용을 덮어쓰고 재시도 상태를 초기화합니다.
+
+        Returns:
+            기록한 항목 수
+        """
+        body = json.dumps(payload, ensure_ascii=False, default=str)
+        rows = [(idempotency_key, target, body) for target in targets]
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT INTO outbox (idempotency_key, target, payload) VALUES (?, ?, ?)
+                ON CONFLICT(idempotency_key, target) DO UPDATE SET
+                    payload = excluded.payload,
+                    version = outbox.version + 1,
+                    status = 'pending',
+                    attempts = 0,
+                    next_attempt_at = 0,
+                    last_error = NULL,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                rows
+            )
+        return len(rows)
+
+    def claim(self, target: str, limit: int = DEFAULT_BATCH_SIZE,
+              lease_seconds: float = DEFAULT_LEASE_SECONDS) -> List[Dict[str, Any]]:
+        """
+        전송할 항목을 임대(lease)하여 반환
+
+        임대 중인 항목은 다른 flusher가 가져가지 않으며, 전송 중 프로세스가 죽어도
+        임대가 만료되면 다시 전송 대상이 됩니다.
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                """
+                SELECT id, idempotency_key, payload, attempts, version FROM outbox
+                WHERE target = ? AND status = 'pending' AND next_attempt_at <= ? AND lease_until <= ?
+                ORDER BY id LIMIT ?
+                """,
+                (target, now, now, limit)
+            ).fetchall()
+            conn.executemany("UPDATE outbox SET lease_until = ? WHERE id = ?",
+                             [(now + lease_seconds, row[0]) for row in rows])
+            conn.commit()
+        finally:
+            conn.close()
+
+        return [
+            {"id": row[0], "idempotency_key": row[1], "payload": json.loads(row[2]),
+             "attempts": row[3], "version": row[4], "target": target}
+            for row in rows
+        ]
+
+    def mark_sent(self, items: List[Dict[str, Any]]):
+        """전송 완료 기록 (전송 중 다시 제출된 항목은 대기 상태 유지)"""
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                UPDATE outbox SET status = 'sent', sent_at = CURRENT_TIMESTAMP, last_error = NULL
+                WHERE id = ? AND version = ?
+                """,
+                [(item["id"], item["version"]) for item in items]
+            )
+            conn.executemany("UPDATE outbox SET lease_until = 0 WHERE id = ?", [(item["id"],) for item in items])
+
+    def mark_failed(self, item: Dict[str, Any], error: str, max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> bool:
+        """
+        전송 실패 기록
+
+        Returns:
+            재시도 한도를 넘겨 dead가 되었으면 True
+        """
+        attempts = item["attempts"] + 1
+        dead = attempts >= max_attempts
+        with self._connect() as conn:
+            conn.execute(
+                """
+                UPDATE outbox SET attempts = ?, status = ?, next_attempt_at = ?, last_error = ?,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ? AND version = ?
+                """,
+                (attempts, "dead" if dead else "pending", time.time() + retry_delay(attempts),
+                 str(error)[:1000], item["id"], item["version"])
+            )
+            conn.execute("UPDATE outbox SET lease_until = 0 WHERE id = ?", (item["id"],))
+        return dead
+
+    def counts(self) -> Dict[str, int]:
+        """상태별 항목 수"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall()
+        counts = {"pending": 0, "sent": 0, "dead": 0}
+        counts.update(dict(rows))
+        return counts
+
+    def retry_dead(self) -> int:
+        """dead 항목을 다시 대기 상태로 (수동 복구용)"""
+        with self._connect() as conn:
+            return conn.execute(
+                "UPDATE outbox SET status = 'pending', attempts = 0, next_attempt_at = 0 WHERE status = 'dead'"
+            ).rowcount
+
+    def purge_sent(self, older_than_days: int = 30) -> int:
+        """오래된 전송 완료 항목 삭제"""
+        with self._connect() as conn:
+            return conn.execute(
+                "DELETE FROM outbox WHERE status = 'sent' AND sent_at < datetime('now', ?)",
+                (f"-{older_than_days} days",)
+            ).rowcount
+
+
+class OutboxFlusher:
+    """outbox를 대상별로 묶어 전송하는 백그라운드 작업자"""
+
+    def __init__(self, outbox: ReflectionOutbox, senders: Dict[str, Sender],
+                 batch_size: int = DEFAULT_BATCH_SIZE, max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+                 interval: float = 5.0, logger: Optional[ThreePartLogger] = None):
+        """
+        Args:
+            outbox: 전송 대기열
+            senders: 대상 이름 → 전송 함수 (없는 대상의 항목은 대기열에 그대로 남음)
+            batch_size: 대상별 한 번에 전송할 항목 수
+            max_attempts: 이 횟수만큼 실패하면 dead 처리
+            interval: 전송할 항목이 없을 때 다시 확인하는 간격 (초)
+            logger: 로깅 시스템 (선택사항)
+        """
+        self.outbox = outbox
+        self.senders = senders
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.interval = interval
+        self.logger = logger or ThreePartLogger(name="reflection_outbox")
+        self.stats = {"sent": 0, "failed": 0, "dead": 0}
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._drain_deadline = 0.0
+        self._thread: Optional[threading.Thread] = None
+
+    def flush_once(self) -> int:
+        """대상별로 한 묶음씩 전송 (처리한 항목 수 반환)"""
+        processed = 0
+        for target, send in self.senders.items():
+            items = self.outbox.claim(target, self.batch_size)
+            if not items:
+                continue
+            processed += len(items)
+
+            try:
+                errors = send(items) or {}
+            except Exception as e:
+                errors = {item["idempotency_key"]: str(e) for item in items}
+
+            self.outbox.mark_sent([item for item in items if item["idempotency_key"] not in errors])
+            self.stats["sent"] += len(items) - len(errors)
+
+            for item in items:
+                error = errors.get(item["idempotency_key"])
+                if error is None:
+                    continue
+                self.stats["failed"] += 1
+                if self.outbox.mark_failed(item, error, self.max_attempts):
+                    self.stats["dead"] += 1
+                    self.logger.error(f"{target} 전송 포기 ({item['idempotency_key']}): {error}")
+                else:
+                    self.logger.warning(f"{target} 전송 실패, 재시도 예정 ({item['idempotency_key']}): {error}")
+        return processed
+
+    def drain(self, timeout: float) -> int:
+        """지금 전송 가능한 항목이 없어질 때까지 반복 (남은 대기 항목 수 반환)"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and self.flush_once():
+            pass
+        return self.outbox.counts()["pending"]
+
+    def _run(self):
+        while True:
+            processed = self.flush_once()
+            if self._stopping.is_set() and (not processed or time.monotonic() >= self._drain_deadline):
+                break
+            if not processed:
+                self._wake.wait(self.interval)
+                self._wake.clear()
+
+    def start(self):
+        """백그라운드 전송 시작 (이미 실행 중이면 즉시 한 번 깨움)"""
+        if not self.senders:
+            return
+        if self._thread is not None and self._thread.is_alive():
+            self._wake.set()
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="reflection-outbox-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self, drain_timeout: float = 0.0) -> int:
+        """
+        백그라운드 전송 종료
+
+        Args:
+            drain_timeout: 남은 항목 전송을 기다릴 최대 시간 (넘기면 다음 실행 때 이어서 전송)
+
+        Returns:
+            남은 대기 항목 수
+        """
+        if self._thread is not None:
+            self._drain_deadline = time.monotonic() + drain_timeout
+            self._stopping.set()
+            self._wake.set()
+            self._thread.join(drain_timeout + self.interval)
+            self._thread = None
+        return self.outbox.counts()["pending"]
+
+
+class NotionPageSender:
+    """Notion 3-Part DB 페이지 생성/갱신 (같은 날짜 + 시간대 페이지가 있으면 갱신)"""
+
+    def __init__(self, client: Any, database_id: str, rate_limiter: Any = None):
+        """
+        Args:
+            client: notion_client.Client 호환 클라이언트
+            database_id: Notion 3-Part 데이터베이스 ID
+            rate_limiter: acquire()를 제공하는 제한기 (기본값: 프로세스 간 공유 Notion 제한기)
+        """
+        self.client = client
+        self.database_id = database_id
+        self.rate_limiter = rate_limiter or get_rate_limiter("notion")
+        self.page_ids: Dict[str, str] = {}
+
+    def _find_page(self, match: Dict[str, str]) -> Optional[str]:
+        self.rate_limiter.acquire()
+        response = self.client.databases.query(
+            database_id=self.database_id,
+            filter={"and": [
+                {"property": "reflection_date", "date": {"equals": match["reflection_date"]}},
+                {"property": "time_part", "select": {"equals": match["time_part"]}}
+            ]},
+            page_size=1
+        )
+        results = (response or {}).get("results", [])
+        return results[0]["id"] if results else None
+
+    def __call__(self, items: List[Dict[str, Any]]) -> Dict[str, str]:
+        errors = {}
+        for item in items:
+            key = item["idempotency_key"]
+            payload = item["payload"]
+            try:
+                page_id = self.page_ids.get(key) or self._find_page(payload["match"])
+                self.rate_limiter.acquire()
+                if page_id:
+                    self.client.pages.update(page_id=page_id, properties=payload["properties"])
+                else:
+                    response = self.client.pages.create(parent={"database_id": self.database_id},
+                                                        properties=payload["properties"])
+                    page_id = (response or {}).get("id")
+                if page_id:
+                    self.page_ids[key] = page_id
+            except Exception as e:
+                errors[key] = str(e)
+        return errors
+
+
+class SupabaseUpsertSender:
+    """Supabase 테이블 일괄 upsert (payload["row"]를 한 번의 요청으로 전송)"""
+
+    def __init__(self, client: Any, table: str = "daily_reflections",
+                 on_conflict: str = "user_id,date,time_part"):
+        self.client = client
+        self.table = table
+        self.on_conflict = on_conflict
+
+    def __call__(self, items: List[Dict[str, Any]]) -> Dict[str, str]:
+        rows = [item["payload"]["row"] for item in items]
+        try:
+            self.client.table(self.table).upsert(rows, on_conflict=self.on_conflict).execute()
+            return {}
+        except Exception as e:
+            return {item["idempotency_key"]: str(e) for item in items}
+
+
+def default_senders(database_id: Optional[str]) -> Dict[str, Sender]:
+    """환경 변수로 만들 수 있는 전송 함수 (설정이 없으면 해당 대상은 대기열에 보관)"""
+    senders: Dict[str, Sender] = {}
+    token = os.getenv("NOTION_API_TOKEN")
+    if database_id and token:
+        try:
+            from notion_client import Client
+            senders["notion"] = NotionPageSender(Client(auth=token), database_id)
+        except ImportError:
+            pass
+    return senders
+
+
+def main():
+    """outbox 상태 확인 및 수동 전송"""
+    parser = argparse.ArgumentParser(description="리플렉션 outbox 관리")
+    parser.add_argument("--db", default=DEFAULT_OUTBOX_PATH, help="outbox DB 경로")
+    parser.add_argument("--flush", action="store_true", help="대기 항목 전송")
+    parser.add_argument("--retry-dead", action="store_true", help="dead 항목을 다시 대기 상태로")
+    parser.add_argument("--timeout", type=float, default=60.0, help="전송 최대 시간 (초)")
+    args = parser.parse_args()
+
+    outbox = ReflectionOutbox(args.db)
+    if args.retry_dead:
+        print(f"♻️ dead 항목 {outbox.retry_dead()}건 재대기")
+
+    if args.flush:
+        senders = default_senders(os.getenv("NOTION_3PART_DATABASE_ID"))
+        if not senders:
+            print("⚠️ NOTION_API_TOKEN / NOTION_3PART_DATABASE_ID가 없어 전송할 수 없습니다.")
+        else:
+            flusher = OutboxFlusher(outbox, senders)
+            remaining = flusher.drain(args.timeout)
+            print(f"📮 전송 {flusher.stats['sent']}건, 실패 {flusher.stats['failed']}건, 남은 대기 {remaining}건")
+
+    print(f"📊 outbox 상태: {outbox.counts()}")
+
+
+if __name__ == "__main__":
+    main()
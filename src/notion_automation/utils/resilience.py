@@ -0,0 +1,404 @@
+"""
+외부 API 호출 복원력 계층 (재시도 백오프 + 서킷 브레이커 + 데드라인 + 헤징)
+
+GitHub/Notion/Supabase 호출의 재시도를 한 곳에서 처리합니다.
+- 재시도 간격은 decorrelated jitter 백오프로 정해 여러 프로세스가 같은 순간에 다시 몰리지 않습니다.
+- 엔드포인트별 서킷 브레이커가 연속 실패 시 호출을 잠시 차단해 장애 중인 API를 두드리지 않습니다.
+- deadline()으로 건 전체 제한 시간은 contextvar로 전파되어 안쪽 재시도와 HTTP 타임아웃이 함께 줄어듭니다.
+- 멱등한 읽기 요청은 hedge_after를 지정해 느린 첫 요청 대신 먼저 끝난 응답을 쓸 수 있습니다.
+"""
+
+import contextvars
+import functools
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Callable, Tuple, Type
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커가 열려 호출을 보내지 않음"""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"서킷 브레이커 열림 [{name}]: {retry_in:.1f}초 후 재시도 가능")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class DeadlineExceeded(TimeoutError):
+    """전체 제한 시간 초과"""
+
+
+class DecorrelatedJitterBackoff:
+    """
+    Decorrelated jitter 백오프
+
+    다음 대기 시간을 base ~ 직전 대기 시간 x 3 사이에서 무작위로 고르고 cap으로 제한합니다.
+    """
+
+    def __init__(self, base: float = 0.5, cap: float = 30.0, rng: Optional[random.Random] = None):
+        self.base = base
+        self.cap = cap
+        self.rng = rng or random.Random()
+
+    def next_delay(self, previous: Optional[float] = None) -> float:
+        previous = previous if previous else self.base
+        return min(self.cap, self.rng.uniform(self.base, previous * 3))
+
+
+class Deadline:
+    """절대 마감 시각 (monotonic 기준)"""
+
+    def __init__(self, seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.expires_at = clock() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - self.clock())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+_current_deadline: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar("deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """현재 컨텍스트에 걸린 데드라인 (없으면 None)"""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline(seconds: Optional[float], clock: Callable[[], float] = time.monotonic):
+    """
+    블록 전체 제한 시간 설정 (바깥 데드라인보다 늦어지지는 않음)
+
+    Example:
+        with deadline(10):
+            policy.call(fetch)  # 재시도와 HTTP 타임아웃이 남은 시간 안으로 제한됨
+    """
+    outer = _current_deadline.get()
+    if seconds is None:
+        yield outer
+        return
+
+    inner = Deadline(seconds, clock)
+    if outer is not None and outer.expires_at <= inner.expires_at:
+        inner = outer
+    token = _current_deadline.set(inner)
+    try:
+        yield inner
+    finally:
+        _current_deadline.reset(token)
+
+
+def remaining_timeout(default: Optional[float] = None) -> Optional[float]:
+    """현재 데드라인까지 남은 시간과 default 중 작은 값 (요청 타임아웃 계산용)"""
+    current = _current_deadline.get()
+    if current is None:
+        return default
+    if default is None:
+        return current.remaining()
+    return min(default, current.remaining())
+
+
+class CircuitBreaker:
+    """
+    엔드포인트별 서킷 브레이커
+
+    closed: 정상 호출, 연속 실패가 failure_threshold에 도달하면 open
+    open: recovery_timeout 동안 호출 차단
+    half_open: 시험 호출 half_open_max_calls개만 허용, 성공하면 closed / 실패하면 다시 open
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0,
+                 half_open_max_calls: int = 1, clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.clock = clock
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.half_open_calls = 0
+        self.stats = {"successes": 0, "failures": 0, "rejected": 0, "opened": 0}
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """호출 허용 여부 (half_open 시험 호출 슬롯도 여기서 차지)"""
+        with self._lock:
+            if self.state == self.OPEN:
+                if self.clock() - self.opened_at < self.recovery_timeout:
+                    self.stats["rejected"] += 1
+                    return False
+                self.state = self.HALF_OPEN
+                self.half_open_calls = 0
+
+            if self.state == self.HALF_OPEN:
+                if self.half_open_calls >= self.half_open_max_calls:
+                    self.stats["rejected"] += 1
+                    return False
+                self.half_open_calls += 1
+            return True
+
+    def retry_in(self) -> float:
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.recovery_timeout - (self.clock() - self.opened_at))
+
+    def record_success(self):
+        with self._lock:
+            self.stats["successes"] += 1
+            self.consecutive_failures = 0
+            self.state = self.CLOSED
+
+    def record_failure(self):
+        with self._lock:
+            self.stats["failures"] += 1
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.stats["opened"] += 1
+                self.state = self.OPEN
+                self.opened_at = self.clock()
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        if not self.allow():
+            raise CircuitOpenError(self.name, self.retry_in())
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self.record_failure()
+            raise
+        self.record_success()
+        return result
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str, **kwargs) -> CircuitBreaker:
+    """엔드포인트 이름별 서킷 브레이커 (프로세스 안에서 공유)"""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(name, **kwargs)
+        return breaker
+
+
+def circuit_breaker_states() -> Dict[str, Dict[str, Any]]:
+    """등록된 서킷 브레이커 상태 요약"""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {
+        breaker.name: {"state": breaker.state, "consecutive_failures": breaker.consecutive_failures, **breaker.stats}
+        for breaker in breakers
+    }
+
+
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+_hedge_lock = threading.Lock()
+
+
+def _get_hedge_executor() -> ThreadPoolExecutor:
+    global _hedge_executor
+    with _hedge_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="hedge")
+        return _hedge_executor
+
+
+def hedged_call(func: Callable[[], Any], hedge_after: float) -> Tuple[Any, bool]:
+    """
+    첫 요청이 hedge_after초 안에 끝나지 않으면 같은 요청을 하나 더 보내고 먼저 성공한 결과 사용
+
+    멱등한 읽기에만 사용해야 합니다. 두 요청 모두 실패하면 마지막 오류를 다시 발생시킵니다.
+
+    Returns:
+        (결과, 헤지 요청을 보냈는지 여부)
+    """
+    executor = _get_hedge_executor()
+    # 데드라인 등 현재 컨텍스트를 작업 스레드로 전달
+    futures = {executor.submit(contextvars.copy_context().run, func)}
+    done, _ = wait(futures, timeout=hedge_after)
+    hedged = not done
+    if hedged:
+        futures.add(executor.submit(contextvars.copy_context().run, func))
+
+    last_error: Optional[BaseException] = None
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, timeout=remaining_timeout(), return_when=FIRST_COMPLETED)
+        if not done:
+            raise DeadlineExceeded("헤지 요청이 데드라인 안에 끝나지 않음")
+        for future in done:
+            if future.exception() is None:
+                return future.result(), hedged
+            last_error = future.exception()
+    raise last_error
+
+
+class RetryPolicy:
+    """백오프 재시도 + 서킷 브레이커 + 데드라인 + (선택) 헤징을 묶은 호출 정책"""
+
+    def __init__(self,
+                 max_attempts: int = 4,
+                 backoff: Optional[DecorrelatedJitterBackoff] = None,
+                 retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+                 is_retryable: Optional[Callable[[BaseException], bool]] = None,
+                 breaker: Optional[CircuitBreaker] = None,
+                 deadline_seconds: Optional[float] = None,
+                 hedge_after: Optional[float] = None,
+                 on_retry: Optional[Callable[[int, BaseException, float], None]] = None,
+                 sleep: Callable[[float], None] = time.sleep,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            max_attempts: 첫 호출을 포함한 최대 시도 횟수
+            backoff: 재시도 간격 계산기 (기본값: base 0.5초, cap 30초)
+            retry_on: 재시도할 예외 타입
+            is_retryable: 예외별 재시도 여부 판단 (예: 4xx 중 429만 재시도)
+            breaker: 엔드포인트 서킷 브레이커
+            deadline_seconds: 재시도를 포함한 전체 제한 시간
+            hedge_after: 지정하면 각 시도를 hedged_call로 실행 (멱등한 읽기 전용)
+            on_retry: 재시도 직전 호출 (시도 번호, 오류, 대기 시간)
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.backoff = backoff or DecorrelatedJitterBackoff()
+        self.retry_on = retry_on
+        self.is_retryable = is_retryable
+        self.breaker = breaker
+        self.deadline_seconds = deadline_seconds
+        self.hedge_after = hedge_after
+        self.on_retry = on_retry
+        self.sleep = sleep
+        self.clock = clock
+        self.stats = {
+            "calls": 0, "attempts": 0, "retries": 0, "successes": 0, "failures": 0,
+            "slept_seconds": 0.0, "short_circuited": 0, "deadline_exceeded": 0, "hedged": 0
+        }
+
+    def _retryable(self, error: BaseException) -> bool:
+        if isinstance(error, (CircuitOpenError, DeadlineExceeded)):
+            return False
+        if not isinstance(error, self.retry_on):
+            return False
+        return self.is_retryable(error) if self.is_retryable else True
+
+    def _attempt(self, func: Callable, args, kwargs) -> Any:
+        if self.breaker is not None and not self.breaker.allow():
+            self.stats["short_circuited"] += 1
+            raise CircuitOpenError(self.breaker.name, self.breaker.retry_in())
+
+        try:
+            if self.hedge_after is not None:
+                result, hedged = hedged_call(lambda: func(*args, **kwargs), self.hedge_after)
+                self.stats["hedged"] += 1 if hedged else 0
+            else:
+                result = func(*args, **kwargs)
+        except Exception:
+            if self.breaker is not None:
+                self.breaker.record_failure()
+            raise
+
+        if self.breaker is not None:
+            self.breaker.record_success()
+        return result
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """정책에 따라 func 실행 (마지막 오류 또는 CircuitOpenError/DeadlineExceeded 발생)"""
+        self.stats["calls"] += 1
+        delay: Optional[float] = None
+
+        with deadline(self.deadline_seconds, self.clock) as active_deadline:
+            for attempt in range(1, self.max_attempts + 1):
+                if active_deadline is not None and active_deadline.expired():
+                    self.stats["deadline_exceeded"] += 1
+                    raise DeadlineExceeded("재시도 전 데드라인 초과")
+
+                self.stats["attempts"] += 1
+                try:
+                    result = self._attempt(func, args, kwargs)
+                    self.stats["successes"] += 1
+                    return result
+                except Exception as e:
+                    if attempt == self.max_attempts or not self._retryable(e):
+                        self.stats["failures"] += 1
+                        raise
+
+                    delay = self.backoff.next_delay(delay)
+                    if active_deadline is not None and active_deadline.remaining() < delay:
+                        self.stats["failures"] += 1
+                        self.stats["deadline_exceeded"] += 1
+                        raise DeadlineExceeded(
+                            f"다음 재시도({delay:.1f}초 후)가 데드라인을 넘김: {e}"
+                        ) from e
+
+                    if self.on_retry is not None:
+                        self.on_retry(attempt, e, delay)
+                    self.stats["retries"] += 1
+                    self.stats["slept_seconds"] += delay
+                    self.sleep(delay)
+
+    def __call__(self, func: Callable) -> Callable:
+        """데코레이터로 사용"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return self.call(func, *args, **kwargs)
+        wrapper.policy = self
+        return wrapper
+
+
+def resilient(endpoint: str, **policy_kwargs) -> RetryPolicy:
+    """엔드포인트 공용 서킷 브레이커를 쓰는 RetryPolicy (데코레이터로도 사용 가능)"""
+    policy_kwargs.setdefault("breaker", get_circuit_breaker(endpoint))
+    return RetryPolicy(**policy_kwargs)
+
+
+def test_resilience():
+    """불안정한 호출로 재시도/서킷 브레이커/데드라인 동작 확인"""
+    print("🛡️ 복원력 계층 테스트 시작")
+
+    calls = {"count": 0}
+
+    def flaky():
+        calls["count"] += 1
+        if calls["count"] < 3:
+            raise ConnectionError("일시적 네트워크 오류")
+        return "ok"
+
+    policy = RetryPolicy(max_attempts=5, backoff=DecorrelatedJitterBackoff(base=0.01, cap=0.1))
+    print(f"✅ 재시도 후 결과: {policy.call(flaky)} (시도 {policy.stats['attempts']}회, "
+          f"대기 {policy.stats['slept_seconds']:.3f}초)")
+
+    breaker = CircuitBreaker("demo", failure_threshold=2, recovery_timeout=60)
+    failing = RetryPolicy(max_attempts=5, backoff=DecorrelatedJitterBackoff(base=0.01, cap=0.05), breaker=breaker)
+    try:
+        failing.call(lambda: (_ for _ in ()).throw(ConnectionError("장애")))
+    except CircuitOpenError as e:
+        print(f"✅ 연속 실패 후 차단: {e}")
+
+    with deadline(0.05):
+        try:
+            RetryPolicy(max_attempts=10, backoff=DecorrelatedJitterBackoff(base=0.1, cap=1.0)).call(
+                lambda: (_ for _ in ()).throw(TimeoutError("응답 없음"))
+            )
+        except DeadlineExceeded as e:
+            print(f"✅ 데드라인 적용: {e}")
+
+
+if __name__ == "__main__":
+    test_resilience()
@@ -0,0 +1,372 @@
+"""
+추가 전용 세그먼트 로그 (길이 접두 레코드 + 메모리 오프셋 인덱스 + 컴팩션)
+
+수집 결과를 날짜/시간대마다 JSON 파일로 따로 쓰는 대신 세그먼트 파일 끝에 레코드 하나를
+덧붙입니다. 레코드는 [길이 4바이트][CRC32 4바이트][JSON] 형식이고, 키(날짜|시간대)별 최신 레코드
+위치를 메모리 인덱스로 유지합니다. 세그먼트가 segment_max_bytes를 넘으면 새 세그먼트로 넘어가며,
+닫힌 세그먼트가 쌓이면 같은 키의 이전 스냅샷을 버리고 최신 레코드만 남기도록 합칩니다.
+전체 이력 재생은 세그먼트를 번호 순서대로 한 번씩 순차로 읽는 것으로 끝납니다.
+
+여러 프로세스가 같은 디렉토리를 열어도 되도록 추가/전환/컴팩션/조회는 디렉토리의 잠금 파일(flock)을
+잡은 상태에서 하고, 잠금을 잡은 직후 다른 프로세스가 덧붙이거나 합친 세그먼트를 인덱스에 반영합니다.
+fcntl이 없는 플랫폼에서는 프로세스 안의 스레드 잠금만 적용되므로 작성 프로세스는 하나여야 합니다.
+"""
+
+import json
+import os
+import struct
+import threading
+import zlib
+from contextlib import contextmanager
+from typing import Dict, List, Any, Optional, Iterator, Tuple
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+
+try:
+    import fcntl
+except ImportError:  # fcntl이 없으면(Windows) 프로세스 간 잠금 없이 단일 작성자로 사용
+    fcntl = None
+
+HEADER = struct.Struct(">II")  # (본문 길이, CRC32)
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".log"
+LOCK_FILE_NAME = "segments.lock"
+DEFAULT_SEGMENT_MAX_BYTES = 8 * 1024 * 1024
+DEFAULT_COMPACT_AFTER_SEGMENTS = 4
+READ_BUFFER_BYTES = 1024 * 1024
+
+
+def _segment_name(seq: int) -> str:
+    return f"{SEGMENT_PREFIX}{seq:08d}{SEGMENT_SUFFIX}"
+
+
+def _encode(key: str, record: Dict[str, Any]) -> bytes:
+    body = json.dumps({"key": key, "record": record}, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+    return HEADER.pack(len(body), zlib.crc32(body)) + body
+
+
+def _scan_segment(path: str, start: int = 0) -> Iterator[Tuple[int, int, Dict[str, Any]]]:
+    """
+    세그먼트를 start 오프셋부터 순차로 읽어 (오프셋, 레코드 길이, 본문) 반환
+
+    헤더나 본문이 잘렸거나 CRC가 맞지 않는 지점에서 멈춥니다 (쓰기 도중 중단된 꼬리).
+    """
+    with open(path, 'rb', buffering=READ_BUFFER_BYTES) as f:
+        f.seek(start)
+        offset = start
+        while True:
+            header = f.read(HEADER.size)
+            if len(header) < HEADER.size:
+                return
+            length, crc = HEADER.unpack(header)
+            body = f.read(length)
+            if len(body) < length or zlib.crc32(body) != crc:
+                return
+            yield offset, HEADER.size + length, json.loads(body.decode("utf-8"))
+            offset += HEADER.size + length
+
+
+class SegmentLog:
+    """키별 최신 스냅샷을 추적하는 추가 전용 로그"""
+
+    def __init__(self, directory: str, segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+                 compact_after_segments: int = DEFAULT_COMPACT_AFTER_SEGMENTS,
+                 fsync: bool = False, logger: Optional[ThreePartLogger] = None):
+        """
+        Args:
+            directory: 세그먼트 파일 디렉토리
+            segment_max_bytes: 이 크기를 넘으면 새 세그먼트 시작
+            compact_after_segments: 닫힌 세그먼트가 이 개수 이상이면 새 세그먼트 시작 시 컴팩션
+            fsync: 추가할 때마다 디스크 동기화 여부 (기본값은 flush까지만)
+        """
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self.compact_after_segments = compact_after_segments
+        self.fsync = fsync
+        self.logger = logger or ThreePartLogger(name="segment_log")
+
+        # 키 → (세그먼트 번호, 오프셋, 레코드 길이)
+        self.index: Dict[str, Tuple[int, int, int]] = {}
+        self.segment_bytes: Dict[int, int] = {}
+        self.stats = {"appends": 0, "compactions": 0, "reclaimed_bytes": 0, "truncated_bytes": 0}
+        self._lock = threading.RLock()
+        self._active = None
+        self.active_seq = 1
+        # 마지막으로 맞춘 디스크 상태 {세그먼트 번호: (inode, 크기)} (None이면 처음부터 읽음)
+        self._seen: Optional[Dict[int, Tuple[int, int]]] = None
+
+        os.makedirs(directory, exist_ok=True)
+        self._lock_file = open(os.path.join(directory, LOCK_FILE_NAME), 'ab')
+        with self._exclusive():
+            pass
+
+    def _path(self, seq: int) -> str:
+        return os.path.join(self.directory, _segment_name(seq))
+
+    def _segments(self) -> List[int]:
+        return sorted(
+            int(name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
+            for name in os.listdir(self.directory)
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX)
+        )
+
+    def _disk_view(self) -> Dict[int, Tuple[int, int]]:
+        view = {}
+        for seq in self._segments():
+            try:
+                stat = os.stat(self._path(seq))
+            except FileNotFoundError:
+                continue
+            view[seq] = (stat.st_ino, stat.st_size)
+        return view
+
+    @contextmanager
+    def _exclusive(self):
+        """스레드 잠금과 잠금 파일(flock)을 잡고 디스크의 세그먼트 상태를 인덱스에 반영한 뒤 실행"""
+        with self._lock:
+            if fcntl is not None:
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                self._refresh()
+                yield
+                self._seen = self._disk_view()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _refresh(self):
+        """
+        마지막으로 본 이후 다른 프로세스가 바꾼 내용을 인덱스에 반영
+
+        활성 세그먼트 끝에 덧붙이기만 했으면 늘어난 부분만 읽고,
+        세그먼트 전환이나 컴팩션으로 파일 구성이 바뀌었으면 처음부터 다시 읽습니다.
+        """
+        view = self._disk_view()
+        if view == self._seen:
+            return
+
+        seen = self._seen or {}
+        active = self.active_seq
+        appended_only = (
+            self._active is not None and set(view) == set(seen)
+            and all(view[seq] == seen[seq] for seq in seen if seq != active)
+            and view[active][0] == seen[active][0] and view[active][1] > seen[active][1]
+        )
+        if appended_only:
+            self._index_segment(active, self.segment_bytes[active])
+        else:
+            self._load()
+
+    def _index_segment(self, seq: int, start: int = 0):
+        """세그먼트를 start 오프셋부터 읽어 인덱스에 반영 (깨진 꼬리는 잘라냄)"""
+        path = self._path(seq)
+        valid_bytes = start
+        if os.path.exists(path):
+            for offset, size, entry in _scan_segment(path, start):
+                self.index[entry["key"]] = (seq, offset, size)
+                valid_bytes = offset + size
+
+            actual_bytes = os.path.getsize(path)
+            if actual_bytes > valid_bytes:
+                self.logger.warning(f"세그먼트 꼬리 손상 복구: {_segment_name(seq)} ({actual_bytes - valid_bytes}바이트 제거)")
+                with open(path, 'r+b') as f:
+                    f.truncate(valid_bytes)
+                self.stats["truncated_bytes"] += actual_bytes - valid_bytes
+        self.segment_bytes[seq] = valid_bytes
+
+    def _load(self):
+        """세그먼트를 순서대로 한 번 읽어 인덱스 재구성하고 마지막 세그먼트를 활성 세그먼트로 엶"""
+        if self._active is not None:
+            self._active.close()
+        self.index.clear()
+        self.segment_bytes.clear()
+
+        segments = self._segments() or [1]
+        for seq in segments:
+            self._index_segment(seq)
+
+        self.active_seq = segments[-1]
+        self._active = open(self._path(self.active_seq), 'ab')
+
+    def close(self):
+        with self._lock:
+            if self._active is not None:
+                self._active.close()
+                self._active = None
+                self._lock_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def append(self, key: str, record: Dict[str, Any]) -> Tuple[int, int]:
+        """레코드 하나를 활성 세그먼트 끝에 추가 (쓰기 한 번) 후 (세그먼트 번호, 오프셋) 반환"""
+        data = _encode(key, record)
+        with self._exclusive():
+            if self.segment_bytes[self.active_seq] and self.segment_bytes[self.active_seq] + len(data) > self.segment_max_bytes:
+                self._roll()
+
+            self._active.write(data)
+            self._active.flush()
+            if self.fsync:
+                os.fsync(self._active.fileno())
+
+            # 잠금 안에서 인덱스를 디스크와 맞춘 뒤 썼으므로 파일 끝 위치에서 이번 레코드 오프셋 계산
+            end = self._active.tell()
+            offset = end - len(data)
+            self.index[key] = (self.active_seq, offset, len(data))
+            self.segment_bytes[self.active_seq] = end
+            self.stats["appends"] += 1
+            return self.active_seq, offset
+
+    def _roll(self):
+        """새 세그먼트로 넘어가고 닫힌 세그먼트가 많으면 컴팩션"""
+        self._active.close()
+        self.active_seq += 1
+        self.segment_bytes[self.active_seq] = 0
+        self._active = open(self._path(self.active_seq), 'ab')
+
+        if len(self.segment_bytes) - 1 >= self.compact_after_segments:
+            self._compact()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """키의 최신 레코드 (인덱스 위치에서 한 번 읽음)"""
+        with self._exclusive():
+            location = self.index.get(key)
+            if location is None:
+                return None
+            seq, offset, size = location
+            with open(self._path(seq), 'rb') as f:
+                f.seek(offset)
+                data = f.read(size)
+        return json.loads(data[HEADER.size:].decode("utf-8"))["record"]
+
+    def replay(self, latest_only: bool = False) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        세그먼트 번호 순서대로 순차 재생
+
+        다른 프로세스의 컴팩션과 겹치지 않도록 잠금 안에서 모두 읽은 뒤 반환합니다.
+
+        Args:
+            latest_only: True면 키별 최신 레코드만 (이후에 덮어쓰인 스냅샷 제외)
+        """
+        entries = []
+        with self._exclusive():
+            for seq in sorted(self.segment_bytes):
+                for offset, size, entry in _scan_segment(self._path(seq)):
+                    if offset >= self.segment_bytes[seq]:
+                        break
+                    if latest_only and self.index.get(entry["key"]) != (seq, offset, size):
+                        continue
+                    entries.append((entry["key"], entry["record"]))
+        return iter(entries)
+
+    def compact(self) -> Dict[str, int]:
+        """
+        닫힌 세그먼트의 이전 스냅샷을 버리고 최신 레코드만 하나의 세그먼트로 합침
+
+        결과는 닫힌 세그먼트 중 마지막 번호로 교체(os.replace)하므로 재생 순서가 유지되고,
+        교체 후 오래된 세그먼트 삭제 전에 중단되어도 중복 레코드만 남을 뿐 최신 상태는 같습니다.
+        """
+        with self._exclusive():
+            return self._compact()
+
+    def _compact(self) -> Dict[str, int]:
+        with self._lock:
+            sealed = sorted(seq for seq in self.segment_bytes if seq != self.active_seq)
+            if not sealed:
+                return {"segments": 0, "kept": 0, "reclaimed_bytes": 0}
+
+            target = sealed[-1]
+            temp_path = self._path(target) + ".compact"
+            before = sum(self.segment_bytes[seq] for seq in sealed)
+            new_locations: Dict[str, Tuple[int, int, int]] = {}
+            written = 0
+
+            with open(temp_path, 'wb') as out:
+                for seq in sealed:
+                    for offset, size, entry in _scan_segment(self._path(seq)):
+                        if self.index.get(entry["key"]) != (seq, offset, size):
+                            continue
+                        data = _encode(entry["key"], entry["record"])
+                        out.write(data)
+                        new_locations[entry["key"]] = (target, written, len(data))
+                        written += len(data)
+                out.flush()
+                os.fsync(out.fileno())
+
+            os.replace(temp_path, self._path(target))
+            for seq in sealed[:-1]:
+                os.remove(self._path(seq))
+                del self.segment_bytes[seq]
+
+            self.segment_bytes[target] = written
+            self.index.update(new_locations)
+            self.stats["compactions"] += 1
+            self.stats["reclaimed_bytes"] += before - written
+
+            self.logger.info(f"세그먼트 컴팩션: {len(sealed)}개 → 1개, {before - written}바이트 회수")
+            return {"segments": len(sealed), "kept": len(new_locations), "reclaimed_bytes": before - written}
+
+    def summary(self) -> Dict[str, Any]:
+        """키 수, 세그먼트 수, 전체/유효 바이트"""
+        with self._lock:
+            total_bytes = sum(self.segment_bytes.values())
+            live_bytes = sum(size for _, _, size in self.index.values())
+            return {
+                "keys": len(self.index),
+                "segments": len(self.segment_bytes),
+                "total_bytes": total_bytes,
+                "live_bytes": live_bytes,
+                "garbage_ratio": round(1 - live_bytes / total_bytes, 4) if total_bytes else 0.0,
+                **self.stats
+            }
+
+
+_logs: Dict[str, SegmentLog] = {}
+_logs_lock = threading.Lock()
+
+
+def open_segment_log(directory: str, **kwargs) -> SegmentLog:
+    """디렉토리별 SegmentLog를 프로세스 안에서 하나만 열어 공유"""
+    key = os.path.abspath(directory)
+    with _logs_lock:
+        log = _logs.get(key)
+        if log is None or log._active is None:
+            log = _logs[key] = SegmentLog(directory, **kwargs)
+        return log
+
+
+def test_segment_log():
+    """같은 키를 반복해서 덮어쓸 때 컴팩션과 재생 확인"""
+    import tempfile
+    import time
+
+    print("🧾 세그먼트 로그 테스트 시작")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with SegmentLog(temp_dir, segment_max_bytes=64 * 1024) as log:
+            started = time.perf_counter()
+            for day in range(365):
+                for part in ("morning", "afternoon", "evening"):
+                    for version in range(3):
+                        log.append(f"2026-{day:03d}|{part}", {"day": day, "part": part, "version": version,
+                                                            "commits": [{"sha": f"{day}{version}", "message": "x" * 40}]})
+            append_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            latest = list(log.replay(latest_only=True))
+            replay_seconds = time.perf_counter() - started
+
+            print(f"✅ 추가 {log.stats['appends']}건 {append_seconds:.2f}초, "
+                  f"최신 {len(latest)}건 재생 {replay_seconds:.3f}초")
+            print(f"✅ 요약: {log.summary()}")
+
+
+if __name__ == "__main__":
+    test_segment_log()
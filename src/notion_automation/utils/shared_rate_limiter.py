@@ -0,0 +1,244 @@
+"""
+프로세스 간 공유 API 요청 제한기 (토큰 버킷)
+
+cron으로 동시에 실행되는 스크립트들이 같은 Notion 통합/GitHub 토큰을 쓰므로
+버킷 상태를 파일 잠금 SQLite(프로젝트 루트의 data/rate_limits.db, RATE_LIMIT_DB_PATH로 변경 가능)에 두고
+API + 자격 증명별로 공유합니다.
+버킷은 GCRA(다음 허용 시각 하나만 저장하는 토큰 버킷)로 구현해, 요청 하나는
+짧은 트랜잭션 한 번으로 슬롯을 예약하고 잠금 밖에서 대기합니다.
+대기 시간은 키별로 누적되어 limiter_metrics()로 확인할 수 있습니다.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Optional
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+# 실행 디렉토리(cron, CLI, 대시보드)가 달라도 같은 버킷을 쓰도록 프로젝트 루트 기준 경로 사용
+DEFAULT_RATE_LIMIT_DB = os.getenv("RATE_LIMIT_DB_PATH", os.path.join(project_root, "data", "rate_limits.db"))
+
+# API별 기본 한도 (공식 한도보다 약간 낮게 잡아 여러 프로세스가 합쳐도 넘지 않도록 함)
+API_LIMITS = {
+    "notion": {"rate": 2.8, "burst": 3},                 # 통합당 평균 3 req/s
+    "github": {"rate": 5000 / 3600 * 0.95, "burst": 20},  # 토큰당 5000 req/h
+}
+
+# 자격 증명을 지정하지 않았을 때 사용할 환경 변수
+API_TOKEN_ENV = {
+    "notion": "NOTION_API_TOKEN",
+    "github": "GITHUB_TOKEN",
+}
+
+RATE_LIMIT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_buckets (
+    bucket_key TEXT PRIMARY KEY,
+    next_free_at REAL NOT NULL DEFAULT 0,
+    permits INTEGER NOT NULL DEFAULT 0,
+    waited_permits INTEGER NOT NULL DEFAULT 0,
+    total_wait_seconds REAL NOT NULL DEFAULT 0,
+    max_wait_seconds REAL NOT NULL DEFAULT 0,
+    penalties INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL DEFAULT 0
+);
+"""
+
+
+def bucket_key(api: str, credential: Optional[str]) -> str:
+    """API + 자격 증명 해시 (토큰 원문은 저장하지 않음)"""
+    digest = hashlib.sha256((credential or "").encode("utf-8")).hexdigest()[:12]
+    return f"{api}:{digest}"
+
+
+class SharedRateLimiter:
+    """SQLite에 상태를 두는 프로세스 간 공유 토큰 버킷"""
+
+    def __init__(self, api: str, credential: Optional[str] = None, rate: Optional[float] = None,
+                 burst: Optional[int] = None, db_path: str = DEFAULT_RATE_LIMIT_DB):
+        """
+        Args:
+            api: API 이름 (notion, github 등)
+            credential: API 토큰 (None이면 API_TOKEN_ENV의 환경 변수 사용)
+            rate: 초당 허용 요청 수 (기본값: API_LIMITS)
+            burst: 한 번에 연속으로 허용할 요청 수 (기본값: API_LIMITS)
+            db_path: 버킷 상태 DB 경로
+        """
+        limits = API_LIMITS.get(api, {"rate": 1.0, "burst": 1})
+        if credential is None and api in API_TOKEN_ENV:
+            credential = os.getenv(API_TOKEN_ENV[api])
+
+        self.api = api
+        self.key = bucket_key(api, credential)
+        self.rate = rate if rate is not None else limits["rate"]
+        self.burst = max(1, burst if burst is not None else limits["burst"])
+        self.interval = 1.0 / self.rate
+        self.tolerance = (self.burst - 1) * self.interval
+        self.db_path = db_path
+        self.total_wait_seconds = 0.0
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(RATE_LIMIT_SCHEMA)
+            conn.execute("INSERT OR IGNORE INTO rate_buckets (bucket_key) VALUES (?)", (self.key,))
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+
+    def reserve(self, permits: int = 1) -> float:
+        """
+        슬롯 예약 후 대기해야 할 시간 반환 (대기는 호출자가 수행)
+
+        다음 허용 시각(next_free_at)을 읽고 permits만큼 앞당겨 기록하는 작업을
+        BEGIN IMMEDIATE 트랜잭션 안에서 처리하므로 여러 프로세스가 같은 슬롯을 받지 않습니다.
+        """
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            now = time.time()
+            next_free_at = conn.execute(
+                "SELECT next_free_at FROM rate_buckets WHERE bucket_key = ?", (self.key,)
+            ).fetchone()[0]
+
+            base = max(next_free_at, now)
+            slot = max(now, base + (permits - 1) * self.interval - self.tolerance)
+            wait_seconds = slot - now
+
+            conn.execute(
+                """
+                UPDATE rate_buckets SET
+                    next_free_at = ?,
+                    permits = permits + ?,
+                    waited_permits = waited_permits + ?,
+                    total_wait_seconds = total_wait_seconds + ?,
+                    max_wait_seconds = MAX(max_wait_seconds, ?),
+                    updated_at = ?
+                WHERE bucket_key = ?
+                """,
+                (base + permits * self.interval, permits, permits if wait_seconds > 0 else 0,
+                 wait_seconds, wait_seconds, now, self.key)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+        self.total_wait_seconds += wait_seconds
+        return wait_seconds
+
+    def acquire(self, permits: int = 1) -> float:
+        """요청 허가를 받을 때까지 대기 (대기한 시간 반환)"""
+        wait_seconds = self.reserve(permits)
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+        return wait_seconds
+
+    def penalize(self, retry_after: float):
+        """
+        429 응답의 Retry-After만큼 모든 프로세스의 다음 요청을 미룸
+
+        reserve()는 버스트 허용치(tolerance)만큼 next_free_at보다 앞선 슬롯도 내주므로,
+        그만큼 더 뒤로 기록해야 Retry-After가 끝나기 전에 나가는 요청이 없습니다.
+        """
+        until = time.time() + retry_after + self.tolerance
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE rate_buckets SET next_free_at = MAX(next_free_at, ?), penalties = penalties + 1 WHERE bucket_key = ?",
+                (until, self.key)
+            )
+
+
+def penalize_on_rate_limit(limiter: Any, error: Exception, default_retry_after: float = 1.0) -> bool:
+    """
+    429 응답 예외면 Retry-After만큼 공유 버킷을 미룸
+
+    notion_client.APIResponseError / requests.HTTPError처럼 status(또는 response.status_code)와
+    headers를 가진 예외를 처리합니다.
+
+    Returns:
+        요청 한도 초과 예외였으면 True
+    """
+    response = getattr(error, "response", None)
+    status = getattr(error, "status", None) or getattr(response, "status_code", None)
+    if status != 429 or not hasattr(limiter, "penalize"):
+        return False
+
+    headers = getattr(error, "headers", None) or getattr(response, "headers", None) or {}
+    try:
+        retry_after = float(headers.get("retry-after", default_retry_after))
+    except (TypeError, ValueError):
+        retry_after = default_retry_after
+    limiter.penalize(retry_after)
+    return True
+
+
+_limiters: Dict[tuple, SharedRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(api: str, credential: Optional[str] = None, rate: Optional[float] = None,
+                     db_path: str = DEFAULT_RATE_LIMIT_DB) -> SharedRateLimiter:
+    """프로세스 안에서 API/자격 증명별 제한기 재사용"""
+    cache_key = (api, credential, rate, os.path.abspath(db_path))
+    with _limiters_lock:
+        limiter = _limiters.get(cache_key)
+        if limiter is None:
+            limiter = _limiters[cache_key] = SharedRateLimiter(api, credential, rate=rate, db_path=db_path)
+        return limiter
+
+
+def limiter_metrics(db_path: str = DEFAULT_RATE_LIMIT_DB) -> Dict[str, Dict[str, Any]]:
+    """버킷별 누적 허가 수와 대기 시간 통계"""
+    if not os.path.exists(db_path):
+        return {}
+    with sqlite3.connect(db_path, timeout=30) as conn:
+        rows = conn.execute(
+            "SELECT bucket_key, permits, waited_permits, total_wait_seconds, max_wait_seconds, penalties, updated_at "
+            "FROM rate_buckets ORDER BY bucket_key"
+        ).fetchall()
+
+    return {
+        key: {
+            "permits": permits,
+            "waited_permits": waited,
+            "total_wait_seconds": round(total_wait, 4),
+            "average_wait_seconds": round(total_wait / permits, 4) if permits else 0.0,
+            "max_wait_seconds": round(max_wait, 4),
+            "penalties": penalties,
+            "last_request_at": updated_at
+        }
+        for key, permits, waited, total_wait, max_wait, penalties, updated_at in rows
+    }
+
+
+def test_shared_rate_limiter():
+    """여러 스레드가 같은 버킷을 공유할 때 전체 요청률 확인"""
+    import tempfile
+    from concurrent.futures import ThreadPoolExecutor
+
+    print("🚦 공유 요청 제한기 테스트 시작")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "rate_limits.db")
+        limiters = [SharedRateLimiter("notion", "token", rate=20, burst=2, db_path=db_path) for _ in range(4)]
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda limiter: [limiter.acquire() for _ in range(10)], limiters))
+        duration = time.perf_counter() - started
+
+        metrics = limiter_metrics(db_path)[bucket_key("notion", "token")]
+        print(f"✅ 40회 요청 {duration:.2f}초 ({40 / duration:.1f} req/s, 한도 20 req/s), "
+              f"평균 대기 {metrics['average_wait_seconds']}초")
+
+
+if __name__ == "__main__":
+    test_shared_rate_limiter()
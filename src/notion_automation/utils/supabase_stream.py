@@ -0,0 +1,164 @@
+"""
+Supabase 스트리밍 추출기 (키셋 페이지네이션)
+
+OFFSET 대신 마지막으로 읽은 (created_at, id) 이후부터 다음 페이지를 조회하므로
+테이블이 커져도 페이지마다 응답 크기와 조회 비용이 일정합니다.
+필요한 컬럼만 조회하고 레코드를 이터레이터로 내보내 백업/동기화가 일정한 메모리로 동작합니다.
+"""
+
+import os
+import time
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Sequence, Tuple, Union
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+
+DEFAULT_PAGE_SIZE = 500
+DEFAULT_KEY_COLUMNS = ("created_at", "id")
+
+# PostgREST or 필터에서 따옴표가 필요한 문자
+_RESERVED_FILTER_CHARS = set(',.:()"\\ ')
+
+
+def _quote_filter_value(value: Any) -> str:
+    """or 필터 값 인용 (타임스탬프의 ':' 등 예약 문자 처리)"""
+    text = str(value)
+    if any(char in _RESERVED_FILTER_CHARS for char in text):
+        return '"' + text.replace('\\', '\\\\').replace('"', '\\"') + '"'
+    return text
+
+
+def build_keyset_filter(key_columns: Sequence[str], last_key: Sequence[Any], descending: bool = False) -> str:
+    """
+    (k1, k2, ...) > (v1, v2, ...) 조건을 PostgREST or 필터 문자열로 변환
+
+    예: created_at.gt.X,and(created_at.eq.X,id.gt.Y)
+    """
+    operator = "lt" if descending else "gt"
+    clauses = []
+    for depth, column in enumerate(key_columns):
+        equals = [f"{key_columns[i]}.eq.{_quote_filter_value(last_key[i])}" for i in range(depth)]
+        condition = f"{column}.{operator}.{_quote_filter_value(last_key[depth])}"
+        clauses.append(f"and({','.join(equals + [condition])})" if equals else condition)
+    return ",".join(clauses)
+
+
+def project_columns(columns: Union[str, Sequence[str]], key_columns: Sequence[str]) -> str:
+    """요청 컬럼에 키 컬럼을 더한 select 문자열"""
+    if isinstance(columns, str):
+        columns = [column.strip() for column in columns.split(",") if column.strip()]
+    if "*" in columns:
+        return "*"
+
+    projected = list(columns)
+    projected.extend(column for column in key_columns if column not in projected)
+    return ",".join(projected)
+
+
+class SupabaseKeysetStream:
+    """키셋 페이지네이션 기반 Supabase 테이블 스트림"""
+
+    def __init__(self, client, table: str, columns: Union[str, Sequence[str]] = "*",
+                 page_size: int = DEFAULT_PAGE_SIZE,
+                 filters: Optional[Iterable[Tuple[str, str, Any]]] = None,
+                 key_columns: Sequence[str] = DEFAULT_KEY_COLUMNS,
+                 descending: bool = False, limit: Optional[int] = None,
+                 logger: Optional[ThreePartLogger] = None):
+        """
+        Args:
+            client: supabase Client
+            table: 테이블 이름
+            columns: 조회할 컬럼 (키 컬럼은 자동 포함)
+            page_size: 페이지당 행 수
+            filters: (메서드, 컬럼, 값) 목록. 예: [("gte", "date", "2025-07-01")]
+            key_columns: 정렬/페이지 경계로 쓰는 유일한 컬럼 조합
+            descending: 최신순 조회 여부
+            limit: 최대 행 수 (None이면 전체)
+            logger: 로깅 시스템 (선택사항)
+        """
+        self.client = client
+        self.table = table
+        self.key_columns = tuple(key_columns)
+        self.columns = project_columns(columns, self.key_columns)
+        self.page_size = page_size
+        self.filters = list(filters or [])
+        self.descending = descending
+        self.limit = limit
+        self.logger = logger or ThreePartLogger(name="supabase_stream")
+        self.stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        return {"rows": 0, "pages": 0, "duration_seconds": 0.0, "rows_per_second": 0.0}
+
+    def _build_query(self, last_key: Optional[Tuple[Any, ...]], page_limit: int):
+        query = self.client.table(self.table).select(self.columns)
+        for method, column, value in self.filters:
+            query = getattr(query, method)(column, value)
+        if last_key is not None:
+            query = query.or_(build_keyset_filter(self.key_columns, last_key, self.descending))
+        for column in self.key_columns:
+            query = query.order(column, desc=self.descending)
+        return query.limit(page_limit)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        self.stats = self._empty_stats()
+        started = time.perf_counter()
+        last_key = None
+
+        try:
+            while True:
+                remaining = None if self.limit is None else self.limit - self.stats["rows"]
+                if remaining is not None and remaining <= 0:
+                    break
+
+                page_limit = self.page_size if remaining is None else min(self.page_size, remaining)
+                rows = self._build_query(last_key, page_limit).execute().data or []
+                self.stats["pages"] += 1
+
+                for row in rows:
+                    self.stats["rows"] += 1
+                    yield row
+
+                if len(rows) < page_limit:
+                    break
+                last_key = tuple(rows[-1][column] for column in self.key_columns)
+        finally:
+            duration = time.perf_counter() - started
+            self.stats["duration_seconds"] = round(duration, 3)
+            self.stats["rows_per_second"] = round(self.stats["rows"] / duration, 1) if duration > 0 else 0.0
+            self.logger.info(
+                f"{self.table} 스트리밍 추출: {self.stats['rows']}행, {self.stats['pages']}페이지, "
+                f"{self.stats['rows_per_second']}행/초"
+            )
+
+
+def stream_rows(client, table: str, columns: Union[str, Sequence[str]] = "*", **kwargs) -> Iterator[Dict[str, Any]]:
+    """SupabaseKeysetStream 간편 함수"""
+    return iter(SupabaseKeysetStream(client, table, columns, **kwargs))
+
+
+def test_supabase_stream():
+    """SupabaseKeysetStream 테스트 함수 (SUPABASE_URL/SUPABASE_ANON_KEY 필요)"""
+    print("🌊 Supabase 스트리밍 추출 테스트 시작")
+
+    url = os.getenv("SUPABASE_URL") or os.getenv("NEXT_PUBLIC_SUPABASE_URL")
+    key = os.getenv("SUPABASE_ANON_KEY") or os.getenv("NEXT_PUBLIC_SUPABASE_ANON_KEY")
+    if not url or not key:
+        print("⚠️ Supabase 환경 변수가 없어 필터 문자열만 확인합니다")
+        print(f"🔎 {build_keyset_filter(DEFAULT_KEY_COLUMNS, ('2025-07-05T15:34:33+00:00', 'abc'))}")
+        return
+
+    from supabase import create_client
+
+    stream = SupabaseKeysetStream(create_client(url, key), "daily_reflections",
+                                  ["id", "date", "time_part", "total_score"], page_size=100)
+    for _ in stream:
+        pass
+    print(f"✅ {stream.stats}")
+
+
+if __name__ == "__main__":
+    test_supabase_stream()
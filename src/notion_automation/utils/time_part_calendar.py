@@ -0,0 +1,199 @@
+"""
+3-Part 시간대 달력 (시각 → 시간대 분류)
+
+시간대 경계는 config/time_schedules.json의 3_part_schedule 한 곳에서 읽어 정렬된 분(minute) 경계
+배열로 컴파일합니다. 분류는 하루 중 분 위치를 경계 배열에서 이진 탐색(bisect)하는 것입니다.
+
+- 시간대 정보가 없는 시각(naive)은 달력 시간대(기본 Asia/Seoul)의 현지 시각으로 보고,
+  "Z"/오프셋이 붙은 시각과 epoch 초는 달력 시간대로 변환한 뒤 분류합니다.
+- 기본 정책은 수업 시간 밖의 시각을 직전 시간대(첫 시간대 이전은 첫 시간대)에 배정합니다.
+  strict=True면 수업 시간 밖은 None입니다.
+"""
+
+import bisect
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone, tzinfo
+from typing import Dict, List, Any, Optional, Iterable, Tuple, Union
+from zoneinfo import ZoneInfo
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.notion_automation.utils.logger import ThreePartLogger
+from src.notion_automation.utils.notion_property_mapper import TIME_PART_OPTIONS
+
+logger = ThreePartLogger("time_part_calendar")
+
+project_root = os.path.join(os.path.dirname(__file__), '..', '..', '..')
+DEFAULT_SCHEDULE_PATH = os.path.join(project_root, "config", "time_schedules.json")
+DEFAULT_TIMEZONE = "Asia/Seoul"
+
+Timestamp = Union[datetime, str, int, float]
+
+
+@dataclass(frozen=True)
+class TimePartWindow:
+    """시간대 하나의 구간 (하루 중 분 단위, 종료 시각 미포함)"""
+    code: str
+    label: str
+    start_minute: int
+    end_minute: int
+
+    @property
+    def start(self) -> str:
+        return f"{self.start_minute // 60:02d}:{self.start_minute % 60:02d}"
+
+    @property
+    def end(self) -> str:
+        return f"{self.end_minute // 60:02d}:{self.end_minute % 60:02d}"
+
+    @property
+    def hours(self) -> Tuple[int, int]:
+        return self.start_minute // 60, self.end_minute // 60
+
+    def contains_minute(self, minute: int) -> bool:
+        return self.start_minute <= minute < self.end_minute
+
+
+def _parse_clock(value: str) -> int:
+    hour, minute = value.split(":")
+    return int(hour) * 60 + int(minute)
+
+
+DEFAULT_WINDOWS = (
+    TimePartWindow("morning", TIME_PART_OPTIONS["morning"], 9 * 60, 12 * 60),
+    TimePartWindow("afternoon", TIME_PART_OPTIONS["afternoon"], 13 * 60, 17 * 60),
+    TimePartWindow("evening", TIME_PART_OPTIONS["evening"], 19 * 60, 22 * 60),
+)
+
+
+class TimePartCalendar:
+    """설정에서 컴파일한 시간대 경계로 시각(들)을 시간대로 분류"""
+
+    def __init__(self, windows: Iterable[TimePartWindow] = DEFAULT_WINDOWS,
+                 tz: Union[str, tzinfo] = DEFAULT_TIMEZONE):
+        """
+        Args:
+            windows: 시간대 구간 목록
+            tz: 달력 시간대 (naive 시각의 기준이자 변환 대상)
+        """
+        self.windows: List[TimePartWindow] = sorted(windows, key=lambda w: w.start_minute)
+        if not self.windows:
+            raise ValueError("시간대 구간이 비어 있습니다")
+        for prev, current in zip(self.windows, self.windows[1:]):
+            if prev.end_minute > current.start_minute:
+                raise ValueError(f"시간대 구간이 겹칩니다: {prev.label} / {current.label}")
+
+        self.tz = ZoneInfo(tz) if isinstance(tz, str) else tz
+        self.labels = [w.label for w in self.windows]
+        self.codes = [w.code for w in self.windows]
+        self._by_key = {**{w.label: w for w in self.windows}, **{w.code: w for w in self.windows}}
+
+        # 기본 정책 경계: 두 번째 시간대부터의 시작 분 (bisect_right 결과가 곧 시간대 번호)
+        self._cuts = [w.start_minute for w in self.windows[1:]]
+        # strict 경계: [시작, 종료, 시작, 종료, ...] (bisect_right 결과가 홀수면 구간 안)
+        self._edges = [m for w in self.windows for m in (w.start_minute, w.end_minute)]
+
+    @classmethod
+    def from_config(cls, path: str = DEFAULT_SCHEDULE_PATH,
+                    tz: Union[str, tzinfo] = DEFAULT_TIMEZONE) -> "TimePartCalendar":
+        """time_schedules.json의 3_part_schedule로 달력 생성 (파일이 없으면 기본 구간)"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                schedule = json.load(f).get("3_part_schedule", {})
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"시간대 설정을 읽지 못해 기본 구간 사용: {path} ({str(e)})")
+            return cls(DEFAULT_WINDOWS, tz)
+        return cls.from_schedule(schedule, tz)
+
+    @classmethod
+    def from_schedule(cls, schedule: Dict[str, Any],
+                      tz: Union[str, tzinfo] = DEFAULT_TIMEZONE) -> "TimePartCalendar":
+        """이미 읽은 3_part_schedule 설정({"오전수업": {"start_time": ..., "end_time": ...}})으로 달력 생성"""
+        codes_by_name = {label.split(" ", 1)[1]: code for code, label in TIME_PART_OPTIONS.items()}
+        windows = []
+        for name, settings in schedule.items():
+            code = codes_by_name.get(name)
+            if code is None:
+                logger.warning(f"알 수 없는 시간대 이름 무시: {name}")
+                continue
+            windows.append(TimePartWindow(code, TIME_PART_OPTIONS[code],
+                                          _parse_clock(settings["start_time"]),
+                                          _parse_clock(settings["end_time"])))
+        return cls(windows or DEFAULT_WINDOWS, tz)
+
+    # ------------------------------------------------------------------ 조회
+
+    def window(self, key: str) -> TimePartWindow:
+        """시간대 이름("🌅 오전수업") 또는 코드("morning")로 구간 조회"""
+        return self._by_key[key]
+
+    def hour_ranges(self) -> Dict[str, Tuple[int, int]]:
+        """{시간대 이름: (시작 시, 종료 시)}"""
+        return {w.label: w.hours for w in self.windows}
+
+    def clock_ranges(self, by: str = "label") -> Dict[str, Dict[str, str]]:
+        """{시간대 이름 또는 코드: {"start": "09:00", "end": "12:00"}}"""
+        return {getattr(w, by): {"start": w.start, "end": w.end} for w in self.windows}
+
+    # ------------------------------------------------------------------ 단건 분류
+
+    def now(self) -> datetime:
+        """달력 시간대의 현재 시각 (서버 시간대와 무관)"""
+        return datetime.now(self.tz)
+
+    def localize(self, moment: Timestamp) -> datetime:
+        """시각을 달력 시간대의 naive 현지 시각으로 변환"""
+        if isinstance(moment, str):
+            moment = datetime.fromisoformat(moment.strip().replace("Z", "+00:00"))
+        elif isinstance(moment, (int, float)):
+            moment = datetime.fromtimestamp(moment, timezone.utc)
+        if moment.tzinfo is not None:
+            moment = moment.astimezone(self.tz).replace(tzinfo=None)
+        return moment
+
+    def _index(self, minute: int, strict: bool) -> Optional[int]:
+        if strict:
+            position = bisect.bisect_right(self._edges, minute)
+            return (position - 1) // 2 if position % 2 else None
+        return bisect.bisect_right(self._cuts, minute)
+
+    def classify(self, moment: Timestamp, strict: bool = False) -> Optional[str]:
+        """시각이 속한 시간대 이름 (strict=False면 수업 시간 밖도 직전 시간대)"""
+        local = self.localize(moment)
+        index = self._index(local.hour * 60 + local.minute, strict)
+        return None if index is None else self.labels[index]
+
+    def contains(self, moment: Timestamp, key: str) -> bool:
+        """시각이 해당 시간대 구간 안인지"""
+        local = self.localize(moment)
+        return self.window(key).contains_minute(local.hour * 60 + local.minute)
+
+
+_calendars: Dict[Tuple[str, str], TimePartCalendar] = {}
+
+
+def get_time_part_calendar(path: str = DEFAULT_SCHEDULE_PATH, tz: str = DEFAULT_TIMEZONE) -> TimePartCalendar:
+    """설정 파일별 달력을 프로세스 안에서 한 번만 컴파일해 공유"""
+    key = (os.path.abspath(path), tz)
+    calendar = _calendars.get(key)
+    if calendar is None:
+        calendar = _calendars[key] = TimePartCalendar.from_config(path, tz)
+    return calendar
+
+
+def test_time_part_calendar():
+    """설정에서 컴파일한 구간과 시간대 변환 분류 확인"""
+    print("🗓️ 시간대 달력 테스트 시작")
+    calendar = get_time_part_calendar()
+    print(f"✅ 구간: {calendar.clock_ranges()}")
+
+    for sample in ("2026-03-02T10:30:00", "2026-03-02T06:00:00Z", "2026-03-02T23:10:00+09:00"):
+        print(f"  {sample} → {calendar.classify(sample)} / strict: {calendar.classify(sample, strict=True)}")
+    print(f"✅ 현재 시각 {calendar.now().isoformat()} → {calendar.classify(calendar.now())}")
+
+
+if __name__ == "__main__":
+    test_time_part_calendar()
@@ -0,0 +1,11 @@
+"""
+테스트 공통 설정
+모듈 로드 시점에 생성되는 로거와 기본 outbox가 저장소의 logs/, data/에 기록하지 않도록 임시 디렉토리로 돌린다.
+"""
+
+import os
+import tempfile
+
+_temp_root = tempfile.mkdtemp(prefix="3part_test_")
+os.environ.setdefault("THREE_PART_LOG_DIR", os.path.join(_temp_root, "logs"))
+os.environ.setdefault("REFLECTION_OUTBOX_PATH", os.path.join(_temp_root, "reflection_outbox.db"))
@@ -0,0 +1,102 @@
+"""
+일별 활동 요약 테이블 테스트
+
+반성 파일 증분 반영(변경/삭제 감지), webhook 저장소 연동, 출처 병합과
+요약 테이블에서 만든 히트맵이 반성 파일 합계와 일치하는지 검증합니다.
+"""
+
+import sys
+import os
+import json
+import random
+from datetime import datetime, timedelta
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.notion_automation.dashboard.activity_summary import DailyActivitySummary, github_counts
+from src.notion_automation.dashboard.reflection_dataset import TIMEPART_FILES, reflection_file_path
+from src.notion_automation.dashboard import github_heatmap
+from src.notion_automation.utils.github_activity_store import GitHubActivityStore
+
+MORNING, AFTERNOON, EVENING = "🌅 오전수업", "🌞 오후수업", "🌙 저녁자율학습"
+
+
+def write_reflection(data_dir, timepart, date, github_data):
+    path = reflection_file_path(str(data_dir), timepart, date)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"github_data": github_data}, f)
+    return path
+
+
+def test_sync_reads_only_changed_files(tmp_path):
+    data_dir = tmp_path / "data"
+    day = datetime(2026, 3, 2)
+    write_reflection(data_dir, MORNING, day, {"commits": 3, "prs": 1})
+    afternoon_path = write_reflection(data_dir, AFTERNOON, day, {"commits": 2, "issues": 1})
+    summary = DailyActivitySummary(str(tmp_path / "summary.db"))
+
+    assert summary.sync_reflection_files(str(data_dir)) == 2
+    assert summary.sync_reflection_files(str(data_dir)) == 0
+    assert summary.activity_grid("2026-03-02", "2026-03-02") == {"2026-03-02": {MORNING: 4, AFTERNOON: 3}}
+
+    write_reflection(data_dir, MORNING, day, {"commits": 10, "prs": 2})
+    os.remove(afternoon_path)
+    assert summary.sync_reflection_files(str(data_dir)) == 1
+    assert summary.activity_grid("2026-03-02", "2026-03-02") == {"2026-03-02": {MORNING: 12}}
+
+
+def test_webhook_store_updates_summary(tmp_path):
+    summary = DailyActivitySummary(str(tmp_path / "summary.db"))
+    store = GitHubActivityStore(str(tmp_path / "activity.db"), summary=summary)
+    arrival = datetime(2026, 3, 2, 14, 5)
+    push = {"repository": {"full_name": "student/repo"},
+            "commits": [{"id": f"sha{i}", "message": "실습", "author": {"username": "student"}} for i in range(3)]}
+
+    store.append_event("push", push, "delivery-1", arrival)
+    store.append_event("push", push, "delivery-2", arrival)  # 같은 커밋 재전송은 건수 증가 없음
+    assert summary.activity_grid(arrival, arrival) == {"2026-03-02": {AFTERNOON: 3}}
+
+    # 반성 입력과 webhook이 같은 칸에 있으면 큰 쪽 사용
+    summary.record_reflection(arrival, AFTERNOON, {"github_data": {"commits": 5}})
+    assert summary.activity_grid(arrival, arrival)["2026-03-02"][AFTERNOON] == 5
+
+
+def test_github_counts_accepts_prs_alias():
+    assert github_counts({"commits": 2, "prs": 1, "issues": "x"}) == {
+        "commits": 2, "issues": 0, "pull_requests": 1, "code_reviews": 0}
+
+
+def test_year_heatmap_matches_reflection_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(github_heatmap, "project_root", str(tmp_path))
+    heatmap = github_heatmap.GitHubTimePartHeatmap()
+    data_dir = tmp_path / "data"
+
+    random.seed(11)
+    today = datetime.now()
+    expected = {}
+    for offset in range(365):
+        day = today - timedelta(days=offset)
+        for timepart in TIMEPART_FILES:
+            if random.random() < 0.7:
+                github_data = {"commits": random.randint(0, 9), "issues": random.randint(0, 2),
+                               "pull_requests": random.randint(0, 2)}
+                write_reflection(data_dir, timepart, day, github_data)
+                expected[(day.strftime("%Y-%m-%d"), timepart)] = sum(github_data.values())
+
+    result = heatmap.create_github_timepart_heatmap(days=365)
+
+    assert len(result["matrix"]) == 365
+    for row in result["matrix"]:
+        for cell in row["timeparts"]:
+            assert cell["activity_count"] == expected.get((row["date"], cell["timepart"]), 0)
+
+    stats = result["statistics"]
+    assert stats["total_activity"] == sum(expected.values())
+    for timepart in TIMEPART_FILES:
+        values = [v for (_, tp), v in expected.items() if tp == timepart]
+        assert stats["timepart_stats"][timepart]["total"] == sum(values)
+        assert stats["timepart_stats"][timepart]["active_days"] == len([v for v in values if v > 0])
+    assert "가장_활발한_요일" in result["analysis"]
@@ -0,0 +1,93 @@
+"""
+콘텐츠 주소 기반 결과 저장소 테스트
+
+동일 내용 중복 제거, 최신 결과 조회, 보존 정책을 검증합니다.
+"""
+
+import sys
+import os
+import json
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.notion_automation.utils import artifact_store
+from src.notion_automation.utils.artifact_store import ArtifactStore
+
+
+def _object_files(store):
+    return [
+        name
+        for prefix in os.listdir(store.objects_dir)
+        for name in os.listdir(os.path.join(store.objects_dir, prefix))
+    ]
+
+
+def test_repeat_put_writes_nothing_new(tmp_path):
+    """실행 시각만 다른 같은 결과는 새 객체/인덱스 항목을 만들지 않음"""
+    store = ArtifactStore(root=str(tmp_path))
+
+    first = store.put("efficiency_trend", {"values": [1, 2], "created_at": "2025-07-05T10:00:00"}, window="7d")
+    second = store.put("efficiency_trend", {"values": [1, 2], "created_at": "2025-07-05T11:00:00"}, window="7d")
+
+    assert first == second
+    assert len(store.list_entries("efficiency_trend", "7d")) == 1
+    assert len(_object_files(store)) == 1
+    assert store.get_latest("efficiency_trend", "7d")["values"] == [1, 2]
+
+
+def test_nested_timestamp_change_is_content(tmp_path):
+    """지정한 경로의 실행 시각만 무시하고, 결과 안쪽의 timestamp/created_at 변경은 새 결과로 기록"""
+    store = ArtifactStore(root=str(tmp_path))
+
+    def batch(reflection_time, run_time):
+        return {
+            "processing_info": {"timestamp": run_time, "total_time_seconds": 1.5},
+            "reflections": [{"time_part": "🌅 오전수업", "timestamp": reflection_time}],
+            "goal": {"title": "복습", "created_at": "2025-07-01"},
+        }
+
+    first = store.put("batch", batch("2025-07-05T09:00:00", "2025-07-05T10:00:00"))
+    assert store.put("batch", batch("2025-07-05T09:00:00", "2025-07-05T11:00:00")) == first
+    second = store.put("batch", batch("2025-07-05T09:30:00", "2025-07-05T11:00:00"))
+
+    assert second != first
+    assert store.get_latest("batch")["reflections"][0]["timestamp"] == "2025-07-05T09:30:00"
+    assert len(store.list_entries("batch")) == 2
+
+    dashboard = {
+        "created_at": "2025-07-05T10:00:00",
+        "sections": [{"content": {"radar_chart": {"values": [1], "created_at": "2025-07-05T10:00:00"}}}],
+        "metadata": {"last_updated": "2025-07-05T10:00:00", "section_timings": {"total_seconds": 0.4}},
+    }
+    rerun = json.loads(json.dumps(dashboard).replace("10:00:00", "11:00:00"))
+    assert store.content_hash(dashboard) == store.content_hash(rerun)
+
+def test_latest_lookup_per_type_and_window(tmp_path):
+    """(유형, 기간)별로 최신 결과를 조회"""
+    store = ArtifactStore(root=str(tmp_path))
+
+    store.put("github_heatmap", {"days": 7, "run": 1}, window="7d")
+    store.put("github_heatmap", {"days": 7, "run": 2}, window="7d")
+    store.put("github_heatmap", {"days": 30}, window="30d")
+
+    assert store.get_latest("github_heatmap", "7d") == {"days": 7, "run": 2}
+    assert store.get_latest("github_heatmap", "30d") == {"days": 30}
+    assert store.get_latest("github_heatmap", "90d") is None
+
+
+def test_retention_keeps_last_entries_and_collects_objects(tmp_path, monkeypatch):
+    """보존 개수를 넘는 항목과 참조 없는 객체를 정리"""
+    monkeypatch.setattr(artifact_store, "OBJECT_GRACE_SECONDS", -1)
+    store = ArtifactStore(root=str(tmp_path), keep_last=2)
+
+    for run in range(4):
+        store.put("3part_dashboard", {"run": run}, window="7d")
+        time.sleep(0.01)
+
+    entries = store.list_entries("3part_dashboard", "7d")
+    assert len(entries) == 2
+    assert store.get_latest("3part_dashboard", "7d") == {"run": 3}
+    assert len(_object_files(store)) == 2
@@ -0,0 +1,141 @@
+"""
+스트리밍 백업 아카이브 테스트
+
+청크 체크섬 기록/검증과 증분 백업 매니페스트 체인 재생,
+수정된 행이 다음 증분 백업에 포함되는지 검증합니다.
+"""
+
+import sys
+import os
+import re
+import json
+import zipfile
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.notion_automation.utils.backup_archive import (
+    StreamingBackupWriter, BackupArchiveReader, resolve_chain, replay_chain, manifest_digest
+)
+
+
+SETUP_SQL = os.path.join(project_root, "lg-dx-dashboard", "scripts", "supabase-manual-setup.sql")
+
+
+def _write(path, records, manifest, chunk_records=3):
+    with StreamingBackupWriter(str(path), chunk_records=chunk_records) as writer:
+        writer.write_dataset("supabase_data", records, watermark_field="updated_at")
+        return writer.write_manifest(manifest)
+
+
+def _locator(tmp_path):
+    return lambda name: str(tmp_path / f"{name}.zip")
+
+
+def test_records_are_chunked_with_checksums(tmp_path):
+    records = ({"id": i, "updated_at": f"2025-07-{i + 1:02d}"} for i in range(8))
+    manifest = _write(tmp_path / "full.zip", records, {"backup_name": "full", "mode": "full"})
+
+    dataset = manifest["datasets"]["supabase_data"]
+    assert dataset["records"] == 8
+    assert [chunk["records"] for chunk in dataset["chunks"]] == [3, 3, 2]
+    assert dataset["watermark"] == "2025-07-08"
+
+    reader = BackupArchiveReader(str(tmp_path / "full.zip"))
+    assert [record["id"] for record in reader.iter_records("supabase_data")] == list(range(8))
+    assert reader.invalid_chunks == []
+
+
+def test_corrupted_chunk_is_reported(tmp_path):
+    path = tmp_path / "full.zip"
+    _write(path, [{"id": i} for i in range(6)], {"backup_name": "full", "mode": "full"})
+
+    # 두 번째 청크의 레코드 하나를 변조해 다시 압축
+    with zipfile.ZipFile(path) as zipf:
+        manifest = zipf.read("manifest.json")
+        lines = zipf.read("supabase_data.jsonl").decode().splitlines(keepends=True)
+    lines[4] = json.dumps({"id": 400}) + "\n"
+    with zipfile.ZipFile(path, "w") as zipf:
+        zipf.writestr("supabase_data.jsonl", "".join(lines))
+        zipf.writestr("manifest.json", manifest)
+
+    reader = BackupArchiveReader(str(path))
+    list(reader.iter_records("supabase_data"))
+    assert [item["chunk"] for item in reader.invalid_chunks] == [1]
+
+
+def test_delta_chain_is_replayed_in_order(tmp_path):
+    locate = _locator(tmp_path)
+    full = _write(locate("full"), [{"id": i, "score": i} for i in range(5)], {"backup_name": "full", "mode": "full"})
+    delta1 = _write(locate("delta1"), [{"id": 1, "score": 10}],
+                    {"backup_name": "delta1", "mode": "delta", "parent": "full", "parent_digest": manifest_digest(full)})
+    _write(locate("delta2"), [{"id": 1, "score": 20}, {"id": 9, "score": 9}],
+           {"backup_name": "delta2", "mode": "delta", "parent": "delta1", "parent_digest": manifest_digest(delta1)})
+
+    chain = resolve_chain(locate("delta2"), locate)
+    state = replay_chain(chain, "supabase_data")
+
+    assert [reader.manifest["backup_name"] for reader in chain] == ["full", "delta1", "delta2"]
+    assert len(state) == 6
+    assert state[1]["score"] == 20
+    assert state[9]["score"] == 9
+
+
+def test_chain_rejects_replaced_parent(tmp_path):
+    locate = _locator(tmp_path)
+    full = _write(locate("full"), [{"id": 1}], {"backup_name": "full", "mode": "full"})
+    _write(locate("delta"), [{"id": 2}],
+           {"backup_name": "delta", "mode": "delta", "parent": "full", "parent_digest": manifest_digest(full)})
+
+    # 같은 이름으로 다른 전체 백업을 덮어쓰면 체인이 끊긴 것으로 처리
+    _write(locate("full"), [{"id": 3}], {"backup_name": "full", "mode": "full"})
+
+    with pytest.raises(ValueError):
+        resolve_chain(locate("delta"), locate)
+
+
+def test_failed_stream_leaves_no_partial_backup(tmp_path):
+    path = tmp_path / "full.zip"
+    _write(path, [{"id": 1}], {"backup_name": "full", "mode": "full"})
+
+    def broken_records():
+        yield {"id": 2}
+        raise ConnectionError("Supabase 연결 끊김")
+
+    with pytest.raises(ConnectionError):
+        _write(path, broken_records(), {"backup_name": "full", "mode": "full"})
+
+    # 실패한 백업은 임시 파일까지 지워지고 이전 백업은 그대로
+    assert sorted(os.listdir(tmp_path)) == ["full.zip"]
+    assert [record["id"] for record in BackupArchiveReader(str(path)).iter_records("supabase_data")] == [1]
+
+    with StreamingBackupWriter(str(tmp_path / "empty.zip")) as writer:
+        writer.write_dataset("supabase_data", [{"id": 3}])
+        assert os.path.exists(writer.part_path)
+    assert sorted(os.listdir(tmp_path)) == ["full.zip"]  # 매니페스트 없이 끝나면 만들지 않음
+
+
+def test_edited_row_appears_in_next_delta(tmp_path):
+    # 증분 백업은 updated_at > 워터마크로 변경분을 고르므로 수정 시 updated_at을 갱신하는 트리거가 스키마에 있어야 함
+    with open(SETUP_SQL, encoding="utf-8") as f:
+        sql = f.read()
+    assert re.search(r"BEFORE UPDATE ON public\.daily_reflections\s+FOR EACH ROW\s+"
+                     r"EXECUTE FUNCTION update_updated_at_column\(\)", sql)
+
+    locate = _locator(tmp_path)
+    rows = {i: {"id": i, "score": i, "updated_at": f"2025-07-01T09:0{i}:00+00:00"} for i in range(3)}
+    full = _write(locate("full"), list(rows.values()), {"backup_name": "full", "mode": "full"})
+    watermark = full["datasets"]["supabase_data"]["watermark"]
+
+    # updated_at을 지정하지 않은 수정도 트리거가 수정 시각으로 바꿈
+    rows[0] = dict(rows[0], score=100, updated_at="2025-07-02T10:00:00+00:00")
+    changed = [row for row in rows.values() if row["updated_at"] > watermark]  # ("gt", "updated_at", watermark)
+    _write(locate("delta"), changed, {"backup_name": "delta", "mode": "delta", "parent": "full",
+                                      "parent_digest": manifest_digest(full)})
+
+    state = replay_chain(resolve_chain(locate("delta"), locate), "supabase_data")
+    assert [row["id"] for row in changed] == [0]
+    assert state[0]["score"] == 100
@@ -0,0 +1,268 @@
+"""
+CDC 소비자 테스트
+
+SQLite 변경 로그 대역으로 연속 수정 합치기, Notion 생성/수정/보관 반영,
+실패 시 체크포인트 유지와 재시작 후 재개, 늦게 커밋된 seq(gap) 처리,
+거부/재시도 한도 초과 변경의 dead letter 처리를 검증합니다.
+"""
+
+import sys
+import os
+import json
+import sqlite3
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.notion_automation.optimization.cdc_consumer import (
+    CDCConsumer, ChangeLogSource, NotionReflectionSink, SQLITE_STANDIN_SCHEMA
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeEndpoint:
+    def __init__(self, handler):
+        self.handler = handler
+
+    def __getattr__(self, name):
+        return lambda **kwargs: self.handler(name, kwargs)
+
+
+class NotionAPIError(Exception):
+    def __init__(self, status):
+        super().__init__(f"{status} validation_error")
+        self.status = status
+
+
+class FakeNotion:
+    """databases.query / pages.create / pages.update 호출 기록"""
+
+    def __init__(self, fail_ids=(), error=None):
+        self.calls = []
+        self.fail_ids = set(fail_ids)
+        self.error = error or ConnectionError("Notion 응답 없음")
+        self.databases = FakeEndpoint(self._databases)
+        self.pages = FakeEndpoint(self._pages)
+
+    def _databases(self, method, kwargs):
+        self.calls.append(("query", kwargs["filter"]["rich_text"]["equals"]))
+        return {"results": []}
+
+    def _pages(self, method, kwargs):
+        supabase_id = None
+        if "properties" in kwargs:
+            supabase_id = kwargs["properties"]["Supabase_ID"]["rich_text"][0]["text"]["content"]
+            if supabase_id in self.fail_ids:
+                raise self.error
+        self.calls.append((method, kwargs.get("page_id") or supabase_id, kwargs))
+        return {"id": f"page-{supabase_id}"} if method == "create" else {}
+
+
+def _standin(tmp_path):
+    db_path = str(tmp_path / "changes.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript(SQLITE_STANDIN_SCHEMA)
+    return db_path
+
+
+def _log(db_path, reflection_id, score, operation="UPDATE", seq=None):
+    record = {"id": reflection_id, "date": "2025-07-23", "time_part": "evening", "understanding_score": score}
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "INSERT INTO reflection_changes (seq, reflection_id, operation, record) VALUES (?, ?, ?, ?)",
+            (seq, reflection_id, operation, json.dumps(record))
+        )
+
+
+def _consumer(tmp_path, db_path, sink, clock, **kwargs):
+    return CDCConsumer(ChangeLogSource(lambda: sqlite3.connect(db_path)), sink,
+                       str(tmp_path / "offset.json"), quiet_seconds=0.5, max_delay_seconds=2.0, clock=clock, **kwargs)
+
+
+class RecordingSink:
+    def __init__(self):
+        self.written = []
+
+    def write_batch(self, changes):
+        self.written.extend((change["seq"], change["reflection_id"]) for change in changes)
+        return {"failed": []}
+
+
+def test_rapid_edits_are_coalesced_into_one_write(tmp_path):
+    db_path = _standin(tmp_path)
+    for score in range(1, 11):
+        _log(db_path, "a", score)
+    _log(db_path, "b", 3, operation="INSERT")
+
+    clock, notion = FakeClock(), FakeNotion()
+    consumer = _consumer(tmp_path, db_path, NotionReflectionSink(notion, "db", requests_per_second=0), clock)
+
+    consumer.poll_once()
+    assert consumer.flush() == 0
+    assert consumer.committed_seq == 0
+
+    clock.now = 0.6
+    assert consumer.flush() == 2
+
+    creates = [call for call in notion.calls if call[0] == "create"]
+    assert [call[1] for call in creates] == ["a", "b"]
+    assert creates[0][2]["properties"]["이해도"] == {"number": 10}
+    assert consumer.stats["changes_coalesced"] == 9
+    assert consumer.committed_seq == 11
+
+    _log(db_path, "a", 7)
+    _log(db_path, "b", 0, operation="DELETE")
+    consumer.poll_once()
+    clock.now = 1.2
+    consumer.flush()
+
+    assert notion.calls[-2][0] == "update" and notion.calls[-2][1] == "page-a"
+    assert notion.calls[-1][2] == {"page_id": "page-b", "archived": True}
+    assert sum(1 for call in notion.calls if call[0] == "query") == 2
+
+
+def test_continuous_edits_flush_at_max_delay(tmp_path):
+    db_path = _standin(tmp_path)
+    clock = FakeClock()
+    written = []
+
+    class Sink:
+        def write_batch(self, changes):
+            written.append([change["record"]["understanding_score"] for change in changes])
+            return {"failed": []}
+
+    consumer = _consumer(tmp_path, db_path, Sink(), clock)
+    for step in range(10):
+        clock.now = step * 0.3
+        _log(db_path, "a", step)
+        consumer.poll_once()
+        consumer.flush()
+
+    # 처음 본 뒤 2초(max_delay)가 지난 7번째 수정에서 한 번 반영, 이후 수정은 대기 중
+    assert written == [[7]]
+    assert len(consumer.coalescer) == 1
+
+
+def test_failed_write_keeps_offset_and_resumes(tmp_path):
+    db_path = _standin(tmp_path)
+    _log(db_path, "a", 5)
+    _log(db_path, "b", 6)
+
+    clock = FakeClock()
+    failing = FakeNotion(fail_ids={"a"})
+    consumer = _consumer(tmp_path, db_path, NotionReflectionSink(failing, "db", requests_per_second=0), clock)
+    consumer.poll_once()
+    clock.now = 1.0
+    consumer.flush()
+
+    assert consumer.stats["records_failed"] == 1
+    assert consumer.committed_seq == 0
+    assert not os.path.exists(tmp_path / "offset.json")
+
+    # 재시작한 소비자는 체크포인트 이후부터 다시 읽어 실패한 변경을 반영
+    notion = FakeNotion()
+    restarted = _consumer(tmp_path, db_path, NotionReflectionSink(notion, "db", requests_per_second=0), clock)
+    restarted.poll_once()
+    clock.now = 2.0
+    restarted.flush()
+
+    assert sorted(call[1] for call in notion.calls if call[0] == "create") == ["a", "b"]
+    assert restarted.committed_seq == 2
+    assert _consumer(tmp_path, db_path, NotionReflectionSink(notion, "db"), clock).committed_seq == 2
+
+
+def test_late_commit_below_fetched_seq_is_not_skipped(tmp_path):
+    db_path = _standin(tmp_path)
+    _log(db_path, "a", 5, seq=1)
+    _log(db_path, "c", 7, seq=3)  # seq 2를 받은 트랜잭션이 아직 커밋 전
+
+    clock, sink = FakeClock(), RecordingSink()
+    consumer = _consumer(tmp_path, db_path, sink, clock)
+    consumer.poll_once()
+    clock.now = 1.0
+    consumer.flush()
+
+    assert sink.written == [(1, "a"), (3, "c")]
+    assert consumer.committed_seq == 1  # 보이지 않은 seq 2 앞에서 멈춤
+
+    _log(db_path, "b", 6, seq=2)
+    consumer.poll_once()
+    clock.now = 2.0
+    consumer.flush()
+
+    assert sink.written[-1] == (2, "b")
+    assert consumer.stats["late_changes"] == 1
+    assert consumer.committed_seq == 3
+
+
+def test_rolled_back_gap_expires(tmp_path):
+    db_path = _standin(tmp_path)
+    _log(db_path, "a", 5, seq=1)
+    _log(db_path, "a", 8, seq=4)
+
+    clock, sink = FakeClock(), RecordingSink()
+    consumer = _consumer(tmp_path, db_path, sink, clock, gap_timeout_seconds=10.0)
+    consumer.poll_once()
+    clock.now = 1.0
+    consumer.flush()
+    assert sink.written == [(4, "a")]
+    assert consumer.committed_seq == 1
+
+    # 롤백된 seq 2, 3은 끝내 나타나지 않으므로 제한 시간이 지나면 체크포인트를 넘김
+    clock.now = 11.0
+    consumer.poll_once()
+    consumer.flush()
+    assert consumer.stats["gaps_expired"] == 2
+    assert consumer.committed_seq == 4
+
+
+def _dead_letters(tmp_path):
+    with open(tmp_path / "offset_dead_letters.jsonl", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_rejected_change_is_dead_lettered_without_pinning_offset(tmp_path):
+    db_path = _standin(tmp_path)
+    _log(db_path, "a", 5)
+    _log(db_path, "b", 6)
+
+    clock = FakeClock()
+    notion = FakeNotion(fail_ids={"a"}, error=NotionAPIError(400))
+    consumer = _consumer(tmp_path, db_path, NotionReflectionSink(notion, "db", requests_per_second=0), clock)
+    consumer.poll_once()
+    clock.now = 1.0
+    consumer.flush()
+
+    # 400은 재시도하지 않고 dead letter로 넘기므로 체크포인트가 진행
+    assert len(consumer.coalescer) == 0
+    assert consumer.committed_seq == 2
+    assert consumer.stats["records_rejected"] == 1
+    assert [(item["reflection_id"], item["reason"]) for item in _dead_letters(tmp_path)] == [("a", "rejected")]
+
+
+def test_retryable_failure_is_dead_lettered_after_max_attempts(tmp_path):
+    db_path = _standin(tmp_path)
+    _log(db_path, "a", 5)
+
+    clock = FakeClock()
+    notion = FakeNotion(fail_ids={"a"}, error=NotionAPIError(429))
+    consumer = _consumer(tmp_path, db_path, NotionReflectionSink(notion, "db", requests_per_second=0), clock,
+                         max_attempts=3)
+    consumer.poll_once()
+    for step in range(1, 4):
+        clock.now = step * 100.0
+        consumer.flush()
+        assert consumer.committed_seq == (1 if step == 3 else 0)
+
+    assert consumer.stats["records_failed"] == 3
+    assert consumer.stats["records_dead"] == 1
+    assert _dead_letters(tmp_path)[0]["reason"] == "max_attempts"
+    assert _dead_letters(tmp_path)[0]["attempts"] == 3
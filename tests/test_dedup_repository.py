@@ -0,0 +1,93 @@
+"""
+중복 제거 백업 저장소 테스트
+
+일일/주간/월간 백업 간 청크 공유, 변경 시 국소적인 신규 저장, 정리 후 GC를 검증합니다.
+"""
+
+import sys
+import os
+from datetime import datetime, timedelta
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.notion_automation.utils import dedup_repository
+from src.notion_automation.utils.dedup_repository import DedupBackupRepository, content_defined_chunks
+
+
+def _records(days, start=datetime(2025, 7, 1)):
+    return [
+        {"date": (start + timedelta(days=day)).strftime("%Y-%m-%d"), "time_part": part,
+         "focus_level": (day * 7 + index) % 10, "notes": f"{day}일차 {part} 학습 메모"}
+        for day in range(days) for index, part in enumerate(("morning", "afternoon", "evening"))
+    ]
+
+
+def _by_day(records):
+    days = {}
+    for record in records:
+        days.setdefault(record["date"], []).append(record)
+    return days
+
+
+def test_chunks_never_cross_date_boundaries():
+    records = _records(10)
+    for lines in content_defined_chunks(records):
+        assert len({line.split(b'"date":"')[1][:10] for line in lines}) == 1
+
+
+def test_weekly_and_monthly_backups_reuse_daily_chunks(tmp_path):
+    repo = DedupBackupRepository(str(tmp_path))
+    records = _records(90)
+
+    daily_bytes = 0
+    for day, day_records in _by_day(records).items():
+        daily_bytes += repo.write_backup("daily", day, day_records)["new_bytes"]
+
+    weekly = repo.write_backup("weekly", "w1", records[:21])
+    monthly = repo.write_backup("monthly", "m1", records)
+
+    assert weekly["new_bytes"] == 0
+    assert monthly["new_bytes"] == 0
+    assert repo.storage_bytes() == daily_bytes
+    assert list(repo.iter_records(monthly)) == records
+    assert repo.verify(monthly) == []
+
+
+def test_changed_record_only_stores_its_chunk(tmp_path):
+    repo = DedupBackupRepository(str(tmp_path))
+    records = _records(30)
+    first = repo.write_backup("monthly", "before", records)
+
+    records[40]["notes"] = "수정된 메모"
+    second = repo.write_backup("monthly", "after", records)
+
+    changed = [c for c in second["chunks"] if c["hash"] not in {f["hash"] for f in first["chunks"]}]
+    assert len(changed) == 1
+    assert 0 < second["new_bytes"] < first["new_bytes"] / 10
+
+
+def test_prune_removes_unreferenced_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(dedup_repository, "CHUNK_GRACE_SECONDS", -1)
+    repo = DedupBackupRepository(str(tmp_path))
+
+    for day, day_records in _by_day(_records(5)).items():
+        repo.write_backup("daily", day, day_records)
+    kept = repo.write_backup("weekly", "w1", _records(2))
+
+    result = repo.prune({"daily": 1})
+
+    assert result["removed_manifests"] == 4
+    assert result["removed_chunks"] == 2  # 7/3, 7/4 청크만 삭제 (7/1, 7/2는 주간 백업이 참조)
+    assert repo.verify(kept) == []
+    assert len(repo.list_manifests("daily")) == 1
+
+
+def test_missing_chunk_is_reported(tmp_path):
+    repo = DedupBackupRepository(str(tmp_path))
+    manifest = repo.write_backup("daily", "d1", _records(1))
+    os.remove(repo.chunk_path(manifest["chunks"][0]["hash"]))
+
+    errors = repo.verify(manifest)
+    assert errors and errors[0].startswith("청크 누락")
@@ -0,0 +1,148 @@
+"""
+GitHub webhook 수신기 테스트
+
+기록된 형태의 payload를 로컬 수신기에 POST해 서명 검증, 시간대 배정,
+중복 delivery 무시와 분석기/수집기의 저장소 조회를 검증합니다.
+"""
+
+import sys
+import os
+import asyncio
+import json
+from datetime import datetime, date, timezone
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.notion_automation.utils.github_activity_store import GitHubActivityStore, time_part_for
+from src.notion_automation.scripts.github_webhook_receiver import GitHubWebhookReceiver, replay_payload
+from src.notion_automation.scripts.github_realtime_collector import GitHubRealtimeCollector
+
+SECRET = "test-secret"
+ARRIVAL = datetime(2026, 3, 2, 14, 5)
+
+PUSH_PAYLOAD = {
+    "ref": "refs/heads/main",
+    "repository": {"full_name": "student/LG_DX_School"},
+    "commits": [
+        {"id": "a1b2c3d4e5f6", "message": "HTML 실습 완료", "timestamp": "2026-03-02T14:01:00+09:00",
+         "author": {"name": "Student", "username": "student"}, "added": ["index.html"], "removed": [], "modified": ["style.css"]},
+        {"id": "f6e5d4c3b2a1", "message": "CSS 반응형 적용", "timestamp": "2026-03-02T14:04:00+09:00",
+         "author": {"name": "Student", "username": "student"}, "added": [], "removed": [], "modified": ["style.css"]},
+    ],
+}
+
+ISSUES_PAYLOAD = {
+    "action": "opened",
+    "repository": {"full_name": "student/LG_DX_School"},
+    "issue": {"number": 21, "title": "실습 오류 질문", "state": "open", "created_at": "2026-03-02T14:03:00Z"},
+}
+
+REVIEW_PAYLOAD = {
+    "action": "submitted",
+    "repository": {"full_name": "student/LG_DX_School"},
+    "pull_request": {"number": 8},
+    "review": {"id": 9001, "state": "APPROVED", "submitted_at": "2026-03-02T14:04:30Z"},
+}
+
+
+def post_all(store, deliveries, secret=SECRET):
+    async def run():
+        receiver = GitHubWebhookReceiver(store, SECRET, clock=lambda: ARRIVAL)
+        host, port = await receiver.start(port=0)
+        try:
+            results = []
+            for event, payload, delivery_id in deliveries:
+                body = json.dumps(payload).encode("utf-8")
+                results.append(await replay_payload(f"http://{host}:{port}/webhook", secret, event, body, delivery_id))
+            return results, receiver.stats
+        finally:
+            await receiver.stop()
+
+    return asyncio.run(run())
+
+
+def test_signed_events_are_stored_in_arrival_time_part(tmp_path):
+    store = GitHubActivityStore(str(tmp_path / "activity.db"))
+
+    results, stats = post_all(store, [
+        ("push", PUSH_PAYLOAD, "d-1"),
+        ("issues", ISSUES_PAYLOAD, "d-2"),
+        ("pull_request_review", REVIEW_PAYLOAD, "d-3"),
+        ("push", PUSH_PAYLOAD, "d-1"),   # GitHub 재전송
+        ("star", {"action": "created"}, "d-4"),
+    ])
+
+    assert [status for status, _ in results] == [200, 200, 200, 202, 202]
+    assert results[0][1] == {"status": "stored", "activities": 2, "time_part": "🌞 오후수업"}
+    assert results[3][1]["status"] == "duplicate"
+    assert stats == {"received": 5, "stored": 3, "duplicate": 1, "ignored": 1, "rejected": 0}
+
+    activities = store.get_time_part_activities(date(2026, 3, 2), "🌞 오후수업")
+    assert [commit["message"] for commit in activities["commits"]] == ["HTML 실습 완료", "CSS 반응형 적용"]
+    assert activities["commits"][0]["files_changed"] == 2
+    assert activities["issues"][0]["number"] == 21
+    assert activities["code_reviews"][0]["state"] == "approved"
+    assert store.get_time_part_activities(date(2026, 3, 2), "🌅 오전수업")["commits"] == []
+
+
+def test_invalid_signature_is_rejected(tmp_path):
+    store = GitHubActivityStore(str(tmp_path / "activity.db"))
+
+    results, stats = post_all(store, [("push", PUSH_PAYLOAD, "d-1")], secret="wrong-secret")
+
+    assert results[0][0] == 401
+    assert stats["rejected"] == 1
+    assert store.counts() == {"deliveries": 0}
+
+
+def test_issue_updates_keep_latest_state(tmp_path):
+    store = GitHubActivityStore(str(tmp_path / "activity.db"))
+    closed = {**ISSUES_PAYLOAD, "action": "closed", "issue": {**ISSUES_PAYLOAD["issue"], "state": "closed"}}
+
+    store.append_event("issues", ISSUES_PAYLOAD, "d-1", ARRIVAL)
+    store.append_event("issues", closed, "d-2", ARRIVAL)
+
+    issues = store.get_time_part_activities(date(2026, 3, 2), "🌞 오후수업")["issues"]
+    assert len(issues) == 1
+    assert issues[0]["state"] == "closed"
+
+
+def test_aware_arrival_is_classified_in_calendar_timezone(tmp_path):
+    store = GitHubActivityStore(str(tmp_path / "activity.db"))
+
+    # UTC 서버가 넘긴 도착 시각: 05:05Z = KST 14:05, 16:30Z = 다음 날 KST 01:30
+    afternoon = store.append_event("issues", ISSUES_PAYLOAD, "d-1", datetime(2026, 3, 2, 5, 5, tzinfo=timezone.utc))
+    next_day = store.append_event("push", PUSH_PAYLOAD, "d-2", datetime(2026, 3, 2, 16, 30, tzinfo=timezone.utc))
+
+    assert afternoon["time_part"] == "🌞 오후수업"
+    assert store.get_time_part_activities(date(2026, 3, 2), "🌞 오후수업")["issues"][0]["number"] == 21
+    assert next_day["time_part"] == "🌅 오전수업"
+    assert len(store.get_time_part_activities(date(2026, 3, 3), "🌅 오전수업")["commits"]) == 2
+
+    receiver = GitHubWebhookReceiver(store, SECRET)
+    assert receiver.clock().utcoffset().total_seconds() == 9 * 3600
+
+
+def test_time_part_for_off_hours():
+    assert time_part_for(datetime(2026, 3, 2, 7, 0)) == "🌅 오전수업"
+    assert time_part_for(datetime(2026, 3, 2, 12, 30)) == "🌅 오전수업"
+    assert time_part_for(datetime(2026, 3, 2, 18, 0)) == "🌞 오후수업"
+    assert time_part_for(datetime(2026, 3, 2, 23, 0)) == "🌙 저녁자율학습"
+
+
+def test_collector_reads_store_instead_of_polling(tmp_path):
+    store = GitHubActivityStore(str(tmp_path / "activity.db"))
+    store.append_event("push", PUSH_PAYLOAD, "d-1", ARRIVAL)
+
+    collector = GitHubRealtimeCollector(owner="student", repo="LG_DX_School", activity_store=store,
+                                        backup_dir=str(tmp_path / "github_realtime"))
+    result = collector.collect_realtime_github_data(date(2026, 3, 2), "🌞 오후수업")
+
+    data = result["data"]["🌞 오후수업"]
+    assert result["collection_method"] == "webhook"
+    assert [commit["sha"] for commit in data["commits"]] == ["a1b2c3d", "f6e5d4c"]
+    assert data["data_source"] == "webhook_store"
+    assert data["productive_score"] > 0
+    assert os.listdir(tmp_path / "github_realtime" / "segments")
@@ -0,0 +1,148 @@
+"""
+공유 HTTP 전송 계층 테스트
+
+로컬 HTTP 서버로 호스트별 연결 재사용, 요청 타이밍 훅, 오류 기록,
+429 응답 때 공유 요청 제한기 지연과 비동기 전송의 동일한 통계 형식을 검증합니다.
+"""
+
+import sys
+import os
+import asyncio
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+pytest.importorskip("requests")
+
+from src.notion_automation.utils.http_transport import HttpTransport, AsyncHttpTransport
+from src.notion_automation.utils.shared_rate_limiter import bucket_key, limiter_metrics
+
+
+class JsonHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+
+    def do_GET(self):
+        JsonHandler.connections.add(self.client_address)
+        limited = self.path == "/limited"
+        body = b'{"ok": false}' if limited else b'{"ok": true}'
+        self.send_response(429 if limited else 200)
+        if limited:
+            self.send_header("Retry-After", "2")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    JsonHandler.connections = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), JsonHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_requests_reuse_one_connection(server_url):
+    transport = HttpTransport()
+    timings = []
+    transport.add_hook(timings.append)
+
+    for _ in range(20):
+        response = transport.get(f"{server_url}/ping")
+        assert response.json() == {"ok": True}
+
+    stats = transport.stats()["127.0.0.1"]
+    assert stats["requests"] == 20
+    assert stats["new_connections"] == 1
+    assert stats["reused_connections"] == 19
+    assert len(JsonHandler.connections) == 1
+
+    first, rest = timings[0], timings[1:]
+    assert first.new_connection and first.connect_seconds > 0
+    assert not any(timing.new_connection or timing.handshake_seconds for timing in rest)
+    assert all(timing.status == 200 and 0 < timing.ttfb_seconds <= timing.total_seconds for timing in timings)
+    transport.close()
+
+
+def test_sessions_are_per_host_with_profile_timeout(server_url):
+    transport = HttpTransport(profiles={"127.0.0.1": {"timeout": (1.0, 2.0), "pool_maxsize": 2}})
+
+    session = transport.session(f"{server_url}/a")
+
+    assert transport.session(f"{server_url}/b") is session
+    assert transport.session("http://localhost/") is not session
+    assert session.default_timeout == (1.0, 2.0)
+    transport.close()
+
+
+def test_failed_request_is_recorded():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+
+    transport = HttpTransport()
+    timings = []
+    transport.add_hook(timings.append)
+
+    with pytest.raises(Exception):
+        transport.get(f"http://127.0.0.1:{port}/")
+
+    assert timings[0].error == "ConnectionError"
+    assert transport.stats()["127.0.0.1"]["errors"] == 1
+
+
+def test_async_transport_reuses_connections(server_url):
+    pytest.importorskip("aiohttp")
+
+    async def fetch_all():
+        async with AsyncHttpTransport() as transport:
+            for _ in range(10):
+                response = await transport.get(f"{server_url}/ping")
+                assert response.json() == {"ok": True}
+            return transport.stats()["127.0.0.1"]
+
+    stats = asyncio.run(fetch_all())
+
+    assert stats["requests"] == 10
+    assert stats["new_connections"] == 1
+    assert stats["ttfb_seconds"] > 0
+
+
+def test_rate_limited_response_penalizes_shared_limiter(server_url, tmp_path):
+    db_path = str(tmp_path / "rate_limits.db")
+    transport = HttpTransport(profiles={"127.0.0.1": {"rate_limit_api": "notion"}}, rate_limit_db=db_path)
+    headers = {"Authorization": "Bearer secret-token"}
+
+    assert transport.get(f"{server_url}/ping", headers=headers).status_code == 200
+    assert limiter_metrics(db_path) == {}
+
+    # 429를 받은 호출자가 제한기를 직접 다루지 않아도 같은 토큰의 버킷이 물러남
+    assert transport.get(f"{server_url}/limited", headers=headers).status_code == 429
+    assert limiter_metrics(db_path)[bucket_key("notion", "secret-token")]["penalties"] == 1
+    transport.close()
+
+
+def test_async_rate_limited_response_penalizes_shared_limiter(server_url, tmp_path):
+    pytest.importorskip("aiohttp")
+    db_path = str(tmp_path / "rate_limits.db")
+
+    async def fetch_limited():
+        async with AsyncHttpTransport(profiles={"127.0.0.1": {"rate_limit_api": "github"}},
+                                      rate_limit_db=db_path) as transport:
+            response = await transport.get(f"{server_url}/limited", headers={"Authorization": "token gh-token"})
+            return response.status_code, response.headers.get("retry-after")
+
+    assert asyncio.run(fetch_limited()) == (429, "2")
+    assert limiter_metrics(db_path)[bucket_key("github", "gh-token")]["penalties"] == 1
@@ -0,0 +1,115 @@
+"""
+다중 학습자 분석 실행기 테스트
+
+SQLite 대역 DB에서 학습자별 스트리밍 묶음, 프로세스 풀 분석,
+daily_statistics 일괄 upsert를 검증합니다.
+"""
+
+import sys
+import os
+import sqlite3
+from datetime import date, timedelta
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.notion_automation.optimization.learner_analytics_runner import (
+    LearnerAnalyticsRunner, create_sqlite_standin_schema, analyze_learner, REFLECTION_COLUMNS, TIME_PARTS
+)
+
+START = date(2025, 3, 3)  # 월요일
+
+
+@pytest.fixture
+def standin_db(tmp_path):
+    """학습자 12명 × 10일 × 3시간대 대역 DB"""
+    db_path = str(tmp_path / "standin.db")
+    conn = sqlite3.connect(db_path)
+    create_sqlite_standin_schema(conn)
+
+    rows = []
+    for learner in range(12):
+        for day in range(10):
+            for index, part in enumerate(TIME_PARTS):
+                # 학습자마다 가장 강한 시간대가 다르도록 구성
+                bonus = 3 if index == learner % 3 else 0
+                rows.append((f"learner-{learner:02d}", str(START + timedelta(days=day)), part,
+                             5 + bonus, 5, 5, "보통", 1, 0, 0))
+    conn.executemany(
+        f"INSERT INTO daily_reflections ({', '.join(REFLECTION_COLUMNS)}) VALUES ({', '.join('?' * len(REFLECTION_COLUMNS))})",
+        rows
+    )
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+def test_streams_reflections_grouped_by_learner(standin_db):
+    """작은 fetch 단위로 읽어도 학습자 경계가 정확히 유지되는지 확인"""
+    runner = LearnerAnalyticsRunner(lambda: sqlite3.connect(standin_db), fetch_size=7)
+    conn = sqlite3.connect(standin_db)
+
+    groups = list(runner.iter_learner_reflections(conn))
+    conn.close()
+
+    assert [user_id for user_id, _ in groups] == [f"learner-{i:02d}" for i in range(12)]
+    assert all(len(rows) == 30 for _, rows in groups)
+
+
+@pytest.mark.parametrize("max_workers", [0, 2])
+def test_run_writes_statistics_in_bulk(standin_db, max_workers):
+    """순차/프로세스 풀 실행 모두 같은 통계를 기록하고, 재실행은 upsert 되는지 확인"""
+    runner = LearnerAnalyticsRunner(lambda: sqlite3.connect(standin_db), max_workers=max_workers,
+                                    learners_per_task=5, write_batch_size=25)
+
+    result = runner.run()
+    runner.run()
+
+    assert result["learner_count"] == 12
+    assert result["statistics_rows_written"] == 120
+
+    best = {summary["user_id"]: summary["best_timepart"] for summary in result["learners"]}
+    assert best["learner-00"] == "morning"
+    assert best["learner-04"] == "afternoon"
+    assert best["learner-08"] == "evening"
+
+    conn = sqlite3.connect(standin_db)
+    count, grades = conn.execute(
+        "SELECT COUNT(*), COUNT(DISTINCT daily_grade) FROM daily_statistics"
+    ).fetchone()
+    reflections, total = conn.execute(
+        "SELECT reflections_completed, total_reflection_score FROM daily_statistics WHERE user_id = 'learner-00' AND date = ?",
+        (str(START),)
+    ).fetchone()
+    conn.close()
+
+    assert count == 120
+    assert grades == 1
+    assert (reflections, total) == (3, 15 + 18 + 15)
+
+
+def test_date_range_filter(standin_db):
+    """기간을 지정하면 해당 날짜만 분석"""
+    runner = LearnerAnalyticsRunner(lambda: sqlite3.connect(standin_db), max_workers=0)
+
+    result = runner.run(start_date=START + timedelta(days=5), end_date=START + timedelta(days=6))
+
+    assert result["statistics_rows_written"] == 24
+    assert all(summary["active_days"] == 2 for summary in result["learners"])
+
+
+def test_analyze_learner_daily_rows():
+    """학습자 분석 함수의 일별 통계 계산 확인"""
+    rows = [
+        {"user_id": "u", "date": "2025-03-03", "time_part": part, "understanding_score": 10,
+         "concentration_score": 9, "achievement_score": 9, "github_commits": 2, "github_issues": 0, "github_prs": 1}
+        for part in TIME_PARTS
+    ]
+
+    summary, statistics_rows = analyze_learner("u", rows)
+
+    assert summary["active_days"] == 1
+    assert statistics_rows[0][2:7] == (3, 84, 28.0, 21, "완벽한 하루")
@@ -0,0 +1,95 @@
+"""
+로컬 3part_local.db 마이그레이션 및 쿼리 플랜 테스트
+
+버전별 마이그레이션 적용, 기존 DB 업그레이드, 주요 조회가 인덱스를 사용하는지 검증합니다.
+"""
+
+import sys
+import os
+import sqlite3
+from datetime import datetime, timedelta
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.notion_automation.optimization.local_db_migrations import migrate, get_schema_version, LATEST_VERSION
+from src.notion_automation.optimization.backup_sync_system import (
+    LOAD_LOCAL_DATA_SQL, BACKUP_STATS_SQL, RECENT_BACKUPS_SQL, RECENT_SYNCS_SQL, TIME_PART_ORDER
+)
+
+
+def _query_plan(conn, sql, params=()):
+    return " | ".join(row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+
+
+def _populated_db(path, years=3):
+    conn = sqlite3.connect(path)
+    migrate(conn)
+    start = datetime(2023, 1, 1)
+    conn.executemany(
+        "INSERT INTO three_part_data (date, time_part, time_part_order, focus_level) VALUES (?, ?, ?, ?)",
+        [
+            ((start + timedelta(days=day)).strftime("%Y-%m-%d"), part, order, day % 10)
+            for day in range(365 * years) for part, order in TIME_PART_ORDER.items()
+        ]
+    )
+    conn.executemany(
+        "INSERT INTO backup_history (backup_type, backup_date, file_path, file_size, record_count, created_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        [("daily", str(day), f"/tmp/{day}", 100, 3, f"2025-01-01 00:{day % 60:02d}:00") for day in range(500)]
+    )
+    conn.executemany(
+        "INSERT INTO sync_log (sync_date, source, target, action, record_count, status, created_at) "
+        "VALUES (?, 'notion', 'local', 'sync', 1, 'success', ?)",
+        [(str(day), f"2025-01-01 00:{day % 60:02d}:00") for day in range(500)]
+    )
+    conn.commit()
+    conn.execute("ANALYZE")
+    return conn
+
+
+def test_migrations_are_versioned_and_idempotent(tmp_path):
+    conn = sqlite3.connect(tmp_path / "local.db")
+    assert migrate(conn) == LATEST_VERSION
+    assert migrate(conn) == LATEST_VERSION
+    assert get_schema_version(conn) == LATEST_VERSION
+    conn.close()
+
+
+def test_existing_v0_database_is_upgraded(tmp_path):
+    """마이그레이션 도입 전 스키마(버전 0)의 데이터에 정렬 컬럼이 채워지는지 확인"""
+    conn = sqlite3.connect(tmp_path / "local.db")
+    migrate(conn, target_version=1)
+    conn.execute("PRAGMA user_version = 0")
+    conn.execute("INSERT INTO three_part_data (date, time_part) VALUES ('2025-07-01', 'evening')")
+    conn.execute("INSERT INTO three_part_data (date, time_part) VALUES ('2025-07-01', 'morning')")
+    conn.commit()
+
+    migrate(conn)
+
+    rows = conn.execute(LOAD_LOCAL_DATA_SQL, ("2025-07-01", "2025-07-01")).fetchall()
+    assert [row[1] for row in rows] == ["morning", "evening"]
+    conn.close()
+
+
+def test_date_range_load_uses_index_without_sort(tmp_path):
+    conn = _populated_db(tmp_path / "local.db")
+
+    plan = _query_plan(conn, LOAD_LOCAL_DATA_SQL, ("2024-03-01", "2024-03-31"))
+
+    assert "idx_three_part_data_date_order" in plan
+    assert "TEMP B-TREE" not in plan
+    assert len(conn.execute(LOAD_LOCAL_DATA_SQL, ("2024-03-01", "2024-03-31")).fetchall()) == 93
+    conn.close()
+
+
+def test_statistics_queries_use_indexes(tmp_path):
+    conn = _populated_db(tmp_path / "local.db")
+
+    assert "COVERING INDEX idx_backup_history_type_stats" in _query_plan(conn, BACKUP_STATS_SQL)
+    assert "idx_backup_history_created_at" in _query_plan(conn, RECENT_BACKUPS_SQL)
+    assert "idx_sync_log_created_at" in _query_plan(conn, RECENT_SYNCS_SQL)
+    for sql in (BACKUP_STATS_SQL, RECENT_BACKUPS_SQL, RECENT_SYNCS_SQL):
+        assert "TEMP B-TREE" not in _query_plan(conn, sql)
+    conn.close()
@@ -0,0 +1,117 @@
+"""
+3-Part 지표 집계 큐브 테스트
+
+월 롤업 + 일별 자투리 조합 결과가 원본 재계산과 같은지, 정정 입력 시
+롤업이 갱신되는지, 요일 집계가 인덱스를 사용하는지 검증합니다.
+"""
+
+import sys
+import os
+import calendar
+import random
+from datetime import date, timedelta
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.notion_automation.dashboard.metric_cube import TimePartMetricCube
+
+TIMEPARTS = ["🌅 오전수업", "🌞 오후수업", "🌙 저녁자율학습"]
+START = date(2024, 1, 1)
+
+
+@pytest.fixture
+def filled_cube(tmp_path):
+    """2년치 무작위 점수를 반영한 큐브와 원본 값"""
+    random.seed(3)
+    cube = TimePartMetricCube(str(tmp_path / "cube.db"))
+    raw = []
+
+    for offset in range(730):
+        day = START + timedelta(days=offset)
+        for timepart in TIMEPARTS:
+            if random.random() < 0.8:
+                raw.append((day, timepart, "overall_score", random.randint(30, 100)))
+
+    cube.record_many(raw)
+    return cube, raw
+
+
+def test_summarize_matches_raw_data(filled_cube):
+    """월 경계를 걸친 임의 구간 통계가 원본 재계산과 같은지 확인"""
+    cube, raw = filled_cube
+    start, end = date(2024, 2, 17), date(2025, 8, 9)
+
+    summary = cube.summarize(start, end, metrics=["overall_score"])
+
+    for timepart in TIMEPARTS:
+        values = [v for d, tp, _, v in raw if tp == timepart and start <= d <= end]
+        mean = sum(values) / len(values)
+        stats = summary[timepart]["overall_score"]
+
+        assert stats["count"] == len(values)
+        assert stats["mean"] == pytest.approx(mean)
+        assert stats["std_dev"] == pytest.approx((sum((v - mean) ** 2 for v in values) / len(values)) ** 0.5)
+        assert (stats["max"], stats["min"]) == (max(values), min(values))
+
+
+def test_weekday_summary_and_rollups(filled_cube):
+    """요일 집계와 월 롤업이 원본과 일치하는지 확인"""
+    cube, raw = filled_cube
+    start, end = date(2024, 1, 1), date(2025, 12, 30)
+
+    weekdays = cube.weekday_summary("overall_score", start, end)
+    monday = [v for d, tp, _, v in raw if tp == TIMEPARTS[0] and d.weekday() == 0]
+    assert weekdays[calendar.day_name[0]][TIMEPARTS[0]]["count"] == len(monday)
+    assert weekdays[calendar.day_name[0]][TIMEPARTS[0]]["mean"] == pytest.approx(sum(monday) / len(monday))
+
+    months = cube.period_series("month", "overall_score", start, end)
+    march = [v for d, tp, _, v in raw if tp == TIMEPARTS[1] and (d.year, d.month) == (2024, 3)]
+    assert months["2024-03"][TIMEPARTS[1]]["total"] == sum(march)
+    assert len(cube.period_series("week", "overall_score", date(2024, 3, 4), date(2024, 3, 17))) == 2
+
+
+def test_correction_updates_rollups(tmp_path):
+    """같은 날짜 값을 정정하면 주/월 롤업도 함께 바뀌고, 같은 값 재반영은 무시"""
+    cube = TimePartMetricCube(str(tmp_path / "cube.db"))
+    day = date(2025, 3, 12)
+
+    assert cube.record(day, TIMEPARTS[0], {"overall_score": 50, "has_data": True}) == 1
+    assert cube.record(day, TIMEPARTS[0], {"overall_score": 50}) == 0
+    cube.record(day, TIMEPARTS[0], {"overall_score": 80})
+
+    month = cube.period_series("month", "overall_score", day, day)["2025-03"][TIMEPARTS[0]]
+    assert (month["count"], month["total"]) == (1, 80)
+    assert cube.summarize(date(2025, 3, 1), date(2025, 3, 31))[TIMEPARTS[0]]["overall_score"]["mean"] == 80
+
+
+def test_remove_updates_rollups(tmp_path):
+    """날짜/시간대 관측값을 지우면 그 주/월 롤업에서도 빠지는지 확인"""
+    cube = TimePartMetricCube(str(tmp_path / "cube.db"))
+    day, other = date(2025, 3, 12), date(2025, 3, 13)
+    cube.record(day, TIMEPARTS[0], {"overall_score": 50, "understanding": 7})
+    cube.record(other, TIMEPARTS[0], {"overall_score": 70})
+
+    assert cube.remove(day, TIMEPARTS[0]) == 2
+    assert cube.remove(day, TIMEPARTS[0]) == 0
+
+    month = cube.period_series("month", "overall_score", day, day)["2025-03"][TIMEPARTS[0]]
+    assert (month["count"], month["total"]) == (1, 70)
+    assert cube.period_series("week", "understanding", day, day) == {}
+
+
+def test_window_queries_use_indexes(filled_cube):
+    """기간/요일 집계 쿼리가 전체 테이블 스캔 대신 인덱스를 사용하는지 확인"""
+    cube, _ = filled_cube
+
+    with cube._connect() as conn:
+        plan = " ".join(row[-1] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT weekday, time_part, SUM(value_sum) FROM cube_daily "
+            "WHERE metric = ? AND date BETWEEN ? AND ? GROUP BY weekday, time_part",
+            ("overall_score", "2024-01-01", "2024-12-31")
+        ))
+
+    assert "USING" in plan and "INDEX" in plan
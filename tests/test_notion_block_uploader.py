@@ -0,0 +1,117 @@
+"""
+Notion 블록 업로더 테스트
+
+텍스트 분할, 요청당 100개 묶음, 하위 트리 병렬 업로드를 검증합니다.
+"""
+
+import sys
+import os
+import threading
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.notion_automation.dashboard.notion_block_uploader import (
+    NotionBlockUploader, split_text, normalize_block, NOTION_MAX_TEXT_LENGTH
+)
+
+
+class FakeChildren:
+    """blocks.children.append 호출을 기록하는 가짜 엔드포인트"""
+
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def append(self, block_id, children):
+        with self.lock:
+            self.calls.append((block_id, children))
+            call_no = len(self.calls)
+        return {"results": [{"id": f"block-{call_no}-{i}"} for i in range(len(children))]}
+
+
+class FakeClient:
+    def __init__(self):
+        self.blocks = type("Blocks", (), {})()
+        self.blocks.children = FakeChildren()
+
+
+def _paragraph(text, children=None):
+    body = {"rich_text": [{"type": "text", "text": {"content": text}}]}
+    if children is not None:
+        body["children"] = children
+    return {"object": "block", "type": "paragraph", "paragraph": body}
+
+
+def test_long_text_is_split_within_limit():
+    """2000자를 넘는 텍스트가 서식을 유지한 채 분할되는지 확인"""
+    text = ("줄 " * 300 + "\n") * 5
+    pieces = split_text(text)
+
+    assert "".join(pieces) == text
+    assert all(len(piece) <= NOTION_MAX_TEXT_LENGTH for piece in pieces)
+
+    block = _paragraph(text)
+    block["paragraph"]["rich_text"][0]["annotations"] = {"bold": True}
+    normalized = normalize_block(block)
+
+    assert len(normalized) == 1
+    rich_text = normalized[0]["paragraph"]["rich_text"]
+    assert len(rich_text) == len(pieces)
+    assert all(item["annotations"] == {"bold": True} for item in rich_text)
+
+
+def test_blocks_are_packed_into_100_per_request():
+    """스트림으로 들어온 블록이 요청당 100개 이하로 묶이는지 확인"""
+    client = FakeClient()
+    uploader = NotionBlockUploader(client, requests_per_second=0)
+
+    stats = uploader.upload("page", (_paragraph(f"항목 {i}") for i in range(250)))
+
+    sizes = [len(children) for _, children in client.blocks.children.calls]
+    assert sizes == [100, 100, 50]
+    assert stats["requests"] == 3
+    assert stats["blocks_uploaded"] == 250
+    assert stats["failed_requests"] == 0
+
+
+def test_subtrees_are_inlined_or_uploaded_separately():
+    """작은 하위 블록은 함께 전송하고, 큰 하위 트리는 생성된 부모 아래에 따로 업로드"""
+    client = FakeClient()
+    uploader = NotionBlockUploader(client, requests_per_second=0)
+
+    small = _paragraph("작은 섹션", [_paragraph(f"s{i}") for i in range(5)])
+    large = _paragraph("큰 섹션", [_paragraph(f"l{i}") for i in range(150)])
+
+    stats = uploader.upload("page", [small, large])
+    calls = client.blocks.children.calls
+
+    assert calls[0][0] == "page"
+    assert len(calls[0][1][0]["paragraph"]["children"]) == 5
+    assert "children" not in calls[0][1][1]["paragraph"]
+
+    # 큰 섹션의 자식은 생성된 부모 블록 ID 아래에 100개 단위로 업로드
+    subtree_calls = [(parent, len(children)) for parent, children in calls[1:]]
+    assert subtree_calls == [("block-1-1", 100), ("block-1-1", 50)]
+    assert stats["blocks_uploaded"] == 2 + 5 + 150
+
+
+def test_failed_request_is_recorded():
+    """요청 실패 시 나머지 업로드를 계속하고 통계에 기록"""
+    class FlakyChildren(FakeChildren):
+        def append(self, block_id, children):
+            if not self.calls:
+                self.calls.append((block_id, children))
+                raise RuntimeError("rate_limited")
+            return super().append(block_id, children)
+
+    client = FakeClient()
+    client.blocks.children = FlakyChildren()
+    uploader = NotionBlockUploader(client, requests_per_second=0)
+
+    stats = uploader.upload("page", [_paragraph(f"항목 {i}") for i in range(120)])
+
+    assert stats["failed_requests"] == 1
+    assert stats["skipped_blocks"] == 100
+    assert stats["blocks_uploaded"] == 20
@@ -0,0 +1,157 @@
+"""
+Notion 페이지 디코더 테스트
+
+속성 타입별 디코딩과 없음(MISSING)/빈 값(None) 구분, select 값 공유, 깨진 페이지 건너뛰기,
+페이지네이션 스트리밍 조회와 무결성 검증기가 디코딩된 레코드로 같은 결과를 내는지 검증합니다.
+"""
+
+import sys
+import os
+import json
+import tracemalloc
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import pytest
+
+from src.notion_automation.utils.notion_page_decoder import (
+    NotionPageSchema, REFLECTION_PAGE_SCHEMA, MISSING, decode_pages, query_records
+)
+from src.notion_automation.scripts.validate_data_integrity import DataIntegrityValidator, save_validation_report
+
+MORNING, AFTERNOON = "🌅 오전수업", "🌞 오후수업"
+
+
+def make_page(page_id, date, time_part, **extra):
+    properties = {
+        "reflection_date": {"type": "date", "date": {"start": date, "end": None}},
+        "time_part": {"type": "select", "select": {"id": "x", "name": time_part, "color": "blue"}},
+    }
+    properties.update(extra)
+    return {"object": "page", "id": page_id, "properties": properties}
+
+
+def test_decodes_property_types():
+    schema = NotionPageSchema({
+        "title": "title",
+        "memo": "rich_text",
+        "subject": "string",
+        "score": "number",
+        "total": "number",
+        "tags": "multi_select",
+        "done": "checkbox",
+        "commit_count": ("Commit Count", "number"),
+    })
+    page = {"id": "p1", "properties": {
+        "title": {"title": [{"plain_text": "2026-03-02 "}, {"text": {"content": "오전"}}]},
+        "memo": {"rich_text": []},
+        "subject": {"title": [{"text": {"content": "파이썬"}}]},
+        "score": {"number": 0},
+        "total": {"type": "formula", "formula": {"type": "number", "number": 7.5}},
+        "tags": {"multi_select": [{"name": "복습"}, {"name": "실습"}]},
+        "done": {"checkbox": False},
+        "Commit Count": {"number": 4},
+    }}
+
+    record = schema.decode(page)
+
+    assert record.page_id == "p1"
+    assert record.title == "2026-03-02 오전"
+    assert record.memo is None
+    assert record.subject == "파이썬"
+    assert (record.score, record.total, record.commit_count) == (0, 7.5, 4)
+    assert record.tags == ("복습", "실습")
+    assert record.done is False
+    assert not hasattr(record, "__dict__")
+
+    assert schema.decode({"id": "p2", "properties": {}}).score is MISSING
+    assert NotionPageSchema({"score": "number"}, missing=None).decode({"properties": {}}).score is None
+    with pytest.raises(ValueError):
+        NotionPageSchema({"x": "relation"})
+
+
+def test_select_values_are_shared_and_bad_pages_skipped():
+    raw = json.dumps([make_page(f"p{i}", "2026-03-02", MORNING) for i in range(3)], ensure_ascii=False)
+    pages = json.loads(raw)
+    pages.insert(1, {"id": "broken", "properties": {"time_part": "오전"}})
+
+    records = decode_pages(pages, REFLECTION_PAGE_SCHEMA)
+
+    assert [r.page_id for r in records] == ["p0", "p1", "p2"]
+    assert records[0].time_part is records[2].time_part
+    assert records[0].reflection_date is records[1].reflection_date
+
+
+def test_query_records_streams_pagination():
+    batches = {
+        None: {"results": [make_page("a", "2026-03-01", MORNING)], "has_more": True, "next_cursor": "c1"},
+        "c1": {"results": [make_page("b", "2026-03-02", AFTERNOON)], "has_more": False, "next_cursor": None},
+    }
+    calls = []
+
+    class Limiter:
+        acquired = 0
+
+        def acquire(self):
+            Limiter.acquired += 1
+
+    def query(**request):
+        calls.append(request)
+        return batches[request.get("start_cursor")]
+
+    records = query_records(query, "db", REFLECTION_PAGE_SCHEMA, page_size=50, limiter=Limiter(),
+                            filter={"property": "time_part"})
+    assert calls == []  # 순회 전에는 요청하지 않음
+
+    assert [(r.page_id, r.time_part) for r in records] == [("a", MORNING), ("b", AFTERNOON)]
+    assert calls[0] == {"filter": {"property": "time_part"}, "database_id": "db", "page_size": 50}
+    assert calls[1]["start_cursor"] == "c1"
+    assert Limiter.acquired == 2
+
+
+def test_records_use_less_memory_than_pages():
+    raw = json.dumps([
+        make_page(f"page-{i}", f"2026-03-{i % 28 + 1:02d}", (MORNING, AFTERNOON)[i % 2],
+                  subject={"rich_text": [{"type": "text", "text": {"content": f"과목 {i}"}, "plain_text": f"과목 {i}"}]},
+                  learning_difficulty={"type": "number", "number": i % 10})
+        for i in range(2000)
+    ], ensure_ascii=False)
+
+    tracemalloc.start()
+    pages = json.loads(raw)
+    page_bytes = tracemalloc.get_traced_memory()[0]
+    records = decode_pages(pages, REFLECTION_PAGE_SCHEMA)
+    del pages
+    record_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    assert len(records) == 2000
+    assert record_bytes * 3 < page_bytes
+
+
+def test_validator_reports_from_decoded_records(tmp_path):
+    validator = DataIntegrityValidator("test-database-id")
+    pages = validator._generate_mock_data_for_testing()
+    broken = pages[1]["properties"]
+    del broken["subject"]
+    broken["condition"]["select"]["name"] = "😴 피곤"
+    broken["understanding"]["number"] = None
+    broken["learning_hours"]["number"] = 12
+    pages.append(json.loads(json.dumps(pages[0])))
+    validator.fetch_all_data = lambda: pages
+
+    results = validator.run_full_validation()
+
+    assert results["duplicate_check"]["failed"] == 1
+    details = results["type_validation"]["details"]
+    assert any(d.startswith("필수 필드 누락: subject") for d in details)
+    assert any(d.startswith("허용되지 않은 값: condition=😴 피곤") for d in details)
+    assert any(d.startswith("숫자 필드 오류: understanding") for d in details)
+    assert results["range_validation"]["failed"] == 1
+    assert results["time_consistency"]["failed"] == 0
+
+    report_file = save_validation_report(results, "test-database-id", report_dir=str(tmp_path))
+    assert os.path.dirname(report_file) == str(tmp_path)
+    assert "test-database-id" in open(report_file, encoding="utf-8").read()
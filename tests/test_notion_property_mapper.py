@@ -0,0 +1,233 @@
+"""
+Notion 속성 매퍼 테스트
+
+선언적 스키마 컴파일 결과, 배치 변환의 오류 수집, 이미 만든 속성 검증과
+두 동기화 경로의 스키마가 매퍼 도입 전 변환 함수와 같은 속성을 만드는지 확인합니다.
+"""
+
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from datetime import date, time
+from types import SimpleNamespace
+
+import pytest
+
+from src.notion_automation.utils.notion_property_mapper import (
+    NotionPropertyMapper, PropertySpec, PropertyMappingError,
+    REFLECTION_DB_SCHEMA, REFLECTION_SYNC_SCHEMA, SUPABASE_MCP_SCHEMA, get_mapper
+)
+
+
+def _row(**overrides):
+    row = {
+        "id": "r1", "date": "2025-07-23", "time_part": "morning",
+        "understanding_score": 8, "concentration_score": 9, "achievement_score": 4,
+        "condition": "좋음", "subject": "Python 기초", "key_topics": ["변수", "데이터타입"],
+        "notes": "x" * 3000, "github_commits": 3
+    }
+    row.update(overrides)
+    return row
+
+
+def test_reflection_schema_maps_row():
+    properties = get_mapper(REFLECTION_DB_SCHEMA).map_row(_row())
+
+    assert properties["name"]["title"][0]["text"]["content"] == "🌅 Python 기초 - 2025-07-23"
+    assert properties["time_part"] == {"select": {"name": "🌅 오전수업"}}
+    assert properties["condition"] == {"select": {"name": "😊 좋음"}}
+    assert properties["focus_level"] == {"select": {"name": "🙂 좋음"}}
+    assert properties["difficulty"] == {"number": 9}
+    assert properties["key_learning"]["rich_text"][0]["text"]["content"] == "변수, 데이터타입"
+    assert len(properties["reflection"]["rich_text"][0]["text"]["content"]) == 2000
+    assert properties["github_activities"]["rich_text"][0]["text"]["content"] == "커밋: 3, 이슈: 0, PR: 0"
+    assert properties["optimal_flag"] == {"checkbox": False}
+    assert "tags" not in properties and "memo" not in properties
+
+
+def test_date_objects_and_unknown_focus_level():
+    properties = get_mapper(REFLECTION_DB_SCHEMA).map_row(_row(date=date(2025, 7, 1), achievement_score=9))
+
+    assert properties["reflection_date"] == {"date": {"start": "2025-07-01"}}
+    assert properties["focus_level"] == {"select": {"name": "😐 보통"}}
+
+
+def test_batch_collects_errors_without_stopping():
+    rows = [_row(id=f"r{i}") for i in range(1000)]
+    rows[10]["date"] = "07/23"
+    rows[20]["understanding_score"] = "높음"
+    rows[30]["time_part"] = None
+
+    result = get_mapper(REFLECTION_DB_SCHEMA).map_batch(rows)
+
+    assert result["mapped"] == 997 and result["failed"] == 3
+    assert [(e["index"], e["key"]) for e in result["errors"]] == [(10, "r10"), (20, "r20"), (30, "r30")]
+    assert result["errors"][2]["error"] == "time_part: 필수 값 누락"
+
+
+def test_mcp_schema_defaults_and_pages():
+    mapper = NotionPropertyMapper(SUPABASE_MCP_SCHEMA, database_id="db")
+    page = mapper.to_page({"id": 7, "date": "2025-07-23", "challenges": [f"c{i}" for i in range(8)]})
+    properties = page["properties"]
+
+    assert page["parent"] == {"database_id": "db"}
+    assert properties["시간대"] == {"select": {"name": "morning"}}
+    assert properties["컨디션"] == {"select": {"name": "보통"}}
+    assert properties["이해도"] == {"number": 0}
+    assert len(properties["어려웠던 점"]["multi_select"]) == 5
+    assert properties["Supabase_ID"]["rich_text"][0]["text"]["content"] == "7"
+    assert " 오늘의 성취" not in properties
+
+
+def test_validate_existing_properties():
+    mapper = get_mapper(REFLECTION_DB_SCHEMA)
+    valid = mapper.map_row(_row())
+    broken = dict(valid, understanding={"number": "8"}, reflection_date={"date": {"start": "어제"}})
+    del broken["time_part"]
+
+    failures = mapper.validate_batch([valid, broken])
+
+    assert list(failures) == [1]
+    assert len(failures[1]) == 3
+
+
+def test_invalid_schema_is_rejected():
+    with pytest.raises(ValueError):
+        NotionPropertyMapper([PropertySpec("a", "number", "x"), PropertySpec("a", "number", "y")])
+    with pytest.raises(ValueError):
+        NotionPropertyMapper([PropertySpec("a", "formula", "x")])
+    with pytest.raises(PropertyMappingError):
+        NotionPropertyMapper([PropertySpec("a", "number", "x", required=True)]).map_row({})
+
+
+def test_get_mapper_caches_by_schema_contents():
+    assert get_mapper(list(SUPABASE_MCP_SCHEMA), "db") is get_mapper(SUPABASE_MCP_SCHEMA, "db")
+    assert get_mapper(SUPABASE_MCP_SCHEMA, "db") is not get_mapper(SUPABASE_MCP_SCHEMA, "other")
+
+    # 임시 스키마 객체가 해제되어 id가 재사용되어도 다른 내용이면 다른 매퍼
+    for limit in (1, 2, 3):
+        schema = [PropertySpec("태그", "multi_select", "tags", mapping={"a": "A"}, limit=limit)]
+        mapper = get_mapper(schema)
+        assert mapper.map_row({"tags": ["a", "b", "c"]})["태그"]["multi_select"] == [
+            {"name": name} for name in ["A", "b", "c"][:limit]
+        ]
+        del schema
+
+
+# ---------------------------------------------------------------- 기존 변환 함수와의 동등성
+
+TIME_EMOJI = {"morning": "🌅", "afternoon": "🌞", "evening": "🌙"}
+TIME_KOREAN = {"morning": "오전수업", "afternoon": "오후수업", "evening": "저녁자율학습"}
+TIME_OPTIONS = {"morning": "🌅 오전수업", "afternoon": "🌞 오후수업", "evening": "🌙 저녁자율학습"}
+CONDITION_EMOJI = {"좋음": "😊", "보통": "😐", "나쁨": "😞"}
+CONDITIONS = {"좋음": "😊 좋음", "보통": "😐 보통", "나쁨": "😞 나쁨"}
+FOCUS = {1: "😴 매우낮음", 2: "😑 낮음", 3: "😐 보통", 4: "🙂 좋음", 5: "😊 매우좋음"}
+
+
+def _text(value):
+    return {"rich_text": [{"text": {"content": value}}]}
+
+
+def legacy_sync_transform(r):
+    """매퍼 도입 전 NotionSyncManager.transform_reflection_to_notion"""
+    emoji = TIME_EMOJI.get(r.time_part, "📝")
+    properties = {
+        "name": {"title": [{"text": {"content": f"{emoji} {r.subject} - {r.date}"}}]},
+        "reflection_date": {"date": {"start": r.date.isoformat()}},
+        "time_part": {"select": {"name": f"{emoji} {TIME_KOREAN.get(r.time_part, r.time_part)}"}},
+        "subject": _text(r.subject),
+        "understanding": {"number": r.understanding_score},
+        "difficulty": {"number": r.concentration_score},
+        "condition": {"select": {"name": f"{CONDITION_EMOJI.get(r.condition, '😐')} {r.condition}"}},
+        "focus_level": {"select": {"name": FOCUS.get(r.achievement_score, "😐 보통")}},
+        "key_learning": _text(r.key_learning),
+        "challenges": _text(r.challenges),
+        "reflection": _text(r.reflection),
+        "github_commits": {"number": r.github_commits},
+        "github_issues": {"number": r.github_issues},
+        "github_prs": {"number": r.github_prs},
+        "memo": _text(r.memo),
+    }
+    if r.tags:
+        properties["tags"] = {"multi_select": [{"name": tag} for tag in r.tags]}
+    return properties
+
+
+def legacy_phase2_transform(d):
+    """매퍼 도입 전 SupabaseToNotionMapper.map_supabase_to_notion"""
+    time_emoji = TIME_OPTIONS.get(d.time_part, "📝").split()[0]
+    properties = {
+        "name": {"title": [{"text": {"content": f"{time_emoji} {d.subject or '일일 반성'} - {d.date}"}}]},
+        "reflection_date": {"date": {"start": d.date}},
+        "time_part": {"select": {"name": TIME_OPTIONS.get(d.time_part, d.time_part)}},
+        "understanding": {"number": d.understanding_score},
+        "difficulty": {"number": d.difficulty_rating or d.concentration_score},
+        "condition": {"select": {"name": CONDITIONS.get(d.condition, d.condition)}},
+        "focus_level": {"select": {"name": FOCUS.get(d.achievement_score, "😐 보통")}},
+        "github_commits": {"number": d.github_commits},
+        "github_issues": {"number": d.github_issues},
+        "github_prs": {"number": d.github_prs},
+    }
+    if d.subject:
+        properties["subject"] = _text(d.subject)
+    if d.key_topics:
+        properties["key_learning"] = _text(", ".join(d.key_topics))
+    if d.challenges:
+        properties["challenges"] = _text(", ".join(d.challenges) if isinstance(d.challenges, list) else str(d.challenges))
+    if d.notes:
+        properties["reflection"] = _text(d.notes)
+    if d.start_time and d.end_time:
+        properties["start_time"] = _text(str(d.start_time))
+        properties["end_time"] = _text(str(d.end_time))
+    if d.study_hours:
+        properties["learning_hours"] = {"number": d.study_hours}
+    if any([d.github_commits, d.github_issues, d.github_prs]):
+        properties["github_activities"] = _text(f"커밋: {d.github_commits}, 이슈: {d.github_issues}, PR: {d.github_prs}")
+    total = d.understanding_score + d.concentration_score + d.achievement_score
+    properties["optimal_flag"] = {"checkbox": total >= 24}
+    return properties
+
+
+def _sync_reflection(**overrides):
+    fields = dict(date=date(2025, 7, 23), time_part="morning", understanding_score=8, concentration_score=7,
+                  achievement_score=4, condition="좋음", subject="Python 기초", key_learning="변수",
+                  challenges="", reflection="복습 필요", github_commits=2, github_issues=0, github_prs=1,
+                  tags=None, memo="")
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _phase2_record(**overrides):
+    fields = dict(id="r1", date="2025-07-23", time_part="afternoon", understanding_score=9, concentration_score=8,
+                  achievement_score=9, condition="보통", start_time=None, end_time=None, study_hours=None,
+                  subject=None, key_topics=None, difficulty_rating=None, challenges=None, notes=None,
+                  github_commits=0, github_issues=0, github_prs=0)
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+@pytest.mark.parametrize("overrides", [
+    {},
+    {"time_part": "night", "condition": "피곤"},
+    {"tags": ["복습", "실습"], "memo": "메모", "achievement_score": 9},
+    {"subject": "", "github_commits": 0, "github_prs": 0},
+])
+def test_sync_schema_matches_legacy_transform(overrides):
+    reflection = _sync_reflection(**overrides)
+    assert get_mapper(REFLECTION_SYNC_SCHEMA).map_row(vars(reflection)) == legacy_sync_transform(reflection)
+
+
+@pytest.mark.parametrize("overrides", [
+    {},
+    {"time_part": "night", "condition": "피곤", "subject": "SQL"},
+    {"end_time": time(18, 0), "study_hours": 0, "difficulty_rating": 0},
+    {"start_time": time(14, 0), "end_time": time(18, 0), "study_hours": 3.5, "difficulty_rating": 6,
+     "key_topics": ["JOIN", "GROUP BY"], "challenges": ["서브쿼리"], "notes": "정리", "github_issues": 2},
+])
+def test_phase2_schema_matches_legacy_transform(overrides):
+    record = _phase2_record(**overrides)
+    assert get_mapper(REFLECTION_DB_SCHEMA).map_row(vars(record)) == legacy_phase2_transform(record)
@@ -0,0 +1,140 @@
+"""
+분위수 스케치 테스트
+
+KLL 스케치의 순위 오차와 보관 크기 상한, 샤드 병합, 날짜 중복 반영 방지와
+상태 저장/복원, 히트맵 강도/효율성 등급의 분위수 구간 적용을 검증합니다.
+"""
+
+import sys
+import os
+import bisect
+import random
+from datetime import date, timedelta
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.notion_automation.dashboard.quantile_sketch import KLLSketch, TimePartQuantileSketches, MIN_SKETCH_SAMPLES
+from src.notion_automation.dashboard import github_heatmap, efficiency_trend
+
+MORNING = "🌅 오전수업"
+START = date(2025, 1, 1)
+
+
+def rank_error(sorted_values, estimate, q):
+    return abs(bisect.bisect_left(sorted_values, estimate) / len(sorted_values) - q)
+
+
+def test_kll_accuracy_and_bounded_memory():
+    rng = random.Random(1)
+    values = [rng.expovariate(0.2) for _ in range(100_000)]
+    sketch = KLLSketch(k=200)
+    for value in values:
+        sketch.update(value)
+
+    exact = sorted(values)
+    for q in (0.01, 0.25, 0.5, 0.75, 0.99):
+        assert rank_error(exact, sketch.quantile(q), q) < 0.02
+    assert sketch.quantile(0) == exact[0] and sketch.quantile(1) == exact[-1]
+    assert sketch.retained() < 3 * 200 + 64
+    assert abs(sketch.rank(exact[len(exact) // 2]) - 0.5) < 0.02
+
+
+def test_merged_shards_match_union():
+    rng = random.Random(2)
+    shards = [[rng.gauss(shard * 2, 1) for _ in range(20_000)] for shard in range(4)]
+
+    merged = KLLSketch()
+    for shard in shards:
+        sketch = KLLSketch()
+        for value in shard:
+            sketch.update(value)
+        merged.merge(sketch)
+
+    exact = sorted(v for shard in shards for v in shard)
+    assert merged.count == len(exact)
+    for q in (0.1, 0.5, 0.9):
+        assert rank_error(exact, merged.quantile(q), q) < 0.02
+
+
+def test_store_dedups_dates_and_persists(tmp_path):
+    path = str(tmp_path / "sketches.json")
+    store = TimePartQuantileSketches(path)
+
+    for offset in range(30):
+        assert store.observe(MORNING, "efficiency", START + timedelta(days=offset), offset)
+    assert not store.observe(MORNING, "efficiency", START + timedelta(days=3), 99)
+    assert store.observe(MORNING, "efficiency", START - timedelta(days=40), 5.0)  # 과거 날짜 보충
+    store.save()
+
+    reopened = TimePartQuantileSketches(path)
+    assert reopened.count(MORNING, "efficiency") == 31
+    assert not reopened.observe(MORNING, "efficiency", START - timedelta(days=40), 5.0)
+    assert reopened.quantiles(MORNING, "efficiency", (0.5,)) == store.quantiles(MORNING, "efficiency", (0.5,))
+
+    other = TimePartQuantileSketches(str(tmp_path / "other.json"))
+    other.observe(MORNING, "efficiency", START + timedelta(days=100), 50)
+    reopened.merge(other)
+    assert reopened.count(MORNING, "efficiency") == 32
+    assert reopened.merged_sketch("efficiency").count == 32
+
+
+def test_concurrent_stores_merge_on_save(tmp_path):
+    path = str(tmp_path / "sketches.json")
+    first = TimePartQuantileSketches(path)
+    second = TimePartQuantileSketches(path)
+
+    for offset in range(10):
+        first.observe(MORNING, "efficiency", START + timedelta(days=offset), offset)
+        second.observe(MORNING, "efficiency", START + timedelta(days=offset + 5), offset + 5)
+    second.observe(MORNING, "github_activity", START, 3)
+    first.save()
+    second.save()
+
+    # 두 저장소가 겹쳐 반영한 5일은 한 번만 세고, 나중 저장이 앞선 저장을 지우지 않음
+    reopened = TimePartQuantileSketches(path)
+    assert reopened.count(MORNING, "efficiency") == 15
+    assert reopened.count(MORNING, "github_activity") == 1
+    assert second.count(MORNING, "efficiency") == 15
+
+    first.reset()
+    first.observe(MORNING, "efficiency", START, 1.0)
+    first.save()
+    assert TimePartQuantileSketches(path).count(MORNING, "efficiency") == 1
+    assert TimePartQuantileSketches(path).count(MORNING, "github_activity") == 0
+
+
+def test_band_needs_enough_samples(tmp_path):
+    store = TimePartQuantileSketches(str(tmp_path / "sketches.json"))
+    for offset in range(MIN_SKETCH_SAMPLES - 1):
+        store.observe(MORNING, "github_activity", START + timedelta(days=offset), offset + 1)
+    assert store.band(MORNING, "github_activity", 5, (0.25, 0.5, 0.75)) is None
+
+    store.observe(MORNING, "github_activity", START + timedelta(days=100), MIN_SKETCH_SAMPLES)
+    assert store.band(MORNING, "github_activity", 1, (0.25, 0.5, 0.75)) == 0
+    assert store.band(MORNING, "github_activity", MIN_SKETCH_SAMPLES, (0.25, 0.5, 0.75)) == 3
+
+
+def test_heatmap_and_grades_use_live_percentiles(tmp_path, monkeypatch):
+    monkeypatch.setattr(github_heatmap, "project_root", str(tmp_path))
+    monkeypatch.setattr(efficiency_trend, "project_root", str(tmp_path))
+    heatmap = github_heatmap.GitHubTimePartHeatmap()
+    chart = efficiency_trend.EfficiencyTrendChart()
+
+    # 고정 임계값: 활동 12개는 항상 최고 강도, 효율 6.0은 "보통"
+    assert heatmap.calculate_intensity_level(12, MORNING) == 4
+    assert chart._get_efficiency_grade(6.0, MORNING) == "보통"
+
+    for offset in range(100):
+        day = START + timedelta(days=offset)
+        heatmap.sketches.observe(MORNING, "github_activity", day, 10 + offset % 20)
+        chart.sketches.observe(MORNING, "efficiency", day, 5.0 + (offset % 10) * 0.1)
+
+    # 오전수업에서 활동 12개는 하위 사분위, 효율 6.0은 상위 10% 이상
+    assert heatmap.calculate_intensity_level(0, MORNING) == 0
+    assert heatmap.calculate_intensity_level(12, MORNING) == 1
+    assert heatmap.calculate_intensity_level(29, MORNING) == 4
+    assert heatmap.calculate_intensity_level(12) == 4
+    assert chart._get_efficiency_grade(6.0, MORNING) == "매우 높음"
+    assert chart._get_efficiency_grade(5.0, MORNING) == "낮음"
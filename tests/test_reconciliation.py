@@ -0,0 +1,77 @@
+"""
+범위 다이제스트 대사 엔진 테스트
+
+월/일 다이제스트가 다른 범위만 레코드 단위로 비교하는지 검증합니다.
+"""
+
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.notion_automation.utils.reconciliation import RangeDigestSource, RangeReconciler
+
+
+def _supabase_rows(count):
+    return [
+        {"id": f"r{i}", "date": f"2025-{1 + i % 12:02d}-{1 + i % 28:02d}", "time_part": "morning",
+         "understanding_score": i % 10, "concentration_score": 7, "achievement_score": 8, "condition": "좋음"}
+        for i in range(count)
+    ]
+
+
+def _notion_rows(rows):
+    # Notion 쪽은 정수 점수가 실수로 오는 등 표현만 다를 수 있음
+    return [dict(row, supabase_id=row["id"], id=f"page-{row['id']}", concentration_score=7.0) for row in rows]
+
+
+def test_identical_datasets_compare_digests_only():
+    rows = _supabase_rows(2000)
+    report = RangeReconciler(
+        RangeDigestSource(rows), RangeDigestSource(_notion_rows(rows), key_field="supabase_id")
+    ).reconcile()
+
+    assert report["mismatched_months"] == []
+    assert report["days_compared"] == 0
+    assert report["records_compared"] == 0
+    assert report["total_source"] == report["total_target"] == 2000
+
+
+def test_only_mismatched_days_are_drilled_into():
+    rows = _supabase_rows(2000)
+    notion = _notion_rows(rows)
+    notion[5]["achievement_score"] = 1          # 불일치
+    removed = notion.pop(100)                   # Notion 누락
+    notion.append({"supabase_id": "ghost", "date": "2025-03-03"})  # Supabase에 없는 레코드
+
+    fetched_days = []
+
+    def fetch_day(day):
+        fetched_days.append(day)
+        return [row for row in rows if row["date"] == day]
+
+    source = RangeDigestSource(rows, fetch_day=fetch_day)
+    report = RangeReconciler(source, RangeDigestSource(notion, key_field="supabase_id")).reconcile()
+
+    assert report["inconsistent"] == ["r5"]
+    assert report["missing_in_target"] == [removed["supabase_id"]]
+    assert report["orphaned_in_target"] == ["ghost"]
+    assert len(report["mismatched_months"]) <= 3
+    assert sorted(fetched_days) == sorted(report["mismatched_days"])
+    assert report["records_compared"] < 100
+
+
+def test_record_with_different_date_is_inconsistent():
+    rows = _supabase_rows(50)
+    notion = _notion_rows(rows)
+    notion[0]["date"] = "2025-12-31"
+
+    report = RangeReconciler(
+        RangeDigestSource(rows), RangeDigestSource(notion, key_field="supabase_id")
+    ).reconcile()
+
+    assert report["inconsistent"] == ["r0"]
+    assert report["missing_in_target"] == []
+    assert report["orphaned_in_target"] == []
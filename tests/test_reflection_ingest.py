@@ -0,0 +1,239 @@
+"""
+반성 입력 시점 통계 반영 테스트
+
+반성 스크립트가 파일을 저장하는 즉시 시간대별 누적 통계가 갱신되는지, 같은 날 재입력은 값을
+대체하고 삭제는 값을 빼는지, 처음 사용할 때 기존 파일을 한 번만 backfill하는지 검증합니다.
+"""
+
+import sys
+import os
+import json
+from datetime import datetime, timedelta
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.notion_automation.dashboard import efficiency_trend
+from src.notion_automation.dashboard.optimal_time_analyzer import OptimalTimeAnalyzer
+from src.notion_automation.dashboard.quantile_sketch import TimePartQuantileSketches
+from src.notion_automation.dashboard.reflection_dataset import reflection_file_path
+from src.notion_automation.dashboard.reflection_ingest import ReflectionStatsIngestor
+from src.notion_automation.dashboard.reflection_metrics import efficiency_score, timepart_metrics
+from src.notion_automation.dashboard.rolling_stats import TimePartRollingStats
+
+MORNING, AFTERNOON, EVENING = "🌅 오전수업", "🌞 오후수업", "🌙 저녁자율학습"
+END = datetime(2026, 3, 10)
+
+
+def write_reflection(data_dir, timepart, date, reflection):
+    path = reflection_file_path(data_dir, timepart, date)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(reflection, f, ensure_ascii=False)
+    return path
+
+
+def window(stats, timepart, metric, days=30):
+    return stats.window(timepart, metric, END, days)
+
+
+def test_backfill_runs_once_over_existing_files(tmp_path):
+    for offset in range(5):
+        write_reflection(str(tmp_path), MORNING, END - timedelta(days=offset), {"총점": 70 + offset})
+
+    ingestor = ReflectionStatsIngestor(str(tmp_path))
+    stats = window(ingestor.score_stats, MORNING, "total_score")
+    assert (stats["count"], stats["mean"]) == (5, 72.0)
+    assert ingestor.backfilled_at is not None
+
+    # 상태가 남아 있으면 다시 열어도 파일을 다시 읽지 않음
+    reopened = ReflectionStatsIngestor(str(tmp_path))
+    assert reopened.backfilled_at == ingestor.backfilled_at
+    assert reopened.sync_reflection_files() == 0
+    assert window(reopened.score_stats, MORNING, "total_score")["count"] == 5
+
+
+def test_backfill_reads_files_in_date_order(tmp_path, monkeypatch):
+    for offset in range(20):
+        write_reflection(str(tmp_path), MORNING, END - timedelta(days=offset), {"총점": 60 + offset})
+        write_reflection(str(tmp_path), EVENING, END - timedelta(days=offset), {"총점": 50 + offset})
+
+    # 날짜순이면 모든 값이 끝에 이어 붙어 누적합 재계산이 일어나지 않음
+    rebuilds = []
+    original = TimePartRollingStats._rebuild
+    monkeypatch.setattr(TimePartRollingStats, "_rebuild",
+                        lambda self, series, start: rebuilds.append(start) or original(self, series, start))
+    ingestor = ReflectionStatsIngestor(str(tmp_path))
+
+    assert window(ingestor.score_stats, MORNING, "total_score")["count"] == 20
+    assert rebuilds == []
+
+
+def test_two_ingestors_keep_each_others_updates(tmp_path):
+    first = ReflectionStatsIngestor(str(tmp_path))
+    second = ReflectionStatsIngestor(str(tmp_path))
+
+    morning = {"총점": 80, "이해도": 8}
+    evening = {"총점": 60, "이해도": 6}
+    first.ingest(MORNING, END, morning, path=write_reflection(str(tmp_path), MORNING, END, morning))
+    second.ingest(EVENING, END, evening, path=write_reflection(str(tmp_path), EVENING, END, evening))
+
+    reopened = ReflectionStatsIngestor(str(tmp_path))
+    assert len(reopened.sources) == 2
+    assert reopened.sync_reflection_files() == 0
+    assert window(reopened.score_stats, MORNING, "total_score")["mean"] == 80
+    assert window(reopened.score_stats, EVENING, "total_score")["mean"] == 60
+
+
+def test_reingest_replaces_and_delete_retracts(tmp_path):
+    ingestor = ReflectionStatsIngestor(str(tmp_path))
+    first = {"총점": 60, "이해도": 6}
+    path = write_reflection(str(tmp_path), EVENING, END, first)
+    ingestor.ingest(EVENING, END, first, path=path)
+
+    corrected = {"총점": 90, "이해도": 9}
+    write_reflection(str(tmp_path), EVENING, END, corrected)
+    assert ingestor.ingest(EVENING, END, corrected, path=path)
+
+    score = window(ingestor.score_stats, EVENING, "total_score")
+    assert (score["count"], score["mean"]) == (1, 90.0)
+    efficiency = window(ingestor.efficiency_stats, EVENING, "efficiency")
+    assert efficiency["mean"] == efficiency_score(corrected, EVENING)
+    assert ingestor.sync_reflection_files() == 0  # 저장 직후 반영한 파일은 다시 읽지 않음
+
+    # 스크립트를 거치지 않은 수정과 삭제도 동기화 때 반영
+    write_reflection(str(tmp_path), EVENING, END, {"총점": 40, "이해도": 4, "메모": "직접 수정"})
+    assert ingestor.sync_reflection_files() == 1
+    assert window(ingestor.score_stats, EVENING, "total_score")["mean"] == 40.0
+
+    os.remove(path)
+    assert ingestor.sync_reflection_files() == 1
+    assert window(ingestor.score_stats, EVENING, "total_score")["count"] == 0
+    assert window(ingestor.efficiency_stats, EVENING, "efficiency")["count"] == 0
+
+    reopened = ReflectionStatsIngestor(str(tmp_path))
+    assert window(reopened.score_stats, EVENING, "total_score")["count"] == 0
+
+
+def test_script_save_updates_chart_stats_without_loader(tmp_path, monkeypatch):
+    from src.notion_automation.scripts.morning_reflection import MorningReflectionInput
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(efficiency_trend, "project_root", str(tmp_path))
+    chart = efficiency_trend.EfficiencyTrendChart()
+    assert window(chart.rolling_stats, MORNING, "efficiency")["count"] == 0
+
+    script = MorningReflectionInput()
+    script.current_date = END.date()
+    user_data = {"subject": "파이썬", "understanding": 8, "condition": "좋음"}
+    assert script.save_local_backup(user_data, {}, score=85)
+
+    # 차트는 load_efficiency_data를 부르지 않아도 저장된 날을 봄
+    stats = window(chart.rolling_stats, MORNING, "efficiency")
+    assert stats["count"] == 1
+    with open(reflection_file_path(str(tmp_path / "data"), MORNING, END), encoding="utf-8") as f:
+        assert stats["mean"] == efficiency_score(json.load(f), MORNING)
+
+
+def test_metric_cube_filled_at_ingest_and_backfill(tmp_path):
+    data_dir = str(tmp_path)
+    old = {"총점": 50, "이해도": 5, "github_data": {"commits": 2}}
+    write_reflection(data_dir, MORNING, END - timedelta(days=40), old)
+
+    # 큐브가 없던 이전 버전 상태 파일이 있어도 기존 파일을 다시 backfill
+    os.makedirs(os.path.join(data_dir, "stats"))
+    with open(os.path.join(data_dir, "stats", "reflection_ingest.json"), "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "backfilled_at": "2026-03-01T00:00:00", "sources": {}}, f)
+
+    analyzer = OptimalTimeAnalyzer(data_dir)
+    start = END - timedelta(days=60)
+    summary = analyzer.metric_cube.summarize(start, END, MORNING)
+    assert summary[MORNING]["github_activity"]["mean"] == timepart_metrics(old)["github_activity"]
+
+    # 분석기가 불러오지 않는 구간도 저장 즉시 큐브에 반영, 정정은 대체, 삭제는 제거
+    ingestor = ReflectionStatsIngestor(data_dir)
+    path = write_reflection(data_dir, MORNING, END, {"총점": 70})
+    ingestor.ingest(MORNING, END, {"총점": 70}, path=path)
+    ingestor.ingest(MORNING, END, {"총점": 90}, path=path)
+    overall = analyzer.metric_cube.summarize(start, END, MORNING)[MORNING]["overall_score"]
+    assert (overall["count"], overall["mean"]) == (2, 70.0)
+
+    os.remove(path)
+    ingestor.sync_reflection_files()
+    overall = analyzer.metric_cube.summarize(start, END, MORNING)[MORNING]["overall_score"]
+    assert (overall["count"], overall["mean"]) == (1, 50.0)
+
+
+def test_sketches_only_take_finished_days(tmp_path):
+    data_dir = str(tmp_path)
+    for offset in range(3):
+        write_reflection(data_dir, MORNING, END - timedelta(days=offset),
+                         {"이해도": 5 + offset, "github_data": {"commits": offset + 1}})
+    write_reflection(data_dir, AFTERNOON, END, {"이해도": 3})
+
+    ingestor = ReflectionStatsIngestor(data_dir, backfill=False)
+    ingestor.sync_reflection_files()
+    ingestor.finalize_days(today=END)
+    assert ingestor.efficiency_sketches.count(MORNING, "efficiency") == 2
+    assert ingestor.activity_sketches.count(MORNING, "github_activity") == 2
+    assert ingestor.efficiency_sketches.count(AFTERNOON, "efficiency") == 0
+
+    # 오늘 값은 정정되어도 스케치에 영향이 없고, 날이 끝나면 마지막 값이 들어감
+    corrected = {"이해도": 9, "집중도": 9}
+    write_reflection(data_dir, AFTERNOON, END, corrected)
+    ingestor.sync_reflection_files()
+    assert ingestor.finalize_days(today=END) == 0
+    ingestor.finalize_days(today=END + timedelta(days=1))
+    assert ingestor.efficiency_sketches.quantiles(AFTERNOON, "efficiency", [0.5]) == [efficiency_score(corrected, AFTERNOON)]
+    assert ingestor.finalized_through == END.date().isoformat()
+
+    # 이미 지난 날짜를 늦게 입력하면 바로 반영, 그 뒤 정정은 확정값을 바꾸지 않음
+    write_reflection(data_dir, EVENING, END - timedelta(days=5), {"이해도": 4})
+    ingestor.sync_reflection_files()
+    assert ingestor.efficiency_sketches.count(EVENING, "efficiency") == 1
+    write_reflection(data_dir, EVENING, END - timedelta(days=5), {"이해도": 8, "메모": "정정"})
+    ingestor.sync_reflection_files()
+    assert ingestor.efficiency_sketches.count(EVENING, "efficiency") == 1
+
+    reopened = ReflectionStatsIngestor(data_dir, backfill=False)
+    assert reopened.finalized_through == END.date().isoformat()
+    assert reopened.activity_sketches.count(MORNING, "github_activity") == 3
+
+
+def test_sketches_rebuilt_without_finalized_watermark(tmp_path):
+    data_dir = str(tmp_path)
+    for offset in range(4):
+        write_reflection(data_dir, MORNING, END - timedelta(days=offset), {"이해도": 6})
+
+    # 이전 방식(차트 로더)이 오늘 값까지 넣어 둔 스케치
+    stale = TimePartQuantileSketches(os.path.join(data_dir, "stats", "efficiency_sketches.json"))
+    stale.observe(MORNING, "efficiency", datetime.now(), 0.5)
+    stale.save()
+
+    ingestor = ReflectionStatsIngestor(data_dir)
+    assert ingestor.efficiency_sketches.count(MORNING, "efficiency") == 4
+    assert ingestor.efficiency_sketches.quantiles(MORNING, "efficiency", [0.0]) == [efficiency_score({"이해도": 6}, MORNING)]
+
+
+def test_optimal_time_analysis_reads_only_the_cube(tmp_path, monkeypatch):
+    from src.notion_automation.dashboard import optimal_time_analyzer
+
+    data_dir = str(tmp_path)
+    today = datetime.now()
+    for offset in range(3):
+        write_reflection(data_dir, MORNING, today - timedelta(days=offset), {"총점": 80, "이해도": 8})
+    write_reflection(data_dir, EVENING, today - timedelta(days=900), {"총점": 40})
+    analyzer = OptimalTimeAnalyzer(data_dir)
+
+    def no_file_reads(*args, **kwargs):
+        raise AssertionError("분석이 반성 파일을 직접 읽음")
+
+    monkeypatch.setattr(optimal_time_analyzer, "get_reflection", no_file_reads)
+    result = analyzer.identify_optimal_learning_times(days=1000)
+
+    morning = result["timepart_performance"][MORNING]
+    assert morning["valid_days"] == 3
+    assert morning["activity_rate"] == 3 / 1000 * 100
+    assert result["timepart_performance"][EVENING]["overall_score"]["average"] == 40
+    assert len(result["weekday_patterns"]) == 7
@@ -0,0 +1,165 @@
+"""
+리플렉션 outbox 테스트
+
+즉시 반환되는 로컬 기록, 같은 키 재제출 덮어쓰기, 배치 전송과 재시도/포기,
+백그라운드 flusher 종료 시 잔여 전송, 입력 CLI 연동을 검증합니다.
+"""
+
+import sys
+import os
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.notion_automation.utils import reflection_outbox
+from src.notion_automation.utils.reflection_outbox import ReflectionOutbox, OutboxFlusher, NotionPageSender
+from src.notion_automation.dashboard.notion_block_uploader import RateLimiter
+
+
+class RecordingSender:
+    def __init__(self, fail_keys=()):
+        self.batches = []
+        self.fail_keys = set(fail_keys)
+
+    def __call__(self, items):
+        self.batches.append([(item["idempotency_key"], item["payload"]["score"]) for item in items])
+        return {item["idempotency_key"]: "timeout" for item in items if item["idempotency_key"] in self.fail_keys}
+
+
+def _outbox(tmp_path, count=0):
+    outbox = ReflectionOutbox(str(tmp_path / "outbox.db"))
+    for i in range(count):
+        outbox.enqueue(f"2025-07-{1 + i:02d}:morning", {"score": i})
+    return outbox
+
+
+def test_resubmission_overwrites_pending_payload(tmp_path):
+    outbox = _outbox(tmp_path)
+    outbox.enqueue("2025-07-23:morning", {"score": 1})
+    outbox.enqueue("2025-07-23:morning", {"score": 2})
+
+    sender = RecordingSender()
+    OutboxFlusher(outbox, {"notion": sender}).flush_once()
+
+    assert sender.batches == [[("2025-07-23:morning", 2)]]
+    assert outbox.counts() == {"pending": 0, "sent": 1, "dead": 0}
+
+
+def test_batches_and_retry_with_backoff(tmp_path):
+    outbox = _outbox(tmp_path, count=25)
+    sender = RecordingSender(fail_keys={"2025-07-03:morning"})
+    flusher = OutboxFlusher(outbox, {"notion": sender}, batch_size=10, max_attempts=2)
+
+    assert flusher.drain(timeout=5) == 1
+    assert [len(batch) for batch in sender.batches] == [10, 10, 5]
+    assert flusher.stats == {"sent": 24, "failed": 1, "dead": 0}
+
+    # 백오프 대기 중인 항목은 바로 다시 가져가지 않음
+    assert outbox.claim("notion") == []
+
+    with outbox._connect() as conn:
+        conn.execute("UPDATE outbox SET next_attempt_at = 0")
+    flusher.drain(timeout=5)
+    assert outbox.counts() == {"pending": 0, "sent": 24, "dead": 1}
+
+
+def test_resubmit_during_send_is_not_marked_sent(tmp_path):
+    outbox = _outbox(tmp_path)
+    outbox.enqueue("2025-07-23:evening", {"score": 1})
+    items = outbox.claim("notion")
+
+    outbox.enqueue("2025-07-23:evening", {"score": 9})
+    outbox.mark_sent(items)
+
+    again = outbox.claim("notion")
+    assert [item["payload"]["score"] for item in again] == [9]
+
+
+def test_background_flusher_drains_on_stop(tmp_path):
+    outbox = _outbox(tmp_path, count=5)
+    sender = RecordingSender()
+    flusher = OutboxFlusher(outbox, {"notion": sender}, batch_size=2, interval=0.05)
+
+    flusher.start()
+    remaining = flusher.stop(drain_timeout=2.0)
+
+    assert remaining == 0
+    assert sum(len(batch) for batch in sender.batches) == 5
+
+
+def test_items_stay_queued_without_sender(tmp_path):
+    outbox = _outbox(tmp_path, count=3)
+    flusher = OutboxFlusher(outbox, {})
+    flusher.start()
+
+    assert flusher.stop(drain_timeout=0.1) == 3
+
+
+class FakeEndpoint:
+    def __init__(self, handler):
+        self.handler = handler
+
+    def __getattr__(self, name):
+        return lambda **kwargs: self.handler(name, kwargs)
+
+
+class FakeNotion:
+    def __init__(self, existing=None):
+        self.calls = []
+        self.existing = existing or {}
+        self.databases = FakeEndpoint(self._databases)
+        self.pages = FakeEndpoint(self._pages)
+
+    def _databases(self, method, kwargs):
+        date_filter, part_filter = kwargs["filter"]["and"]
+        page_id = self.existing.get((date_filter["date"]["equals"], part_filter["select"]["equals"]))
+        return {"results": [{"id": page_id}] if page_id else []}
+
+    def _pages(self, method, kwargs):
+        self.calls.append((method, kwargs.get("page_id")))
+        return {"id": "new-page"}
+
+
+def test_notion_sender_updates_existing_page(tmp_path):
+    outbox = _outbox(tmp_path)
+    for day, part in (("2025-07-23", "🌅 오전수업"), ("2025-07-24", "🌅 오전수업")):
+        outbox.enqueue(f"{day}:morning", {"properties": {}, "match": {"reflection_date": day, "time_part": part}})
+
+    notion = FakeNotion(existing={("2025-07-23", "🌅 오전수업"): "page-23"})
+    OutboxFlusher(outbox, {"notion": NotionPageSender(notion, "db", rate_limiter=RateLimiter(0))}).flush_once()
+
+    assert notion.calls == [("update", "page-23"), ("create", None)]
+
+
+def test_morning_cli_returns_without_network(tmp_path, monkeypatch, capsys):
+    from src.notion_automation.scripts.morning_reflection import MorningReflectionInput
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("NOTION_API_TOKEN", raising=False)
+    monkeypatch.setattr(reflection_outbox, "DEFAULT_OUTBOX_PATH", str(tmp_path / "data" / "reflection_outbox.db"))
+    cli = MorningReflectionInput(database_id="db")
+    user_data = {"subject": "Python", "difficulty": 5, "understanding": 7, "condition": "😊 좋음",
+                 "learning_hours": 3.0, "key_learning": "리스트 컴프리헨션", "reflection": "복습 필요"}
+
+    started = time.perf_counter()
+    assert cli.create_notion_entry(user_data, {"commits": 2}) is True
+    assert time.perf_counter() - started < 1.0
+
+    assert cli.finish_pending_writes(drain_timeout=0.1) == 1
+    output = capsys.readouterr().out
+    assert "전송 대상이 설정되지 않아" in output
+    assert "다음 실행 때 자동으로" not in output
+    item = ReflectionOutbox("data/reflection_outbox.db").claim("notion")[0]
+    assert item["payload"]["properties"]["subject"]["rich_text"][0]["text"]["content"] == "Python"
+    assert os.path.exists(tmp_path / "data" / "morning_reflections")
+
+
+def test_default_outbox_does_not_depend_on_working_directory(tmp_path, monkeypatch):
+    if "REFLECTION_OUTBOX_PATH" not in os.environ:
+        assert reflection_outbox.DEFAULT_OUTBOX_PATH == os.path.join(project_root, "data", "reflection_outbox.db")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(reflection_outbox, "DEFAULT_OUTBOX_PATH", str(tmp_path / "shared" / "outbox.db"))
+    assert ReflectionOutbox().db_path == str(tmp_path / "shared" / "outbox.db")
@@ -0,0 +1,163 @@
+"""
+복원력 계층 테스트
+
+지터 백오프 범위, 서킷 브레이커 상태 전이, 데드라인 전파와
+헤지 요청 동작을 가짜 시계로 검증합니다.
+"""
+
+import sys
+import os
+import random
+import threading
+import time
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.notion_automation.utils.resilience import (
+    RetryPolicy, CircuitBreaker, CircuitOpenError, DecorrelatedJitterBackoff,
+    DeadlineExceeded, deadline, remaining_timeout, hedged_call
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def failing(times, error=ConnectionError("일시적 오류")):
+    calls = {"count": 0}
+
+    def operation():
+        calls["count"] += 1
+        if calls["count"] <= times:
+            raise error
+        return calls["count"]
+
+    operation.calls = calls
+    return operation
+
+
+def test_backoff_is_jittered_and_capped():
+    backoff = DecorrelatedJitterBackoff(base=0.5, cap=10.0, rng=random.Random(7))
+
+    delays, previous = [], None
+    for _ in range(50):
+        previous = backoff.next_delay(previous)
+        delays.append(previous)
+
+    assert all(0.5 <= delay <= 10.0 for delay in delays)
+    assert len(set(delays)) > 10
+    assert max(delays) == 10.0
+
+
+def test_retry_until_success_records_stats():
+    clock = FakeClock()
+    policy = RetryPolicy(max_attempts=5, sleep=clock.sleep, clock=clock)
+
+    assert policy.call(failing(3)) == 4
+    assert policy.stats["attempts"] == 4
+    assert policy.stats["retries"] == 3
+    assert policy.stats["slept_seconds"] == pytest.approx(clock.now - 1000.0)
+
+
+def test_non_retryable_errors_fail_fast():
+    policy = RetryPolicy(max_attempts=5, is_retryable=lambda e: not isinstance(e, PermissionError),
+                         sleep=lambda s: None)
+    operation = failing(10, PermissionError("권한 없음"))
+
+    with pytest.raises(PermissionError):
+        policy.call(operation)
+    assert operation.calls["count"] == 1
+
+
+def test_circuit_breaker_opens_and_recovers():
+    clock = FakeClock()
+    breaker = CircuitBreaker("notion", failure_threshold=3, recovery_timeout=30, clock=clock)
+    policy = RetryPolicy(max_attempts=10, breaker=breaker, sleep=clock.sleep, clock=clock,
+                         backoff=DecorrelatedJitterBackoff(base=0.1, cap=0.2))
+    operation = failing(100)
+
+    with pytest.raises(CircuitOpenError):
+        policy.call(operation)
+    assert operation.calls["count"] == 3
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # 차단 중에는 호출 자체를 보내지 않음
+    with pytest.raises(CircuitOpenError):
+        breaker.call(operation)
+    assert operation.calls["count"] == 3
+
+    # 복구 대기 후 시험 호출이 성공하면 닫힘
+    clock.now += 30
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_failure_reopens():
+    clock = FakeClock()
+    breaker = CircuitBreaker("github", failure_threshold=1, recovery_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.now += 10
+
+    assert breaker.allow() is True
+    assert breaker.allow() is False  # 시험 호출은 하나만
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.stats["opened"] == 2
+
+
+def test_deadline_stops_retries_and_propagates():
+    clock = FakeClock()
+    policy = RetryPolicy(max_attempts=10, deadline_seconds=5, sleep=clock.sleep, clock=clock,
+                         backoff=DecorrelatedJitterBackoff(base=1.0, cap=2.0, rng=random.Random(1)))
+    seen_timeouts = []
+
+    def operation():
+        seen_timeouts.append(remaining_timeout(30))
+        raise TimeoutError("응답 없음")
+
+    with pytest.raises(DeadlineExceeded):
+        policy.call(operation)
+
+    assert seen_timeouts[0] == 5
+    assert all(timeout <= 5 for timeout in seen_timeouts)
+    assert clock.now - 1000.0 <= 5
+    assert policy.stats["deadline_exceeded"] == 1
+    assert remaining_timeout(30) == 30
+
+
+def test_inner_deadline_cannot_extend_outer():
+    clock = FakeClock()
+    with deadline(2, clock) as outer:
+        with deadline(10, clock) as inner:
+            assert inner is outer
+            assert remaining_timeout() == 2
+
+
+def test_hedged_call_uses_faster_response():
+    calls = {"count": 0}
+    lock = threading.Lock()
+
+    def slow_first():
+        with lock:
+            calls["count"] += 1
+            call_number = calls["count"]
+        time.sleep(1.0 if call_number == 1 else 0.01)
+        return call_number
+
+    started = time.perf_counter()
+    result, hedged = hedged_call(slow_first, hedge_after=0.05)
+
+    assert hedged is True
+    assert result == 2
+    assert time.perf_counter() - started < 0.5
@@ -0,0 +1,117 @@
+"""
+재개 가능한 복구 엔진 테스트
+
+배치 upsert, 체인 순서 재생, 중단 후 체크포인트 재개, 체크섬 불일치 시 중단을 검증합니다.
+"""
+
+import sys
+import os
+import sqlite3
+import threading
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.notion_automation.utils.backup_archive import StreamingBackupWriter, BackupArchiveReader, manifest_digest
+from src.notion_automation.optimization.restore_engine import RestoreEngine, SQLiteRestoreTarget
+
+
+def _reflections(count, score=5):
+    return [
+        {"id": f"r{i:04d}", "user_id": "learner", "date": f"2025-{1 + i % 12:02d}-{1 + i % 28:02d}",
+         "time_part": "morning", "understanding_score": score, "extra_column": "무시됨"}
+        for i in range(count)
+    ]
+
+
+def _archive(path, records, manifest):
+    with StreamingBackupWriter(str(path), chunk_records=50) as writer:
+        writer.write_dataset("supabase_data", records)
+        return writer.write_manifest(manifest)
+
+
+def _mirror_rows(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return dict(conn.execute("SELECT id, understanding_score FROM daily_reflections").fetchall())
+
+
+class FailingTarget:
+    """지정한 횟수만큼 기록한 뒤 실패하는 대상"""
+
+    def __init__(self, target, fail_after):
+        self.target = target
+        self.fail_after = fail_after
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def write_batch(self, records):
+        with self.lock:
+            self.calls += 1
+            if self.calls > self.fail_after:
+                raise ConnectionError("연결 끊김")
+        return self.target.write_batch(records)
+
+
+def test_chain_is_restored_in_order(tmp_path):
+    full = _archive(tmp_path / "full.zip", _reflections(1000), {"backup_name": "full", "mode": "full"})
+    _archive(tmp_path / "delta.zip", _reflections(10, score=9),
+             {"backup_name": "delta", "mode": "delta", "parent": "full", "parent_digest": manifest_digest(full)})
+
+    target = SQLiteRestoreTarget(str(tmp_path / "mirror.db"))
+    engine = RestoreEngine(target, str(tmp_path / "restore.json"), batch_size=64, max_workers=4)
+    chain = [BackupArchiveReader(str(tmp_path / "full.zip")), BackupArchiveReader(str(tmp_path / "delta.zip"))]
+
+    result = engine.restore_chain(chain)
+    target.close()
+
+    rows = _mirror_rows(tmp_path / "mirror.db")
+    assert result["completed"] is True
+    assert result["records_written"] == 1010
+    assert result["records_per_second"] > 0
+    assert len(rows) == 1000
+    assert rows["r0000"] == 9 and rows["r0999"] == 5
+    assert not os.path.exists(tmp_path / "restore.json")
+
+
+def test_interrupted_restore_resumes_from_checkpoint(tmp_path):
+    _archive(tmp_path / "full.zip", _reflections(1000), {"backup_name": "full", "mode": "full"})
+    chain = [BackupArchiveReader(str(tmp_path / "full.zip"))]
+    checkpoint = str(tmp_path / "restore.json")
+
+    target = SQLiteRestoreTarget(str(tmp_path / "mirror.db"))
+    failing = FailingTarget(target, fail_after=6)
+    first = RestoreEngine(failing, checkpoint, batch_size=100, max_workers=0).restore_chain(chain)
+
+    assert first["completed"] is False
+    assert first["records_written"] == 600
+    assert os.path.exists(checkpoint)
+
+    second = RestoreEngine(target, checkpoint, batch_size=100, max_workers=2).restore_chain(chain)
+    target.close()
+
+    assert second["completed"] is True
+    assert second["batches_skipped"] == 6
+    assert second["records_written"] == 400
+    assert len(_mirror_rows(tmp_path / "mirror.db")) == 1000
+
+
+def test_corrupted_archive_is_not_written(tmp_path):
+    import zipfile
+
+    path = tmp_path / "full.zip"
+    _archive(path, _reflections(100), {"backup_name": "full", "mode": "full"})
+    with zipfile.ZipFile(path) as zipf:
+        manifest = zipf.read("manifest.json")
+        body = zipf.read("supabase_data.jsonl").replace(b'"understanding_score":5', b'"understanding_score":1', 1)
+    with zipfile.ZipFile(path, "w") as zipf:
+        zipf.writestr("supabase_data.jsonl", body)
+        zipf.writestr("manifest.json", manifest)
+
+    target = SQLiteRestoreTarget(str(tmp_path / "mirror.db"))
+    result = RestoreEngine(target, str(tmp_path / "restore.json")).restore_chain([BackupArchiveReader(str(path))])
+    target.close()
+
+    assert result["completed"] is False
+    assert result["error"] == "checksum_mismatch"
+    assert _mirror_rows(tmp_path / "mirror.db") == {}
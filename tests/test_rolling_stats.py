@@ -0,0 +1,131 @@
+"""
+시간대별 온라인 누적 통계 테스트
+
+Welford/누적합 구간 조회가 전체 재계산 결과와 같은지, 정정 입력과
+저장/복원이 올바른지 검증합니다.
+"""
+
+import sys
+import os
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.notion_automation.dashboard.rolling_stats import RunningStats, TimePartRollingStats
+
+TIMEPART = "🌅 오전수업"
+START = datetime(2025, 1, 1)
+
+
+def _brute_force(points, end, days):
+    """(날짜 서수, 값) 목록에서 구간 통계를 직접 계산"""
+    start = end - days
+    selected = [(x, v) for x, v in points if start < x <= end]
+    n = len(selected)
+    mean = sum(v for _, v in selected) / n
+    variance = sum((v - mean) ** 2 for _, v in selected) / n
+    mean_x = sum(x for x, _ in selected) / n
+    sxx = sum((x - mean_x) ** 2 for x, _ in selected)
+    slope = sum((x - mean_x) * (v - mean) for x, v in selected) / sxx if sxx else 0.0
+    return n, mean, variance, slope
+
+
+def test_running_stats_matches_two_pass():
+    """Welford 평균/분산이 두 번 훑은 결과와 같은지 확인"""
+    values = [random.uniform(0, 10) for _ in range(200)]
+    stats = RunningStats.from_values(values)
+
+    mean = sum(values) / len(values)
+    variance = sum((v - mean) ** 2 for v in values) / len(values)
+
+    assert stats.mean == pytest.approx(mean)
+    assert stats.variance == pytest.approx(variance)
+    assert RunningStats.from_values([1, 2, 3, 4]).slope == pytest.approx(1.0)
+
+
+def test_window_queries_match_full_rescan(tmp_path):
+    """30/90/365일 구간 조회가 전체 재계산과 같은지 확인 (빈 날짜 포함)"""
+    random.seed(7)
+    stats = TimePartRollingStats(str(tmp_path / "stats.json"))
+    points = []
+
+    for offset in range(400):
+        if random.random() < 0.7:
+            date = START + timedelta(days=offset)
+            value = round(5 + offset * 0.01 + random.uniform(-2, 2), 1)
+            stats.observe(TIMEPART, "efficiency", date, value)
+            points.append((date.toordinal(), value))
+
+    end = START + timedelta(days=399)
+    for days in (30, 90, 365):
+        n, mean, variance, slope = _brute_force(points, end.toordinal(), days)
+        window = stats.window(TIMEPART, "efficiency", end, days)
+
+        assert window["count"] == n
+        assert window["mean"] == pytest.approx(mean)
+        assert window["variance"] == pytest.approx(variance, abs=1e-9)
+        assert window["slope"] == pytest.approx(slope, abs=1e-9)
+
+
+def test_late_and_corrected_values(tmp_path):
+    """지연 입력/정정 값 반영 및 동일 값 재입력 무시"""
+    stats = TimePartRollingStats(str(tmp_path / "stats.json"))
+    for offset, value in enumerate([4.0, 6.0, 8.0]):
+        stats.observe(TIMEPART, "efficiency", START + timedelta(days=offset + 1), value)
+
+    assert stats.observe(TIMEPART, "efficiency", START + timedelta(days=2), 6.0) is False
+
+    stats.observe(TIMEPART, "efficiency", START + timedelta(days=2), 9.0)  # 정정
+    stats.observe(TIMEPART, "efficiency", START, 1.0)                      # 이전 날짜 지연 입력
+
+    window = stats.window(TIMEPART, "efficiency", START + timedelta(days=3), 10)
+    assert window["count"] == 4
+    assert window["mean"] == pytest.approx((1.0 + 4.0 + 9.0 + 8.0) / 4)
+    assert stats.running(TIMEPART, "efficiency").count == 4
+
+
+def test_state_persists_between_instances(tmp_path):
+    """저장한 상태를 다시 열어 같은 결과를 조회"""
+    path = str(tmp_path / "stats.json")
+    stats = TimePartRollingStats(path)
+    for offset in range(10):
+        stats.observe(TIMEPART, "efficiency", START + timedelta(days=offset), offset)
+    stats.save()
+
+    reopened = TimePartRollingStats(path)
+    end = START + timedelta(days=9)
+
+    assert reopened.window(TIMEPART, "efficiency", end, 5) == stats.window(TIMEPART, "efficiency", end, 5)
+    assert reopened.running(TIMEPART, "efficiency").ewma == pytest.approx(stats.running(TIMEPART, "efficiency").ewma)
+
+
+def test_concurrent_writers_merge_instead_of_overwriting(tmp_path):
+    """두 객체가 같은 파일에 저장해도 서로 다른 날짜 값과 삭제가 모두 남음"""
+    path = str(tmp_path / "stats.json")
+    first = TimePartRollingStats(path)
+    second = TimePartRollingStats(path)
+
+    first.observe(TIMEPART, "efficiency", START, 4.0)
+    second.observe(TIMEPART, "efficiency", START + timedelta(days=1), 6.0)
+    first.save()
+    second.save()
+
+    third = TimePartRollingStats(path)
+    assert [value for _, value in third.daily_values(TIMEPART, "efficiency")] == [4.0, 6.0]
+
+    # 삭제도 병합되어, 이전 상태를 들고 있던 객체가 저장해도 되살아나지 않음
+    third.discard(TIMEPART, "efficiency", START)
+    third.save()
+    first.observe(TIMEPART, "efficiency", START + timedelta(days=2), 8.0)
+    first.save()
+
+    merged = TimePartRollingStats(path)
+    assert [value for _, value in merged.daily_values(TIMEPART, "efficiency")] == [6.0, 8.0]
+    window = merged.window(TIMEPART, "efficiency", START + timedelta(days=2), 3)
+    assert (window["count"], window["mean"]) == (2, pytest.approx(7.0))
+    assert first.window(TIMEPART, "efficiency", START + timedelta(days=2), 3) == window
@@ -0,0 +1,186 @@
+"""
+시간대 스케줄러 데몬 테스트
+
+time_schedules.json 기반 트리거 생성, jitter 적용, 놓친 실행 보충,
+작업별 겹침 방지와 실패 격리를 가짜 시계로 검증합니다.
+"""
+
+import sys
+import os
+import random
+import threading
+from datetime import datetime, time as dt_time, timezone
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.notion_automation.optimization import scheduler_daemon
+from src.notion_automation.optimization.scheduler_daemon import (
+    TimePartScheduler, SchedulerJob, build_triggers, load_schedule_config
+)
+from src.notion_automation.utils.time_part_calendar import TimePartCalendar, TimePartWindow
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def recording_jobs(calls, names=("github_collection", "local_persistence", "notion_sync", "dashboard_refresh")):
+    def make(name):
+        return lambda context: calls.append((name, context["time_part"], context["catch_up"]))
+    return {name: SchedulerJob(name, make(name)) for name in names}
+
+
+def make_scheduler(tmp_path, clock, calls, jitter_seconds=0.0, **kwargs):
+    triggers = build_triggers(load_schedule_config())
+    return TimePartScheduler(recording_jobs(calls), triggers, state_path=str(tmp_path / "state.json"),
+                             jitter_seconds=jitter_seconds, clock=clock, rng=random.Random(3), **kwargs)
+
+
+def run_all(scheduler, now=None):
+    for future in scheduler.run_pending(now):
+        future.result()
+
+
+def test_triggers_follow_time_schedules():
+    triggers = {trigger.key: trigger for trigger in build_triggers(load_schedule_config())}
+
+    assert triggers["morning_boundary"].at == dt_time(12, 0)
+    assert triggers["afternoon_boundary"].at == dt_time(17, 0)
+    assert triggers["evening_boundary"].at == dt_time(22, 0)
+    assert triggers["dashboard_refresh"].at == dt_time(22, 30)
+    assert triggers["morning_boundary"].jobs == ("github_collection", "local_persistence", "notion_sync")
+
+
+def test_boundary_runs_jobs_in_order_once(tmp_path):
+    clock = FakeClock(datetime(2026, 3, 2, 11, 0))
+    calls = []
+    scheduler = make_scheduler(tmp_path, clock, calls)
+
+    run_all(scheduler)
+    assert calls == []
+
+    clock.now = datetime(2026, 3, 2, 12, 0, 5)
+    run_all(scheduler)
+    run_all(scheduler)
+
+    assert calls == [
+        ("github_collection", "morning", False),
+        ("local_persistence", "morning", False),
+        ("notion_sync", "morning", False),
+    ]
+
+
+def test_jitter_delays_run_within_window(tmp_path):
+    clock = FakeClock(datetime(2026, 3, 2, 11, 59))
+    calls = []
+    scheduler = make_scheduler(tmp_path, clock, calls, jitter_seconds=120)
+
+    delay = scheduler.seconds_until_next()
+    assert 60 <= delay <= 180
+
+    # 정해진 시각이 되어도 jitter만큼 지나기 전에는 실행하지 않음
+    clock.now = datetime(2026, 3, 2, 12, 0, 0)
+    run_all(scheduler)
+    assert calls == []
+
+    clock.now = datetime(2026, 3, 2, 12, 2, 1)
+    run_all(scheduler)
+    assert len(calls) == 3
+
+
+def test_missed_runs_are_caught_up_once_after_restart(tmp_path):
+    clock = FakeClock(datetime(2026, 3, 2, 9, 0))
+    calls = []
+    make_scheduler(tmp_path, clock, calls)._save_state()
+
+    # 데몬이 12:00, 17:00을 놓치고 18:00에 재시작
+    clock.now = datetime(2026, 3, 2, 18, 0)
+    restarted = make_scheduler(tmp_path, clock, calls)
+    run_all(restarted)
+
+    assert {(time_part, catch_up) for _, time_part, catch_up in calls} == {("morning", True), ("afternoon", True)}
+    assert restarted.stats["catch_up_runs"] == 2
+
+    # 보충 기간(12시간)을 넘긴 실행은 건너뜀
+    calls.clear()
+    clock.now = datetime(2026, 3, 3, 12, 30)
+    late = make_scheduler(tmp_path, clock, calls)
+    run_all(late)
+
+    assert {time_part for _, time_part, _ in calls} == {"morning"}
+    assert late.stats["missed"] == 2  # 전날 저녁 경계 + 대시보드 갱신
+
+
+def test_overlapping_job_is_skipped_and_failures_are_isolated(tmp_path):
+    clock = FakeClock(datetime(2026, 3, 2, 9, 0))
+    calls = []
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow_sync(context):
+        started.set()
+        release.wait(5)
+
+    def failing_collection(context):
+        raise RuntimeError("GitHub 장애")
+
+    jobs = recording_jobs(calls)
+    jobs["notion_sync"] = SchedulerJob("notion_sync", slow_sync)
+    jobs["github_collection"] = SchedulerJob("github_collection", failing_collection)
+    scheduler = TimePartScheduler(jobs, build_triggers(load_schedule_config()),
+                                  state_path=str(tmp_path / "state.json"), jitter_seconds=0, clock=clock)
+
+    clock.now = datetime(2026, 3, 2, 12, 0, 1)
+    first = scheduler.run_pending()[0]
+    assert started.wait(5)
+
+    second = scheduler.run_trigger(scheduler.triggers["afternoon_boundary"])
+    release.set()
+    first_run = first.result()
+
+    assert first_run.jobs == {"github_collection": "failed", "local_persistence": "success", "notion_sync": "success"}
+    assert second.jobs["notion_sync"] == "skipped_overlap"
+    assert scheduler.stats["skipped_overlap"] == 1
+    assert scheduler.stats["job_failures"] == 2
+
+
+def test_triggers_come_from_calendar_windows():
+    calendar = TimePartCalendar([
+        TimePartWindow("morning", "🌅 오전수업", 8 * 60, 11 * 60 + 30),
+        TimePartWindow("evening", "🌙 저녁자율학습", 18 * 60, 21 * 60),
+    ])
+    config = {"3_part_schedule": {}, "automation_settings": {"auto_dashboard_update": False}}
+    triggers = {trigger.key: trigger for trigger in build_triggers(config, calendar)}
+
+    assert set(triggers) == {"morning_boundary", "evening_boundary"}
+    assert triggers["morning_boundary"].at == dt_time(11, 30)
+    assert triggers["evening_boundary"].at == dt_time(21, 0)
+
+
+def test_boundary_follows_calendar_timezone_not_server_time(tmp_path):
+    # 서버 시계가 UTC여도 12:00 KST(03:00 UTC)에 오전 경계 작업 실행
+    clock = FakeClock(datetime(2026, 3, 2, 2, 0, tzinfo=timezone.utc))
+    calls = []
+    scheduler = make_scheduler(tmp_path, clock, calls)
+
+    clock.now = datetime(2026, 3, 2, 2, 59, tzinfo=timezone.utc)
+    assert scheduler.run_pending() == []
+
+    clock.now = datetime(2026, 3, 2, 3, 0, 5, tzinfo=timezone.utc)
+    run_all(scheduler)
+    assert [time_part for _, time_part, _ in calls] == ["morning"] * 3
+
+    next_run = scheduler.upcoming()[0]["next_run"]
+    assert next_run == "2026-03-02T17:00:00+09:00"
+
+
+def test_default_state_path_does_not_depend_on_working_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert os.path.isabs(scheduler_daemon.DEFAULT_STATE_PATH)
+    assert os.path.dirname(scheduler_daemon.DEFAULT_STATE_PATH).startswith(project_root)
@@ -0,0 +1,138 @@
+"""
+세그먼트 로그 테스트
+
+추가/조회/재생, 세그먼트 전환과 컴팩션 후 최신 스냅샷 유지,
+깨진 꼬리 복구와 수집기 백업 이력 재생을 검증합니다.
+"""
+
+import sys
+import os
+import multiprocessing
+from datetime import date
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.notion_automation.utils import segment_log
+from src.notion_automation.utils.segment_log import SegmentLog
+from src.notion_automation.scripts.github_realtime_collector import GitHubRealtimeCollector
+
+
+def snapshot(day, part, version):
+    return {"date": day, "time_part": part, "version": version, "commits": ["x" * 200]}
+
+
+def test_append_get_and_replay(tmp_path):
+    with SegmentLog(str(tmp_path)) as log:
+        log.append("2026-03-02|morning", snapshot("2026-03-02", "morning", 1))
+        log.append("2026-03-02|afternoon", snapshot("2026-03-02", "afternoon", 1))
+        log.append("2026-03-02|morning", snapshot("2026-03-02", "morning", 2))
+
+        assert log.get("2026-03-02|morning")["version"] == 2
+        assert log.get("missing") is None
+        assert [record["version"] for _, record in log.replay()] == [1, 1, 2]
+        assert [key for key, _ in log.replay(latest_only=True)] == ["2026-03-02|afternoon", "2026-03-02|morning"]
+
+
+def test_compaction_keeps_latest_snapshot_per_key(tmp_path):
+    log = SegmentLog(str(tmp_path), segment_max_bytes=2048, compact_after_segments=3)
+    for version in range(20):
+        for part in ("morning", "afternoon", "evening"):
+            log.append(f"2026-03-02|{part}", snapshot("2026-03-02", part, version))
+
+    summary = log.summary()
+    assert summary["compactions"] >= 1
+    assert summary["segments"] <= 4
+    assert summary["reclaimed_bytes"] > 0
+
+    latest = {key: record["version"] for key, record in log.replay(latest_only=True)}
+    assert latest == {f"2026-03-02|{part}": 19 for part in ("morning", "afternoon", "evening")}
+
+    # 다시 열어도 같은 인덱스
+    log.close()
+    with SegmentLog(str(tmp_path), segment_max_bytes=2048, compact_after_segments=3) as reopened:
+        assert reopened.index == log.index
+        assert reopened.get("2026-03-02|evening")["version"] == 19
+
+
+def test_torn_tail_is_truncated_on_open(tmp_path):
+    with SegmentLog(str(tmp_path)) as log:
+        log.append("a", {"value": 1})
+        log.append("b", {"value": 2})
+        segment_path = log._path(log.active_seq)
+
+    with open(segment_path, 'ab') as f:
+        f.write(b"\x00\x00\x01\x00partial")
+
+    with SegmentLog(str(tmp_path)) as log:
+        assert log.stats["truncated_bytes"] == 11
+        log.append("c", {"value": 3})
+        assert [key for key, _ in log.replay()] == ["a", "b", "c"]
+
+
+def test_two_writers_on_same_directory_see_each_other(tmp_path):
+    first = SegmentLog(str(tmp_path), segment_max_bytes=1024, compact_after_segments=2)
+    second = SegmentLog(str(tmp_path), segment_max_bytes=1024, compact_after_segments=2)
+
+    first.append("a", snapshot("2026-03-02", "morning", 1))
+    second.append("b", snapshot("2026-03-02", "afternoon", 1))
+    assert first.get("b")["version"] == 1
+
+    # first가 세그먼트를 넘기고 합쳐도 second의 인덱스가 새 위치를 따라감
+    for version in range(2, 12):
+        first.append("a", snapshot("2026-03-02", "morning", version))
+    assert first.stats["compactions"] >= 1
+    second.append("c", snapshot("2026-03-02", "evening", 1))
+
+    assert second.get("a")["version"] == 11
+    assert first.get("c")["version"] == 1
+    assert {key: record["version"] for key, record in first.replay(latest_only=True)} == {"a": 11, "b": 1, "c": 1}
+    first.close()
+    second.close()
+
+    with SegmentLog(str(tmp_path)) as reopened:
+        assert reopened.stats["truncated_bytes"] == 0
+        assert {key: record["version"] for key, record in reopened.replay(latest_only=True)} == {"a": 11, "b": 1, "c": 1}
+
+
+def _append_from_process(directory, writer, versions):
+    with SegmentLog(directory, segment_max_bytes=4096, compact_after_segments=2) as log:
+        for version in range(versions):
+            for part in ("morning", "afternoon"):
+                log.append(f"{writer}|{part}", snapshot("2026-03-02", part, version))
+
+
+@pytest.mark.skipif(segment_log.fcntl is None, reason="프로세스 간 잠금(fcntl) 미지원 플랫폼")
+def test_concurrent_processes_keep_every_latest_snapshot(tmp_path):
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_append_from_process, args=(str(tmp_path), writer, 40))
+               for writer in ("w1", "w2", "w3")]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(30)
+        assert worker.exitcode == 0
+
+    with SegmentLog(str(tmp_path)) as log:
+        assert log.stats["truncated_bytes"] == 0
+        latest = {key: record["version"] for key, record in log.replay(latest_only=True)}
+    assert latest == {f"{writer}|{part}": 39 for writer in ("w1", "w2", "w3") for part in ("morning", "afternoon")}
+
+
+def test_collector_backup_is_single_append_and_replayable(tmp_path):
+    collector = GitHubRealtimeCollector(owner="student", repo="LG_DX_School", backup_dir=str(tmp_path))
+
+    collector.collect_realtime_github_data(date(2026, 3, 2), "🌅 오전수업")
+    collector.collect_realtime_github_data(date(2026, 3, 2), "🌅 오전수업")
+    collector.collect_realtime_github_data(date(2026, 3, 3), "🌞 오후수업")
+
+    assert os.listdir(tmp_path) == ["segments"]
+    assert len(collector.load_backup_history(latest_only=False)) == 3
+
+    history = collector.load_backup_history(start_date=date(2026, 3, 3))
+    assert len(history) == 1
+    assert history[0]["backup_info"]["timepart"] == "🌞 오후수업"
+    assert history[0]["github_data"]["commits"]
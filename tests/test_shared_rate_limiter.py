@@ -0,0 +1,104 @@
+"""
+프로세스 간 공유 요청 제한기 테스트
+
+여러 프로세스가 같은 버킷을 쓸 때 전체 요청 간격, 자격 증명별 분리,
+429 Retry-After 반영과 대기 시간 지표를 검증합니다.
+"""
+
+import sys
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.notion_automation.utils.shared_rate_limiter import (
+    DEFAULT_RATE_LIMIT_DB, SharedRateLimiter, bucket_key, limiter_metrics, penalize_on_rate_limit
+)
+
+RATE = 40.0
+
+
+def _acquire_many(db_path, count):
+    limiter = SharedRateLimiter("notion", "token", rate=RATE, burst=1, db_path=db_path)
+    stamps = []
+    for _ in range(count):
+        limiter.acquire()
+        stamps.append(time.time())
+    return stamps
+
+
+def test_default_db_does_not_depend_on_working_directory():
+    if "RATE_LIMIT_DB_PATH" not in os.environ:
+        assert DEFAULT_RATE_LIMIT_DB == os.path.join(project_root, "data", "rate_limits.db")
+    assert os.path.isabs(DEFAULT_RATE_LIMIT_DB)
+
+
+def test_processes_share_one_bucket(tmp_path):
+    db_path = str(tmp_path / "rate_limits.db")
+    SharedRateLimiter("notion", "token", rate=RATE, burst=1, db_path=db_path)
+
+    with ProcessPoolExecutor(max_workers=3) as pool:
+        stamps = sorted(t for batch in pool.map(_acquire_many, [db_path] * 3, [10] * 3) for t in batch)
+
+    gaps = [b - a for a, b in zip(stamps, stamps[1:])]
+    assert len(stamps) == 30
+    # 세 프로세스가 합쳐서도 한도(40 req/s)를 넘지 않음 (sleep 오차 허용)
+    assert stamps[-1] - stamps[0] >= 29 / RATE * 0.95
+    assert min(gaps) > 1 / RATE * 0.5
+
+    metrics = limiter_metrics(db_path)[bucket_key("notion", "token")]
+    assert metrics["permits"] == 30
+    assert metrics["waited_permits"] >= 25
+    assert metrics["max_wait_seconds"] > 0
+
+
+def test_credentials_have_separate_buckets(tmp_path):
+    db_path = str(tmp_path / "rate_limits.db")
+    first = SharedRateLimiter("github", "token-a", rate=1, burst=1, db_path=db_path)
+    second = SharedRateLimiter("github", "token-b", rate=1, burst=1, db_path=db_path)
+
+    assert first.acquire() == 0
+    assert second.acquire() == 0
+    assert first.reserve() > 0.5
+    assert "token-a" not in " ".join(limiter_metrics(db_path))
+
+
+def test_burst_then_steady_rate(tmp_path):
+    limiter = SharedRateLimiter("notion", "token", rate=10, burst=3, db_path=str(tmp_path / "rate_limits.db"))
+
+    waits = [limiter.reserve() for _ in range(5)]
+
+    assert waits[:3] == [0, 0, 0]
+    assert 0.05 < waits[3] < 0.15
+    assert 0.15 < waits[4] < 0.25
+
+
+class RateLimitedError(Exception):
+    status = 429
+    headers = {"retry-after": "2"}
+
+
+def test_retry_after_pushes_back_all_clients(tmp_path):
+    db_path = str(tmp_path / "rate_limits.db")
+    limiter = SharedRateLimiter("notion", "token", rate=100, burst=5, db_path=db_path)
+    other_process_view = SharedRateLimiter("notion", "token", rate=100, burst=5, db_path=db_path)
+
+    assert penalize_on_rate_limit(limiter, RateLimitedError()) is True
+    assert penalize_on_rate_limit(limiter, ValueError("다른 오류")) is False
+    assert other_process_view.reserve() > 1.5
+    assert limiter_metrics(db_path)[limiter.key]["penalties"] == 1
+
+
+def test_no_burst_released_before_retry_after(tmp_path):
+    db_path = str(tmp_path / "rate_limits.db")
+    limiter = SharedRateLimiter("notion", "token", rate=5, burst=5, db_path=db_path)
+
+    limiter.penalize(1.0)
+    waits = [limiter.reserve() for _ in range(5)]
+
+    # 버스트 허용치가 남아 있어도 Retry-After 동안은 아무 요청도 나가지 않고, 이후에는 한도 간격으로 나감
+    assert min(waits) >= 0.95
+    assert all(b - a > 0.15 for a, b in zip(waits, waits[1:]))
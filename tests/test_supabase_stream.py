@@ -0,0 +1,128 @@
+"""
+Supabase 키셋 스트리밍 추출 테스트
+
+(created_at, id) 키셋 페이지 경계, 컬럼 투영, 행/초 통계를 검증합니다.
+"""
+
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.notion_automation.utils.supabase_stream import (
+    SupabaseKeysetStream, build_keyset_filter, project_columns
+)
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+
+class FakeQuery:
+    """select/or_/order/limit 호출을 기록하고 키셋 조건을 직접 평가하는 가짜 쿼리"""
+
+    def __init__(self, table):
+        self.table = table
+        self.columns = None
+        self.after = None
+        self.filters = []
+        self.page_limit = None
+
+    def select(self, columns):
+        self.columns = columns
+        return self
+
+    def gte(self, column, value):
+        self.filters.append((column, value))
+        return self
+
+    def or_(self, expression):
+        self.after = expression
+        return self
+
+    def order(self, column, desc=False):
+        return self
+
+    def limit(self, count):
+        self.page_limit = count
+        return self
+
+    def execute(self):
+        self.table.queries.append(self)
+        rows = sorted(self.table.rows, key=lambda r: (r["created_at"], r["id"]))
+        rows = [r for r in rows if all(r[c] >= v for c, v in self.filters)]
+        if self.after is not None:
+            last_key = self.table.last_key
+            rows = [r for r in rows if (r["created_at"], r["id"]) > last_key]
+        page = rows[:self.page_limit]
+        if page:
+            self.table.last_key = (page[-1]["created_at"], page[-1]["id"])
+        if self.columns != "*":
+            names = self.columns.split(",")
+            page = [{name: row[name] for name in names} for row in page]
+        return FakeResponse(page)
+
+
+class FakeClient:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+        self.last_key = None
+
+    def table(self, name):
+        return FakeQuery(self)
+
+
+def _rows(count):
+    # 같은 created_at을 가진 행이 페이지 경계에 걸치도록 구성
+    return [
+        {"id": f"id-{i:03d}", "created_at": f"2025-07-{1 + i // 3:02d}T09:00:00+00:00",
+         "date": f"2025-07-{1 + i // 3:02d}", "total_score": i, "condition": "좋음"}
+        for i in range(count)
+    ]
+
+
+def test_keyset_filter_quotes_timestamps():
+    """타임스탬프 값이 인용되고 동률 조건이 and로 묶이는지 확인"""
+    expression = build_keyset_filter(("created_at", "id"), ("2025-07-01T09:00:00+00:00", "id-1"))
+    assert expression == (
+        'created_at.gt."2025-07-01T09:00:00+00:00",'
+        'and(created_at.eq."2025-07-01T09:00:00+00:00",id.gt.id-1)'
+    )
+    assert build_keyset_filter(("created_at", "id"), ("t", "x"), descending=True).startswith("created_at.lt.t")
+
+
+def test_projection_always_includes_key_columns():
+    assert project_columns(["date", "total_score"], ("created_at", "id")) == "date,total_score,created_at,id"
+    assert project_columns("*", ("created_at", "id")) == "*"
+
+
+def test_stream_pages_without_gaps_or_duplicates():
+    """페이지 경계의 동률 created_at에서도 누락/중복 없이 모든 행을 내보내는지 확인"""
+    client = FakeClient(_rows(23))
+    stream = SupabaseKeysetStream(client, "daily_reflections", ["date", "total_score"], page_size=5)
+
+    rows = list(stream)
+
+    assert [row["total_score"] for row in rows] == list(range(23))
+    assert set(rows[0]) == {"date", "total_score", "created_at", "id"}
+    assert all(query.page_limit == 5 for query in client.queries)
+    assert client.queries[0].after is None and all(q.after for q in client.queries[1:])
+    assert stream.stats["rows"] == 23
+    assert stream.stats["pages"] == 5
+    assert stream.stats["rows_per_second"] >= 0
+
+
+def test_stream_respects_limit_and_filters():
+    client = FakeClient(_rows(30))
+    stream = SupabaseKeysetStream(client, "daily_reflections", "id,date", page_size=4,
+                                  filters=[("gte", "date", "2025-07-03")], limit=7)
+
+    rows = list(stream)
+
+    assert len(rows) == 7
+    assert all(row["date"] >= "2025-07-03" for row in rows)
+    assert [query.page_limit for query in client.queries] == [4, 3]
@@ -0,0 +1,129 @@
+"""
+대시보드 섹션 DAG 실행기 테스트
+
+의존성 순서, 동시 실행, 실패 전파, 섹션별 시간 기록을 검증합니다.
+"""
+
+import sys
+import os
+import time
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.notion_automation.optimization.task_dag_executor import TaskDAGExecutor
+
+
+def _square(value):
+    """프로세스 작업용 (pickle 가능한 최상위 함수)"""
+    return value * value
+
+
+def test_dependencies_receive_results_in_order():
+    """의존 작업 결과가 선언 순서대로 전달되는지 확인"""
+    executor = TaskDAGExecutor()
+    executor.add_task("a", lambda: 2)
+    executor.add_task("b", lambda: 3)
+    executor.add_task("sum", lambda a, b: a * 10 + b, ["a", "b"])
+
+    results = executor.run()
+
+    assert results["sum"] == 23
+    assert executor.timings["sum"]["status"] == "done"
+
+
+def test_independent_tasks_run_concurrently():
+    """독립 작업의 총 소요 시간이 합계가 아닌 최장 작업에 가까운지 확인"""
+    executor = TaskDAGExecutor(max_threads=4)
+    executor.add_task("dataset", lambda: "data")
+    for name in ["radar", "heatmap", "trend", "weekly"]:
+        executor.add_task(name, lambda data: time.sleep(0.2) or data, ["dataset"])
+
+    executor.run()
+    breakdown = executor.get_timing_breakdown()
+
+    assert breakdown["sequential_seconds"] >= 0.8
+    assert breakdown["total_seconds"] < 0.6
+    assert set(breakdown["tasks"]) == {"dataset", "radar", "heatmap", "trend", "weekly"}
+
+
+def test_failed_task_skips_dependents():
+    """실패한 작업의 후속 작업은 건너뛰고 나머지는 계속 실행"""
+    def broken():
+        raise RuntimeError("boom")
+
+    executor = TaskDAGExecutor()
+    executor.add_task("broken", broken)
+    executor.add_task("after_broken", lambda value: value, ["broken"])
+    executor.add_task("independent", lambda: "ok")
+
+    results = executor.run()
+
+    assert results["broken"] is None
+    assert results["after_broken"] is None
+    assert results["independent"] == "ok"
+    assert executor.timings["broken"]["status"] == "failed"
+    assert executor.timings["after_broken"]["status"] == "skipped"
+
+
+def test_skip_reaches_grandchild_registered_before_parent():
+    """등록 순서와 관계없이 실패가 손자 작업까지 전파되는지 확인"""
+    def broken():
+        raise RuntimeError("boom")
+
+    executor = TaskDAGExecutor()
+    executor.add_task("grandchild", lambda value: value, ["child"])
+    executor.add_task("root", broken)
+    executor.add_task("child", lambda value: value, ["root"])
+
+    results = executor.run()
+
+    assert results == {"root": None, "child": None, "grandchild": None}
+    assert executor.timings["child"]["status"] == "skipped"
+    assert executor.timings["grandchild"]["status"] == "skipped"
+
+
+def test_cycle_and_unknown_dependency_rejected():
+    """순환 의존성과 미등록 의존성 검출"""
+    executor = TaskDAGExecutor()
+    executor.add_task("a", lambda b: b, ["b"])
+    executor.add_task("b", lambda a: a, ["a"])
+    with pytest.raises(ValueError):
+        executor.run()
+
+    executor = TaskDAGExecutor()
+    executor.add_task("a", lambda missing: missing, ["missing"])
+    with pytest.raises(ValueError):
+        executor.run()
+
+
+def test_process_task():
+    """프로세스 풀 작업 실행"""
+    executor = TaskDAGExecutor(max_processes=1)
+    executor.add_task("value", lambda: 7)
+    executor.add_task("square", _square, ["value"], kind="process")
+
+    results = executor.run()
+
+    assert results["square"] == 49
+    assert executor.timings["square"]["kind"] == "process"
+
+
+def test_dashboard_sections_with_process_analytics(tmp_path, monkeypatch):
+    """process_analytics=True에서 최적 시간대 분석이 프로세스 워커에서 완료되는지 확인"""
+    from src.notion_automation.dashboard import (create_3part_dashboard, github_heatmap, efficiency_trend,
+                                                 optimal_time_analyzer, time_part_visualizer)
+
+    for module in (create_3part_dashboard, github_heatmap, efficiency_trend, optimal_time_analyzer, time_part_visualizer):
+        monkeypatch.setattr(module, "project_root", str(tmp_path))
+    dashboard = create_3part_dashboard.ThreePartDashboard(process_analytics=True)
+
+    results = dashboard._build_sections(days=3)
+    timings = dashboard.last_build_timings["tasks"]
+
+    assert timings["optimal_analysis"] == {**timings["optimal_analysis"], "kind": "process", "status": "done"}
+    expected = create_3part_dashboard.run_optimal_analysis(dashboard.data_dir, 6, results["dataset"])
+    assert results["optimal_analysis"]["timepart_performance"] == expected["timepart_performance"]
@@ -0,0 +1,72 @@
+"""
+시간대 달력 테스트
+
+config/time_schedules.json에서 컴파일한 경계가 각 모듈에 그대로 쓰이는지,
+분류 정책(strict 포함)과 시간대 변환이 올바른지 검증합니다.
+"""
+
+import sys
+import os
+import json
+from datetime import datetime, timezone
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import pytest
+
+from src.notion_automation.utils.time_part_calendar import TimePartCalendar, TimePartWindow, get_time_part_calendar
+from src.notion_automation.optimization.batch_processor import ThreePartBatchProcessor
+from src.notion_automation.core.github_time_analyzer import GitHubTimeAnalyzer
+
+MORNING, AFTERNOON, EVENING = "🌅 오전수업", "🌞 오후수업", "🌙 저녁자율학습"
+
+
+def test_compiled_from_config_matches_modules(tmp_path):
+    calendar = get_time_part_calendar()
+
+    assert calendar.hour_ranges() == {MORNING: (9, 12), AFTERNOON: (13, 17), EVENING: (19, 22)}
+    processor = ThreePartBatchProcessor(artifact_root=str(tmp_path / "artifacts"))
+    assert processor.time_schedules == calendar.clock_ranges(by="code")
+    assert GitHubTimeAnalyzer().time_ranges[AFTERNOON] == {"start": 13, "end": 17, "type": "afternoon"}
+
+
+def test_classify_policies():
+    calendar = TimePartCalendar()
+
+    assert calendar.classify(datetime(2026, 3, 2, 9, 0)) == MORNING
+    assert calendar.classify(datetime(2026, 3, 2, 12, 30)) == MORNING
+    assert calendar.classify(datetime(2026, 3, 2, 12, 30), strict=True) is None
+    assert calendar.classify(datetime(2026, 3, 2, 16, 59), strict=True) == AFTERNOON
+    assert calendar.classify(datetime(2026, 3, 2, 18, 0)) == AFTERNOON
+    assert calendar.classify(datetime(2026, 3, 2, 6, 0)) == MORNING
+    assert calendar.classify(datetime(2026, 3, 2, 23, 0)) == EVENING
+
+
+def test_timezone_conversion():
+    calendar = TimePartCalendar()
+
+    # 05:30 UTC = 14:30 KST
+    assert calendar.classify("2026-03-02T05:30:00Z") == AFTERNOON
+    assert calendar.classify(datetime(2026, 3, 2, 10, 0, tzinfo=timezone.utc)) == EVENING
+    assert calendar.classify(datetime(2026, 3, 2, 1, 0, tzinfo=timezone.utc).timestamp()) == MORNING
+    assert calendar.localize("2026-03-02T15:30:00Z") == datetime(2026, 3, 3, 0, 30)
+
+
+def test_custom_config_and_validation(tmp_path):
+    config_path = tmp_path / "time_schedules.json"
+    config_path.write_text(json.dumps({"3_part_schedule": {
+        "오전수업": {"start_time": "08:30", "end_time": "11:30"},
+        "오후수업": {"start_time": "12:30", "end_time": "17:30"},
+        "저녁자율학습": {"start_time": "19:00", "end_time": "21:00"},
+    }}, ensure_ascii=False), encoding="utf-8")
+
+    calendar = TimePartCalendar.from_config(str(config_path), tz="UTC")
+    assert calendar.window("morning").start == "08:30"
+    assert calendar.classify("2026-03-02T12:30:00Z") == AFTERNOON
+    assert calendar.classify("2026-03-02T12:29:00Z") == MORNING
+
+    with pytest.raises(ValueError):
+        TimePartCalendar([TimePartWindow("morning", MORNING, 540, 800),
+                          TimePartWindow("afternoon", AFTERNOON, 780, 1020)])